@@ -0,0 +1,59 @@
+"""add station_id prefix and per-station log ordering indexes
+
+Revision ID: 20261018_array_history_idx
+Revises: 20261018_season_stats_rollups
+Create Date: 2026-10-18
+
+- ``ix_station_metadata_station_id_upper`` on ``upper(station_id)`` lets the
+  array history endpoint resolve an array code as an index range scan.
+- ``ix_offload_logs_station_id_log_timestamp`` serves per-station window
+  functions and the newest-first paged array log listing.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import inspect
+
+
+revision: str = "20261018_array_history_idx"
+down_revision: Union[str, Sequence[str], None] = "20261018_season_stats_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_index_if_missing(table: str, index_name: str, columns: list, *, unique: bool = False) -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if not inspector.has_table(table):
+        return
+    existing = {idx["name"] for idx in inspector.get_indexes(table)}
+    if index_name not in existing:
+        op.create_index(index_name, table, columns, unique=unique)
+
+
+def _drop_index_if_present(table: str, index_name: str) -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if not inspector.has_table(table):
+        return
+    existing = {idx["name"] for idx in inspector.get_indexes(table)}
+    if index_name in existing:
+        op.drop_index(index_name, table_name=table)
+
+
+def upgrade() -> None:
+    # SQLite reflection skips expression indexes, so guard with IF NOT EXISTS.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_station_metadata_station_id_upper "
+        "ON station_metadata (upper(station_id))"
+    )
+    _create_index_if_missing(
+        "offload_logs",
+        "ix_offload_logs_station_id_log_timestamp",
+        ["station_id", "log_timestamp_utc"],
+    )
+
+
+def downgrade() -> None:
+    _drop_index_if_present("offload_logs", "ix_offload_logs_station_id_log_timestamp")
+    op.execute("DROP INDEX IF EXISTS ix_station_metadata_station_id_upper")
@@ -0,0 +1,46 @@
+"""add embedding_cache (content-hash -> embedding store for the vector index)
+
+Revision ID: 20261018_embedding_cache
+Revises: 20261018_array_history_idx
+Create Date: 2026-10-18
+
+Derived data: rows are written as chunks are embedded, so no backfill is
+needed. The next ``reindex-all`` (or document re-upload) fills the table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "20261018_embedding_cache"
+down_revision: Union[str, Sequence[str], None] = "20261018_array_history_idx"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if not inspector.has_table("embedding_cache"):
+        op.create_table(
+            "embedding_cache",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("model_name", sa.String(), nullable=False),
+            sa.Column("content_hash", sa.String(), nullable=False),
+            sa.Column("dimensions", sa.Integer(), nullable=False),
+            sa.Column("embedding", sa.LargeBinary(), nullable=False),
+            sa.Column("created_at_utc", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("model_name", "content_hash", name="uq_embedding_cache_model_hash"),
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+
+    if inspector.has_table("embedding_cache"):
+        op.drop_table("embedding_cache")
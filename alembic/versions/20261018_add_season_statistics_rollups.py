@@ -0,0 +1,81 @@
+"""add season_statistics_rollups (per station type season statistics partials)
+
+Revision ID: 20261018_season_stats_rollups
+Revises: 20261018_station_status_snaps
+Create Date: 2026-10-18
+
+Open-season rows are derived data rebuilt lazily on the next summary read.
+Closed seasons get frozen rows the first time their summary is read (or when
+their statistics are reprocessed), so no backfill is needed.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "20261018_season_stats_rollups"
+down_revision: Union[str, Sequence[str], None] = "20261018_station_status_snaps"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_index_if_missing(table: str, index_name: str, columns: list[str], *, unique: bool = False) -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if not inspector.has_table(table):
+        return
+    existing = {idx["name"] for idx in inspector.get_indexes(table)}
+    if index_name not in existing:
+        op.create_index(index_name, table, columns, unique=unique)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if "season_statistics_rollups" not in tables:
+        op.create_table(
+            "season_statistics_rollups",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("field_season_year", sa.Integer(), nullable=False),
+            sa.Column("station_type", sa.String(), nullable=False),
+            sa.Column("rollup_json", sa.Text(), nullable=False),
+            sa.Column("is_frozen", sa.Boolean(), nullable=False, server_default=sa.false()),
+            sa.Column("computed_at_utc", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint(
+                "field_season_year",
+                "station_type",
+                name="uq_season_statistics_rollup_year_type",
+            ),
+        )
+    _create_index_if_missing(
+        "season_statistics_rollups",
+        "ix_season_statistics_rollups_field_season_year",
+        ["field_season_year"],
+    )
+    _create_index_if_missing(
+        "season_statistics_rollups",
+        "ix_season_statistics_rollups_station_type",
+        ["station_type"],
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if "season_statistics_rollups" not in tables:
+        return
+    existing = {idx["name"] for idx in inspector.get_indexes("season_statistics_rollups")}
+    for idx_name in (
+        "ix_season_statistics_rollups_station_type",
+        "ix_season_statistics_rollups_field_season_year",
+    ):
+        if idx_name in existing:
+            op.drop_index(idx_name, table_name="season_statistics_rollups")
+    op.drop_table("season_statistics_rollups")
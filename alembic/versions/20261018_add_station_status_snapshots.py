@@ -0,0 +1,82 @@
+"""add station_status_snapshots (materialized status overview rows)
+
+Revision ID: 20261018_station_status_snaps
+Revises: 20260722_reactivate_hist
+Create Date: 2026-10-18
+
+One row per (season context, station). Rows are derived data: the app drops
+them on station/log/flag/hardware writes and rebuilds them lazily, so the
+table starts empty and needs no backfill
+(``python -m app.cli.rebuild_station_status_snapshots`` pre-warms it).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+
+revision: str = "20261018_station_status_snaps"
+down_revision: Union[str, Sequence[str], None] = "20260722_reactivate_hist"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_index_if_missing(table: str, index_name: str, columns: list[str], *, unique: bool = False) -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    if not inspector.has_table(table):
+        return
+    existing = {idx["name"] for idx in inspector.get_indexes(table)}
+    if index_name not in existing:
+        op.create_index(index_name, table, columns, unique=unique)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if "station_status_snapshots" not in tables:
+        op.create_table(
+            "station_status_snapshots",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("context_key", sa.String(), nullable=False),
+            sa.Column("station_id", sa.String(), nullable=False),
+            sa.Column("row_json", sa.Text(), nullable=False),
+            sa.Column("computed_at_utc", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["station_id"], ["station_metadata.station_id"]),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint(
+                "context_key",
+                "station_id",
+                name="uq_station_status_snapshot_context_station",
+            ),
+        )
+    _create_index_if_missing(
+        "station_status_snapshots",
+        "ix_station_status_snapshots_context_key",
+        ["context_key"],
+    )
+    _create_index_if_missing(
+        "station_status_snapshots",
+        "ix_station_status_snapshots_station_id",
+        ["station_id"],
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    if "station_status_snapshots" not in tables:
+        return
+    existing = {idx["name"] for idx in inspector.get_indexes("station_status_snapshots")}
+    for idx_name in (
+        "ix_station_status_snapshots_station_id",
+        "ix_station_status_snapshots_context_key",
+    ):
+        if idx_name in existing:
+            op.drop_index(idx_name, table_name="station_status_snapshots")
+    op.drop_table("station_status_snapshots")
@@ -0,0 +1,43 @@
+"""rebuild chatbot vector collections in cosine space with explicit HNSW params
+
+Revision ID: 20261018_vector_cosine_hnsw
+Revises: 20261018_embedding_cache
+Create Date: 2026-10-18
+
+Data migration on the Chroma store (settings.vector_store_dir), not the SQL schema.
+Chroma cannot change a collection's distance space or HNSW build parameters in
+place, so each collection whose settings differ from vector_distance_metric /
+vector_hnsw_* is recreated and its stored embeddings, documents and metadata
+are copied over (no re-embedding). No-op when chromadb is not installed or the
+store does not exist yet. Downgrade rebuilds with Chroma defaults (L2).
+"""
+from typing import Sequence, Union
+
+
+revision: str = "20261018_vector_cosine_hnsw"
+down_revision: Union[str, Sequence[str], None] = "20261018_embedding_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rebuild(tuned: bool) -> None:
+    from app.config import settings
+    from app.core.utils import resolve_data_path
+    from app.services.vector_search_service import CHROMADB_AVAILABLE, rebuild_collections
+
+    storage_path = resolve_data_path(settings.vector_store_dir)
+    if not CHROMADB_AVAILABLE or not storage_path.is_dir():
+        return
+
+    import chromadb
+
+    client = chromadb.PersistentClient(path=str(storage_path))
+    rebuild_collections(client, tuned=tuned)
+
+
+def upgrade() -> None:
+    _rebuild(tuned=True)
+
+
+def downgrade() -> None:
+    _rebuild(tuned=False)
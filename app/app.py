@@ -1553,7 +1553,7 @@ async def run_weather_map_cleanup_job():
 
 
 async def run_iridium_tle_prefetch_job():
-    """Leader job: refresh CelesTrak Iridium-E TLEs when stale (disk TTL / rate gate)."""
+    """Leader job: refresh Iridium-E TLEs when stale (disk TTL / rate gate), then vehicle pass windows."""
     logger.info("AUTOMATED: Prefetching Iridium TLE cache...")
     try:
         from .core.geo.iridium_tle_cache import prefetch_iridium_tles
@@ -1562,6 +1562,14 @@ async def run_iridium_tle_prefetch_job():
         logger.info("AUTOMATED: Iridium TLE prefetch finished: %s", summary)
     except Exception as exc:
         logger.error("AUTOMATED: Iridium TLE prefetch failed: %s", exc, exc_info=True)
+        return
+    try:
+        from .core.geo.iridium_passes import precompute_vehicle_passes
+
+        summary = await precompute_vehicle_passes()
+        logger.info("AUTOMATED: Iridium vehicle pass windows computed: %s", summary)
+    except Exception as exc:
+        logger.error("AUTOMATED: Iridium vehicle pass precompute failed: %s", exc, exc_info=True)
 
 
 async def run_iridium_tle_cleanup_job():
@@ -1599,6 +1607,53 @@ async def run_bathy_cache_cleanup_job():
         logger.error("AUTOMATED: Bathymetry cache cleanup failed: %s", exc, exc_info=True)
 
 
+async def run_report_figure_cache_cleanup_job():
+    """Leader job: purge report figure PNGs unused past max age and enforce the LRU quota."""
+    logger.info("AUTOMATED: Cleaning report figure cache...")
+    try:
+        from .core.reporting.figure_cache import run_figure_cache_cleanup
+
+        summary = run_figure_cache_cleanup()
+        logger.info(
+            "AUTOMATED: Report figure cache cleanup finished (removed=%s, freed_bytes=%s)",
+            summary.get("removed_files"),
+            summary.get("freed_bytes"),
+        )
+    except Exception as exc:
+        logger.error("AUTOMATED: Report figure cache cleanup failed: %s", exc, exc_info=True)
+
+
+async def run_report_basemap_cache_cleanup_job():
+    """Leader job: purge report basemap tiles unused past max age and enforce the LRU quota."""
+    logger.info("AUTOMATED: Cleaning report basemap cache...")
+    try:
+        from .core.geo.basemap_cache import run_basemap_cache_cleanup
+
+        summary = run_basemap_cache_cleanup()
+        logger.info(
+            "AUTOMATED: Report basemap cache cleanup finished (removed=%s, freed_bytes=%s)",
+            summary.get("removed_files"),
+            summary.get("freed_bytes"),
+        )
+    except Exception as exc:
+        logger.error("AUTOMATED: Report basemap cache cleanup failed: %s", exc, exc_info=True)
+
+
+async def run_forecast_cache_cleanup_job():
+    """Leader job: purge Open-Meteo point forecast cells too old to serve as stale fallback."""
+    try:
+        from .core.geo.forecast_cache import purge_forecast_cache
+
+        summary = purge_forecast_cache()
+        logger.info(
+            "AUTOMATED: Forecast cache cleanup finished (removed=%s, freed_bytes=%s)",
+            summary.get("removed_files"),
+            summary.get("freed_bytes"),
+        )
+    except Exception as exc:
+        logger.error("AUTOMATED: Forecast cache cleanup failed: %s", exc, exc_info=True)
+
+
 async def run_slocum_overage_cleanup_job():
     """Leader job: purge expired Slocum overage entries, enforce quota, remove orphan mirrors."""
     if not feature_toggles.is_feature_enabled("slocum_platform"):
@@ -1639,10 +1694,17 @@ async def run_sfmc_cache_refresh_job():
         with SQLModelSession(sqlite_engine) as session:
             summary = await refresh_all_active_sfmc_snapshots(session)
         logger.info(
-            "AUTOMATED: SFMC cache refresh finished (attempted=%s, succeeded=%s, failed=%s)",
+            "AUTOMATED: SFMC cache refresh finished "
+            "(attempted=%s, succeeded=%s, failed=%s, gliders=%s, elapsed=%ss)",
             summary.get("attempted"),
             summary.get("succeeded"),
             summary.get("failed"),
+            summary.get("gliders"),
+            summary.get("elapsed_sec"),
+        )
+        logger.debug(
+            "AUTOMATED: SFMC per-glider latency (s): %s",
+            summary.get("glider_latency_sec"),
         )
     except Exception as exc:
         logger.error("AUTOMATED: SFMC cache refresh failed: %s", exc, exc_info=True)
@@ -1855,6 +1917,38 @@ async def startup_event():
             "Bathymetry cache cleanup scheduled daily at %02d:20 UTC",
             cleanup_hour,
         )
+        scheduler.add_job(
+            run_report_figure_cache_cleanup_job,
+            "cron",
+            hour=cleanup_hour,
+            minute=22,
+            timezone="UTC",
+            id="system_report_figure_cache_cleanup_job",
+        )
+        logger.info(
+            "Report figure cache cleanup scheduled daily at %02d:22 UTC",
+            cleanup_hour,
+        )
+        scheduler.add_job(
+            run_report_basemap_cache_cleanup_job,
+            "cron",
+            hour=cleanup_hour,
+            minute=23,
+            timezone="UTC",
+            id="system_report_basemap_cache_cleanup_job",
+        )
+        logger.info(
+            "Report basemap cache cleanup scheduled daily at %02d:23 UTC",
+            cleanup_hour,
+        )
+        scheduler.add_job(
+            run_forecast_cache_cleanup_job,
+            "cron",
+            hour=cleanup_hour,
+            minute=25,
+            timezone="UTC",
+            id="system_forecast_cache_cleanup_job",
+        )
         iridium_prefetch_hours = max(
             1, int(getattr(settings, "iridium_tle_prefetch_interval_hours", 2) or 2)
         )
@@ -1933,6 +2027,14 @@ async def startup_event():
             await run_bathy_cache_cleanup_job()
         except Exception as exc:
             logger.warning("STARTUP: Initial bathymetry cache cleanup failed: %s", exc)
+        try:
+            await run_report_figure_cache_cleanup_job()
+        except Exception as exc:
+            logger.warning("STARTUP: Initial report figure cache cleanup failed: %s", exc)
+        try:
+            await run_report_basemap_cache_cleanup_job()
+        except Exception as exc:
+            logger.warning("STARTUP: Initial report basemap cache cleanup failed: %s", exc)
         try:
             await run_iridium_tle_cleanup_job()
         except Exception as exc:
@@ -2042,15 +2144,26 @@ async def startup_event():
                 mission_forms_db = {}
     elif settings.forms_storage_mode == "sqlite":
         logger.info("Forms storage mode is 'sqlite'. JSON load skipped.")
+    if settings.chatbot_warm_on_startup:
+        from .services.chatbot_service import chatbot_service
+        from .services.llm_service import llm_service
+
+        chatbot_service.warm_in_background()
+        llm_service.warm_in_background()
     logger.info("Application startup event completed.")  
 
 
 @app.on_event("shutdown") 
-def shutdown_event():
+async def shutdown_event():
     global _scheduler_started_by_this_worker
     if _scheduler_started_by_this_worker and scheduler.running:
         scheduler.shutdown()
         logger.info("APScheduler shut down.")
+    from .services.llm_service import llm_service
+    await llm_service.aclose()
+    await forecast.aclose()
+    from .routers.knowledge_base import kb_service
+    kb_service.shutdown()
 
 
 async def _process_loaded_data_for_home_view(
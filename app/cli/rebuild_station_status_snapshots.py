@@ -0,0 +1,35 @@
+"""
+Rebuild the materialized station status overview (``station_status_snapshots``).
+
+Drops every snapshot row and recomputes all season contexts (no season plus
+each field season, open or closed) for live registry stations. Safe to run at
+any time; the app also rebuilds missing rows lazily on the next overview read.
+
+Run from project root:
+  python -m app.cli.rebuild_station_status_snapshots
+"""
+import argparse
+import json
+import logging
+
+from app.core.infra.db import SQLModelSession, sqlite_engine
+from app.services.station_status_snapshot_service import rebuild_station_status_snapshots
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("station_status_snapshot_rebuild")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Drop and rebuild station_status_snapshots for every season context."
+    )
+    parser.parse_args()
+
+    with SQLModelSession(sqlite_engine) as session:
+        summary = rebuild_station_status_snapshots(session)
+    logger.info("Station status snapshots rebuilt: %s", json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
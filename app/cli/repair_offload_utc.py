@@ -10,6 +10,8 @@ from sqlmodel import select
 
 from app.core import models
 from app.core.infra.db import SQLModelSession, sqlite_engine
+# Registers the flush hook that drops stale station status overview rows.
+import app.services.station_status_snapshot_service  # noqa: F401
 
 
 logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,117 @@
+"""
+Chatbot vector store maintenance.
+
+``reindex-all`` clears and rebuilds every Chroma collection (FAQs, documents,
+tips, Slocum masterdata) from the database with batched embedding. Run it
+while the web app is idle or stopped: it opens the same Chroma store.
+
+``rebuild-collections`` recreates collections whose distance space / HNSW
+parameters differ from the vector_distance_metric / vector_hnsw_* settings,
+copying the stored embeddings (the alembic migration does the same on upgrade).
+
+Run from project root:
+  python -m app.cli.vector_index_cli reindex-all
+  python -m app.cli.vector_index_cli reindex-all --threads 8 --batch-size 64
+  python -m app.cli.vector_index_cli rebuild-collections [--force]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from app.config import settings
+from app.core.infra.db import SQLModelSession, sqlite_engine
+from app.core.utils import resolve_data_path
+from app.services.vector_index_service import reindex_all
+from app.services.vector_search_service import (
+    CHROMADB_AVAILABLE,
+    VectorSearchService,
+    rebuild_collections,
+)
+
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("vector_index_cli")
+
+
+def _reindex_all(args: argparse.Namespace) -> int:
+    if args.batch_size:
+        settings.vector_embedding_batch_size = args.batch_size
+    vector_service = VectorSearchService(cpu_threads=args.threads)
+    if not vector_service.enabled:
+        logger.error("Vector search dependencies are not available; nothing to do.")
+        return 1
+
+    last_logged = {}
+
+    def progress(stage: str, done: int, total: int) -> None:
+        if last_logged.get(stage) != done:
+            last_logged[stage] = done
+            logger.info("%s: %s/%s", stage, done, total)
+
+    started = time.perf_counter()
+    with SQLModelSession(sqlite_engine) as session:
+        summary = reindex_all(vector_service, session, progress)
+    summary["seconds"] = round(time.perf_counter() - started, 2)
+    summary["threads"] = args.threads
+    summary["batch_size"] = settings.vector_embedding_batch_size
+    logger.info("Reindex complete: %s", json.dumps(summary))
+    return 0
+
+
+def _rebuild_collections(args: argparse.Namespace) -> int:
+    if not CHROMADB_AVAILABLE:
+        logger.error("chromadb is not installed; nothing to do.")
+        return 1
+    import chromadb
+
+    storage_path = args.storage_path or resolve_data_path(settings.vector_store_dir)
+    client = chromadb.PersistentClient(path=str(storage_path))
+    rebuilt = rebuild_collections(client, force=args.force)
+    logger.info("Rebuilt collections: %s", json.dumps(rebuilt) if rebuilt else "none (already up to date)")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Chatbot vector store maintenance.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reindex = subparsers.add_parser(
+        "reindex-all", help="Clear and rebuild every vector collection from the database."
+    )
+    reindex.add_argument(
+        "--threads",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="CPU threads for the embedding model (default: all cores)",
+    )
+    reindex.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help=f"Texts per encode() batch (default: {settings.vector_embedding_batch_size})",
+    )
+    reindex.set_defaults(handler=_reindex_all)
+
+    rebuild = subparsers.add_parser(
+        "rebuild-collections",
+        help="Recreate collections with the configured distance space and HNSW parameters.",
+    )
+    rebuild.add_argument(
+        "--storage-path",
+        default=None,
+        help=f"Chroma store (default: vector_store_dir, {settings.vector_store_dir})",
+    )
+    rebuild.add_argument(
+        "--force", action="store_true", help="Rebuild even if the settings already match"
+    )
+    rebuild.set_defaults(handler=_rebuild_collections)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
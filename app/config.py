@@ -116,6 +116,22 @@ class Settings(BaseSettings):
     # Longer than weather: grids are stable topography reused across report generation.
     bathy_cache_max_age_days: int = 90
     bathy_cache_max_bytes: int = 512 * 1024 * 1024  # 512 MB
+    # Per-worker LRU of loaded .npz tiles (bathymetry tile pyramid) for map mosaics
+    # and point/track depth lookups.
+    bathy_loaded_grid_cache_size: int = 64
+
+    # --- Rendered report figures (content-addressed PNGs; see reporting/figure_cache) ---
+    report_figure_cache_enabled: bool = True
+    report_figure_cache_dir: Path = Path("data_store/report_figure_cache")
+    report_figure_cache_max_age_days: int = 60
+    report_figure_cache_max_bytes: int = 1024 * 1024 * 1024  # 1 GB
+
+    # --- Pre-rendered report map backgrounds (fixed-grid tiles; see geo/basemap_cache) ---
+    report_basemap_cache_enabled: bool = True
+    report_basemap_cache_dir: Path = Path("data_store/report_basemap_cache")
+    # Coastlines do not change; keep tiles as long as bathymetry tiles.
+    report_basemap_cache_max_age_days: int = 90
+    report_basemap_cache_max_bytes: int = 512 * 1024 * 1024  # 512 MB
 
     # --- Open-Meteo weather map layer cache (home-page wind overlay) ---
     weather_map_cache_dir: Path = Path("data_store/weather_cache")
@@ -125,11 +141,32 @@ class Settings(BaseSettings):
     weather_map_prefetch_horizon_days: int = 7
     weather_map_prefetch_step_hours: int = 3
     weather_map_prefetch_cron_hour: int = 7  # UTC
+    # Concurrent .om downloads per prefetch run (and per upstream host).
+    weather_map_prefetch_concurrency: int = 6
+    weather_map_prefetch_per_host_limit: int = 4
     # Buddy manifest TTL: API rebuilds latest.json when older than this (ICON runs update often).
     weather_map_manifest_ttl_seconds: int = 6 * 3600
     # Daily disk cleanup runs even when weather_map_layers is disabled (stranded cache).
     weather_map_cleanup_cron_hour: int = 7  # UTC
     weather_map_cache_max_bytes: int = 5 * 1024 * 1024 * 1024  # 5 GB
+    # Per-worker in-process tier: memory-mapped .om bodies + parsed meta for range serving.
+    weather_map_hot_cache_max_bytes: int = 512 * 1024 * 1024  # 512 MB of mapped files
+    # Entry cap for the same tier; also bounds unmapped entries (too big to map, or no mmap).
+    weather_map_hot_cache_max_entries: int = 2048
+    # A worker following another worker's .om download fetches it itself after this long without progress.
+    weather_map_download_stall_seconds: float = 30.0
+
+    # --- Open-Meteo point forecast cache (general + marine, shared across workers) ---
+    forecast_cache_enabled: bool = True
+    forecast_cache_dir: Path = Path("data_store/forecast_cache")
+    # Requests snap to this lat/lon grid; one upstream call serves every point in a cell.
+    forecast_cache_grid_deg: float = 0.1
+    # Cached forecasts are fresh within one model-run bucket (UTC hours floored to this).
+    forecast_cache_run_hours: int = 1
+    # Workers waiting on another worker's refresh fetch themselves after this long.
+    forecast_cache_lock_wait_seconds: float = 30.0
+    # Cells not refreshed for this long are purged (no longer useful as stale fallback).
+    forecast_cache_max_age_days: int = 2
 
     # --- Iridium constellation TLE cache (home-page satellite overlay) ---
     # CelesTrak updates ~every 2 hours; disk gate enforces ≤1 upstream contact per TTL.
@@ -141,6 +178,8 @@ class Settings(BaseSettings):
     # Daily cleanup reclaim when feature off or files older than this.
     iridium_tle_cleanup_max_age_days: int = 7
     iridium_tle_cleanup_cron_hour: int = 7  # UTC
+    # Server-side SGP4 ephemeris span (needs `sgp4`); rebuilt on TLE refresh.
+    iridium_pass_horizon_hours: int = 6
 
     # --- Sensor Tracker Settings ---
     # SECURITY: Credentials MUST be configured in .env file
@@ -161,6 +200,12 @@ class Settings(BaseSettings):
     sfmc_cache_refresh_interval_minutes: int = 60
     # SFMC hosts typically allow ~25 requests/minute; stay under that.
     sfmc_max_requests_per_minute: int = 20
+    # Gliders loaded concurrently by the snapshot job (calls still share the rate budget above).
+    sfmc_refresh_max_concurrency: int = 4
+    # Shared-disk cache of downloaded glider files (goto .ma, network logs) + parsed results,
+    # keyed by listing size/mtime so unchanged files are never re-fetched.
+    sfmc_file_cache_dir: Path = Path("data_store/sfmc_file_cache")
+    sfmc_file_cache_max_bytes: int = 256 * 1024 * 1024  # 256 MB
 
     # --- Automated Slocum daily checklist (leader cron; UTC only) ---
     # Fires at deadline; submits missing checklists as System using cached SFMC.
@@ -170,6 +215,10 @@ class Settings(BaseSettings):
     
     # --- Knowledge Base Settings ---
     knowledge_base_max_upload_size_mb: int = 50  # Maximum file upload size in MB
+    knowledge_base_extraction_workers: int = 2  # Processes for PDF/DOCX/PPTX text extraction (per web worker)
+    knowledge_base_pdf_pages_per_task: int = 16  # PDF pages per extraction task (pages run in parallel)
+    # Extracted text keyed by file SHA-256; re-ingesting the same file skips extraction.
+    knowledge_base_text_cache_dir: Path = Path("data_store/extracted_text_cache")
     
     # --- OpenWeatherMap API Settings ---
     # SECURITY: API key MUST be configured in .env file
@@ -196,10 +245,27 @@ class Settings(BaseSettings):
     
     # --- Chatbot Vector Search Settings ---
     vector_search_enabled: bool = False  # Enable vector search (requires chromadb and sentence-transformers)
-    vector_similarity_threshold: float = 0.35  # Minimum similarity for matches (0.0-1.0, 0.35 works well)
+    vector_store_dir: Path = Path("data_store/chroma_db")  # Chroma persistent store
+    # Minimum cosine similarity for FAQ/doc/tip matches, in every collection space.
+    # 0.07 keeps the recall of the former default (0.35 on the 1/(1+L2^2) scale of
+    # the pre-cosine L2 collections, i.e. cos >= 0.071 for unit-length MiniLM vectors).
+    vector_similarity_threshold: float = 0.07
+    vector_distance_metric: str = "cosine"  # Chroma space for new/rebuilt collections: cosine, l2 or ip
+    vector_hnsw_m: int = 16  # HNSW graph degree (higher = better recall, more memory)
+    vector_hnsw_ef_construction: int = 200  # HNSW build-time candidate list (higher = better graph, slower indexing)
+    vector_hnsw_ef_search: int = 64  # HNSW query-time candidate list (higher = better recall, slower search)
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"  # Embedding model name
+    vector_query_cache_size: int = 512  # LRU entries of cached query embeddings
+    vector_embedding_batch_size: int = 32  # Texts per encode() batch during ingestion/reindex
+    faq_index_max_age_seconds: int = 300  # Rebuild the in-memory FAQ keyword index from the DB after this long
+    faq_hybrid_keyword_weight: float = 0.3  # Share of BM25 keyword score when re-ranking vector FAQ hits
     vector_chunking_enabled: bool = False  # Enable chunking for document vectorization
     vector_chunking_min_chars: int = 2000  # Chunk documents longer than this
+    chatbot_warm_on_startup: bool = True  # Load embedding model / probe Ollama in a background thread after startup
+    chatbot_answer_cache_enabled: bool = True  # Reuse LLM answers for near-identical questions
+    chatbot_answer_cache_similarity: float = 0.9  # Min query-embedding cosine to reuse a cached answer
+    chatbot_answer_cache_size: int = 256  # Cached answers per worker (LRU)
+    chatbot_answer_cache_ttl_seconds: int = 3600  # Max age of a cached answer (new sources may rank higher)
     
     # --- LLM Settings (Ollama) ---
     llm_enabled: bool = False  # Enable LLM for response synthesis
@@ -210,6 +276,8 @@ class Settings(BaseSettings):
     llm_timeout: int = 180  # Timeout in seconds (increased for larger context)
     llm_fallback_to_search: bool = False  # Fall back to search results if LLM unavailable
     llm_max_context_chars: int = 6000  # Max context to send to LLM (Mistral supports ~8k tokens)
+    llm_max_concurrent_requests: int = 2  # Generations in flight per worker (protects the Ollama server)
+    llm_max_queued_requests: int = 8  # Requests allowed to wait for a slot before being rejected
     
     # Parsed values (not loaded directly from env)
     remote_mission_folder_map: dict[str, str] = {}
@@ -0,0 +1,395 @@
+"""Pre-rendered static basemap tiles for PDF report maps.
+
+In a fresh worker nearly all of a report map's render time goes to cartopy
+loading the Natural Earth land, ocean, coastline and border geometries;
+drawing them is cheap once they are loaded. This module caches those static
+layers as RGB tiles on a fixed PlateCarree grid, so a report whose tiles are
+on disk never loads a shapefile: it draws the track, markers and gridline
+labels over a mosaic of cached tiles. ETOPO depth contours stay vector, drawn
+on top by ``plotting`` (their levels follow the depth range in view, and
+their labels would not line up across tiles).
+
+Grid: level ``L`` has ``2 ** (L / LEVELS_PER_OCTAVE)`` pixels per degree and
+``TILE_PX`` square tiles counted from (0°, 0°). A request names the pixels
+per degree its map axes are drawn at; it is served from the closest level,
+within ``REUSE_SCALE_TOLERANCE``, whose tiles covering the extent are all
+cached. Otherwise the closest level is rendered,
+and since the geometry load is paid anyway, the render covers every missing
+tile within ``PREFETCH_SPANS`` of the request's longer side around it. The
+next week's drift, a week regenerated with a few more fixes and the
+end-of-mission overview then mosaic from tiles already on disk, and a track
+that leaves the rendered area only renders the tiles it lacks.
+
+Tiles are PNGs under ``report_basemap_cache_dir`` as
+``<family>/<level>_<x>_<y>.png`` (``family`` hashes kind, style, tile grid
+and params); the name is the georeferencing. Rendering itself is supplied by
+the caller (``plotting``), like ``reporting.figure_cache``. A hit bumps the
+tile mtimes, and a small per-worker LRU keeps the last mosaics for the weeks
+of an end-of-mission report. Cleanup is TTL plus a size quota, least
+recently used first.
+
+Bump ``BASEMAP_STYLE_VERSION`` whenever the basemap layers change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence
+
+import matplotlib
+import numpy as np
+from PIL import Image as PILImage
+
+from ...config import settings
+from ..utils import (
+    enforce_cache_dir_quota,
+    iter_cache_files,
+    purge_cache_dir,
+    resolve_data_path,
+    write_bytes_atomic,
+)
+
+logger = logging.getLogger(__name__)
+
+BASEMAP_STYLE_VERSION = 2
+BASEMAP_PROJECTION = "PlateCarree"
+# Same as the report PNGs, so tiles drawn near 1:1 keep the vector line widths.
+BASEMAP_DPI = 200
+# Level L is 2 ** (L / LEVELS_PER_OCTAVE) pixels per degree.
+LEVELS_PER_OCTAVE = 4
+TILE_PX = 512
+# A render covers missing tiles this many request spans around the request.
+PREFETCH_SPANS = 1.0
+# Tiles per side of one render call, to bound the canvas size.
+RENDER_CHUNK_TILES = 4
+# Drawn around each render call and cropped, so strokes at its edge match
+# the tiles next to it.
+RENDER_PAD_PX = 16
+# A cached level is used if its pixels per degree are within this factor
+# (either way) of the request's; line widths scale with it.
+REUSE_SCALE_TOLERANCE = 1.5
+_MEMORY_CACHE_SIZE = 4
+
+
+@dataclass(frozen=True)
+class Basemap:
+    """RGB raster (row 0 = north) covering ``extent`` [west, east, south, north] in PlateCarree."""
+
+    image: np.ndarray
+    extent: tuple[float, float, float, float]
+
+
+# render(extent, width_px, height_px) -> RGB array of exactly that size,
+# ``extent`` spanning the outer pixel edges.
+Renderer = Callable[[List[float], int, int], np.ndarray]
+
+# Inclusive tile indices (x0, x1, y0, y1).
+TileRange = tuple[int, int, int, int]
+
+_stats: dict[str, Any] = {
+    "hits": 0,
+    "memory_hits": 0,
+    "misses": 0,
+    "tiles_rendered": 0,
+    "bytes_written": 0,
+    "last_cleanup_at": None,
+    "last_cleanup_summary": None,
+}
+
+_memory: "OrderedDict[tuple, Basemap]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def get_basemap_cache_dir() -> Path:
+    return resolve_data_path(settings.report_basemap_cache_dir)
+
+
+def basemap_cache_enabled() -> bool:
+    return bool(getattr(settings, "report_basemap_cache_enabled", True))
+
+
+def level_pixels_per_degree(level: int) -> float:
+    return 2.0 ** (level / LEVELS_PER_OCTAVE)
+
+
+def candidate_levels(px_per_deg: float) -> list[int]:
+    """Levels within ``REUSE_SCALE_TOLERANCE`` of ``px_per_deg``, closest first."""
+    exact = math.log2(px_per_deg) * LEVELS_PER_OCTAVE
+    reach = math.log2(REUSE_SCALE_TOLERANCE) * LEVELS_PER_OCTAVE
+    levels = range(math.ceil(exact - reach), math.floor(exact + reach) + 1)
+    return sorted(levels, key=lambda level: abs(level - exact))
+
+
+def tile_range(extent: Sequence[float], level: int) -> TileRange:
+    """Tiles of ``level`` covering ``extent``, kept within valid latitudes."""
+    size = TILE_PX / level_pixels_per_degree(level)
+    west, east, south, north = (float(v) for v in extent)
+    eps = 1e-9
+    x0 = math.floor(west / size + eps)
+    y0 = max(math.ceil(-90.0 / size - eps), math.floor(south / size + eps))
+    x1 = max(x0, math.ceil(east / size - eps) - 1)
+    y1 = max(y0, min(math.floor(90.0 / size + eps) - 1, math.ceil(north / size - eps) - 1))
+    return x0, x1, y0, y1
+
+
+def tiles_extent(level: int, tiles: TileRange) -> List[float]:
+    """PlateCarree extent of the outer edges of ``tiles``."""
+    size = TILE_PX / level_pixels_per_degree(level)
+    x0, x1, y0, y1 = tiles
+    return [x0 * size, (x1 + 1) * size, y0 * size, (y1 + 1) * size]
+
+
+def _grow(extent: Sequence[float], spans: float) -> List[float]:
+    west, east, south, north = (float(v) for v in extent)
+    margin = spans * max(east - west, north - south)
+    return [west - margin, east + margin, south - margin, north + margin]
+
+
+def basemap_family(kind: str, params: Optional[dict[str, Any]] = None) -> str:
+    """Hash of everything that decides a tile's look except its position and level."""
+    payload = {
+        "kind": kind,
+        "style": BASEMAP_STYLE_VERSION,
+        "projection": BASEMAP_PROJECTION,
+        "matplotlib": matplotlib.__version__,
+        "dpi": BASEMAP_DPI,
+        "tile_px": TILE_PX,
+        "levels_per_octave": LEVELS_PER_OCTAVE,
+        "params": params or {},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _tile_path(family: str, level: int, x: int, y: int) -> Path:
+    return get_basemap_cache_dir() / family / f"{level}_{x}_{y}.png"
+
+
+def _tile_paths(family: str, level: int, tiles: TileRange) -> dict[tuple[int, int], Path]:
+    x0, x1, y0, y1 = tiles
+    return {
+        (x, y): _tile_path(family, level, x, y)
+        for y in range(y0, y1 + 1)
+        for x in range(x0, x1 + 1)
+    }
+
+
+def _read_tile(path: Path) -> Optional[np.ndarray]:
+    try:
+        with PILImage.open(path) as img:
+            image = np.asarray(img.convert("RGB"))
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        logger.warning("Failed to read report basemap tile %s: %s", path, exc)
+        return None
+    if image.shape[:2] != (TILE_PX, TILE_PX):
+        return None
+    try:
+        os.utime(path)  # LRU for the quota
+    except OSError:
+        pass
+    return image
+
+
+def _write_tile(path: Path, image: np.ndarray) -> None:
+    buf = io.BytesIO()
+    PILImage.fromarray(image).save(buf, format="PNG")
+    data = buf.getvalue()
+    if write_bytes_atomic(path, data, label="report basemap tile"):
+        _stats["bytes_written"] += len(data)
+
+
+def _render_tiles(
+    family: str,
+    level: int,
+    tiles: TileRange,
+    wanted: set[tuple[int, int]],
+    render: Renderer,
+) -> dict[tuple[int, int], np.ndarray]:
+    """Render and store the ``wanted`` tiles of ``tiles``, ``RENDER_CHUNK_TILES`` square per call."""
+    x0, x1, y0, y1 = tiles
+    pad = RENDER_PAD_PX / level_pixels_per_degree(level)
+    rendered: dict[tuple[int, int], np.ndarray] = {}
+    for cy in range(y0, y1 + 1, RENDER_CHUNK_TILES):
+        for cx in range(x0, x1 + 1, RENDER_CHUNK_TILES):
+            todo = [
+                (x, y)
+                for y in range(cy, min(cy + RENDER_CHUNK_TILES - 1, y1) + 1)
+                for x in range(cx, min(cx + RENDER_CHUNK_TILES - 1, x1) + 1)
+                if (x, y) in wanted
+            ]
+            if not todo:
+                continue
+            chunk = (
+                min(x for x, _ in todo),
+                max(x for x, _ in todo),
+                min(y for _, y in todo),
+                max(y for _, y in todo),
+            )
+            west, east, south, north = tiles_extent(level, chunk)
+            width = (chunk[1] - chunk[0] + 1) * TILE_PX + 2 * RENDER_PAD_PX
+            height = (chunk[3] - chunk[2] + 1) * TILE_PX + 2 * RENDER_PAD_PX
+            image = np.asarray(render([west - pad, east + pad, south - pad, north + pad], width, height))
+            if image.shape[:2] != (height, width):
+                raise ValueError(f"basemap render returned {image.shape[:2]}, expected {(height, width)}")
+            for x, y in todo:
+                left = RENDER_PAD_PX + (x - chunk[0]) * TILE_PX
+                top = RENDER_PAD_PX + (chunk[3] - y) * TILE_PX
+                tile = np.ascontiguousarray(image[top : top + TILE_PX, left : left + TILE_PX, :3], dtype=np.uint8)
+                _write_tile(_tile_path(family, level, x, y), tile)
+                rendered[(x, y)] = tile
+    _stats["tiles_rendered"] += len(rendered)
+    return rendered
+
+
+def _mosaic(level: int, tiles: TileRange, images: dict[tuple[int, int], np.ndarray]) -> Basemap:
+    x0, x1, y0, y1 = tiles
+    image = np.empty(((y1 - y0 + 1) * TILE_PX, (x1 - x0 + 1) * TILE_PX, 3), dtype=np.uint8)
+    for y in range(y0, y1 + 1):
+        for x in range(x0, x1 + 1):
+            top = (y1 - y) * TILE_PX
+            left = (x - x0) * TILE_PX
+            image[top : top + TILE_PX, left : left + TILE_PX] = images[(x, y)]
+    return Basemap(image=image, extent=tuple(tiles_extent(level, tiles)))
+
+
+def _remember(key: tuple, basemap: Basemap) -> Basemap:
+    with _memory_lock:
+        _memory[key] = basemap
+        _memory.move_to_end(key)
+        while len(_memory) > _MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+    return basemap
+
+
+def _read_cached(family: str, level: int, tiles: TileRange) -> Optional[dict[tuple[int, int], np.ndarray]]:
+    """Every tile of ``tiles`` from disk, or ``None`` if any is missing or unreadable."""
+    paths = _tile_paths(family, level, tiles)
+    if not all(path.is_file() for path in paths.values()):
+        return None
+    images = {}
+    for xy, path in paths.items():
+        image = _read_tile(path)
+        if image is None:
+            return None
+        images[xy] = image
+    return images
+
+
+def get_or_render(
+    kind: str,
+    extent: Sequence[float],
+    px_per_deg: float,
+    render: Renderer,
+    *,
+    params: Optional[dict[str, Any]] = None,
+) -> Basemap:
+    """Basemap mosaic covering ``extent`` near ``px_per_deg``: cached tiles, else ``render()`` the missing ones."""
+    family = basemap_family(kind, params)
+    levels = candidate_levels(px_per_deg)
+    for level in levels:
+        tiles = tile_range(extent, level)
+        key = (family, level, tiles)
+        with _memory_lock:
+            cached = _memory.get(key)
+            if cached is not None:
+                _memory.move_to_end(key)
+        if cached is not None:
+            _stats["memory_hits"] += 1
+            return cached
+        images = _read_cached(family, level, tiles)
+        if images is not None:
+            _stats["hits"] += 1
+            return _remember(key, _mosaic(level, tiles, images))
+
+    _stats["misses"] += 1
+    level = levels[0]
+    tiles = tile_range(extent, level)
+    ahead = tile_range(_grow(extent, PREFETCH_SPANS), level)
+    shown = set(_tile_paths(family, level, tiles))
+    images = {}
+    missing = set()
+    for xy, path in _tile_paths(family, level, ahead).items():
+        image = _read_tile(path) if xy in shown else None
+        if image is not None:
+            images[xy] = image
+        elif xy in shown or not path.is_file():
+            missing.add(xy)
+    images.update(_render_tiles(family, level, ahead, missing, render))
+    return _remember((family, level, tiles), _mosaic(level, tiles, images))
+
+
+def _iter_entries() -> list[tuple[Path, float, int]]:
+    return iter_cache_files(get_basemap_cache_dir(), "*/*.png")
+
+
+def get_basemap_cache_status() -> dict[str, Any]:
+    entries = _iter_entries()
+    reused = _stats["hits"] + _stats["memory_hits"]
+    lookups = reused + _stats["misses"]
+    with _memory_lock:
+        in_memory = len(_memory)
+    return {
+        "cache_dir": str(get_basemap_cache_dir()),
+        "enabled": basemap_cache_enabled(),
+        "style_version": BASEMAP_STYLE_VERSION,
+        "files": len(entries),
+        "total_bytes": sum(size for _, _, size in entries),
+        "in_memory": in_memory,
+        "max_bytes": int(getattr(settings, "report_basemap_cache_max_bytes", 0) or 0),
+        "max_age_days": int(getattr(settings, "report_basemap_cache_max_age_days", 90)),
+        "hit_rate": round(reused / lookups, 3) if lookups else None,
+        **_stats,
+    }
+
+
+def enforce_basemap_cache_quota() -> dict[str, int]:
+    """Evict least recently used tiles until under report_basemap_cache_max_bytes."""
+    return enforce_cache_dir_quota(
+        get_basemap_cache_dir(),
+        "*/*.png",
+        int(getattr(settings, "report_basemap_cache_max_bytes", 0) or 0),
+        label="report basemap",
+    )
+
+
+def purge_basemap_cache(
+    *,
+    force_all: bool = False,
+    max_age_days: Optional[int] = None,
+    enforce_quota: bool = True,
+) -> dict[str, Any]:
+    """Remove tiles unused for ``max_age_days`` (or all, plus stray tmp files), then enforce quota."""
+    if max_age_days is None:
+        max_age_days = int(getattr(settings, "report_basemap_cache_max_age_days", 90))
+    summary = purge_cache_dir(
+        get_basemap_cache_dir(),
+        "*/*.png",
+        max_age_days=max_age_days,
+        max_bytes=int(getattr(settings, "report_basemap_cache_max_bytes", 0) or 0),
+        force_all=force_all,
+        enforce_quota=enforce_quota,
+        label="report basemap",
+    )
+    if force_all:
+        with _memory_lock:
+            _memory.clear()
+    return summary
+
+
+def run_basemap_cache_cleanup() -> dict[str, Any]:
+    """Always-on disk cleanup: TTL purge + LRU quota."""
+    summary = purge_basemap_cache(force_all=False, enforce_quota=True)
+    _stats["last_cleanup_at"] = datetime.now(timezone.utc).isoformat()
+    _stats["last_cleanup_summary"] = summary
+    return summary
@@ -1,31 +1,53 @@
 """ETOPO 2022 bathymetry fetch and contour helpers for PDF telemetry maps.
 
 Data source: NOAA NCEI ETOPO 2022 via ERDDAP griddap (dataset ETOPO_2022_v1_15s,
-variable z). Only the map bounding box is requested; results are cached under
-data_store/bathy_cache/ as .npz files. Longitudes are converted to 0-360 for
-the ERDDAP query and back to -180..180 for Cartopy plotting.
+variable z). Longitudes are converted to 0-360 for the ERDDAP query and back
+to -180..180 for Cartopy plotting.
+
+Grids are cached as a fixed tile pyramid under data_store/bathy_cache/:
+1 deg x 1 deg tiles (240 x 240 native 15" cells) per griddap stride in
+``BATHY_TILE_STRIDES``, stored as ``s<stride>/tile_<lat0>_<lon0>.npz``.
+A map extent picks the pyramid level at or above ``choose_stride`` and is
+mosaicked from that level's tiles; only tiles not on disk are requested from
+ERDDAP (one bbox request per side of the prime meridian), so overlapping
+report maps and point lookups share tiles instead of each storing its own
+overlapping grid. Every level's stride divides 240, so all tiles of a level
+sit on one regular grid and mosaic without seams.
 
 Disable contours with feature toggle report_bathymetry_contours=false.
-Disk cleanup (TTL + size quota) mirrors weather_map_cache.
+Disk cleanup (TTL + size quota) mirrors weather_map_cache and works per tile;
+a tile's mtime is bumped when it is loaded, so both evict least recently used
+tiles first. Per-extent ``bathy_*.npz`` files from the previous layout are no
+longer read and are removed by the next purge.
+
+Point and track depth lookups (``fetch_etopo_depth_at``, ``depths_at``) sample
+the finest cached level that has the tile containing the position.
+``_TileIndex`` keeps the cached tiles in memory and is rebuilt when the cache
+directories change - a write, eviction or purge by any worker. Loaded tiles
+are kept in a small LRU (``bathy_loaded_grid_cache_size``).
 """
 
 from __future__ import annotations
 
 import logging
 import math
+import os
 import re
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
 from erddapy import ERDDAP
 
 from ...config import settings
+from ..utils import replace_path_with_retries, unique_sibling_tmp_path
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +55,11 @@ ETOPO_DEG_STEP = 0.004166667
 BATHY_BBOX_PAD_DEG = 0.02
 # Half-width of the tiny fallback bbox used by point depth sampling (°).
 POINT_DEPTH_HALF_WIDTH_DEG = 0.01
-_CACHE_FILENAME_RE = re.compile(
-    r"^bathy_(-?\d+(?:\.\d+)?)_(-?\d+(?:\.\d+)?)_(-?\d+(?:\.\d+)?)_(-?\d+(?:\.\d+)?)_(\d+)\.npz$"
-)
+# Tile edge (°) and pyramid levels (griddap strides); each stride divides the
+# 240 native cells of a tile edge.
+BATHY_TILE_DEG = 1
+BATHY_TILE_STRIDES = (1, 2, 4, 8, 16, 48, 240)
+_TILE_FILENAME_RE = re.compile(r"^tile_(-?\d+)_(-?\d+)\.npz$")
 OCEAN_DEPTH_LEVELS_M = (
     -10,
     -20,
@@ -58,6 +82,11 @@ _cleanup_stats: dict[str, Any] = {
     "last_cleanup_at": None,
     "last_cleanup_summary": None,
 }
+_tile_stats: dict[str, int] = {
+    "tiles_reused": 0,
+    "tiles_fetched": 0,
+    "upstream_requests": 0,
+}
 
 
 @dataclass(frozen=True)
@@ -112,6 +141,14 @@ def choose_stride(extent: List[float], *, max_points: int = 400) -> int:
     return max(1, int(math.ceil(max_n / max_points)))
 
 
+def pyramid_stride(stride: int) -> int:
+    """Finest pyramid level at least as coarse as ``stride`` (coarsest level beyond)."""
+    for level in BATHY_TILE_STRIDES:
+        if level >= stride:
+            return level
+    return BATHY_TILE_STRIDES[-1]
+
+
 def nice_contour_levels(zmin: float, zmax: float, *, target: int = 8) -> list[float]:
     """Return standard ocean depth contour levels (negative meters) within z range."""
     if zmax >= 0:
@@ -162,35 +199,68 @@ def _cache_key(extent: List[float], stride: int) -> tuple[float, float, float, f
     )
 
 
-def _cache_path(cache_key: tuple[float, float, float, float, int]) -> Path:
-    west, east, south, north, stride = cache_key
-    filename = f"bathy_{west}_{east}_{south}_{north}_{stride}.npz"
-    return get_bathy_cache_dir() / filename
+def _tile_origins(values: np.ndarray) -> np.ndarray:
+    """South/west tile edge containing each coordinate (rounded so 36.0 - eps -> 36)."""
+    deg = BATHY_TILE_DEG
+    return np.floor(np.round(np.asarray(values, dtype=float) / deg, 6)).astype(int) * deg
 
 
-def _load_cached_grid(cache_key: tuple[float, float, float, float, int]) -> Optional[BathyGrid]:
-    path = _cache_path(cache_key)
-    if not path.exists():
-        return None
+def tiles_for_bounds(bounds: dict[str, float]) -> list[tuple[int, int]]:
+    """``(lat0, lon0)`` south-west corners of the tiles covering -180..180 ``bounds``."""
+    deg = BATHY_TILE_DEG
+    lat_lo, lat_hi = np.clip(_tile_origins([bounds["south"], bounds["north"]]), -90, 90 - deg)
+    lon_lo, lon_hi = np.clip(_tile_origins([bounds["west"], bounds["east"]]), -180, 180 - deg)
+    return [
+        (int(lat0), int(lon0))
+        for lat0 in range(int(lat_lo), int(lat_hi) + 1, deg)
+        for lon0 in range(int(lon_lo), int(lon_hi) + 1, deg)
+    ]
+
+
+def _tile_dir(stride: int) -> Path:
+    return get_bathy_cache_dir() / f"s{stride}"
+
+
+def _tile_path(stride: int, lat0: int, lon0: int) -> Path:
+    return _tile_dir(stride) / f"tile_{lat0}_{lon0}.npz"
+
+
+def _load_grid_file(path: Path) -> Optional[BathyGrid]:
     try:
-        data = np.load(path)
-        return BathyGrid(
-            longitude=data["longitude"],
-            latitude=data["latitude"],
-            z=data["z"],
-        )
+        with np.load(path) as data:
+            return BathyGrid(
+                longitude=data["longitude"],
+                latitude=data["latitude"],
+                z=data["z"],
+            )
+    except FileNotFoundError:
+        return None
     except Exception as exc:
-        logger.warning("Failed to load bathymetry cache %s: %s", path, exc)
+        logger.warning("Failed to load bathymetry tile %s: %s", path, exc)
         return None
 
 
-def _save_cached_grid(cache_key: tuple[float, float, float, float, int], grid: BathyGrid) -> None:
-    path = _cache_path(cache_key)
+def _save_tile(stride: int, lat0: int, lon0: int, grid: BathyGrid) -> None:
+    path = _tile_path(stride, lat0, lon0)
+    tmp_path = unique_sibling_tmp_path(path)
     try:
-        get_bathy_cache_dir().mkdir(parents=True, exist_ok=True)
-        np.savez(path, longitude=grid.longitude, latitude=grid.latitude, z=grid.z)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Temp + replace so other workers' lookups never load a half-written file.
+        with open(tmp_path, "wb") as handle:
+            np.savez(
+                handle,
+                longitude=grid.longitude,
+                latitude=grid.latitude,
+                z=np.asarray(grid.z, dtype=np.float32),
+            )
+        replace_path_with_retries(tmp_path, path)
     except Exception as exc:
-        logger.warning("Failed to write bathymetry cache %s: %s", path, exc)
+        logger.warning("Failed to write bathymetry tile %s: %s", path, exc)
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    _TILE_INDEX.invalidate()
 
 
 def _fetch_from_erddap(
@@ -220,28 +290,134 @@ def _fetch_from_erddap(
     return _pivot_griddap_dataframe(df)
 
 
-@lru_cache(maxsize=32)
-def _fetch_cached(cache_key: tuple[float, float, float, float, int]) -> Optional[BathyGrid]:
-    cached = _load_cached_grid(cache_key)
-    if cached is not None:
-        return cached
+def _tile_query_bounds(south0: int, north0: int, west0: int, east0: int) -> dict[str, float]:
+    """Griddap bounds selecting exactly the native cells of tiles ``south0..north0`` x ``west0..east0``.
+
+    Each bound sits a quarter cell inside the outermost cell, so ERDDAP's
+    nearest-index snapping stays inside the tiles whether the dataset is
+    cell-centred or grid-registered.
+    """
+    inner = ETOPO_DEG_STEP / 4
+    outer = BATHY_TILE_DEG - 3 * ETOPO_DEG_STEP / 4
+    return {
+        "south": south0 + inner,
+        "north": north0 + outer,
+        "west": west0 + inner,
+        "east": east0 + outer,
+    }
 
-    west, east, south, north, stride = cache_key
-    extent = [west, east, south, north]
-    bounds = bathy_query_bounds(extent)
-    timeout = int(settings.etopo_request_timeout)
 
+def _split_into_tiles(grid: BathyGrid) -> dict[tuple[int, int], BathyGrid]:
+    lat_keys = _tile_origins(grid.latitude)
+    lon_keys = _tile_origins(grid.longitude)
+    tiles: dict[tuple[int, int], BathyGrid] = {}
+    for lat0 in np.unique(lat_keys):
+        rows = lat_keys == lat0
+        for lon0 in np.unique(lon_keys):
+            cols = lon_keys == lon0
+            tiles[(int(lat0), int(lon0))] = BathyGrid(
+                longitude=grid.longitude[cols],
+                latitude=grid.latitude[rows],
+                z=grid.z[np.ix_(rows, cols)],
+            )
+    return tiles
+
+
+def _fetch_tiles(stride: int, keys: Sequence[tuple[int, int]]) -> dict[tuple[int, int], BathyGrid]:
+    """Fetch and store missing tiles: one bbox request per side of the prime meridian.
+
+    The 0-360 query cannot wrap, hence the split. A bbox may span tiles that
+    are already cached; those are not rewritten.
+    """
+    timeout = int(settings.etopo_request_timeout)
+    groups: dict[bool, list[tuple[int, int]]] = {}
+    for key in keys:
+        groups.setdefault(key[1] < 0, []).append(key)
+
+    fetched: dict[tuple[int, int], BathyGrid] = {}
+    for group in groups.values():
+        bounds = _tile_query_bounds(
+            min(lat0 for lat0, _ in group),
+            max(lat0 for lat0, _ in group),
+            min(lon0 for _, lon0 in group),
+            max(lon0 for _, lon0 in group),
+        )
+        _tile_stats["upstream_requests"] += 1
+        try:
+            grid = _fetch_from_erddap(bounds, stride=stride, timeout=timeout)
+        except Exception as exc:
+            logger.warning("ETOPO bathymetry fetch failed for %s at stride %s: %s", bounds, stride, exc)
+            continue
+        if grid is None:
+            continue
+        pieces = _split_into_tiles(grid)
+        for key in group:
+            tile = pieces.get(key)
+            if tile is None or tile.z.size == 0:
+                continue
+            _save_tile(stride, key[0], key[1], tile)
+            fetched[key] = tile
+    _tile_stats["tiles_fetched"] += len(fetched)
+    return fetched
+
+
+def _crop_slice(axis: np.ndarray, lo: float, hi: float) -> slice:
+    """Cells within ``[lo, hi]`` plus one either side, so coarse levels still cover the edges."""
+    start = max(0, int(np.searchsorted(axis, lo, side="left")) - 1)
+    stop = min(axis.size, int(np.searchsorted(axis, hi, side="right")) + 1)
+    return slice(start, stop)
+
+
+def _assemble_tiles(stride: int, bounds: dict[str, float]) -> Optional[BathyGrid]:
+    """Mosaic the level-``stride`` tiles covering ``bounds``, fetching only missing ones."""
+    # One cell of margin: a tile's outermost cell can sit up to a cell inside its edge.
+    margin = stride * ETOPO_DEG_STEP
+    keys = tiles_for_bounds(
+        {
+            "west": bounds["west"] - margin,
+            "east": bounds["east"] + margin,
+            "south": bounds["south"] - margin,
+            "north": bounds["north"] + margin,
+        }
+    )
+    tiles: dict[tuple[int, int], BathyGrid] = {}
+    for key in keys:
+        tile = _TILE_INDEX.load(stride, key[0], key[1])
+        if tile is not None:
+            tiles[key] = tile
+    _tile_stats["tiles_reused"] += len(tiles)
+
+    missing = [key for key in keys if key not in tiles]
+    if missing:
+        tiles.update(_fetch_tiles(stride, missing))
+        missing = [key for key in keys if key not in tiles]
+        if missing:
+            logger.warning("ETOPO bathymetry tiles unavailable at stride %s: %s", stride, missing)
+            return None
+
+    lat0s = sorted({lat0 for lat0, _ in keys})
+    lon0s = sorted({lon0 for _, lon0 in keys})
     try:
-        grid = _fetch_from_erddap(bounds, stride=stride, timeout=timeout)
-    except Exception as exc:
-        logger.warning("ETOPO bathymetry fetch failed for %s: %s", cache_key, exc)
+        z = np.vstack([np.hstack([tiles[(lat0, lon0)].z for lon0 in lon0s]) for lat0 in lat0s])
+    except ValueError as exc:
+        logger.warning("ETOPO bathymetry tiles at stride %s do not line up: %s", stride, exc)
         return None
+    latitude = np.concatenate([tiles[(lat0, lon0s[0])].latitude for lat0 in lat0s])
+    longitude = np.concatenate([tiles[(lat0s[0], lon0)].longitude for lon0 in lon0s])
+
+    rows = _crop_slice(latitude, bounds["south"], bounds["north"])
+    cols = _crop_slice(longitude, bounds["west"], bounds["east"])
+    return BathyGrid(
+        longitude=np.asarray(longitude[cols], dtype=float),
+        latitude=np.asarray(latitude[rows], dtype=float),
+        z=np.asarray(z[rows, cols], dtype=float),
+    )
 
-    if grid is None:
-        return None
 
-    _save_cached_grid(cache_key, grid)
-    return grid
+@lru_cache(maxsize=32)
+def _fetch_cached(cache_key: tuple[float, float, float, float, int]) -> Optional[BathyGrid]:
+    west, east, south, north, stride = cache_key
+    return _assemble_tiles(stride, bathy_query_bounds([west, east, south, north]))
 
 
 def fetch_etopo_bathymetry(extent: List[float]) -> Optional[BathyGrid]:
@@ -249,124 +425,252 @@ def fetch_etopo_bathymetry(extent: List[float]) -> Optional[BathyGrid]:
     if not extent or len(extent) != 4:
         return None
 
-    stride = choose_stride(extent)
+    stride = pyramid_stride(choose_stride(extent))
     cache_key = _cache_key(extent, stride)
     return _fetch_cached(cache_key)
 
 
-def sample_depth_m_from_grid(grid: BathyGrid, lat: float, lon: float) -> Optional[float]:
-    """Nearest-cell water depth (positive meters) from a BathyGrid; None on land/NaN."""
-    if grid is None or grid.longitude.size == 0 or grid.latitude.size == 0:
-        return None
-    if not math.isfinite(lat) or not math.isfinite(lon):
-        return None
+def _nearest_index(axis: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Index of the nearest ``axis`` entry for each value (ties -> lower index, like argmin)."""
+    if axis.size > 1 and np.all(axis[1:] >= axis[:-1]):
+        right = np.clip(np.searchsorted(axis, values, side="left"), 1, axis.size - 1)
+        left = right - 1
+        nearest = np.where(values - axis[left] <= axis[right] - values, left, right)
+        return np.searchsorted(axis, axis[nearest], side="left")  # first of equal values
+    # Unsorted (e.g. a grid across the antimeridian after lon_to_180) or single cell.
+    return np.argmin(np.abs(axis[np.newaxis, :] - values[:, np.newaxis]), axis=1)
+
 
-    lon_idx = int(np.argmin(np.abs(grid.longitude - lon)))
-    lat_idx = int(np.argmin(np.abs(grid.latitude - lat)))
+def sample_depths_m_from_grid(grid: BathyGrid, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Vectorized ``sample_depth_m_from_grid``: positive meters, NaN on land/NaN/bad input."""
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    depths = np.full(lats.shape, np.nan)
+    if grid is None or grid.longitude.size == 0 or grid.latitude.size == 0:
+        return depths
+    valid = np.isfinite(lats) & np.isfinite(lons)
+    if not valid.any():
+        return depths
+    lon_idx = _nearest_index(np.asarray(grid.longitude, dtype=float), lons[valid])
+    lat_idx = _nearest_index(np.asarray(grid.latitude, dtype=float), lats[valid])
     try:
-        z = float(grid.z[lat_idx, lon_idx])
+        z = np.asarray(grid.z, dtype=float)[lat_idx, lon_idx]
     except (IndexError, TypeError, ValueError):
-        return None
-    if not math.isfinite(z) or z >= 0:
-        return None
-    return -z
+        return depths
+    depths[valid] = np.where(np.isfinite(z) & (z < 0), -z, np.nan)
+    return depths
 
 
-def _parse_bathy_cache_filename(path: Path) -> Optional[tuple[float, float, float, float, int]]:
-    """Parse west/east/south/north/stride from a cache filename; None if malformed."""
-    match = _CACHE_FILENAME_RE.match(path.name)
-    if not match:
-        return None
-    west, east, south, north, stride = match.groups()
-    try:
-        return float(west), float(east), float(south), float(north), int(stride)
-    except (TypeError, ValueError):
+def sample_depth_m_from_grid(grid: BathyGrid, lat: float, lon: float) -> Optional[float]:
+    """Nearest-cell water depth (positive meters) from a BathyGrid; None on land/NaN."""
+    if not math.isfinite(lat) or not math.isfinite(lon):
         return None
+    depth = float(sample_depths_m_from_grid(grid, np.array([lat]), np.array([lon]))[0])
+    return depth if math.isfinite(depth) else None
 
 
-def _point_in_bbox(lat: float, lon: float, west: float, east: float, south: float, north: float) -> bool:
-    return south <= lat <= north and west <= lon <= east
+class _TileIndex:
+    """In-memory map of cached tiles per pyramid level plus an LRU of loaded tiles.
 
+    Rebuilt from the level directories whenever the cache root or one of them
+    changes (a directory's mtime moves on every create/replace/unlink, from
+    any worker), so lookups never glob on the hot path.
+    """
 
-def _load_covering_cached_grid(lat: float, lon: float) -> Optional[BathyGrid]:
-    """Return the tightest cached report/point grid whose bbox contains (lat, lon)."""
-    root = get_bathy_cache_dir()
-    if not root.is_dir():
-        return None
-
-    candidates: list[tuple[float, float, Path]] = []
-    for path in root.glob("bathy_*.npz"):
-        parsed = _parse_bathy_cache_filename(path)
-        if parsed is None:
-            continue
-        west, east, south, north, _stride = parsed
-        if not _point_in_bbox(lat, lon, west, east, south, north):
-            continue
-        area = max(east - west, 1e-9) * max(north - south, 1e-9)
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._dir_stamp: Optional[tuple] = None
+        self._tiles: dict[tuple[int, int, int], tuple[Path, tuple[int, int]]] = {}
+        self._levels: tuple[int, ...] = ()
+        self._loaded: "OrderedDict[Path, tuple[tuple[int, int], BathyGrid]]" = OrderedDict()
+        self.rebuilds = 0
+        self.tile_hits = 0
+        self.tile_loads = 0
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._dir_stamp = None
+
+    @staticmethod
+    def _stamp() -> tuple:
+        root = get_bathy_cache_dir()
+        levels = []
+        for level in BATHY_TILE_STRIDES:
+            try:
+                levels.append((level, _tile_dir(level).stat().st_mtime_ns))
+            except OSError:
+                continue
         try:
-            mtime = path.stat().st_mtime
+            root_mtime = root.stat().st_mtime_ns
         except OSError:
-            mtime = 0.0
-        candidates.append((area, -mtime, path))
-
-    if not candidates:
-        return None
-
-    candidates.sort()  # smallest area first; then newest mtime
-    for _area, _neg_mtime, path in candidates:
+            root_mtime = -1
+        return str(root), root_mtime, tuple(levels)
+
+    def _ensure_current(self) -> None:
+        stamp = self._stamp()
+        with self._lock:
+            if stamp == self._dir_stamp:
+                return
+        tiles: dict[tuple[int, int, int], tuple[Path, tuple[int, int]]] = {}
+        for level, _mtime in stamp[2]:
+            for path in _tile_dir(level).glob("tile_*.npz"):
+                match = _TILE_FILENAME_RE.match(path.name)
+                if not match:
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                tiles[(level, int(match.group(1)), int(match.group(2)))] = (path, (st.st_mtime_ns, st.st_size))
+        with self._lock:
+            self._tiles = tiles
+            self._levels = tuple(sorted({level for level, _, _ in tiles}))
+            live = {path for path, _ in tiles.values()}
+            for stale in [p for p in self._loaded if p not in live]:
+                del self._loaded[stale]
+            self._dir_stamp = stamp
+            self.rebuilds += 1
+
+    def levels(self) -> tuple[int, ...]:
+        """Pyramid levels with at least one cached tile, finest first."""
+        self._ensure_current()
+        with self._lock:
+            return self._levels
+
+    def has(self, stride: int, lat0: int, lon0: int) -> bool:
+        with self._lock:
+            return (stride, lat0, lon0) in self._tiles
+
+    def load(self, stride: int, lat0: int, lon0: int) -> Optional[BathyGrid]:
+        """Cached tile or None; a load from disk bumps the file's mtime (LRU for purge/quota)."""
+        self._ensure_current()
+        with self._lock:
+            entry = self._tiles.get((stride, lat0, lon0))
+            if entry is None:
+                return None
+            path, identity = entry
+            cached = self._loaded.get(path)
+            if cached is not None and cached[0] == identity:
+                self._loaded.move_to_end(path)
+                self.tile_hits += 1
+                return cached[1]
+        grid = _load_grid_file(path)
+        if grid is None:
+            return None
         try:
-            data = np.load(path)
-            grid = BathyGrid(
-                longitude=data["longitude"],
-                latitude=data["latitude"],
-                z=data["z"],
-            )
+            os.utime(path)
+        except OSError:
+            pass
+        max_tiles = max(1, int(getattr(settings, "bathy_loaded_grid_cache_size", 64) or 64))
+        with self._lock:
+            self.tile_loads += 1
+            self._loaded[path] = (identity, grid)
+            self._loaded.move_to_end(path)
+            while len(self._loaded) > max_tiles:
+                self._loaded.popitem(last=False)
+        return grid
+
+    def status(self) -> dict[str, Any]:
+        self._ensure_current()
+        with self._lock:
+            per_level: dict[str, int] = {}
+            for level, _, _ in self._tiles:
+                per_level[str(level)] = per_level.get(str(level), 0) + 1
+            return {
+                "indexed_tiles": len(self._tiles),
+                "tiles_per_stride": dict(sorted(per_level.items(), key=lambda item: int(item[0]))),
+                "loaded_tiles": len(self._loaded),
+                "rebuilds": self.rebuilds,
+                "tile_hits": self.tile_hits,
+                "tile_loads": self.tile_loads,
+            }
+
+
+_TILE_INDEX = _TileIndex()
+
+
+def depths_at(lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+    """Water depth (positive meters) for each position of a track; NaN on land/unknown.
+
+    Each point is sampled from the finest cached pyramid level holding its
+    tile with a water cell there (each tile is loaded once for all its points).
+    Points left over are served by one ``fetch_etopo_bathymetry`` around all
+    of them (padded like the single-point fallback), which fetches only the
+    tiles that are missing.
+    """
+    lats = np.asarray(lats, dtype=float).reshape(-1)
+    lons = np.asarray(lons, dtype=float).reshape(-1)
+    if lats.shape != lons.shape:
+        raise ValueError("lats and lons must have the same length")
+    depths = np.full(lats.shape, np.nan)
+    pending = np.isfinite(lats) & np.isfinite(lons) & (np.abs(lats) <= 90.0) & (np.abs(lons) <= 180.0)
+    if not pending.any():
+        return depths
+
+    deg = BATHY_TILE_DEG
+    tile_lat = np.zeros(lats.shape, dtype=int)
+    tile_lon = np.zeros(lons.shape, dtype=int)
+    tile_lat[pending] = np.clip(_tile_origins(lats[pending]), -90, 90 - deg)
+    tile_lon[pending] = np.clip(_tile_origins(lons[pending]), -180, 180 - deg)
+
+    for stride in _TILE_INDEX.levels():
+        if not pending.any():
+            break
+        for lat0, lon0 in sorted(set(zip(tile_lat[pending].tolist(), tile_lon[pending].tolist()))):
+            if not _TILE_INDEX.has(stride, lat0, lon0):
+                continue
+            grid = _TILE_INDEX.load(stride, lat0, lon0)
+            if grid is None:
+                continue
+            inside = pending & (tile_lat == lat0) & (tile_lon == lon0)
+            sampled = sample_depths_m_from_grid(grid, lats[inside], lons[inside])
+            found = np.isfinite(sampled)
+            idx = np.flatnonzero(inside)[found]
+            depths[idx] = sampled[found]
+            pending[idx] = False
+
+    if pending.any():
+        half = POINT_DEPTH_HALF_WIDTH_DEG
+        extent = [
+            float(lons[pending].min()) - half,
+            float(lons[pending].max()) + half,
+            float(lats[pending].min()) - half,
+            float(lats[pending].max()) + half,
+        ]
+        try:
+            grid = fetch_etopo_bathymetry(extent)
         except Exception as exc:
-            logger.warning("Failed to load covering bathymetry cache %s: %s", path, exc)
-            continue
-        depth = sample_depth_m_from_grid(grid, lat, lon)
-        if depth is not None:
-            return grid
-    return None
+            logger.warning("ETOPO track depth fetch failed for %s: %s", extent, exc)
+            grid = None
+        if grid is not None:
+            depths[pending] = sample_depths_m_from_grid(grid, lats[pending], lons[pending])
+    return depths
 
 
 def fetch_etopo_depth_at(lat: float, lon: float) -> Optional[float]:
     """Approximate water depth (positive meters) at a point from ETOPO 2022.
 
-    Prefers an existing cached report/point grid covering the location (zero
-    network). Falls back to a tiny bbox fetch via ``fetch_etopo_bathymetry``.
+    Prefers a cached tile containing the location (zero network, finest
+    level first). Otherwise fetches the full-resolution tile around it via
+    ``fetch_etopo_bathymetry``, which later lookups nearby then reuse.
     Returns None on failure or when the nearest cell is land (z >= 0).
+    For many points use ``depths_at``.
     """
     if not math.isfinite(lat) or not math.isfinite(lon):
         return None
     if abs(lat) > 90.0 or abs(lon) > 180.0:
         return None
-
-    cached_grid = _load_covering_cached_grid(lat, lon)
-    if cached_grid is not None:
-        depth = sample_depth_m_from_grid(cached_grid, lat, lon)
-        if depth is not None:
-            return depth
-
-    half = POINT_DEPTH_HALF_WIDTH_DEG
-    extent = [lon - half, lon + half, lat - half, lat + half]
-    try:
-        grid = fetch_etopo_bathymetry(extent)
-    except Exception as exc:
-        logger.warning("ETOPO point depth fetch failed at (%s, %s): %s", lat, lon, exc)
-        return None
-    if grid is None:
-        return None
-    return sample_depth_m_from_grid(grid, lat, lon)
+    depth = float(depths_at([lat], [lon])[0])
+    return depth if math.isfinite(depth) else None
 
 
 def _iter_npz_entries() -> list[tuple[Path, float, int]]:
-    """Return (path, mtime, byte_size) for each .npz under the bathy cache dir."""
+    """Return (path, mtime, byte_size) for each tile (and legacy grid) under the bathy cache dir."""
     root = get_bathy_cache_dir()
     entries: list[tuple[Path, float, int]] = []
     if not root.is_dir():
         return entries
-    for path in root.glob("*.npz"):
+    for path in root.rglob("*.npz"):
         try:
             st = path.stat()
             entries.append((path, st.st_mtime, st.st_size))
@@ -375,6 +679,11 @@ def _iter_npz_entries() -> list[tuple[Path, float, int]]:
     return entries
 
 
+def _is_legacy_grid(path: Path) -> bool:
+    """Per-extent ``bathy_*.npz`` from before the tile pyramid (never read any more)."""
+    return path.parent == get_bathy_cache_dir() and path.name.startswith("bathy_")
+
+
 def get_bathy_cache_status() -> dict[str, Any]:
     entries = _iter_npz_entries()
     total_bytes = sum(size for _, _, size in entries)
@@ -382,16 +691,21 @@ def get_bathy_cache_status() -> dict[str, Any]:
     return {
         "cache_dir": str(get_bathy_cache_dir()),
         "response_files": len(entries),
+        "legacy_files": sum(1 for path, _, _ in entries if _is_legacy_grid(path)),
         "total_bytes": total_bytes,
         "max_bytes": max_bytes,
         "max_age_days": int(getattr(settings, "bathy_cache_max_age_days", 90)),
+        "tile_deg": BATHY_TILE_DEG,
+        "tile_strides": list(BATHY_TILE_STRIDES),
+        "index": _TILE_INDEX.status(),
+        **_tile_stats,
         "last_cleanup_at": _cleanup_stats["last_cleanup_at"],
         "last_cleanup_summary": _cleanup_stats["last_cleanup_summary"],
     }
 
 
 def enforce_bathy_cache_quota() -> dict[str, int]:
-    """Evict oldest-by-mtime .npz files until under bathy_cache_max_bytes."""
+    """Evict least recently used tiles until under bathy_cache_max_bytes."""
     max_bytes = int(getattr(settings, "bathy_cache_max_bytes", 0) or 0)
     if max_bytes <= 0:
         return {"evicted_files": 0, "freed_bytes": 0}
@@ -401,7 +715,7 @@ def enforce_bathy_cache_quota() -> dict[str, int]:
     if total <= max_bytes:
         return {"evicted_files": 0, "freed_bytes": 0}
 
-    entries.sort(key=lambda item: item[1])  # oldest mtime first
+    entries.sort(key=lambda item: item[1])  # oldest mtime (last use) first
     removed_files = 0
     freed = 0
     for path, _mtime, size in entries:
@@ -417,6 +731,7 @@ def enforce_bathy_cache_quota() -> dict[str, int]:
 
     if removed_files:
         _fetch_cached.cache_clear()
+        _TILE_INDEX.invalidate()
     return {"evicted_files": removed_files, "freed_bytes": freed}
 
 
@@ -426,25 +741,29 @@ def purge_bathy_cache(
     max_age_days: Optional[int] = None,
     enforce_quota: bool = True,
 ) -> dict[str, Any]:
-    """Remove stale (or all) bathymetry .npz cache files and optionally enforce size quota."""
+    """Remove stale (or all) bathymetry tiles and legacy grids, optionally enforce size quota."""
     if max_age_days is None:
         max_age_days = int(getattr(settings, "bathy_cache_max_age_days", 90))
     cutoff = time.time() - max(0, max_age_days) * 24 * 60 * 60
 
     removed_files = 0
     freed_bytes = 0
+    legacy_removed = 0
     for path, mtime, size in _iter_npz_entries():
-        if not force_all and mtime >= cutoff:
+        legacy = _is_legacy_grid(path)
+        if not force_all and not legacy and mtime >= cutoff:
             continue
         try:
             path.unlink()
             removed_files += 1
             freed_bytes += size
+            legacy_removed += int(legacy)
         except OSError as err:
             logger.warning("Failed to remove bathy cache file %s: %s", path, err)
 
     if removed_files:
         _fetch_cached.cache_clear()
+        _TILE_INDEX.invalidate()
 
     quota = {"evicted_files": 0, "freed_bytes": 0}
     if enforce_quota:
@@ -456,6 +775,7 @@ def purge_bathy_cache(
         "removed_files": removed_files,
         "freed_bytes": freed_bytes,
         "stale_files_removed": removed_files - quota["evicted_files"],
+        "legacy_files_removed": legacy_removed,
         "quota_evicted_files": quota["evicted_files"],
         "quota_freed_bytes": quota["freed_bytes"],
         "force_all": force_all,
@@ -474,6 +794,7 @@ def run_bathy_cache_cleanup() -> dict[str, Any]:
             "removed_files",
             "freed_bytes",
             "stale_files_removed",
+            "legacy_files_removed",
             "quota_evicted_files",
             "quota_freed_bytes",
         )
@@ -1,9 +1,14 @@
+import asyncio
 import logging  # type: ignore # Keep type: ignore if needed for your linter
+import weakref
 from datetime import datetime, timezone  # Added for fetch timestamp
 from typing import Any, Dict, Optional  # For type hinting
 
 import httpx  # Changed from requests to httpx
 
+from ...config import settings
+from . import forecast_cache
+
 logger = logging.getLogger(__name__)
 
 MARINE_API_BASE_URL = (
@@ -28,27 +33,46 @@ BACKOFF_FACTOR = 0.5  # Backoff factor for retries (delay = backoff_factor * (2
 # BACKOFF_FACTOR = 0.5
 # delay = backoff_factor * (2 ** (retry_attempt - 1))
 
+# One pooled client per event loop (keep-alive across calls; the scheduler and
+# request handlers may run on different loops).
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=RETRY_COUNT),
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=4),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose() -> None:
+    """Close this loop's pooled client (app shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 async def _fetch_forecast_data(
     api_url: str, params: Dict[str, Any]
 ) -> Optional[Dict[str, Any]]:
     """Helper function to fetch forecast data with retries."""
     try:
-        transport_config = (
-            httpx.AsyncHTTPTransport(  # Use AsyncHTTPTransport for AsyncClient
-                retries=RETRY_COUNT
-            )
+        logger.debug(
+            f"Fetching data from {api_url} with params {params} using "
+            f"{RETRY_COUNT} retries and backoff {BACKOFF_FACTOR}"
         )
-        async with httpx.AsyncClient(
-            transport=transport_config, timeout=DEFAULT_TIMEOUT
-        ) as client:
-            logger.debug(
-                f"Fetching data from {api_url} with params {params} using "
-                f"{RETRY_COUNT} retries and backoff {BACKOFF_FACTOR}"
-            )
-            response = await client.get(api_url, params=params)
-            logger.debug(f"Response status from {api_url}: {response.status_code}")
-            response.raise_for_status()
-            return response.json()
+        response = await _get_client().get(api_url, params=params)
+        logger.debug(f"Response status from {api_url}: {response.status_code}")
+        response.raise_for_status()
+        return response.json()
     except httpx.HTTPStatusError as e:
         # Specific handling for HTTP status errors (like 404) is done by the caller
         logger.warning(
@@ -67,7 +91,33 @@ async def _fetch_forecast_data(
         return None
 
 
+async def _cached_forecast(kind: str, lat: float, lon: float, fetch) -> Optional[Dict[str, Any]]:
+    """Serve ``kind`` through the grid-cell cache (``forecast_cache``), or fetch directly when disabled."""
+    if not settings.forecast_cache_enabled:
+        return await fetch(lat, lon)
+    data = await forecast_cache.get_or_fetch(kind, lat, lon, fetch)
+    if data is not None:
+        # latitude_used/longitude_used are the snapped grid point sent upstream.
+        data["latitude_requested"] = lat
+        data["longitude_requested"] = lon
+    return data
+
+
 async def get_general_meteo_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+    """General weather forecast for the ~``forecast_cache_grid_deg`` cell at lat/lon.
+
+    Served from the shared forecast cache; on upstream failure the last cached
+    forecast is returned with ``stale: true``. Returns None if neither is available.
+    """
+    return await _cached_forecast("general", lat, lon, _fetch_general_meteo_forecast)
+
+
+async def get_marine_meteo_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+    """Marine forecast (waves, currents); cached like ``get_general_meteo_forecast``."""
+    return await _cached_forecast("marine", lat, lon, _fetch_marine_meteo_forecast)
+
+
+async def _fetch_general_meteo_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     """Fetches general weather forecast data. Returns None on error."""
     final_data: Optional[Dict[str, Any]] = None
     base_api_params = {
@@ -108,7 +158,7 @@ async def get_general_meteo_forecast(lat: float, lon: float) -> Optional[Dict[st
     return final_data
 
 
-async def get_marine_meteo_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+async def _fetch_marine_meteo_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     """Fetches marine-specific forecast data. Returns None on error."""
     final_data: Optional[Dict[str, Any]] = None
     base_api_params = {
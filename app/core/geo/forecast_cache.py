@@ -0,0 +1,264 @@
+"""Shared disk cache for Open-Meteo point forecasts (general + marine).
+
+Requests are bucketed in space and time so nearby vehicles and repeated page
+loads share one upstream call:
+
+- lat/lon snap to a ``forecast_cache_grid_deg`` grid (default 0.1 deg, ~11 km),
+  and the snapped point is what Open-Meteo is asked for;
+- an entry is fresh for the model-run bucket it was fetched in (UTC time
+  floored to ``forecast_cache_run_hours``); the next bucket refetches.
+
+One JSON file per grid cell and forecast type lives under
+``forecast_cache_dir`` so every gunicorn worker shares it. Refreshes are
+single-flight: in-process via a task per cell, across workers via the cell's
+sidecar lock (other workers wait for the file instead of calling upstream).
+When upstream fails the last cached forecast for the cell is served with
+``stale: true`` and its ``age_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+from ...config import settings
+from ..utils import (
+    release_cross_process_file_lock,
+    replace_path_with_retries,
+    resolve_data_path,
+    sibling_lock_path,
+    try_cross_process_file_lock,
+    unique_sibling_tmp_path,
+    unlink_unheld_lock_file,
+)
+
+logger = logging.getLogger(__name__)
+
+Fetcher = Callable[[float, float], Awaitable[Optional[dict[str, Any]]]]
+
+_IN_FLIGHT: dict[str, asyncio.Task] = {}
+_LOCK_POLL_SECONDS = 0.1
+_stats: dict[str, Any] = {
+    "cache_hits": 0,
+    "cache_misses": 0,
+    "upstream_fetches": 0,
+    "coalesced": 0,
+    "stale_served": 0,
+    "last_error": None,
+}
+
+
+def _cache_dir() -> Path:
+    return resolve_data_path(settings.forecast_cache_dir)
+
+
+def _grid_deg() -> float:
+    return max(0.001, float(getattr(settings, "forecast_cache_grid_deg", 0.1) or 0.1))
+
+
+def _run_hours() -> int:
+    return max(1, int(getattr(settings, "forecast_cache_run_hours", 1) or 1))
+
+
+def snap_to_grid(lat: float, lon: float, step: Optional[float] = None) -> tuple[float, float]:
+    """Nearest grid point (lon wrapped to [-180, 180))."""
+    step = step or _grid_deg()
+    snapped_lat = max(-90.0, min(90.0, round(lat / step) * step))
+    snapped_lon = round(lon / step) * step
+    snapped_lon = ((snapped_lon + 180.0) % 360.0) - 180.0
+    return round(snapped_lat, 6), round(snapped_lon, 6)
+
+
+def model_run_bucket(now: Optional[datetime] = None) -> str:
+    """Start of the current model-run bucket, ISO UTC."""
+    now = now or datetime.now(timezone.utc)
+    hours = _run_hours()
+    floored = now.replace(hour=(now.hour // hours) * hours, minute=0, second=0, microsecond=0)
+    return floored.isoformat()
+
+
+def _cell_key(kind: str, lat: float, lon: float) -> str:
+    return f"{kind}/{lat:.4f}_{lon:.4f}"
+
+
+def _entry_path(cell_key: str) -> Path:
+    return _cache_dir() / f"{cell_key}.json"
+
+
+def _read_entry(path: Path) -> Optional[dict[str, Any]]:
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Failed to read forecast cache %s: %s", path, exc)
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("payload"), dict):
+        return None
+    return entry
+
+
+def _write_entry(path: Path, entry: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = unique_sibling_tmp_path(path)
+    try:
+        tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+        replace_path_with_retries(tmp_path, path)
+    except OSError as exc:
+        logger.warning("Failed to write forecast cache %s: %s", path, exc)
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _entry_age_seconds(entry: dict[str, Any]) -> Optional[float]:
+    stored_at = entry.get("stored_at")
+    if stored_at is None:
+        return None
+    return max(0.0, time.time() - float(stored_at))
+
+
+def _response(entry: dict[str, Any], *, cache_hit: bool, stale: bool, **extra: Any) -> dict[str, Any]:
+    return {
+        **entry["payload"],
+        "cache_hit": cache_hit,
+        "stale": stale,
+        "age_seconds": _entry_age_seconds(entry),
+        "model_run_bucket": entry.get("run_bucket"),
+        **extra,
+    }
+
+
+async def _refresh_cell(
+    cell_key: str, run_bucket: str, lat: float, lon: float, fetch: Fetcher
+) -> Optional[dict[str, Any]]:
+    """Fetch one cell once across workers; returns the entry now on disk (or None)."""
+    path = _entry_path(cell_key)
+    lock_path = sibling_lock_path(path)
+    deadline = time.monotonic() + float(getattr(settings, "forecast_cache_lock_wait_seconds", 30.0))
+    while True:
+        entry = _read_entry(path)
+        if entry is not None and entry.get("run_bucket") == run_bucket:
+            _stats["coalesced"] += 1  # another worker refreshed it
+            return entry
+        lock = try_cross_process_file_lock(lock_path)
+        if lock is not None or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(_LOCK_POLL_SECONDS)
+
+    try:
+        _stats["upstream_fetches"] += 1
+        payload = await fetch(lat, lon)
+        if payload is None:
+            return None
+        entry = {"run_bucket": run_bucket, "stored_at": time.time(), "payload": payload}
+        await asyncio.to_thread(_write_entry, path, entry)
+        return entry
+    finally:
+        if lock is not None:
+            release_cross_process_file_lock(lock)
+
+
+async def get_or_fetch(kind: str, lat: float, lon: float, fetch: Fetcher) -> Optional[dict[str, Any]]:
+    """Cached forecast of ``kind`` for the grid cell containing ``lat``/``lon``.
+
+    ``fetch(lat, lon)`` is called with the snapped point on a miss and must
+    return the forecast dict or ``None`` on failure (it may also raise).
+    Returns ``None`` only when upstream failed and nothing is cached for the cell.
+    """
+    grid_lat, grid_lon = snap_to_grid(lat, lon)
+    cell_key = _cell_key(kind, grid_lat, grid_lon)
+    run_bucket = model_run_bucket()
+    path = _entry_path(cell_key)
+
+    cached = _read_entry(path)
+    if cached is not None and cached.get("run_bucket") == run_bucket:
+        _stats["cache_hits"] += 1
+        return _response(cached, cache_hit=True, stale=False)
+
+    _stats["cache_misses"] += 1
+    task = _IN_FLIGHT.get(cell_key)
+    if task is None:
+        task = asyncio.create_task(_refresh_cell(cell_key, run_bucket, grid_lat, grid_lon, fetch))
+        _IN_FLIGHT[cell_key] = task
+        task.add_done_callback(lambda _: _IN_FLIGHT.pop(cell_key, None))
+    else:
+        _stats["coalesced"] += 1
+
+    error: Optional[str] = None
+    try:
+        entry = await asyncio.shield(task)
+    except Exception as exc:
+        entry = None
+        error = str(exc) or type(exc).__name__
+    if entry is not None:
+        return _response(entry, cache_hit=False, stale=False)
+
+    _stats["last_error"] = error or "upstream returned no data"
+    cached = _read_entry(path) or cached
+    if cached is None:
+        return None
+    _stats["stale_served"] += 1
+    logger.warning(
+        "Serving stale %s forecast for %s (age %.0fs) after upstream failure",
+        kind,
+        cell_key,
+        _entry_age_seconds(cached) or -1,
+    )
+    return _response(cached, cache_hit=True, stale=True, upstream_error=_stats["last_error"])
+
+
+def purge_forecast_cache(*, max_age_days: Optional[float] = None) -> dict[str, int]:
+    """Remove cells not refreshed within ``max_age_days`` (too old to serve as stale)."""
+    if max_age_days is None:
+        max_age_days = float(getattr(settings, "forecast_cache_max_age_days", 2))
+    root = _cache_dir()
+    removed = 0
+    freed = 0
+    if not root.is_dir():
+        return {"removed_files": 0, "freed_bytes": 0}
+    cutoff = time.time() - max_age_days * 86400
+    for pattern in ("*.json", "*.tmp"):
+        for path in list(root.rglob(pattern)):
+            try:
+                st = path.stat()
+                if st.st_mtime >= cutoff:
+                    continue
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+            freed += st.st_size
+    # A cell lock's mtime never moves while held; drop it only once its cell
+    # is gone and no worker holds it.
+    for lock_path in list(root.rglob("*.json.lock")):
+        if lock_path.with_name(lock_path.name[: -len(".lock")]).exists():
+            continue
+        size = unlink_unheld_lock_file(lock_path)
+        if size is None:
+            continue
+        removed += 1
+        freed += size
+    return {"removed_files": removed, "freed_bytes": freed}
+
+
+def get_cache_status() -> dict[str, Any]:
+    root = _cache_dir()
+    cells = list(root.rglob("*.json")) if root.is_dir() else []
+    lookups = _stats["cache_hits"] + _stats["cache_misses"]
+    return {
+        "cache_dir": str(root),
+        "cells": len(cells),
+        "grid_deg": _grid_deg(),
+        "run_hours": _run_hours(),
+        "current_run_bucket": model_run_bucket(),
+        "hit_rate": round(_stats["cache_hits"] / lookups, 3) if lookups else None,
+        "in_flight": len(_IN_FLIGHT),
+        **_stats,
+    }
@@ -0,0 +1,528 @@
+"""Server-side SGP4 propagation of the cached Iridium-E constellation.
+
+Replaces per-frame browser propagation of the raw TLEs:
+
+- ``satellite_positions`` returns compact lat/lon/alt arrays (one row per
+  satellite, one column per time step) for a short window; the map overlay
+  interpolates between steps.
+- ``observer_passes`` returns the next-pass summary for one position (AOS /
+  peak / LOS over the next 2 h, same rule as the old browser scan: the best
+  elevation over all satellites is >= ``MIN_ELEVATION_DEG``) plus the pass
+  windows in that horizon.
+- ``precompute_vehicle_passes`` (leader job after the TLE prefetch) does the
+  same for the last track position of every active Wave Glider mission and
+  Slocum dataset and writes ``vehicle_passes.json`` for all workers.
+
+All satellites are propagated at once with ``sgp4.api.SatrecArray``. One
+ephemeris (Earth-fixed positions over ``iridium_pass_horizon_hours`` every
+``PASS_STEP_SECONDS``) is built per TLE payload and shared by every observer;
+it and the per-observer elevation profiles are reused until the TLEs are
+refreshed (or the ephemeris no longer covers the display horizon).
+
+``sgp4`` is optional: without it ``SGP4_AVAILABLE`` is False and callers get
+``RuntimeError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import numpy as np
+
+from ...config import settings
+from ..infra.feature_toggles import is_feature_enabled
+from . import iridium_tle_cache
+
+try:
+    from sgp4.api import Satrec, SatrecArray
+
+    SGP4_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    Satrec = SatrecArray = None
+    SGP4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MIN_ELEVATION_DEG = 8.2
+PASS_STEP_SECONDS = 30
+# Map positions: linear interpolation over 60 s is within ~3 km of the orbit.
+POSITION_STEP_SECONDS = 60
+PASS_DISPLAY_HORIZON_SECONDS = 2 * 3600
+MAX_POSITION_STEPS = 721
+# Pass profiles are shared per cell (~5 km); elevation changes are negligible
+# against ~2000 km footprints.
+_OBSERVER_CELL_DEG = 0.05
+_WGS84_A_KM = 6378.137
+_WGS84_F = 1.0 / 298.257223563
+_WGS84_E2 = _WGS84_F * (2.0 - _WGS84_F)
+
+_stats: dict[str, Any] = {
+    "ephemeris_builds": 0,
+    "pass_cache_hits": 0,
+    "pass_cache_misses": 0,
+    "position_cache_hits": 0,
+    "position_cache_misses": 0,
+    "last_ephemeris_at": None,
+    "last_vehicle_precompute_at": None,
+    "last_vehicle_precompute_summary": None,
+}
+
+
+@dataclass(frozen=True)
+class _Ephemeris:
+    """Earth-fixed positions (km) of every satellite at ``start + i * step``."""
+
+    fetched_at: Optional[str]
+    norad_ids: list[Optional[int]]
+    names: list[str]
+    satrecs: Any
+    start: float
+    step: int
+    ecef: np.ndarray  # (satellites, steps, 3)
+    valid: np.ndarray  # (satellites, steps)
+
+    @property
+    def end(self) -> float:
+        return self.start + (self.ecef.shape[1] - 1) * self.step
+
+
+_EPHEMERIS: Optional[_Ephemeris] = None
+_PASS_CACHE: "OrderedDict[tuple[float, float], tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+_PASS_CACHE_MAX_ENTRIES = 512  # snapped observer cells; one profile is ~2 arrays of horizon/step samples
+_POSITION_CACHE: "OrderedDict[tuple, dict[str, Any]]" = OrderedDict()
+_build_lock = asyncio.Lock()
+
+
+def _horizon_seconds() -> int:
+    hours = float(getattr(settings, "iridium_pass_horizon_hours", 6) or 6)
+    return max(PASS_DISPLAY_HORIZON_SECONDS, int(hours * 3600))
+
+
+def _iso(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _julian(seconds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Unix seconds -> (whole, fraction) Julian date as ``SatrecArray.sgp4`` expects."""
+    days, remainder = np.divmod(np.asarray(seconds, dtype=float), 86400.0)
+    return 2440587.5 + days, remainder / 86400.0
+
+
+def _gmst_rad(jd: np.ndarray, fr: np.ndarray) -> np.ndarray:
+    """Greenwich mean sidereal time (IAU 1982, as satellite.js ``gstime``)."""
+    tut1 = (jd - 2451545.0 + fr) / 36525.0
+    seconds = (
+        -6.2e-6 * tut1**3
+        + 0.093104 * tut1**2
+        + (876600.0 * 3600.0 + 8640184.812866) * tut1
+        + 67310.54841
+    )
+    return np.mod(np.radians(seconds / 240.0), 2.0 * np.pi)
+
+
+def _teme_to_ecef(r: np.ndarray, gmst: np.ndarray) -> np.ndarray:
+    cos_g, sin_g = np.cos(gmst), np.sin(gmst)
+    x = r[..., 0] * cos_g + r[..., 1] * sin_g
+    y = -r[..., 0] * sin_g + r[..., 1] * cos_g
+    return np.stack([x, y, r[..., 2]], axis=-1)
+
+
+def _ecef_to_geodetic(ecef: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """WGS84 latitude/longitude (deg) and height (km), fixed-point iteration."""
+    x, y, z = ecef[..., 0], ecef[..., 1], ecef[..., 2]
+    p = np.hypot(x, y)
+    lat = np.arctan2(z, p * (1.0 - _WGS84_E2))
+    for _ in range(4):
+        n = _WGS84_A_KM / np.sqrt(1.0 - _WGS84_E2 * np.sin(lat) ** 2)
+        height = p / np.cos(lat) - n
+        lat = np.arctan2(z, p * (1.0 - _WGS84_E2 * n / (n + height)))
+    n = _WGS84_A_KM / np.sqrt(1.0 - _WGS84_E2 * np.sin(lat) ** 2)
+    height = p / np.cos(lat) - n
+    return np.degrees(lat), np.degrees(np.arctan2(y, x)), height
+
+
+def _observer_frame(lat: float, lon: float) -> tuple[np.ndarray, np.ndarray]:
+    """Observer ECEF position (km, sea level) and local up unit vector."""
+    phi, lam = math.radians(lat), math.radians(lon)
+    n = _WGS84_A_KM / math.sqrt(1.0 - _WGS84_E2 * math.sin(phi) ** 2)
+    position = np.array(
+        [
+            n * math.cos(phi) * math.cos(lam),
+            n * math.cos(phi) * math.sin(lam),
+            n * (1.0 - _WGS84_E2) * math.sin(phi),
+        ]
+    )
+    up = np.array([math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi)])
+    return position, up
+
+
+def _propagate(satrecs: Any, seconds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """ECEF positions (satellites, steps, 3) and validity for unix ``seconds``."""
+    jd, fr = _julian(seconds)
+    errors, r, _v = satrecs.sgp4(jd, fr)
+    valid = (errors == 0) & np.all(np.isfinite(r), axis=-1)
+    return _teme_to_ecef(r, _gmst_rad(jd, fr)), valid
+
+
+def _build_ephemeris(payload: dict[str, Any], now: float) -> _Ephemeris:
+    norad_ids: list[Optional[int]] = []
+    names: list[str] = []
+    records = []
+    for sat in payload.get("satellites") or []:
+        try:
+            record = Satrec.twoline2rv(sat["line1"], sat["line2"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if getattr(record, "error", 0):
+            continue
+        records.append(record)
+        norad_ids.append(sat.get("norad_id"))
+        names.append(sat.get("name") or f"NORAD {sat.get('norad_id')}")
+    if not records:
+        raise ValueError("No usable Iridium TLEs in cache")
+
+    satrecs = SatrecArray(records)
+    start = math.floor(now / PASS_STEP_SECONDS) * PASS_STEP_SECONDS
+    seconds = start + np.arange(0, _horizon_seconds() + 1, PASS_STEP_SECONDS, dtype=float)
+    ecef, valid = _propagate(satrecs, seconds)
+    return _Ephemeris(
+        fetched_at=payload.get("fetched_at"),
+        norad_ids=norad_ids,
+        names=names,
+        satrecs=satrecs,
+        start=float(start),
+        step=PASS_STEP_SECONDS,
+        ecef=ecef,
+        valid=valid,
+    )
+
+
+async def _current_ephemeris() -> tuple[_Ephemeris, dict[str, Any]]:
+    """Ephemeris for the cached TLEs, rebuilt on TLE refresh or when it runs out."""
+    global _EPHEMERIS
+    if not SGP4_AVAILABLE:
+        raise RuntimeError("sgp4 is not installed; server-side Iridium propagation is unavailable")
+    payload = await iridium_tle_cache.get_iridium_tles()
+
+    def usable(ephemeris: Optional[_Ephemeris]) -> bool:
+        return (
+            ephemeris is not None
+            and ephemeris.fetched_at == payload.get("fetched_at")
+            and ephemeris.end >= time.time() + PASS_DISPLAY_HORIZON_SECONDS
+        )
+
+    if not usable(_EPHEMERIS):
+        async with _build_lock:
+            if not usable(_EPHEMERIS):
+                _EPHEMERIS = await asyncio.to_thread(_build_ephemeris, payload, time.time())
+                _PASS_CACHE.clear()
+                _POSITION_CACHE.clear()
+                _stats["ephemeris_builds"] += 1
+                _stats["last_ephemeris_at"] = _iso(time.time())
+    return _EPHEMERIS, payload
+
+
+def _payload_meta(payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: payload.get(key)
+        for key in ("fetched_at", "source", "attribution", "cache_hit", "stale", "age_seconds", "rate_limit_reason")
+        if key in payload
+    }
+
+
+async def satellite_positions(*, minutes: int = 30, step_seconds: int = POSITION_STEP_SECONDS) -> dict[str, Any]:
+    """Positions of every satellite from now (floored to ``step_seconds``) for ``minutes``.
+
+    ``lat``/``lon``/``alt_km`` are lists per satellite (same order as
+    ``satellites``) with one entry per step; ``None`` where SGP4 failed.
+    """
+    ephemeris, payload = await _current_ephemeris()
+    step_seconds = max(1, int(step_seconds))
+    steps = min(MAX_POSITION_STEPS, int(max(0, minutes) * 60 // step_seconds) + 1)
+    start = math.floor(time.time() / step_seconds) * step_seconds
+    key = (ephemeris.fetched_at, start, steps, step_seconds)
+    cached = _POSITION_CACHE.get(key)
+    if cached is not None:
+        _stats["position_cache_hits"] += 1
+        return {**cached, **_payload_meta(payload)}
+    _stats["position_cache_misses"] += 1
+
+    def compute() -> dict[str, Any]:
+        seconds = start + np.arange(steps, dtype=float) * step_seconds
+        ecef, valid = _propagate(ephemeris.satrecs, seconds)
+        lat, lon, alt = _ecef_to_geodetic(ecef)
+
+        def rows(values: np.ndarray, digits: int) -> list[list[Optional[float]]]:
+            values = np.round(values, digits)
+            if valid.all():
+                return values.tolist()
+            return [
+                [v if ok else None for v, ok in zip(row, row_ok)]
+                for row, row_ok in zip(values.tolist(), valid.tolist())
+            ]
+
+        return {
+            "start_ms": int(start * 1000),
+            "step_seconds": step_seconds,
+            "steps": steps,
+            "min_elevation_deg": MIN_ELEVATION_DEG,
+            "satellites": [
+                {"norad_id": norad_id, "name": name}
+                for norad_id, name in zip(ephemeris.norad_ids, ephemeris.names)
+            ],
+            "lat": rows(lat, 2),
+            "lon": rows(lon, 2),
+            "alt_km": rows(alt, 0),
+        }
+
+    result = await asyncio.to_thread(compute)
+    _POSITION_CACHE[key] = result
+    while len(_POSITION_CACHE) > 8:
+        _POSITION_CACHE.popitem(last=False)
+    return {**result, **_payload_meta(payload)}
+
+
+def _snap_observer(lat: float, lon: float) -> tuple[float, float]:
+    step = _OBSERVER_CELL_DEG
+    return round(round(lat / step) * step, 4), round(round(lon / step) * step, 4)
+
+
+def _elevation_profile(ephemeris: _Ephemeris, lat: float, lon: float) -> tuple[np.ndarray, np.ndarray]:
+    """Best elevation (deg) over all satellites and which satellite, per ephemeris step."""
+    position, up = _observer_frame(lat, lon)
+    rng = ephemeris.ecef - position
+    sin_elev = np.einsum("ijk,k->ij", rng, up) / np.linalg.norm(rng, axis=-1)
+    elevation = np.degrees(np.arcsin(np.clip(sin_elev, -1.0, 1.0)))
+    elevation[~ephemeris.valid] = -90.0
+    best_sat = np.argmax(elevation, axis=0)
+    return elevation[best_sat, np.arange(elevation.shape[1])], best_sat
+
+
+def _summarize(
+    ephemeris: _Ephemeris,
+    best: np.ndarray,
+    best_sat: np.ndarray,
+    now: float,
+    horizon_seconds: int,
+) -> dict[str, Any]:
+    """Next pass and pass windows from ``now`` (mirrors the map's former browser scan)."""
+    first = min(best.size - 1, max(0, int(math.ceil((now - ephemeris.start) / ephemeris.step))))
+    last = min(best.size - 1, first + horizon_seconds // ephemeris.step)
+    elev = best[first : last + 1]
+    sats = best_sat[first : last + 1]
+    times = ephemeris.start + (first + np.arange(elev.size)) * ephemeris.step
+    in_view = elev >= MIN_ELEVATION_DEG
+
+    windows = []
+    edges = np.diff(np.concatenate(([0], in_view.astype(np.int8), [0])))
+    for aos, end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+        peak = aos + int(np.argmax(elev[aos:end]))
+        windows.append(
+            {
+                "aos_time": _iso(times[aos]),
+                "los_time": _iso(times[end - 1]),
+                "peak_time": _iso(times[peak]),
+                "peak_elevation_deg": round(float(elev[peak]), 1),
+                "aos_satellite": ephemeris.names[int(sats[aos])],
+                "peak_satellite": ephemeris.names[int(sats[peak])],
+            }
+        )
+
+    summary: dict[str, Any] = {
+        "currently_in_view": bool(in_view[0]) if in_view.size else False,
+        "none_in_horizon": not windows,
+        "horizon_seconds": int(times[-1] - times[0]) if times.size else 0,
+        "step_seconds": ephemeris.step,
+        "min_elevation_deg": MIN_ELEVATION_DEG,
+        "tle_fetched_at": ephemeris.fetched_at,
+        "windows": windows,
+    }
+    if windows:
+        nxt = windows[0]
+        aos_seconds = datetime.fromisoformat(nxt["aos_time"].replace("Z", "+00:00")).timestamp()
+        summary.update(
+            {
+                "aos_time": nxt["aos_time"],
+                "aos_satellite": nxt["aos_satellite"],
+                "peak_time": nxt["peak_time"],
+                "peak_elevation_deg": nxt["peak_elevation_deg"],
+                "peak_satellite": nxt["peak_satellite"],
+                "los_time": nxt["los_time"],
+                "gap_seconds": 0.0 if summary["currently_in_view"] else max(0.0, aos_seconds - now),
+            }
+        )
+    return summary
+
+
+def _pass_profile(ephemeris: _Ephemeris, key: tuple[float, float]) -> tuple[np.ndarray, np.ndarray]:
+    """Elevation profile for a snapped observer cell, LRU-cached per ephemeris."""
+    profile = _PASS_CACHE.get(key)
+    if profile is not None:
+        _stats["pass_cache_hits"] += 1
+        _PASS_CACHE.move_to_end(key)
+        return profile
+    _stats["pass_cache_misses"] += 1
+    profile = _elevation_profile(ephemeris, *key)
+    _PASS_CACHE[key] = profile
+    while len(_PASS_CACHE) > _PASS_CACHE_MAX_ENTRIES:
+        _PASS_CACHE.popitem(last=False)
+    return profile
+
+
+async def observer_passes(
+    lat: float,
+    lon: float,
+    *,
+    horizon_seconds: int = PASS_DISPLAY_HORIZON_SECONDS,
+) -> dict[str, Any]:
+    """Next-pass summary and pass windows for a position over ``horizon_seconds``."""
+    if not (math.isfinite(lat) and math.isfinite(lon) and abs(lat) <= 90.0 and abs(lon) <= 180.0):
+        raise ValueError("lat/lon out of range")
+    ephemeris, payload = await _current_ephemeris()
+    profile = _pass_profile(ephemeris, _snap_observer(lat, lon))
+    horizon_seconds = max(ephemeris.step, min(int(horizon_seconds), _horizon_seconds()))
+    summary = _summarize(ephemeris, profile[0], profile[1], time.time(), horizon_seconds)
+    return {"lat": lat, "lon": lon, **summary, **_payload_meta(payload)}
+
+
+def _last_position(df: Any) -> Optional[dict[str, Any]]:
+    if df is None or df.empty or not {"Latitude", "Longitude"}.issubset(df.columns):
+        return None
+    valid = df.dropna(subset=["Latitude", "Longitude"])
+    if "Timestamp" in valid.columns:
+        valid = valid.sort_values("Timestamp")
+    if valid.empty:
+        return None
+    row = valid.iloc[-1]
+    timestamp = row.get("Timestamp")
+    return {
+        "lat": float(row["Latitude"]),
+        "lon": float(row["Longitude"]),
+        "position_time": timestamp.isoformat() if hasattr(timestamp, "isoformat") else None,
+    }
+
+
+async def _active_vehicle_positions() -> list[dict[str, Any]]:
+    """Last track sample of every active Wave Glider mission and Slocum dataset."""
+    from ..data.data_service import get_data_service
+    from ..data.processors import preprocess_telemetry_df
+
+    vehicles: list[dict[str, Any]] = []
+    data_service = get_data_service()
+    for mission_id in [m.strip() for m in settings.active_realtime_missions if m and m.strip()]:
+        try:
+            df, _, _ = await data_service.load("telemetry", mission_id, hours_back=24)
+            position = _last_position(preprocess_telemetry_df(df) if df is not None and not df.empty else None)
+        except Exception as exc:
+            logger.warning("Iridium passes: no position for mission %s: %s", mission_id, exc)
+            continue
+        if position:
+            vehicles.append({"id": mission_id, "platform": "wave_glider", **position})
+
+    if is_feature_enabled("slocum_platform"):
+        from ..slocum_cache_service import get_cached_or_fetch_dashboard_df, parse_slocum_time_window
+        from ..slocum_mirror_service import dashboard_df_to_track_df
+
+        for dataset_id in [d.strip() for d in settings.active_slocum_datasets if d and d.strip()]:
+            try:
+                time_start, time_end, _ = parse_slocum_time_window(dataset_id, 24, False, None, None)
+                df = await get_cached_or_fetch_dashboard_df(dataset_id, time_start, time_end, hours_back=24)
+                position = _last_position(dashboard_df_to_track_df(df) if df is not None else None)
+            except Exception as exc:
+                logger.warning("Iridium passes: no position for Slocum dataset %s: %s", dataset_id, exc)
+                continue
+            if position:
+                vehicles.append({"id": dataset_id, "platform": "slocum", **position})
+    return vehicles
+
+
+async def precompute_vehicle_passes() -> dict[str, Any]:
+    """Leader job: pass windows for active vehicles, written to ``vehicle_passes.json``.
+
+    Each vehicle entry carries the full ephemeris horizon of windows so any
+    worker can derive the current next-pass summary until the next refresh.
+    """
+    if not is_feature_enabled("iridium_map_layer"):
+        return {"skipped": True, "reason": "feature_disabled"}
+    if not SGP4_AVAILABLE:
+        return {"skipped": True, "reason": "sgp4_unavailable"}
+
+    ephemeris, _payload = await _current_ephemeris()
+    now = time.time()
+    vehicles = []
+    for vehicle in await _active_vehicle_positions():
+        profile = _pass_profile(ephemeris, _snap_observer(vehicle["lat"], vehicle["lon"]))
+        horizon = int(ephemeris.end - now)
+        summary = _summarize(ephemeris, profile[0], profile[1], now, horizon)
+        vehicles.append({**vehicle, "windows": summary["windows"]})
+
+    document = {
+        "computed_at": _iso(now),
+        "tle_fetched_at": ephemeris.fetched_at,
+        "valid_until": _iso(ephemeris.end),
+        "min_elevation_deg": MIN_ELEVATION_DEG,
+        "vehicles": vehicles,
+    }
+    iridium_tle_cache.write_vehicle_passes(document)
+    summary = {"skipped": False, "vehicles": len(vehicles), "valid_until": document["valid_until"]}
+    _stats["last_vehicle_precompute_at"] = document["computed_at"]
+    _stats["last_vehicle_precompute_summary"] = summary
+    return summary
+
+
+def vehicle_next_passes(*, horizon_seconds: int = PASS_DISPLAY_HORIZON_SECONDS) -> dict[str, Any]:
+    """Next-pass summary per active vehicle from the precomputed windows (no propagation)."""
+    document = iridium_tle_cache.read_vehicle_passes()
+    if document is None:
+        return {"computed_at": None, "vehicles": []}
+    now = time.time()
+    limit = now + horizon_seconds
+    vehicles = []
+    for vehicle in document.get("vehicles") or []:
+        windows = [
+            w
+            for w in vehicle.get("windows") or []
+            if _parse_ts(w["los_time"]) >= now and _parse_ts(w["aos_time"]) <= limit
+        ]
+        entry = {k: v for k, v in vehicle.items() if k != "windows"}
+        if windows:
+            nxt = windows[0]
+            in_view = _parse_ts(nxt["aos_time"]) <= now
+            entry["next_pass"] = {
+                **nxt,
+                "currently_in_view": in_view,
+                "gap_seconds": 0.0 if in_view else _parse_ts(nxt["aos_time"]) - now,
+            }
+        else:
+            entry["next_pass"] = None
+        entry["windows"] = windows
+        vehicles.append(entry)
+    valid_until = document.get("valid_until")
+    return {
+        **{k: v for k, v in document.items() if k != "vehicles"},
+        "expired": bool(valid_until) and _parse_ts(valid_until) < limit,
+        "vehicles": vehicles,
+    }
+
+
+def _parse_ts(value: str) -> float:
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def get_status() -> dict[str, Any]:
+    ephemeris = _EPHEMERIS
+    return {
+        "sgp4_available": SGP4_AVAILABLE,
+        "ephemeris_tle_fetched_at": ephemeris.fetched_at if ephemeris else None,
+        "ephemeris_satellites": len(ephemeris.names) if ephemeris else 0,
+        "ephemeris_valid_until": _iso(ephemeris.end) if ephemeris else None,
+        "cached_observers": len(_PASS_CACHE),
+        **_stats,
+    }
@@ -80,6 +80,11 @@ def _rate_limit_path() -> Path:
     return _cache_dir() / "upstream_rate_limit.json"
 
 
+def vehicle_passes_path() -> Path:
+    """Per-vehicle pass windows written by ``iridium_passes.precompute_vehicle_passes``."""
+    return _cache_dir() / "vehicle_passes.json"
+
+
 def _ensure_cache_dir() -> None:
     _cache_dir().mkdir(parents=True, exist_ok=True)
 
@@ -438,10 +443,21 @@ def _record_upstream_result(*, ok: bool, error: Optional[str] = None, source_url
         logger.warning("Iridium rate-limit result write failed: %s", exc)
 
 
-def _write_payload(payload: dict[str, Any]) -> None:
+def write_tle_payload(payload: dict[str, Any]) -> None:
+    """Replace the cached TLE payload (``{"fetched_at", "source", "satellites"}``)."""
     _atomic_write_json(_tles_path(), payload)
 
 
+def read_vehicle_passes() -> Optional[dict[str, Any]]:
+    """Precomputed per-vehicle pass document, or None when missing or unreadable."""
+    return _read_json_file(vehicle_passes_path())
+
+
+def write_vehicle_passes(document: dict[str, Any]) -> None:
+    """Atomically replace the precomputed per-vehicle pass document."""
+    _atomic_write_json(vehicle_passes_path(), document)
+
+
 async def _fetch_upstream_tles() -> dict[str, Any]:
     """Perform at most one primary JSON request (TLE only if JSON fails)."""
     _stats["upstream_fetches"] += 1
@@ -487,7 +503,7 @@ async def _fetch_upstream_tles() -> dict[str, Any]:
         "satellites": satellites,
     }
     try:
-        _write_payload(payload)
+        write_tle_payload(payload)
     except OSError as exc:
         logger.warning(
             "Iridium TLE disk write failed after upstream fetch (%s); serving in-memory payload",
@@ -627,7 +643,7 @@ def purge_iridium_cache(*, force_all: bool = False) -> dict[str, Any]:
     _ensure_cache_dir()
     removed_files = 0
     freed_bytes = 0
-    paths = [_tles_path(), _rate_limit_path()]
+    paths = [_tles_path(), _rate_limit_path(), vehicle_passes_path()]
     max_age_seconds = _cleanup_max_age_days() * 86400
     feature_on = is_feature_enabled("iridium_map_layer")
 
@@ -1,4 +1,26 @@
-"""Open-Meteo weather map layer disk cache, prefetch, and fetch-through proxy."""
+"""Open-Meteo weather map layer disk cache, prefetch, and fetch-through proxy.
+
+Cached ``.om`` bodies are served through an in-process hot tier: each entry
+holds the parsed meta and a read-only ``mmap`` of the body, so the many small
+Range requests a browser issues per map pan are answered by slicing only the
+requested bytes. The tier is LRU, bounded by ``weather_map_hot_cache_max_bytes``
+(mapped bytes) and ``weather_map_hot_cache_max_entries`` (which also covers
+bodies kept unmapped). Entries are revalidated with one ``stat`` per hit, so a
+body rewritten or evicted by another worker is remapped or dropped. Bodies are
+written via temp file + atomic replace, never truncated in place, which keeps
+live mappings in other workers valid. Where mapping is not possible (or on
+Windows, where a mapping would block eviction) ranges are read with
+``os.pread`` / seek+read instead.
+
+Cache misses are downloaded once per object, not once per request: every GET
+for an object (any range) joins one in-process ``_Download``, and across
+workers the sidecar ``<key>.body.lock`` (held for the whole download, released
+by the OS if the worker dies) elects a single downloader. The body is streamed
+to ``<key>.body.part`` and replaced into place when complete; waiting range
+requests - in the downloading worker or any other - are answered from the
+partial file as soon as their last byte has arrived. Other workers follow the
+partial file's size and take over if its writer stalls.
+"""
 
 from __future__ import annotations
 
@@ -7,9 +29,12 @@ import hashlib
 import json
 import logging
 import math
+import mmap
 import os
 import re
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -22,6 +47,14 @@ from ..data.data_service import get_data_service
 from ..data.processors import preprocess_telemetry_df
 from ..geo.map_utils import get_track_bounds, prepare_track_points
 from ..infra.feature_toggles import is_feature_enabled
+from ..utils import (
+    release_cross_process_file_lock,
+    replace_path_with_retries,
+    sibling_lock_path,
+    try_cross_process_file_lock,
+    unique_sibling_tmp_path,
+    unlink_unheld_lock_file,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,14 +64,18 @@ LATEST_JSON_PATH = "data_spatial/dwd_icon/latest.json"
 WIND_VARIABLE = "wind_u_component_10m"
 FALLBACK_BOUNDS = [-78.0, 36.0, -70.0, 44.0]  # west, south, east, north
 
-_IN_FLIGHT: dict[str, asyncio.Task] = {}
+_IN_FLIGHT: dict[str, asyncio.Task] = {}  # HEAD requests (GETs coalesce in _DOWNLOADS)
 # Short-lived negative cache so Leaflet tile HEAD storms do not re-hit Open-Meteo on known 404s.
 _NEGATIVE_UPSTREAM: dict[str, float] = {}
 _NEGATIVE_UPSTREAM_TTL_SECONDS = 120.0
 _stats = {
     "cache_hits": 0,
     "cache_misses": 0,
+    "hot_hits": 0,
+    "hot_misses": 0,
     "upstream_fetches": 0,
+    "download_joins": 0,
+    "download_follows": 0,
     "last_prefetch_at": None,
     "last_prefetch_summary": None,
     "last_cleanup_at": None,
@@ -54,6 +91,10 @@ def _manifest_path() -> Path:
     return _cache_dir() / "manifest.json"
 
 
+def _prefetch_progress_path() -> Path:
+    return _cache_dir() / "prefetch_progress.json"
+
+
 def _response_cache_dir() -> Path:
     return _cache_dir() / "responses"
 
@@ -166,24 +207,179 @@ def _make_cache_key(upstream_url: str, range_header: Optional[str]) -> str:
     return hashlib.sha256(material.encode("utf-8")).hexdigest()
 
 
-def _read_cache_entry(cache_key: str) -> Optional[tuple[dict[str, Any], bytes]]:
+def _read_file_range(path: Path, start: int, end: int) -> bytes:
+    """Bytes ``start``..``end`` inclusive (short if the file is shorter)."""
+    length = end - start + 1
+    with path.open("rb") as handle:
+        if hasattr(os, "pread"):
+            return os.pread(handle.fileno(), length, start)
+        handle.seek(start)
+        return handle.read(length)
+
+
+# Keep mappings only where an open mapping does not block unlink/replace.
+_MMAP_BODIES = os.name == "posix"
+
+
+def _file_identity(st: os.stat_result) -> tuple[int, int, int]:
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+class _CachedBody:
+    """Parsed meta plus random access to one cached ``.body`` file."""
+
+    __slots__ = ("meta", "size", "identity", "_path", "_mm")
+
+    def __init__(self, meta: dict[str, Any], body_path: Path, st: os.stat_result):
+        self.meta = meta
+        self.size = st.st_size
+        self.identity = _file_identity(st)
+        self._path = body_path
+        self._mm: Optional[mmap.mmap] = None
+        if _MMAP_BODIES and self.size > 0:
+            try:
+                with body_path.open("rb") as handle:
+                    self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._mm = None
+
+    @property
+    def mapped_bytes(self) -> int:
+        return self.size if self._mm is not None else 0
+
+    def read(self, start: int, end: int) -> bytes:
+        """Bytes ``start``..``end`` inclusive."""
+        if self._mm is not None:
+            return self._mm[start : end + 1]
+        return _read_file_range(self._path, start, end)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+class _HotTier:
+    """LRU of ``_CachedBody`` entries bounded by mapped bytes and entry count."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _CachedBody]" = OrderedDict()
+        self._mapped_bytes = 0
+
+    @staticmethod
+    def _max_bytes() -> int:
+        return max(0, int(getattr(settings, "weather_map_hot_cache_max_bytes", 0) or 0))
+
+    @staticmethod
+    def _max_entries() -> int:
+        return max(1, int(getattr(settings, "weather_map_hot_cache_max_entries", 0) or 0))
+
+    def _over_budget(self) -> bool:
+        return self._mapped_bytes > self._max_bytes() or len(self._entries) > self._max_entries()
+
+    def get(self, cache_key: str, body_path: Path) -> Optional[_CachedBody]:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+        if entry is None:
+            return None
+        try:
+            identity = _file_identity(body_path.stat())
+        except OSError:
+            identity = None
+        if identity != entry.identity:
+            self.discard(cache_key)
+            return None
+        with self._lock:
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+        return entry
+
+    def put(self, cache_key: str, entry: _CachedBody) -> None:
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._mapped_bytes -= previous.mapped_bytes
+                previous.close()
+            if entry.mapped_bytes > self._max_bytes():
+                entry.close()  # too big to keep mapped; still served via pread
+            self._entries[cache_key] = entry
+            self._mapped_bytes += entry.mapped_bytes
+            over_budget = self._over_budget()
+        if not over_budget:
+            return
+        # Only when evicting: drop entries whose file is already gone first,
+        # so they don't push live ones out.
+        self._prune_missing()
+        with self._lock:
+            while self._over_budget() and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._mapped_bytes -= evicted.mapped_bytes
+                evicted.close()
+
+    def discard(self, cache_key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(cache_key, None)
+            if entry is not None:
+                self._mapped_bytes -= entry.mapped_bytes
+                entry.close()
+
+    def _prune_missing(self) -> None:
+        """Unmap entries whose file was deleted (e.g. by another worker's quota run)."""
+        with self._lock:
+            entries = list(self._entries.items())
+        for cache_key, entry in entries:
+            if not entry._path.exists():
+                self.discard(cache_key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                entry.close()
+            self._entries.clear()
+            self._mapped_bytes = 0
+
+    def status(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries(),
+                "mapped_bytes": self._mapped_bytes,
+                "max_bytes": self._max_bytes(),
+            }
+
+
+_HOT_TIER = _HotTier()
+
+
+def _open_cache_entry(cache_key: str) -> Optional[_CachedBody]:
+    """Hot-tier entry for ``cache_key``, loading meta + mapping the body on a hot miss."""
     meta_path, body_path = _cache_entry_paths(cache_key)
-    if not meta_path.is_file() or not body_path.is_file():
-        return None
+    entry = _HOT_TIER.get(cache_key, body_path)
+    if entry is not None:
+        _stats["hot_hits"] += 1
+        return entry
     try:
         meta = json.loads(meta_path.read_text(encoding="utf-8"))
-        body = body_path.read_bytes()
-        return meta, body
+        entry = _CachedBody(meta, body_path, body_path.stat())
     except (OSError, json.JSONDecodeError):
         return None
+    _stats["hot_misses"] += 1
+    _HOT_TIER.put(cache_key, entry)
+    return entry
 
 
-def _write_cache_entry(cache_key: str, meta: dict[str, Any], body: bytes) -> None:
-    _ensure_cache_dirs()
-    meta_path, body_path = _cache_entry_paths(cache_key)
-    meta_path.parent.mkdir(parents=True, exist_ok=True)
-    meta_path.write_text(json.dumps(meta), encoding="utf-8")
-    body_path.write_bytes(body)
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp_path = unique_sibling_tmp_path(path)
+    try:
+        tmp_path.write_bytes(data)
+        replace_path_with_retries(tmp_path, path)
+    except Exception:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        raise
 
 
 def _parse_range_header(range_header: str, total_size: int) -> Optional[tuple[int, int]]:
@@ -198,32 +394,34 @@ def _parse_range_header(range_header: str, total_size: int) -> Optional[tuple[in
     return start, end
 
 
-def _slice_cached_body(
-    body: bytes,
-    range_header: Optional[str],
-    meta: dict[str, Any],
-) -> tuple[int, bytes, dict[str, str]]:
+def _cached_headers(meta: dict[str, Any]) -> dict[str, str]:
     headers = {
         "Content-Type": meta.get("content_type", "application/octet-stream"),
         "Accept-Ranges": "bytes",
+        "Cache-Control": "public, max-age=3600",
     }
     if meta.get("etag"):
         headers["ETag"] = meta["etag"]
-    if not range_header:
-        headers["Cache-Control"] = "public, max-age=3600"
-        return 200, body, headers
+    return headers
+
 
-    parsed = _parse_range_header(range_header, len(body))
+def _serve_cached_entry(
+    entry: _CachedBody,
+    range_header: Optional[str],
+    *,
+    head_only: bool = False,
+) -> tuple[int, bytes, dict[str, str]]:
+    """Status, body and headers for a cached entry; reads only the requested range (mmap/pread)."""
+    headers = _cached_headers(entry.meta)
+    parsed = _parse_range_header(range_header, entry.size) if range_header else None
     if parsed is None:
-        headers["Cache-Control"] = "public, max-age=3600"
+        headers["Content-Length"] = str(entry.size)
+        body = b"" if head_only or entry.size == 0 else entry.read(0, entry.size - 1)
         return 200, body, headers
-
     start, end = parsed
-    chunk = body[start : end + 1]
-    headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
-    headers["Content-Length"] = str(len(chunk))
-    headers["Cache-Control"] = "public, max-age=3600"
-    return 206, chunk, headers
+    headers["Content-Range"] = f"bytes {start}-{end}/{entry.size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return 206, b"" if head_only else entry.read(start, end), headers
 
 
 async def compute_union_mission_bbox() -> list[float]:
@@ -453,34 +651,242 @@ def _negative_cache_set(upstream_url: str) -> None:
     _NEGATIVE_UPSTREAM[upstream_url] = time.monotonic() + _NEGATIVE_UPSTREAM_TTL_SECONDS
 
 
-async def _fetch_upstream(
-    upstream_url: str,
-    range_header: Optional[str],
-    *,
-    head_only: bool = False,
-) -> tuple[int, bytes, dict[str, str]]:
-    headers: dict[str, str] = {}
-    if range_header:
-        headers["Range"] = range_header
+def _negative_cache_error(upstream_url: str, method: str) -> httpx.HTTPStatusError:
+    request = httpx.Request(method, upstream_url)
+    response = httpx.Response(404, request=request)
+    return httpx.HTTPStatusError("Cached upstream 404", request=request, response=response)
+
 
+async def _fetch_upstream_head(upstream_url: str) -> tuple[int, bytes, dict[str, str]]:
     if _negative_cache_get(upstream_url):
-        request = httpx.Request("HEAD" if head_only else "GET", upstream_url)
-        response = httpx.Response(404, request=request)
-        raise httpx.HTTPStatusError("Cached upstream 404", request=request, response=response)
+        raise _negative_cache_error(upstream_url, "HEAD")
 
     async with httpx.AsyncClient(timeout=60.0) as client:
-        if head_only:
-            response = await client.head(upstream_url, headers=headers)
-        else:
-            response = await client.get(upstream_url, headers=headers)
+        response = await client.head(upstream_url)
         if response.status_code == 404:
             _negative_cache_set(upstream_url)
         response.raise_for_status()
-        out_headers = _response_headers_from_upstream(response)
-        body = b"" if head_only else response.content
-        if not head_only and "Content-Length" not in out_headers and body:
-            out_headers["Content-Length"] = str(len(body))
-        return response.status_code, body, out_headers
+        return response.status_code, b"", _response_headers_from_upstream(response)
+
+
+_DOWNLOAD_CHUNK_BYTES = 256 * 1024
+_FOLLOW_POLL_SECONDS = 0.05
+
+
+def _download_stall_seconds() -> float:
+    return max(1.0, float(getattr(settings, "weather_map_download_stall_seconds", 30.0) or 30.0))
+
+
+def _partial_paths(cache_key: str) -> tuple[Path, Path, Path]:
+    """(lock, partial body, partial meta) paths for an object being downloaded."""
+    _, body_path = _cache_entry_paths(cache_key)
+    return (
+        sibling_lock_path(body_path),
+        body_path.with_name(f"{body_path.name}.part"),
+        body_path.with_name(f"{cache_key}.part.json"),
+    )
+
+
+class _Download:
+    """One full-object GET shared by every request for that object in this worker.
+
+    ``serve`` answers a request from the finished cache entry, or earlier from
+    the partial body once the requested range is on disk.
+    """
+
+    def __init__(self, upstream_url: str, cache_key: str):
+        self.upstream_url = upstream_url
+        self.cache_key = cache_key
+        self.lock_path, self.part_path, self.info_path = _partial_paths(cache_key)
+        self.meta: Optional[dict[str, Any]] = None
+        self.total: Optional[int] = None  # object size, when announced up front
+        self.available = 0  # bytes of the partial body on disk
+        self.entry: Optional[_CachedBody] = None
+        self.passthrough: Optional[tuple[int, bytes, dict[str, str]]] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self._changed = asyncio.Condition()
+        self.task = asyncio.create_task(self._run())
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def _run(self) -> None:
+        try:
+            await self._download_or_follow()
+            if self.entry is None and self.passthrough is None:
+                raise RuntimeError(f"Weather map download ended without a body: {self.upstream_url}")
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.done = True
+            if _DOWNLOADS.get(self.cache_key) is self:
+                del _DOWNLOADS[self.cache_key]
+            await self._notify()
+
+    async def _download_or_follow(self) -> None:
+        followed = False
+        last_size = -1
+        last_progress = time.monotonic()
+        while True:
+            self.entry = _open_cache_entry(self.cache_key)
+            if self.entry is not None:
+                return
+            lock = try_cross_process_file_lock(self.lock_path)
+            if lock is not None:
+                try:
+                    # Another worker may have finished between the two checks.
+                    self.entry = _open_cache_entry(self.cache_key)
+                    if self.entry is None:
+                        await self._fetch(self.part_path, shared=True)
+                finally:
+                    release_cross_process_file_lock(lock)
+                return
+
+            # Another worker is downloading this object: follow its partial body.
+            if not followed:
+                followed = True
+                _stats["download_follows"] += 1
+            size = self._poll_partial()
+            now = time.monotonic()
+            if size != last_size:
+                last_size = size
+                last_progress = now
+                await self._notify()
+            elif now - last_progress > _download_stall_seconds():
+                logger.warning(
+                    "Weather map download of %s stalled in another worker; fetching directly",
+                    self.upstream_url,
+                )
+                _, body_path = _cache_entry_paths(self.cache_key)
+                await self._fetch(unique_sibling_tmp_path(body_path), shared=False)
+                return
+            await asyncio.sleep(_FOLLOW_POLL_SECONDS)
+
+    def _poll_partial(self) -> int:
+        """Pick up the downloading worker's progress; returns bytes on disk (-1 if none)."""
+        if self.meta is None:
+            try:
+                info = json.loads(self.info_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return -1
+            self.total = info.pop("size", None)
+            self.meta = info
+        try:
+            self.available = self.part_path.stat().st_size
+        except OSError:
+            self.available = 0
+            return -1
+        return self.available
+
+    async def _fetch(self, target_path: Path, *, shared: bool) -> None:
+        """Stream the object to ``target_path`` and move it into the cache."""
+        if _negative_cache_get(self.upstream_url):
+            raise _negative_cache_error(self.upstream_url, "GET")
+        _ensure_cache_dirs()
+        meta_path, body_path = _cache_entry_paths(self.cache_key)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        if shared:
+            self.info_path.unlink(missing_ok=True)  # left behind by a worker that died
+        self.meta, self.total, self.available = None, None, 0
+        self.part_path = target_path
+        _stats["upstream_fetches"] += 1
+        try:
+            async with httpx.AsyncClient(timeout=60.0) as client:
+                async with client.stream("GET", self.upstream_url) as response:
+                    if response.status_code == 404:
+                        _negative_cache_set(self.upstream_url)
+                    if response.status_code != 200:
+                        body = await response.aread()
+                        response.raise_for_status()
+                        headers = _response_headers_from_upstream(response)
+                        headers["Cache-Control"] = "public, max-age=3600"
+                        self.passthrough = (response.status_code, body, headers)
+                        return
+
+                    meta = {
+                        "upstream_url": self.upstream_url,
+                        "content_type": response.headers.get("content-type", "application/octet-stream"),
+                        "etag": response.headers.get("etag"),
+                        "status_code": 200,
+                    }
+                    encoded = response.headers.get("content-encoding", "identity") != "identity"
+                    length = response.headers.get("content-length")
+                    total = int(length) if length and length.isdigit() and not encoded else None
+                    if shared:
+                        _atomic_write(self.info_path, json.dumps({**meta, "size": total}).encode("utf-8"))
+                    self.meta, self.total = meta, total
+
+                    with target_path.open("wb", buffering=0) as handle:
+                        async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_BYTES):
+                            handle.write(chunk)
+                            self.available += len(chunk)
+                            await self._notify()
+
+            if not self.available:
+                headers = _cached_headers(meta)
+                headers["Content-Length"] = "0"
+                self.passthrough = (200, b"", headers)
+                return
+            meta["cached_at"] = datetime.now(timezone.utc).isoformat()
+            _HOT_TIER.discard(self.cache_key)
+            replace_path_with_retries(target_path, body_path)
+            _atomic_write(meta_path, json.dumps(meta).encode("utf-8"))
+            self.entry = _open_cache_entry(self.cache_key)
+        finally:
+            for path in (target_path, self.info_path) if shared else (target_path,):
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+    def _serve_partial(self, range_header: Optional[str]) -> Optional[tuple[int, bytes, dict[str, str]]]:
+        """206 for ``range_header`` if all of its bytes are already on disk."""
+        if self.meta is None or self.total is None or not range_header:
+            return None
+        parsed = _parse_range_header(range_header, self.total)
+        if parsed is None or parsed[1] >= self.available:
+            return None
+        start, end = parsed
+        try:
+            chunk = _read_file_range(self.part_path, start, end)
+        except OSError:
+            return None  # renamed into place meanwhile; served from the entry next
+        if len(chunk) != end - start + 1:
+            return None
+        headers = _cached_headers(self.meta)
+        headers["Content-Range"] = f"bytes {start}-{end}/{self.total}"
+        headers["Content-Length"] = str(len(chunk))
+        return 206, chunk, headers
+
+    async def serve(self, range_header: Optional[str]) -> tuple[int, bytes, dict[str, str]]:
+        async with self._changed:
+            while True:
+                if self.entry is not None:
+                    return _serve_cached_entry(self.entry, range_header)
+                if self.passthrough is not None:
+                    status, body, headers = self.passthrough
+                    return status, body, dict(headers)
+                if self.error is not None:
+                    raise self.error
+                early = self._serve_partial(range_header)
+                if early is not None:
+                    return early
+                await self._changed.wait()
+
+
+_DOWNLOADS: dict[str, _Download] = {}
+
+
+def _join_download(upstream_url: str, cache_key: str) -> _Download:
+    download = _DOWNLOADS.get(cache_key)
+    if download is None:
+        download = _Download(upstream_url, cache_key)
+        _DOWNLOADS[cache_key] = download
+    else:
+        _stats["download_joins"] += 1
+    return download
 
 
 async def _get_or_fetch_cached(
@@ -492,65 +898,30 @@ async def _get_or_fetch_cached(
     """Return status, body, headers, from_cache.
 
     Only full-file responses are written to disk. Range requests are served by
-    slicing a cached (or freshly fetched) full body so Range fragments never
+    slicing a cached (or downloading) full body so Range fragments never
     proliferate under weather_cache/responses/.
     """
     if not upstream_url.startswith(OPEN_METEO_BASE):
         raise ValueError("Upstream URL is not allowlisted")
 
     full_key = _make_cache_key(upstream_url, None)
-    full_cached = _read_cache_entry(full_key)
+    full_cached = _open_cache_entry(full_key)
 
     if full_cached:
         _stats["cache_hits"] += 1
-        meta, body = full_cached
-        if head_only:
-            headers = {
-                "Content-Type": meta.get("content_type", "application/octet-stream"),
-                "Accept-Ranges": "bytes",
-                "Cache-Control": "public, max-age=3600",
-            }
-            if meta.get("etag"):
-                headers["ETag"] = meta["etag"]
-            if range_header:
-                parsed = _parse_range_header(range_header, len(body))
-                if parsed is not None:
-                    start, end = parsed
-                    headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
-                    headers["Content-Length"] = str(end - start + 1)
-                    return 206, b"", headers, True
-            headers["Content-Length"] = str(len(body))
-            return 200, b"", headers, True
-        status, chunk, headers = _slice_cached_body(body, range_header, meta)
+        status, chunk, headers = _serve_cached_entry(full_cached, range_header, head_only=head_only)
         return status, chunk, headers, True
 
     _stats["cache_misses"] += 1
-    _stats["upstream_fetches"] += 1
-    # Always fetch the full object (no Range) so we can cache once and slice.
-    status, body, headers = await _fetch_upstream(
-        upstream_url, None, head_only=head_only
-    )
-
     if head_only:
+        status, _, headers = await _fetch_upstream_head(upstream_url)
         out_headers = dict(headers)
         out_headers["Cache-Control"] = "public, max-age=3600"
         return status, b"", out_headers, False
 
-    if status == 200 and body:
-        meta = {
-            "upstream_url": upstream_url,
-            "content_type": headers.get("Content-Type", "application/octet-stream"),
-            "etag": headers.get("ETag"),
-            "status_code": 200,
-            "cached_at": datetime.now(timezone.utc).isoformat(),
-        }
-        _write_cache_entry(full_key, meta, body)
-        status_out, chunk, slice_headers = _slice_cached_body(body, range_header, meta)
-        return status_out, chunk, slice_headers, False
-
-    out_headers = dict(headers)
-    out_headers["Cache-Control"] = "public, max-age=3600"
-    return status, body, out_headers, False
+    # Always download the full object (no Range), once, so we can cache and slice.
+    status, body, headers = await _join_download(upstream_url, full_key).serve(range_header)
+    return status, body, headers, False
 
 
 async def proxy_open_meteo_request(
@@ -568,16 +939,18 @@ async def proxy_open_meteo_request(
             query_params["variable"] = WIND_VARIABLE
         upstream_url = build_upstream_url(relative_path, query_params)
 
-    in_flight_key = _make_cache_key(
-        upstream_url,
-        f"{range_header or ''}|{'HEAD' if head_only else 'GET'}",
-    )
+    if not head_only:
+        # GETs coalesce per object inside _get_or_fetch_cached, whatever their range.
+        status, body, headers, _ = await _get_or_fetch_cached(upstream_url, range_header)
+        return status, body, headers
+
+    in_flight_key = _make_cache_key(upstream_url, f"{range_header or ''}|HEAD")
     if in_flight_key in _IN_FLIGHT:
         status, body, headers, _ = await _IN_FLIGHT[in_flight_key]
-        return status, body, headers
+        return status, body, dict(headers)
 
     task = asyncio.create_task(
-        _get_or_fetch_cached(upstream_url, range_header, head_only=head_only)
+        _get_or_fetch_cached(upstream_url, range_header, head_only=True)
     )
     _IN_FLIGHT[in_flight_key] = task
     try:
@@ -589,12 +962,17 @@ async def proxy_open_meteo_request(
 
 async def prefetch_om_url(upstream_url: str) -> int:
     """Warm full-file cache for one .om URL. Returns bytes stored."""
-    status, body, _, from_cache = await _get_or_fetch_cached(upstream_url, None)
-    if status != 200 or not body:
-        return 0
-    if from_cache:
-        return len(body)
-    return len(body)
+    cache_key = _make_cache_key(upstream_url, None)
+    cached = _open_cache_entry(cache_key)
+    if cached is not None:
+        return cached.size
+    if not upstream_url.startswith(OPEN_METEO_BASE):
+        raise ValueError("Upstream URL is not allowlisted")
+    download = _join_download(upstream_url, cache_key)
+    await asyncio.shield(download.task)
+    if download.error is not None:
+        raise download.error
+    return download.entry.size if download.entry is not None else 0
 
 
 def _unlink_cache_pair(meta_path: Path) -> tuple[int, int]:
@@ -602,6 +980,7 @@ def _unlink_cache_pair(meta_path: Path) -> tuple[int, int]:
     removed = 0
     freed = 0
     body_path = meta_path.with_name(meta_path.name.replace(".meta.json", ".body"))
+    _HOT_TIER.discard(body_path.name[: -len(".body")])
     for path in (body_path, meta_path):
         if not path.is_file():
             continue
@@ -688,6 +1067,17 @@ def enforce_weather_cache_quota() -> dict[str, int]:
     return {"evicted_files": removed_files, "freed_bytes": freed}
 
 
+def _download_lock_held(lock_path: Path) -> bool:
+    """True when another worker holds ``lock_path`` (non-blocking probe)."""
+    if not lock_path.is_file():
+        return False
+    handle = try_cross_process_file_lock(lock_path)
+    if handle is None:
+        return True
+    release_cross_process_file_lock(handle)
+    return False
+
+
 def purge_weather_cache(
     *,
     force_all: bool = False,
@@ -708,6 +1098,7 @@ def purge_weather_cache(
     freed_bytes = 0
     stale_pairs_removed = 0
     orphan_bodies_removed = 0
+    download_leftovers_removed = 0
 
     if responses_root.is_dir():
         for meta_path in list(responses_root.rglob("*.meta.json")):
@@ -736,6 +1127,34 @@ def purge_weather_cache(
             except OSError:
                 continue
 
+        # Partial downloads abandoned by dead workers. A held <key>.body.lock
+        # marks a live download, whose partial files stay whatever their age.
+        for pattern in ("*.body.part", "*.part.json"):
+            for path in list(responses_root.rglob(pattern)):
+                cache_key = path.name.split(".", 1)[0]
+                if _download_lock_held(path.with_name(f"{cache_key}.body.lock")):
+                    continue
+                try:
+                    st = path.stat()
+                    if not force_all and st.st_mtime >= cutoff:
+                        continue
+                    path.unlink()
+                except OSError:
+                    continue
+                removed_files += 1
+                freed_bytes += st.st_size
+                download_leftovers_removed += 1
+
+        # Download locks: flock never updates the lock file's mtime, so age says
+        # nothing about a long download. Remove only locks nobody holds.
+        for lock_path in list(responses_root.rglob("*.body.lock")):
+            lock_size = unlink_unheld_lock_file(lock_path)
+            if lock_size is None:
+                continue
+            removed_files += 1
+            freed_bytes += lock_size
+            download_leftovers_removed += 1
+
         empty_dirs = _remove_empty_cache_dirs(responses_root)
     else:
         empty_dirs = 0
@@ -751,6 +1170,7 @@ def purge_weather_cache(
         "freed_bytes": freed_bytes,
         "stale_pairs_removed": stale_pairs_removed,
         "orphan_bodies_removed": orphan_bodies_removed,
+        "download_leftovers_removed": download_leftovers_removed,
         "empty_dirs_removed": empty_dirs,
         "quota_evicted_files": quota["evicted_files"],
         "quota_freed_bytes": quota["freed_bytes"],
@@ -782,9 +1202,16 @@ def get_cache_status() -> dict[str, Any]:
         "max_bytes": max_bytes,
         "cache_hits": _stats["cache_hits"],
         "cache_misses": _stats["cache_misses"],
+        "hot_hits": _stats["hot_hits"],
+        "hot_misses": _stats["hot_misses"],
+        "hot_tier": _HOT_TIER.status(),
         "upstream_fetches": _stats["upstream_fetches"],
+        "download_joins": _stats["download_joins"],
+        "download_follows": _stats["download_follows"],
+        "downloads_in_flight": len(_DOWNLOADS),
         "last_prefetch_at": _stats["last_prefetch_at"],
         "last_prefetch_summary": _stats["last_prefetch_summary"],
+        "prefetch_progress": load_prefetch_progress() or None,
         "last_cleanup_at": _stats.get("last_cleanup_at"),
         "last_cleanup_summary": _stats.get("last_cleanup_summary"),
         "manifest_reference_time": manifest.get("reference_time") if manifest else None,
@@ -819,6 +1246,118 @@ async def run_weather_map_cleanup() -> dict[str, Any]:
     return summary
 
 
+def load_prefetch_progress() -> dict[str, Any]:
+    """Per-URL record of the latest prefetch run (see ``prefetch_om_urls``)."""
+    try:
+        return json.loads(_prefetch_progress_path().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _write_prefetch_progress(progress: dict[str, Any]) -> None:
+    _ensure_cache_dirs()
+    progress["updated_at"] = datetime.now(timezone.utc).isoformat()
+    _atomic_write(_prefetch_progress_path(), json.dumps(progress, indent=2).encode("utf-8"))
+
+
+async def prefetch_om_urls(
+    om_urls: dict[str, str],
+    *,
+    reference_time: Optional[str] = None,
+) -> dict[str, Any]:
+    """Warm the cache for ``{time_step: upstream_url}`` with bounded concurrency.
+
+    At most ``weather_map_prefetch_concurrency`` downloads run at once, and at
+    most ``weather_map_prefetch_per_host_limit`` against one upstream host.
+    Each finished URL is recorded in ``prefetch_progress.json`` (state, ETag,
+    bytes, seconds) as soon as it completes, so a run interrupted mid-way
+    resumes for the same model run. Each ``.om`` URL is specific to one model
+    run (``reference_time``) and valid time, and objects are never rewritten
+    under it, so a URL with a cached body is skipped without contacting
+    upstream, whether this prefetch or the proxy stored it.
+    """
+    previous = load_prefetch_progress()
+    same_run = reference_time is not None and previous.get("reference_time") == reference_time
+    records: dict[str, dict[str, Any]] = dict(previous.get("files") or {}) if same_run else {}
+    progress = {
+        "reference_time": reference_time,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "completed_at": None,
+        "resumed": same_run and previous.get("completed_at") is None,
+        "files": records,
+    }
+    _write_prefetch_progress(progress)
+
+    run_limit = asyncio.Semaphore(max(1, int(settings.weather_map_prefetch_concurrency)))
+    host_limits: dict[str, asyncio.Semaphore] = {}
+
+    def host_limit(upstream_url: str) -> asyncio.Semaphore:
+        host = urlparse(upstream_url).netloc
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(max(1, int(settings.weather_map_prefetch_per_host_limit)))
+        return host_limits[host]
+
+    async def prefetch_one(time_step: str, upstream_url: str) -> dict[str, Any]:
+        cache_key = _make_cache_key(upstream_url, None)
+        cached = _open_cache_entry(cache_key)
+        if cached is not None:
+            # The URL names the model run and valid time, so whatever body is
+            # cached under it (by this run or by the proxy) is the object.
+            return {
+                "time_step": time_step,
+                "state": "skipped",
+                "etag": cached.meta.get("etag"),
+                "bytes": cached.size,
+                "seconds": 0.0,
+            }
+        async with run_limit, host_limit(upstream_url):
+            started = time.perf_counter()
+            try:
+                stored = await prefetch_om_url(upstream_url)
+            except Exception as exc:
+                logger.warning("Weather prefetch failed for %s: %s", time_step, exc)
+                return {
+                    "time_step": time_step,
+                    "state": "failed",
+                    "error": str(exc) or type(exc).__name__,
+                    "seconds": round(time.perf_counter() - started, 3),
+                }
+            entry = _open_cache_entry(cache_key)
+            return {
+                "time_step": time_step,
+                "state": "downloaded",
+                "etag": entry.meta.get("etag") if entry is not None else None,
+                "bytes": stored,
+                "seconds": round(time.perf_counter() - started, 3),
+            }
+
+    async def run_one(time_step: str, upstream_url: str) -> dict[str, Any]:
+        record = await prefetch_one(time_step, upstream_url)
+        record["finished_at"] = datetime.now(timezone.utc).isoformat()
+        records[upstream_url] = record
+        _write_prefetch_progress(progress)
+        return record
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run_one(step, url) for step, url in om_urls.items()))
+    elapsed = time.perf_counter() - started
+    progress["completed_at"] = datetime.now(timezone.utc).isoformat()
+    _write_prefetch_progress(progress)
+
+    downloaded = [r for r in results if r["state"] == "downloaded"]
+    bytes_downloaded = sum(r["bytes"] for r in downloaded)
+    return {
+        "downloaded": len(downloaded),
+        "skipped": sum(1 for r in results if r["state"] == "skipped"),
+        "failed": sum(1 for r in results if r["state"] == "failed"),
+        "bytes_stored": sum(r.get("bytes", 0) for r in results),
+        "bytes_downloaded": bytes_downloaded,
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_bytes_per_second": round(bytes_downloaded / elapsed) if downloaded and elapsed > 0 else None,
+        "resumed": progress["resumed"],
+    }
+
+
 async def prefetch_union_bbox_cache() -> dict[str, Any]:
     """Daily prefetch orchestrator."""
     if not is_feature_enabled("weather_map_layers"):
@@ -836,22 +1375,20 @@ async def prefetch_union_bbox_cache() -> dict[str, Any]:
     buddy_manifest = build_buddy_manifest(upstream_manifest, union_bbox, om_urls)
     write_buddy_manifest(buddy_manifest)
 
-    bytes_stored = 0
-    fetched = 0
-    for time_step, upstream_url in om_urls.items():
-        try:
-            stored = await prefetch_om_url(upstream_url)
-            bytes_stored += stored
-            fetched += 1
-        except Exception as exc:
-            logger.warning("Weather prefetch failed for %s: %s", time_step, exc)
+    prefetch = await prefetch_om_urls(om_urls, reference_time=upstream_manifest.get("reference_time"))
 
     cleanup = purge_weather_cache(force_all=False, enforce_quota=True)
     summary = {
         "union_bbox": buddy_manifest["union_bbox"],
         "reference_time": upstream_manifest.get("reference_time"),
-        "timesteps_prefetched": fetched,
-        "bytes_stored": bytes_stored,
+        "timesteps_prefetched": prefetch["downloaded"] + prefetch["skipped"],
+        "bytes_stored": prefetch["bytes_stored"],
+        "downloaded": prefetch["downloaded"],
+        "skipped": prefetch["skipped"],
+        "failed": prefetch["failed"],
+        "bytes_downloaded": prefetch["bytes_downloaded"],
+        "elapsed_seconds": prefetch["elapsed_seconds"],
+        "throughput_bytes_per_second": prefetch["throughput_bytes_per_second"],
         "stale_entries_removed": cleanup.get("stale_pairs_removed", 0),
         "cleanup": {
             "removed_files": cleanup.get("removed_files"),
@@ -36,6 +36,8 @@ from .database import (
     OffloadLog,
     OffloadLogBase,
     StationFlagEvent,
+    StationStatusSnapshot,
+    SeasonStatisticsRollup,
     Vm4ProcessingCheckpoint,
     FieldSeason,
     MissionOverview,
@@ -58,6 +60,7 @@ from .database import (
     TipComment,
     FAQEntry,
     ChatbotInteraction,
+    EmbeddingCacheEntry,
     SlocumDeployment,
     SlocumDeploymentGoal,
     SlocumDeploymentNote,
@@ -198,6 +201,8 @@ __all__ = [
     "OffloadLog",
     "OffloadLogBase",
     "StationFlagEvent",
+    "StationStatusSnapshot",
+    "SeasonStatisticsRollup",
     "Vm4ProcessingCheckpoint",
     "FieldSeason",
     "MissionOverview",
@@ -220,6 +225,7 @@ __all__ = [
     "TipComment",
     "FAQEntry",
     "ChatbotInteraction",
+    "EmbeddingCacheEntry",
     "SlocumDeployment",
     "SlocumDeploymentGoal",
     "SlocumDeploymentNote",
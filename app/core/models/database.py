@@ -5,8 +5,8 @@ SQLModel database table definitions for the Wave Glider Buddy System.
 from datetime import datetime, timezone, date
 from typing import List, Optional, TYPE_CHECKING, Dict
 
-from sqlalchemy import UniqueConstraint
-from sqlmodel import JSON, Column, Text
+from sqlalchemy import Index, UniqueConstraint, func, literal_column
+from sqlmodel import JSON, Column, LargeBinary, Text
 from sqlmodel import Field as SQLModelField
 from sqlmodel import Relationship, SQLModel
 
@@ -68,6 +68,10 @@ class UserInDB(SQLModel, table=True):
 class StationMetadata(SQLModel, table=True):
     """Station metadata database table."""
     __tablename__ = "station_metadata"
+    __table_args__ = (
+        # Case-insensitive prefix range scans for array codes (HFX, NCAT, ...).
+        Index("ix_station_metadata_station_id_upper", func.upper(literal_column("station_id"))),
+    )
 
     station_id: str = SQLModelField(default=..., primary_key=True, index=True, description="Unique Station Identifier (e.g., CBS001). Primary key.")
     serial_number: Optional[str] = SQLModelField(default=None, index=True, description="Serial number of the station hardware.")
@@ -209,6 +213,9 @@ class OffloadLogBase(SQLModel):
 class OffloadLog(OffloadLogBase, table=True):
     """Offload log database table."""
     __tablename__ = "offload_logs"
+    __table_args__ = (
+        Index("ix_offload_logs_station_id_log_timestamp", "station_id", "log_timestamp_utc"),
+    )
     
     id: Optional[int] = SQLModelField(default=None, primary_key=True)
     station_id: str = SQLModelField(foreign_key="station_metadata.station_id", index=True, description="Identifier of the station this log pertains to.")
@@ -262,6 +269,39 @@ class StationFlagEvent(SQLModel, table=True):
     )
 
 
+class StationStatusSnapshot(SQLModel, table=True):
+    """
+    Materialized status-overview row per station and season context.
+
+    ``context_key`` is ``"none"`` (no season) or ``"<year>:open"`` /
+    ``"<year>:closed"`` so closing a season naturally selects a new context.
+    Rows are dropped whenever the station, its offload logs, flags or hardware
+    history change and are rebuilt on the next overview read.
+    """
+    __tablename__ = "station_status_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "context_key",
+            "station_id",
+            name="uq_station_status_snapshot_context_station",
+        ),
+    )
+
+    id: Optional[int] = SQLModelField(default=None, primary_key=True)
+    context_key: str = SQLModelField(index=True, description="Season context (see class docstring).")
+    station_id: str = SQLModelField(
+        foreign_key="station_metadata.station_id",
+        index=True,
+    )
+    row_json: str = SQLModelField(
+        sa_column=Column(Text, nullable=False),
+        description="JSON output of build_status_overview_row for this context.",
+    )
+    computed_at_utc: datetime = SQLModelField(
+        default_factory=lambda: datetime.now(timezone.utc),
+    )
+
+
 class Vm4ProcessingCheckpoint(SQLModel, table=True):
     """Durable checkpoint for incremental VM4 parser runs."""
     __tablename__ = "vm4_processing_checkpoints"
@@ -333,6 +373,37 @@ class FieldSeason(SQLModel, table=True):
     )
 
 
+class SeasonStatisticsRollup(SQLModel, table=True):
+    """
+    Mergeable season statistics partial for one station type.
+
+    ``calculate_season_statistics`` sums these per-type partials instead of
+    rescanning every offload log. Open-season rows are dropped whenever a
+    station or offload log of that type is written and rebuilt on the next
+    read; ``is_frozen`` rows are written at season close and never invalidated.
+    """
+    __tablename__ = "season_statistics_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "field_season_year",
+            "station_type",
+            name="uq_season_statistics_rollup_year_type",
+        ),
+    )
+
+    id: Optional[int] = SQLModelField(default=None, primary_key=True)
+    field_season_year: int = SQLModelField(index=True)
+    station_type: str = SQLModelField(index=True, description="Station id prefix, e.g. CBS")
+    rollup_json: str = SQLModelField(
+        sa_column=Column(Text, nullable=False),
+        description="Partial counters for this station type (see station_season_service).",
+    )
+    is_frozen: bool = SQLModelField(default=False)
+    computed_at_utc: datetime = SQLModelField(
+        default_factory=lambda: datetime.now(timezone.utc),
+    )
+
+
 # --- Station metadata snapshot (immutable roster at season close) ---
 class StationMetadataSeasonSnapshot(SQLModel, table=True):
     """
@@ -1007,6 +1078,30 @@ class ChatbotInteraction(SQLModel, table=True):
     created_at_utc: datetime = SQLModelField(default_factory=lambda: datetime.now(timezone.utc), index=True)
 
 
+class EmbeddingCacheEntry(SQLModel, table=True):
+    """
+    Content-addressed text embedding shared by all vector collections.
+
+    Keyed by embedding model and the SHA-256 of the whitespace-normalized
+    text, so unchanged chunks and boilerplate repeated across manuals are
+    embedded once and reused on re-upload or reindex.
+    """
+    __tablename__ = "embedding_cache"
+    __table_args__ = (
+        UniqueConstraint("model_name", "content_hash", name="uq_embedding_cache_model_hash"),
+    )
+
+    id: Optional[int] = SQLModelField(default=None, primary_key=True)
+    model_name: str = SQLModelField(description="Embedding model the vector was produced with")
+    content_hash: str = SQLModelField(description="SHA-256 hex of the normalized text")
+    dimensions: int = SQLModelField(description="Vector length")
+    embedding: bytes = SQLModelField(
+        sa_column=Column(LargeBinary, nullable=False),
+        description="float32 vector, native byte order",
+    )
+    created_at_utc: datetime = SQLModelField(default_factory=lambda: datetime.now(timezone.utc))
+
+
 # --- Slocum Deployment Database Models ---
 class SlocumDeployment(SQLModel, table=True):
     """Slocum glider deployment - briefing/metadata identity linked to ERDDAP datasets."""
@@ -829,6 +829,7 @@ class KnowledgeDocumentUploadResponse(BaseModel):
     title: str
     file_url: str
     message: str
+    vector_index_job_id: Optional[str] = None
 
 
 # ============================================================================
@@ -1038,6 +1039,7 @@ class ChatbotResponse(BaseModel):
     sources_used: List[str] = []  # References to sources used in synthesis
     llm_used: bool = False  # Whether LLM was used for this response
     llm_model: Optional[str] = None  # Model name used for LLM generation (e.g., "mistral:7b")
+    cached: bool = False  # Answer reused from the semantic answer cache
 
 
 class ChatbotFeedbackRequest(BaseModel):
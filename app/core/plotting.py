@@ -15,11 +15,16 @@ import matplotlib.colors as mcolors
 import cmocean.cm as cmo
 import matplotlib.dates as mdates
 import pandas as pd
+from PIL import Image as PILImage
+import cartopy
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from cartopy.mpl.gridliner import LATITUDE_FORMATTER, LONGITUDE_FORMATTER
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
 from matplotlib.patches import FancyArrowPatch, Rectangle
-from matplotlib.transforms import Bbox
+from matplotlib.transforms import Bbox, IdentityTransform, TransformedBbox
 import numpy as np  # type: ignore
 import logging
 
@@ -27,6 +32,7 @@ from . import models, utils
 from .data.processors import (preprocess_ctd_df, preprocess_power_df,
                          preprocess_wave_df, preprocess_weather_df)
 from .data.processors import preprocess_telemetry_df, telemetry_speed_over_ground_series
+from .geo import basemap_cache
 from .geo.bathymetry import fetch_etopo_bathymetry, nice_contour_levels
 from .geo.coordinates import drop_null_island_rows
 from .infra.feature_toggles import is_report_bathymetry_contours_enabled
@@ -378,6 +384,9 @@ def generate_wave_plot(wave_df, mission_id, hours_back=72):
 #   5. SOG-colored track, then overlay strip elements after tight_layout
 
 REPORT_MAP_OCEAN_COLOR = "#B8D4E8"
+# Set to False on a report figure whose output is degraded (e.g. bathymetry
+# unavailable) so reporting.figure_cache re-renders it instead of storing it.
+REPORT_FIGURE_CACHEABLE_ATTR = "report_cacheable"
 REPORT_MAP_LAND_COLOR = "#C4A882"
 _NM_PER_KM = 1.0 / 1.852
 _KM_PER_DEG_LAT = 111.32
@@ -523,13 +532,119 @@ def _regional_inset_extent(
     return [center_lon - half, center_lon + half, center_lat - half, center_lat + half]
 
 
-def _setup_report_map(ax, extent):
-    """Configures a Cartopy map with basic features for PDF reports."""
-    ax.set_extent(extent)
+def _draw_report_basemap_layers(ax, kind: str) -> None:
+    """Static background of a report map: ocean, land, coastlines (+ borders on the main map)."""
     ax.add_feature(cfeature.OCEAN, facecolor=REPORT_MAP_OCEAN_COLOR, zorder=0)
     ax.add_feature(cfeature.LAND, facecolor=REPORT_MAP_LAND_COLOR, zorder=1)
+    if kind == "inset":
+        ax.coastlines(resolution="50m", zorder=2)
+        return
     ax.coastlines(resolution="10m", zorder=2)
     ax.add_feature(cfeature.BORDERS, linestyle=":", zorder=2)
+
+
+def _render_report_basemap(kind: str, extent: List[float], width_px: int, height_px: int) -> np.ndarray:
+    """Rasterize the static layers so `extent` spans exactly `width_px` x `height_px` (RGB)."""
+    dpi = basemap_cache.BASEMAP_DPI
+    fig = Figure(figsize=(width_px / dpi, height_px / dpi), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0.0, 0.0, 1.0, 1.0], projection=ccrs.PlateCarree())
+    ax.spines["geo"].set_visible(False)
+    ax.set_extent(extent, crs=ccrs.PlateCarree())
+    _draw_report_basemap_layers(ax, kind)
+    fig.canvas.draw()
+    # The extent has the canvas' aspect, so the axes fill it; ocean makes it opaque.
+    return np.asarray(fig.canvas.buffer_rgba())[:, :, :3].copy()
+
+
+class _BasemapImage(AxesImage):
+    """Basemap raster resampled with PIL in uint8.
+
+    Matplotlib's generic path converts the whole raster to float and
+    resamples it on every draw (twice with ``bbox_inches="tight"``); the
+    basemap is only ever shown near 1:1, so crop the visible window and
+    resize it directly. Vector backends fall back to the default path.
+    """
+
+    def make_image(self, renderer, magnification=1.0, unsampled=False):
+        if unsampled or magnification != 1.0:
+            return super().make_image(renderer, magnification, unsampled=unsampled)
+        x1, x2, y1, y2 = self.get_extent()
+        shown = TransformedBbox(Bbox([[x1, y1], [x2, y2]]), self.get_transform())
+        clip = (self.get_clip_box() or self.axes.bbox) if self.get_clip_on() else self.figure.bbox
+        out = Bbox.intersection(shown, clip)
+        if out is None or shown.width <= 0 or shown.height <= 0:
+            return None, 0, 0, None
+        x0, y0 = math.floor(out.x0), math.floor(out.y0)
+        width = max(1, math.ceil(out.x1) - x0)
+        height = max(1, math.ceil(out.y1) - y0)
+
+        rows, cols = self._A.shape[:2]
+        sx = cols / shown.width
+        sy = rows / shown.height
+        crop = (
+            max(0.0, (x0 - shown.x0) * sx),
+            max(0.0, (shown.y1 - (y0 + height)) * sy),
+            min(float(cols), (x0 + width - shown.x0) * sx),
+            min(float(rows), (shown.y1 - y0) * sy),
+        )
+        if getattr(self, "_source", None) is None:
+            self._source = PILImage.fromarray(np.asarray(self._A, dtype=np.uint8))
+        resized = self._source.resize((width, height), PILImage.Resampling.BILINEAR, box=crop).convert("RGBA")
+        # Renderers take image rows bottom-up.
+        return np.ascontiguousarray(np.asarray(resized)[::-1]), x0, y0, IdentityTransform()
+
+
+def _report_basemap_params(kind: str) -> Dict[str, Any]:
+    return {
+        "ocean": REPORT_MAP_OCEAN_COLOR,
+        "land": REPORT_MAP_LAND_COLOR,
+        "cartopy": cartopy.__version__,
+    }
+
+
+def _report_map_pixels_per_degree(ax, extent: List[float]) -> float:
+    """Pixels per degree of an equal-aspect map axes in the report PNG (before tight layout trims it)."""
+    west, east, south, north = extent
+    box = ax.get_position()
+    fig_width, fig_height = ax.figure.get_size_inches()
+    inches_per_degree = min(
+        box.width * fig_width / max(east - west, 1e-6),
+        box.height * fig_height / max(north - south, 1e-6),
+    )
+    return inches_per_degree * basemap_cache.BASEMAP_DPI
+
+
+def _add_report_basemap(ax, extent: List[float], kind: str) -> None:
+    """Map background: cached basemap tiles (vector layers if disabled or on error), then depth contours."""
+    if basemap_cache.basemap_cache_enabled():
+        try:
+            basemap = basemap_cache.get_or_render(
+                kind,
+                extent,
+                _report_map_pixels_per_degree(ax, extent),
+                lambda target, width_px, height_px: _render_report_basemap(kind, target, width_px, height_px),
+                params=_report_basemap_params(kind),
+            )
+        except Exception as exc:
+            logger.warning("Report basemap tiles unavailable for %s; drawing vector layers: %s", extent, exc)
+            _draw_report_basemap_layers(ax, kind)
+        else:
+            image = _BasemapImage(ax, origin="upper", extent=basemap.extent, zorder=0)
+            image.set_data(basemap.image)
+            # The mosaic reaches past the map; clip it like imshow so it stays out of the tight bbox.
+            image.set_clip_path(ax.patch)
+            ax.add_image(image)
+    else:
+        _draw_report_basemap_layers(ax, kind)
+    if kind == "main":
+        _add_report_bathymetry_contours(ax, extent)
+
+
+def _setup_report_map(ax, extent):
+    """Configures a Cartopy map with basic features for PDF reports."""
+    ax.set_extent(extent)
+    _add_report_basemap(ax, extent, "main")
     g1 = ax.gridlines(draw_labels=True, linewidth=0.25, color="gray", alpha=0.5, linestyle="--")
     g1.top_labels = False
     g1.right_labels = False
@@ -542,9 +657,7 @@ def _setup_report_map(ax, extent):
 def _setup_report_inset_map(ax, extent: List[float]) -> None:
     """Regional locator inset: land/ocean only, no grid labels."""
     ax.set_extent(extent)
-    ax.add_feature(cfeature.OCEAN, facecolor=REPORT_MAP_OCEAN_COLOR, zorder=0)
-    ax.add_feature(cfeature.LAND, facecolor=REPORT_MAP_LAND_COLOR, zorder=1)
-    ax.coastlines(resolution="50m", zorder=2)
+    _add_report_basemap(ax, extent, "inset")
 
 
 def _add_report_bathymetry_contours(ax, extent: List[float]) -> None:
@@ -558,6 +671,7 @@ def _add_report_bathymetry_contours(ax, extent: List[float]) -> None:
 
     grid = fetch_etopo_bathymetry(extent)
     if grid is None or grid.z.size == 0:
+        setattr(ax.figure, REPORT_FIGURE_CACHEABLE_ATTR, False)
         return
 
     z_ocean = np.ma.masked_where(grid.z >= 0, grid.z)
@@ -589,6 +703,7 @@ def _add_report_bathymetry_contours(ax, extent: List[float]) -> None:
         )
     except Exception as exc:
         logger.warning("Skipping bathymetry contours for extent %s: %s", extent, exc)
+        setattr(ax.figure, REPORT_FIGURE_CACHEABLE_ATTR, False)
 
 
 def _add_report_map_scale_and_compass(
@@ -792,335 +907,508 @@ _NOTE_MARKER_RELAX_DAMPING = 0.8
 _NOTE_MARKER_RELAX_MIN_MOVEMENT_PX = 0.5
 _NOTE_MARKER_SETTLE_MAX_ITERATIONS = 25
 _NOTE_MARKER_SETTLE_STEP = 0.5
+# Text-overlap repair: standoffs tried per direction (up to the relaxation cap).
+_NOTE_MARKER_REPAIR_DISTANCE_MULTIPLIERS = (1.0, 1.5, 2.2, 3.0, 4.5, 6.6)
+_NOTE_MARKER_REPAIR_MAX_ROUNDS = 3
+_NOTE_MARKER_FONT_SIZE = 7.5
+# Gap the leader line leaves before the marker dot (arrow `shrinkB`, points).
+_NOTE_MARKER_LEADER_SHRINK_PTS = 3.0
 
 
-@dataclass
-class PlacedLabel:
-    """One callout after greedy placement; mutated by the relaxation pass."""
-
-    lon: float
-    lat: float
-    offset_x: float
-    offset_y: float
-    bbox: Any
-    annotation: Any = None
-    # Greedy "home" offset (preferred direction at the smallest non-overlapping
-    # standoff the first-fit search found). The settle pass pulls each label
-    # back toward this so relaxation doesn't leave callouts stranded at the
-    # map perimeter with long crossing leader lines.
-    rest_offset_x: float = 0.0
-    rest_offset_y: float = 0.0
-
-
-def _bboxes_overlap(a, b, pad: float = _NOTE_MARKER_OVERLAP_PAD_PX) -> bool:
-    """Return True if two display-coord bboxes overlap, allowing `pad` px of
-    visual separation. The padding accounts for the rounded bbox decoration
-    that `Text.get_window_extent` does not include in its returned extent.
+# Note labels are laid out in display pixels before any annotation exists:
+# text extents are measured once per distinct label, each label's box is its
+# text box plus leader line (`_label_boxes`), and collisions are found
+# through a uniform-grid spatial hash instead of all-pairs checks.
+# Offsets are in display points, as `Annotation.xyann` with "offset points".
+
+
+def _label_alignment(offsets: np.ndarray) -> np.ndarray:
+    """Text-box origin as a fraction of the text size, from the offset direction.
+
+    Matches `_create_marker_annotation`: left/bottom aligned (0) for positive
+    offsets, right/top (-1) for negative, centered (-0.5) for zero.
     """
-    return not (
-        a.x1 + pad < b.x0
-        or a.x0 - pad > b.x1
-        or a.y1 + pad < b.y0
-        or a.y0 - pad > b.y1
-    )
+    return np.where(offsets > 0, 0.0, np.where(offsets < 0, -1.0, -0.5))
 
 
-def _bbox_overlap_amount(
-    a,
-    b,
-    pad: float = _NOTE_MARKER_OVERLAP_PAD_PX,
-) -> Tuple[float, float]:
-    """Return padded AABB overlap `(overlap_x, overlap_y)` in display pixels.
+def _label_boxes(
+    anchors: np.ndarray,
+    sizes: np.ndarray,
+    align: np.ndarray,
+    offsets: np.ndarray,
+    px_per_pt: float,
+) -> np.ndarray:
+    """`(n, 4)` display boxes `[x0, y0, x1, y1]`: text box plus its leader line.
 
-    Returns `(0.0, 0.0)` when the boxes are separated on either axis (same
-    semantics as `_bboxes_overlap`). Positive values include the `pad`
-    separation deficit so a near-miss still produces a non-zero nudge.
+    Same extent as `Annotation.get_window_extent`: the leader runs from the
+    text centre toward the anchor and stops `_NOTE_MARKER_LEADER_SHRINK_PTS`
+    short of it, which matters where neighbouring fixes are a few px apart.
     """
-    overlap_x = min(a.x1, b.x1) - max(a.x0, b.x0) + pad
-    overlap_y = min(a.y1, b.y1) - max(a.y0, b.y0) + pad
-    if overlap_x <= 0.0 or overlap_y <= 0.0:
-        return (0.0, 0.0)
-    return (overlap_x, overlap_y)
+    origin = anchors + offsets * px_per_pt + align * sizes
+    toward_text = origin + sizes / 2.0 - anchors
+    length = np.maximum(np.hypot(toward_text[..., 0], toward_text[..., 1]), 1e-9)[..., None]
+    tip = anchors + toward_text / length * (_NOTE_MARKER_LEADER_SHRINK_PTS * px_per_pt)
+    lower = np.minimum(origin, tip)
+    upper = np.maximum(origin + sizes, tip)
+    return np.concatenate([lower, upper], axis=-1)
+
+
+def _label_text_boxes(
+    anchors: np.ndarray,
+    sizes: np.ndarray,
+    align: np.ndarray,
+    offsets: np.ndarray,
+    px_per_pt: float,
+) -> np.ndarray:
+    """`(n, 4)` display boxes of the label text alone (`Text.get_window_extent`)."""
+    origin = anchors + offsets * px_per_pt + align * sizes
+    return np.concatenate([origin, origin + sizes], axis=-1)
+
+
+def _boxes_overlap(a: np.ndarray, b: np.ndarray, pad: float = _NOTE_MARKER_OVERLAP_PAD_PX) -> np.ndarray:
+    """True where boxes overlap, allowing `pad` px of visual separation (broadcasts).
+
+    The padding accounts for the rounded bbox decoration that
+    `Text.get_window_extent` does not include in its returned extent.
+    """
+    return ~(
+        (a[..., 2] + pad < b[..., 0])
+        | (a[..., 0] - pad > b[..., 2])
+        | (a[..., 3] + pad < b[..., 1])
+        | (a[..., 1] - pad > b[..., 3])
+    )
 
 
-def _separation_nudge(
-    bbox_a,
-    bbox_b,
-    pad: float = _NOTE_MARKER_OVERLAP_PAD_PX,
-    buffer: float = _NOTE_MARKER_SEPARATION_BUFFER_PX,
-) -> Tuple[float, float, float, float]:
-    """Return opposing display-pixel nudges that push two overlapping labels apart.
+def _cap_standoffs(offsets: np.ndarray, max_standoff: float) -> np.ndarray:
+    """Scale rows of `offsets` down to at most `max_standoff` points."""
+    magnitude = np.hypot(offsets[..., 0], offsets[..., 1])
+    scale = np.where(magnitude > max_standoff, max_standoff / np.maximum(magnitude, 1e-9), 1.0)
+    return offsets * scale[..., None]
+
 
-    Each label moves half of `(max(overlap_x, overlap_y) + buffer)` along the
-    center-to-center unit vector. Returns zeros when the boxes do not overlap.
+class _LabelGrid:
+    """Uniform-grid spatial hash of label boxes (indices per `cell_px` square).
+
+    Boxes are registered grown by half the overlap pad, so two boxes within
+    `pad` of each other always share at least one cell.
     """
-    overlap_x, overlap_y = _bbox_overlap_amount(bbox_a, bbox_b, pad=pad)
-    if overlap_x <= 0.0 or overlap_y <= 0.0:
-        return (0.0, 0.0, 0.0, 0.0)
-
-    cx_a = (bbox_a.x0 + bbox_a.x1) / 2.0
-    cy_a = (bbox_a.y0 + bbox_a.y1) / 2.0
-    cx_b = (bbox_b.x0 + bbox_b.x1) / 2.0
-    cy_b = (bbox_b.y0 + bbox_b.y1) / 2.0
-    dx = cx_b - cx_a
-    dy = cy_b - cy_a
-    dist = math.hypot(dx, dy)
-    if dist < 1e-6:
-        ux, uy = 1.0, 0.0
-    else:
-        ux, uy = dx / dist, dy / dist
 
-    half = (max(overlap_x, overlap_y) + buffer) / 2.0
-    return (-ux * half, -uy * half, ux * half, uy * half)
+    def __init__(self, cell_px: float, pad: float = _NOTE_MARKER_OVERLAP_PAD_PX) -> None:
+        self.cell = float(cell_px)
+        self.half_pad = pad / 2.0
+        self.cells: Dict[Tuple[int, int], set] = {}
+
+    def _keys(self, box) -> List[Tuple[int, int]]:
+        cell, half = self.cell, self.half_pad
+        x0, x1 = math.floor((box[0] - half) / cell), math.floor((box[2] + half) / cell)
+        y0, y1 = math.floor((box[1] - half) / cell), math.floor((box[3] + half) / cell)
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def add(self, idx: int, box) -> None:
+        for key in self._keys(box):
+            self.cells.setdefault(key, set()).add(idx)
+
+    def discard(self, idx: int, box) -> None:
+        for key in self._keys(box):
+            members = self.cells.get(key)
+            if members is not None:
+                members.discard(idx)
+
+    def near(self, box) -> List[int]:
+        found: set = set()
+        for key in self._keys(box):
+            found.update(self.cells.get(key, ()))
+        return list(found)
+
+
+def _grid_candidate_pairs(
+    boxes: np.ndarray,
+    cell_px: float,
+    pad: float = _NOTE_MARKER_OVERLAP_PAD_PX,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Index pairs `(i, j)`, `i < j`, whose padded boxes share a grid cell (numpy-only hash)."""
+    n = len(boxes)
+    if n < 2:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    half = pad / 2.0
+    lo = np.floor((boxes[:, :2] - half) / cell_px).astype(np.int64)
+    hi = np.floor((boxes[:, 2:] + half) / cell_px).astype(np.int64)
+    span = hi - lo + 1
+    counts = span[:, 0] * span[:, 1]
+    owner = np.repeat(np.arange(n), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    cx = lo[owner, 0] + k % span[owner, 0]
+    cy = lo[owner, 1] + k // span[owner, 0]
+    key = (cx - cx.min()) * (int(cy.max() - cy.min()) + 1) + (cy - cy.min())
+
+    order = np.argsort(key, kind="stable")
+    key, owner = key[order], owner[order]
+    first: List[np.ndarray] = []
+    second: List[np.ndarray] = []
+    # Members of a cell are contiguous after the sort: pair each entry with
+    # the ones `d` places later while they are still in the same cell.
+    for d in range(1, len(key)):
+        same = key[d:] == key[:-d]
+        if not same.any():
+            break
+        first.append(owner[:-d][same])
+        second.append(owner[d:][same])
+    if not first:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    i = np.concatenate(first)
+    j = np.concatenate(second)
+    i, j = np.minimum(i, j), np.maximum(i, j)
+    codes = np.unique(i[i != j] * n + j[i != j])
+    return codes // n, codes % n
 
 
-def _cap_standoff(offset_x: float, offset_y: float, max_standoff: float) -> Tuple[float, float]:
-    """Scale `(offset_x, offset_y)` down if its magnitude exceeds `max_standoff`."""
-    magnitude = math.hypot(offset_x, offset_y)
-    if magnitude <= max_standoff or magnitude < 1e-9:
-        return (offset_x, offset_y)
-    scale = max_standoff / magnitude
-    return (offset_x * scale, offset_y * scale)
+@dataclass
+class _NoteLabelLayout:
+    """Display-space state for all note labels; rows are clusters in placement order."""
 
+    anchors: np.ndarray  # (n, 2) marker position, display px
+    sizes: np.ndarray  # (n, 2) text width/height, display px
+    offsets: np.ndarray  # (n, 2) current offset, points
+    align: np.ndarray  # (n, 2) fixed by the greedy direction (annotation ha/va)
+    rest: np.ndarray  # (n, 2) greedy "home" offset, points
+    px_per_pt: float
+    cell_px: float
 
-def _apply_offset(
-    placed: PlacedLabel,
-    offset_x: float,
-    offset_y: float,
-    renderer=None,
+    def boxes(self) -> np.ndarray:
+        return _label_boxes(self.anchors, self.sizes, self.align, self.offsets, self.px_per_pt)
+
+    def text_boxes(self) -> np.ndarray:
+        return _label_text_boxes(self.anchors, self.sizes, self.align, self.offsets, self.px_per_pt)
+
+
+def _label_directions(anchors: np.ndarray, mid: Optional[np.ndarray]) -> np.ndarray:
+    """`(n, 8, 2)` unit directions per label in preference order.
+
+    Labels lean toward the map centre so edge points don't push their label
+    off the page; horizontal-first ordering avoids stacking text on top of
+    the (usually N-S) track.
+    """
+    if mid is None:
+        prefer = np.ones_like(anchors)
+    else:
+        prefer = np.where(anchors > mid, -1.0, 1.0)
+    px, py = prefer[:, 0], prefer[:, 1]
+    zero = np.zeros_like(px)
+    order = [
+        (px, zero), (px, py), (px, -py), (zero, py),
+        (-px, py), (-px, zero), (zero, -py), (-px, -py),
+    ]
+    return np.stack([np.stack(pair, axis=-1) for pair in order], axis=1)
+
+
+def _place_labels_greedy(
+    anchors: np.ndarray,
+    sizes: np.ndarray,
+    directions: np.ndarray,
     *,
-    dpi: float = 72.0,
-) -> None:
-    """Set callout offset and refresh `placed.bbox`.
+    px_per_pt: float,
+    cell_px: float,
+    pad: float = _NOTE_MARKER_OVERLAP_PAD_PX,
+) -> _NoteLabelLayout:
+    """First candidate (distance-major, then direction) clear of earlier labels.
 
-    When a live matplotlib annotation + renderer are available, `xyann` is
-    updated and the window extent is recomputed. Otherwise the bbox is
-    translated by the offset delta (scaled by `dpi`) so unit tests can drive
-    relaxation with synthetic boxes.
+    A label whose every candidate overlaps keeps its preferred direction at
+    the largest standoff; relaxation untangles it afterwards.
     """
-    delta_x_pts = offset_x - placed.offset_x
-    delta_y_pts = offset_y - placed.offset_y
-    placed.offset_x = offset_x
-    placed.offset_y = offset_y
-
-    if placed.annotation is not None:
-        placed.annotation.xyann = (offset_x, offset_y)
-        if renderer is not None:
-            placed.bbox = placed.annotation.get_window_extent(renderer)
-            return
-
-    # Synthetic path: offset points → display pixels at the given dpi.
-    px_per_pt = float(dpi) / 72.0
-    dx_px = delta_x_pts * px_per_pt
-    dy_px = delta_y_pts * px_per_pt
-    placed.bbox = Bbox.from_extents(
-        placed.bbox.x0 + dx_px,
-        placed.bbox.y0 + dy_px,
-        placed.bbox.x1 + dx_px,
-        placed.bbox.y1 + dy_px,
+    n = len(anchors)
+    standoffs = _NOTE_MARKER_BASE_STANDOFF_PTS * np.asarray(_NOTE_MARKER_DISTANCE_MULTIPLIERS)
+    # (n, candidates, 2): every direction at the first distance, then the next.
+    candidates = (standoffs[None, :, None, None] * directions[:, None, :, :]).reshape(n, -1, 2)
+    candidate_align = _label_alignment(candidates)
+    candidate_boxes = _label_boxes(
+        anchors[:, None, :], sizes[:, None, :], candidate_align, candidates, px_per_pt
+    )
+
+    fallback = -directions.shape[1]  # preferred direction, farthest standoff
+    offsets = candidates[:, fallback, :].copy()
+    align = candidate_align[:, fallback, :].copy()
+    boxes = np.zeros((n, 4))
+    grid = _LabelGrid(cell_px, pad)
+    for idx in range(n):
+        options = candidate_boxes[idx]
+        envelope = (options[:, 0].min(), options[:, 1].min(), options[:, 2].max(), options[:, 3].max())
+        near = grid.near(envelope)
+        if near:
+            clash = _boxes_overlap(options[:, None, :], boxes[near][None, :, :], pad).any(axis=1)
+            free = np.flatnonzero(~clash)
+        else:
+            free = np.arange(len(options))
+        if free.size:
+            offsets[idx] = candidates[idx, free[0]]
+            align[idx] = candidate_align[idx, free[0]]
+        boxes[idx] = _label_boxes(anchors[idx], sizes[idx], align[idx], offsets[idx], px_per_pt)
+        grid.add(idx, boxes[idx])
+
+    return _NoteLabelLayout(
+        anchors=anchors,
+        sizes=sizes,
+        offsets=offsets,
+        align=align,
+        rest=offsets.copy(),
+        px_per_pt=px_per_pt,
+        cell_px=cell_px,
     )
 
 
-def _clamp_placed_to_axes(
-    placed: PlacedLabel,
-    axes_bbox,
+def _clamp_labels_to_axes(
+    layout: _NoteLabelLayout,
+    axes_box: Optional[Tuple[float, float, float, float]],
     *,
     margin: float = _NOTE_MARKER_BOUNDS_MARGIN_PX,
     max_standoff: float = _NOTE_MARKER_MAX_STANDOFF_PTS,
-    renderer=None,
-    dpi: float = 72.0,
 ) -> float:
-    """Shift a label so its bbox stays inside `axes_bbox`; return movement in px."""
-    if axes_bbox is None:
+    """Shift labels so their boxes stay inside `axes_box` and cap standoffs; return movement in px."""
+    if axes_box is None or not len(layout.offsets):
         return 0.0
-
-    shift_x_px = 0.0
-    shift_y_px = 0.0
-    bbox = placed.bbox
-    if bbox.x0 < axes_bbox.x0 + margin:
-        shift_x_px = (axes_bbox.x0 + margin) - bbox.x0
-    elif bbox.x1 > axes_bbox.x1 - margin:
-        shift_x_px = (axes_bbox.x1 - margin) - bbox.x1
-    if bbox.y0 < axes_bbox.y0 + margin:
-        shift_y_px = (axes_bbox.y0 + margin) - bbox.y0
-    elif bbox.y1 > axes_bbox.y1 - margin:
-        shift_y_px = (axes_bbox.y1 - margin) - bbox.y1
-
-    pts_per_px = 72.0 / float(dpi)
-    if abs(shift_x_px) < 1e-9 and abs(shift_y_px) < 1e-9:
-        capped_x, capped_y = _cap_standoff(placed.offset_x, placed.offset_y, max_standoff)
-        if capped_x == placed.offset_x and capped_y == placed.offset_y:
-            return 0.0
-        old_x, old_y = placed.offset_x, placed.offset_y
-        _apply_offset(placed, capped_x, capped_y, renderer, dpi=dpi)
-        return math.hypot(
-            (capped_x - old_x) * float(dpi) / 72.0,
-            (capped_y - old_y) * float(dpi) / 72.0,
-        )
-
-    new_ox = placed.offset_x + shift_x_px * pts_per_px
-    new_oy = placed.offset_y + shift_y_px * pts_per_px
-    new_ox, new_oy = _cap_standoff(new_ox, new_oy, max_standoff)
-    _apply_offset(placed, new_ox, new_oy, renderer, dpi=dpi)
-    return math.hypot(shift_x_px, shift_y_px)
+    ax0, ay0, ax1, ay1 = axes_box
+    boxes = layout.boxes()
+    shift_x = np.where(
+        boxes[:, 0] < ax0 + margin,
+        ax0 + margin - boxes[:, 0],
+        np.where(boxes[:, 2] > ax1 - margin, ax1 - margin - boxes[:, 2], 0.0),
+    )
+    shift_y = np.where(
+        boxes[:, 1] < ay0 + margin,
+        ay0 + margin - boxes[:, 1],
+        np.where(boxes[:, 3] > ay1 - margin, ay1 - margin - boxes[:, 3], 0.0),
+    )
+    shift = np.stack([shift_x, shift_y], axis=1)
+    old = layout.offsets
+    new = _cap_standoffs(old + shift / layout.px_per_pt, max_standoff)
+    shifted = (np.abs(shift) > 1e-9).any(axis=1)
+    movement = np.where(
+        shifted,
+        np.hypot(shift_x, shift_y),
+        np.hypot(*((new - old) * layout.px_per_pt).T),
+    )
+    layout.offsets = new
+    return float(movement.sum())
 
 
-def _relax_placed_labels(
-    placed: List[PlacedLabel],
-    renderer=None,
+def _relax_labels(
+    layout: _NoteLabelLayout,
     *,
-    axes_bbox=None,
+    axes_box=None,
     max_iterations: int = _NOTE_MARKER_RELAX_MAX_ITERATIONS,
     pad: float = _NOTE_MARKER_OVERLAP_PAD_PX,
+    buffer: float = _NOTE_MARKER_SEPARATION_BUFFER_PX,
     damping: float = _NOTE_MARKER_RELAX_DAMPING,
     min_movement_px: float = _NOTE_MARKER_RELAX_MIN_MOVEMENT_PX,
     max_standoff: float = _NOTE_MARKER_MAX_STANDOFF_PTS,
-    dpi: float = 72.0,
 ) -> None:
-    """Iteratively repel overlapping callouts; clamp to axes bounds each pass.
+    """Iteratively repel overlapping labels; clamp to axes bounds each pass.
 
-    Nudges are accumulated per iteration so chain overlaps (A–B–C) do not
-    oscillate. Stops early when no pair overlaps or total movement is tiny.
+    Each overlapping pair moves apart by `(max(overlap_x, overlap_y) +
+    buffer) / 2` each along the centre-to-centre direction. Nudges are
+    accumulated per iteration so chain overlaps (A-B-C) do not oscillate.
+    Stops early when no pair overlaps or total movement is tiny.
     """
-    if len(placed) < 2:
-        if placed and axes_bbox is not None:
-            _clamp_placed_to_axes(
-                placed[0],
-                axes_bbox,
-                max_standoff=max_standoff,
-                renderer=renderer,
-                dpi=dpi,
-            )
+    n = len(layout.offsets)
+    if n < 2:
+        _clamp_labels_to_axes(layout, axes_box, max_standoff=max_standoff)
         return
 
-    pts_per_px = 72.0 / float(dpi)
     for iteration in range(max_iterations):
-        nudges = [(0.0, 0.0) for _ in placed]
-        any_overlap = False
-        for i in range(len(placed)):
-            for j in range(i + 1, len(placed)):
-                nax, nay, nbx, nby = _separation_nudge(
-                    placed[i].bbox,
-                    placed[j].bbox,
-                    pad=pad,
-                )
-                if nax == 0.0 and nay == 0.0 and nbx == 0.0 and nby == 0.0:
-                    continue
-                any_overlap = True
-                damp = 1.0 if iteration == 0 else damping
-                nudges[i] = (nudges[i][0] + nax * damp, nudges[i][1] + nay * damp)
-                nudges[j] = (nudges[j][0] + nbx * damp, nudges[j][1] + nby * damp)
+        boxes = layout.boxes()
+        i, j = _grid_candidate_pairs(boxes, layout.cell_px, pad)
+        a, b = boxes[i], boxes[j]
+        overlap_x = np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0]) + pad
+        overlap_y = np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1]) + pad
+        hit = (overlap_x > 0.0) & (overlap_y > 0.0)
+        any_overlap = bool(hit.any())
 
         total_movement = 0.0
         if any_overlap:
-            for idx, label in enumerate(placed):
-                nx_px, ny_px = nudges[idx]
-                if abs(nx_px) < 1e-9 and abs(ny_px) < 1e-9:
-                    continue
-                new_ox = label.offset_x + nx_px * pts_per_px
-                new_oy = label.offset_y + ny_px * pts_per_px
-                new_ox, new_oy = _cap_standoff(new_ox, new_oy, max_standoff)
-                _apply_offset(label, new_ox, new_oy, renderer, dpi=dpi)
-                total_movement += math.hypot(nx_px, ny_px)
-
-        if axes_bbox is not None:
-            for label in placed:
-                total_movement += _clamp_placed_to_axes(
-                    label,
-                    axes_bbox,
-                    max_standoff=max_standoff,
-                    renderer=renderer,
-                    dpi=dpi,
-                )
+            i, j, a, b = i[hit], j[hit], a[hit], b[hit]
+            delta = (b[:, :2] + b[:, 2:]) / 2.0 - (a[:, :2] + a[:, 2:]) / 2.0
+            dist = np.hypot(delta[:, 0], delta[:, 1])
+            unit = np.where(
+                dist[:, None] < 1e-6,
+                np.array([1.0, 0.0]),
+                delta / np.maximum(dist, 1e-6)[:, None],
+            )
+            half = (np.maximum(overlap_x[hit], overlap_y[hit]) + buffer) / 2.0
+            half *= 1.0 if iteration == 0 else damping
+            nudges = np.zeros((n, 2))
+            np.add.at(nudges, i, -unit * half[:, None])
+            np.add.at(nudges, j, unit * half[:, None])
+            moved = (np.abs(nudges) > 1e-9).any(axis=1)
+            layout.offsets[moved] = _cap_standoffs(
+                layout.offsets[moved] + nudges[moved] / layout.px_per_pt, max_standoff
+            )
+            total_movement += float(np.hypot(*nudges[moved].T).sum())
 
-        if not any_overlap:
-            break
-        if total_movement < min_movement_px:
+        total_movement += _clamp_labels_to_axes(layout, axes_box, max_standoff=max_standoff)
+        if not any_overlap or total_movement < min_movement_px:
             break
 
 
-def _settle_labels_toward_anchors(
-    placed: List[PlacedLabel],
-    renderer=None,
+def _settle_labels(
+    layout: _NoteLabelLayout,
     *,
-    axes_bbox=None,
+    axes_box=None,
     max_iterations: int = _NOTE_MARKER_SETTLE_MAX_ITERATIONS,
     step: float = _NOTE_MARKER_SETTLE_STEP,
     pad: float = _NOTE_MARKER_OVERLAP_PAD_PX,
     max_standoff: float = _NOTE_MARKER_MAX_STANDOFF_PTS,
-    dpi: float = 72.0,
 ) -> None:
-    """Pull each callout back toward its greedy home offset when room exists.
+    """Pull each label back toward its greedy home offset when room exists.
 
     Relaxation only repels, so overlapping labels drift outward and stay at the
     map perimeter even after the conflict that pushed them there has cleared.
-    This pass walks each label back toward `rest_offset` (the compact greedy
+    This pass walks each label back toward `rest` (the compact greedy
     position) by `step` per iteration, accepting a move only if it introduces
-    no new label-vs-label overlap. Labels whose home still overlaps a neighbour
+    no new label-vs-label overlap; moves are checked one label at a time
+    against its grid neighbours. Labels whose home still overlaps a neighbour
     simply remain pushed out, so separation is preserved.
     """
-    if not placed:
+    n = len(layout.offsets)
+    if n == 0:
         return
-
-    if len(placed) < 2:
-        for label in placed:
-            if abs(label.rest_offset_x - label.offset_x) < 1e-6 and abs(
-                label.rest_offset_y - label.offset_y) < 1e-6:
-                continue
-            _apply_offset(
-                label,
-                label.rest_offset_x,
-                label.rest_offset_y,
-                renderer,
-                dpi=dpi,
-            )
-            if axes_bbox is not None:
-                _clamp_placed_to_axes(
-                    label,
-                    axes_bbox,
-                    max_standoff=max_standoff,
-                    renderer=renderer,
-                    dpi=dpi,
-                )
+    if n == 1:
+        layout.offsets = layout.rest.copy()
+        _clamp_labels_to_axes(layout, axes_box, max_standoff=max_standoff)
         return
 
     for _ in range(max_iterations):
+        away = np.flatnonzero((np.abs(layout.rest - layout.offsets) >= 1e-6).any(axis=1))
+        if not away.size:
+            break
+        boxes = layout.boxes()
+        grid = _LabelGrid(layout.cell_px, pad)
+        for idx in range(n):
+            grid.add(idx, boxes[idx])
+
+        proposed = _cap_standoffs(
+            layout.offsets[away] + step * (layout.rest[away] - layout.offsets[away]), max_standoff
+        )
+        proposed_boxes = _label_boxes(
+            layout.anchors[away], layout.sizes[away], layout.align[away], proposed, layout.px_per_pt
+        )
         any_move = False
-        for idx, label in enumerate(placed):
-            home_x = label.rest_offset_x
-            home_y = label.rest_offset_y
-            if abs(home_x - label.offset_x) < 1e-6 and abs(home_y - label.offset_y) < 1e-6:
+        for row, idx in enumerate(away):
+            box = proposed_boxes[row]
+            near = [k for k in grid.near(box) if k != idx]
+            if near and _boxes_overlap(box[None, :], boxes[near], pad).any():
                 continue
-            new_ox = label.offset_x + step * (home_x - label.offset_x)
-            new_oy = label.offset_y + step * (home_y - label.offset_y)
-            new_ox, new_oy = _cap_standoff(new_ox, new_oy, max_standoff)
-
-            old_ox, old_oy = label.offset_x, label.offset_y
-            _apply_offset(label, new_ox, new_oy, renderer, dpi=dpi)
-            conflict = any(
-                _bboxes_overlap(label.bbox, other.bbox, pad=pad)
-                for k, other in enumerate(placed)
-                if k != idx
-            )
-            if conflict:
-                _apply_offset(label, old_ox, old_oy, renderer, dpi=dpi)
-            else:
-                any_move = True
-
-        if axes_bbox is not None:
-            for label in placed:
-                _clamp_placed_to_axes(
-                    label,
-                    axes_bbox,
-                    max_standoff=max_standoff,
-                    renderer=renderer,
-                    dpi=dpi,
-                )
+            grid.discard(idx, boxes[idx])
+            grid.add(idx, box)
+            boxes[idx] = box
+            layout.offsets[idx] = proposed[row]
+            any_move = True
 
+        _clamp_labels_to_axes(layout, axes_box, max_standoff=max_standoff)
         if not any_move:
             break
 
 
+def _repair_text_overlaps(
+    layout: _NoteLabelLayout,
+    directions: np.ndarray,
+    *,
+    axes_box=None,
+    max_rounds: int = _NOTE_MARKER_REPAIR_MAX_ROUNDS,
+    pad: float = _NOTE_MARKER_OVERLAP_PAD_PX,
+    margin: float = _NOTE_MARKER_BOUNDS_MARGIN_PX,
+    max_standoff: float = _NOTE_MARKER_MAX_STANDOFF_PTS,
+) -> None:
+    """Re-place labels whose text still overlaps another label's text.
+
+    Relaxation and settling separate whole boxes (text plus leader line). On
+    a dense track that cannot be satisfied, and repulsion leaves labels
+    stacked at the standoff cap along the axes edge. Here each label whose
+    text overlaps another's moves to the candidate with the fewest text
+    overlaps: every direction at `_NOTE_MARKER_REPAIR_DISTANCE_MULTIPLIERS`
+    standoffs, kept inside the axes. Ties go to fewer whole-box overlaps,
+    then to the shorter standoff. A move is taken only if it strictly
+    reduces the label's text overlaps. Alignment follows the new direction.
+    """
+    n = len(layout.offsets)
+    if n < 2:
+        return
+    standoffs = np.minimum(
+        _NOTE_MARKER_BASE_STANDOFF_PTS * np.asarray(_NOTE_MARKER_REPAIR_DISTANCE_MULTIPLIERS), max_standoff
+    )
+    # (n, candidates, 2), distance-major like the greedy placement.
+    candidates = (standoffs[None, :, None, None] * directions[:, None, :, :]).reshape(n, -1, 2)
+    candidate_align = _label_alignment(candidates)
+
+    for _ in range(max_rounds):
+        text = layout.text_boxes()
+        i, j = _grid_candidate_pairs(text, layout.cell_px, pad)
+        hit = _boxes_overlap(text[i], text[j], pad)
+        crowded = np.unique(np.concatenate([i[hit], j[hit]]))
+        if not crowded.size:
+            break
+        boxes = layout.boxes()
+        grid = _LabelGrid(layout.cell_px, pad)
+        for idx in range(n):
+            grid.add(idx, boxes[idx])
+
+        moved = 0
+        for idx in crowded:
+            # Row 0 is the current position.
+            offsets = np.concatenate([layout.offsets[idx][None, :], candidates[idx]])
+            align = np.concatenate([layout.align[idx][None, :], candidate_align[idx]])
+            option_boxes = _label_boxes(layout.anchors[idx], layout.sizes[idx], align, offsets, layout.px_per_pt)
+            option_text = _label_text_boxes(layout.anchors[idx], layout.sizes[idx], align, offsets, layout.px_per_pt)
+            envelope = (
+                option_boxes[:, 0].min(), option_boxes[:, 1].min(),
+                option_boxes[:, 2].max(), option_boxes[:, 3].max(),
+            )
+            near = [k for k in grid.near(envelope) if k != idx]
+            if not near:
+                continue
+            text_hits = _boxes_overlap(option_text[:, None, :], text[near][None, :, :], pad).sum(axis=1)
+            box_hits = _boxes_overlap(option_boxes[:, None, :], boxes[near][None, :, :], pad).sum(axis=1)
+            if axes_box is not None:
+                ax0, ay0, ax1, ay1 = axes_box
+                outside = (
+                    (option_boxes[:, 0] < ax0 + margin)
+                    | (option_boxes[:, 1] < ay0 + margin)
+                    | (option_boxes[:, 2] > ax1 - margin)
+                    | (option_boxes[:, 3] > ay1 - margin)
+                )
+                outside[0] = False
+                text_hits = np.where(outside, n + 1, text_hits)
+            best = int(np.lexsort((box_hits, text_hits))[0])
+            if text_hits[best] >= text_hits[0]:
+                continue
+            grid.discard(idx, boxes[idx])
+            layout.offsets[idx] = offsets[best]
+            layout.align[idx] = align[best]
+            boxes[idx] = option_boxes[best]
+            text[idx] = option_text[best]
+            grid.add(idx, boxes[idx])
+            moved += 1
+        if not moved:
+            break
+
+
+def _measure_label_sizes(fig, labels: List[str], renderer) -> np.ndarray:
+    """Text extent (px) of each label, measured once per distinct string."""
+    from matplotlib.text import Text
+
+    probe = Text(0, 0, "", fontsize=_NOTE_MARKER_FONT_SIZE, fontweight="bold")
+    probe.set_figure(fig)
+    measured: Dict[str, Tuple[float, float]] = {}
+    sizes = np.zeros((len(labels), 2))
+    for idx, label in enumerate(labels):
+        if label not in measured:
+            probe.set_text(label)
+            extent = probe.get_window_extent(renderer)
+            measured[label] = (extent.width, extent.height)
+        sizes[idx] = measured[label]
+    return sizes
+
+
 def _create_marker_annotation(
     ax,
     label: str,
@@ -1128,19 +1416,25 @@ def _create_marker_annotation(
     lat: float,
     offset_x: float,
     offset_y: float,
+    *,
+    ha: Optional[str] = None,
+    va: Optional[str] = None,
 ):
     """Render a labelled marker callout offset from `(lon, lat)` with a
-    leader line back to the point. Offset is in display points.
+    leader line back to the point. Offset is in display points; alignment
+    follows the offset direction unless `ha`/`va` are given.
     """
-    ha = "left" if offset_x > 0 else ("right" if offset_x < 0 else "center")
-    va = "bottom" if offset_y > 0 else ("top" if offset_y < 0 else "center")
+    if ha is None:
+        ha = "left" if offset_x > 0 else ("right" if offset_x < 0 else "center")
+    if va is None:
+        va = "bottom" if offset_y > 0 else ("top" if offset_y < 0 else "center")
     return ax.annotate(
         label,
         xy=(lon, lat),
         xycoords=ax.transData,
         xytext=(offset_x, offset_y),
         textcoords="offset points",
-        fontsize=7.5,
+        fontsize=_NOTE_MARKER_FONT_SIZE,
         fontweight="bold",
         ha=ha,
         va=va,
@@ -1156,7 +1450,7 @@ def _create_marker_annotation(
             color="black",
             linewidth=0.6,
             shrinkA=0,
-            shrinkB=3,
+            shrinkB=_NOTE_MARKER_LEADER_SHRINK_PTS,
         ),
         zorder=6,
     )
@@ -1178,7 +1472,11 @@ def _annotate_note_markers(
     back to a small marker dot, so the text doesn't sit on top of the
     speed-coloured scatter. A short placement search picks the first
     candidate offset that doesn't overlap any previously-placed label, then
-    an iterative relaxation pass repels any remaining overlaps.
+    an iterative relaxation pass repels any remaining overlaps, a settle
+    pass pulls labels back toward their first-fit position and a repair pass
+    moves labels whose text still collides. All of it runs on
+    display-pixel boxes (`_NoteLabelLayout`); annotations are created once,
+    at their final offsets.
     """
     if not note_annotations:
         return
@@ -1204,140 +1502,79 @@ def _annotate_note_markers(
             cluster_order.append(key)
         clusters[key]["count"] += 1
 
-    fig = ax.get_figure()
-    # Force a draw so the renderer is ready to compute window extents for
-    # collision detection.
-    fig.canvas.draw()
-    renderer = fig.canvas.get_renderer()
-    dpi = float(fig.dpi)
-
-    try:
-        west, east, south, north = ax.get_extent(crs=ccrs.PlateCarree())
-        mid_lon = (west + east) / 2.0
-        mid_lat = (south + north) / 2.0
-    except Exception:
-        mid_lon = mid_lat = None
-
-    try:
-        axes_bbox = ax.get_window_extent(renderer)
-    except Exception:
-        axes_bbox = None
-
-    placed: List[PlacedLabel] = []
+    if not cluster_order:
+        return
 
+    labels: List[str] = []
     for key in cluster_order:
         cluster = clusters[key]
         if cluster["count"] == 1:
-            label = cluster["letter"]
+            labels.append(cluster["letter"])
         else:
-            label = f"{cluster['letter']}+{cluster['count'] - 1}"
+            labels.append(f"{cluster['letter']}+{cluster['count'] - 1}")
+    lonlat = np.array([[clusters[key]["lon"], clusters[key]["lat"]] for key in cluster_order])
 
-        lon = cluster["lon"]
-        lat = cluster["lat"]
+    # Marker dots at the actual telemetry points, regardless of where each
+    # label ends up. The report map is PlateCarree, so lon/lat are data
+    # coordinates: one plain marker line here, and transData below.
+    ax.plot(
+        lonlat[:, 0],
+        lonlat[:, 1],
+        marker="o",
+        markerfacecolor="black",
+        markeredgecolor="white",
+        markeredgewidth=0.6,
+        markersize=4.5,
+        transform=ccrs.PlateCarree(),
+        zorder=5,
+        linestyle="None",
+    )
 
-        # Marker dot at the actual telemetry point — drawn once regardless of
-        # which label position the search ends up choosing.
-        ax.plot(
-            lon,
-            lat,
-            marker="o",
-            markerfacecolor="black",
-            markeredgecolor="white",
-            markeredgewidth=0.6,
-            markersize=4.5,
-            transform=ccrs.Geodetic(),
-            zorder=5,
-            linestyle="None",
-        )
+    fig = ax.get_figure()
+    # Layout happens in display space: fix the equal-aspect axes position so
+    # transData is final (no full draw needed), then measure text once.
+    renderer = fig.canvas.get_renderer()
+    ax.apply_aspect()
+    px_per_pt = float(fig.dpi) / 72.0
+    anchors = ax.transData.transform(lonlat)
 
-        # Direction preference: nudge the label toward the map centre so
-        # edge points don't push their label off the page. Horizontal-first
-        # ordering avoids stacking text on top of the (usually N-S) track.
-        prefer_dx = -1 if (mid_lon is not None and lon > mid_lon) else 1
-        prefer_dy = -1 if (mid_lat is not None and lat > mid_lat) else 1
-        sorted_directions = [
-            (prefer_dx, 0),
-            (prefer_dx, prefer_dy),
-            (prefer_dx, -prefer_dy),
-            (0, prefer_dy),
-            (-prefer_dx, prefer_dy),
-            (-prefer_dx, 0),
-            (0, -prefer_dy),
-            (-prefer_dx, -prefer_dy),
-        ]
-
-        chosen_annotation = None
-        chosen_offset_x = 0.0
-        chosen_offset_y = 0.0
-        chosen_bbox = None
-        for distance_mult in _NOTE_MARKER_DISTANCE_MULTIPLIERS:
-            standoff = _NOTE_MARKER_BASE_STANDOFF_PTS * distance_mult
-            for dx_unit, dy_unit in sorted_directions:
-                offset_x = dx_unit * standoff
-                offset_y = dy_unit * standoff
-                annotation = _create_marker_annotation(
-                    ax,
-                    label,
-                    lon,
-                    lat,
-                    offset_x,
-                    offset_y,
-                )
-                bbox = annotation.get_window_extent(renderer)
-                if not any(_bboxes_overlap(bbox, item.bbox) for item in placed):
-                    chosen_annotation = annotation
-                    chosen_offset_x = offset_x
-                    chosen_offset_y = offset_y
-                    chosen_bbox = bbox
-                    break
-                annotation.remove()
-            if chosen_annotation is not None:
-                break
-
-        if chosen_annotation is None:
-            # Every candidate overlapped — keep the highest-priority direction
-            # at maximum distance; relaxation will try to untangle afterward.
-            dx_unit, dy_unit = sorted_directions[0]
-            standoff = (
-                _NOTE_MARKER_BASE_STANDOFF_PTS * _NOTE_MARKER_DISTANCE_MULTIPLIERS[-1]
-            )
-            chosen_offset_x = dx_unit * standoff
-            chosen_offset_y = dy_unit * standoff
-            chosen_annotation = _create_marker_annotation(
-                ax,
-                label,
-                lon,
-                lat,
-                chosen_offset_x,
-                chosen_offset_y,
-            )
-            chosen_bbox = chosen_annotation.get_window_extent(renderer)
-
-        placed.append(
-            PlacedLabel(
-                lon=lon,
-                lat=lat,
-                offset_x=chosen_offset_x,
-                offset_y=chosen_offset_y,
-                bbox=chosen_bbox,
-                annotation=chosen_annotation,
-                rest_offset_x=chosen_offset_x,
-                rest_offset_y=chosen_offset_y,
-            )
-        )
+    try:
+        west, east, south, north = ax.get_extent(crs=ccrs.PlateCarree())
+        mid = ax.transData.transform([[(west + east) / 2.0, (south + north) / 2.0]])[0]
+    except Exception:
+        mid = None
 
-    _relax_placed_labels(
-        placed,
-        renderer,
-        axes_bbox=axes_bbox,
-        dpi=dpi,
-    )
-    _settle_labels_toward_anchors(
-        placed,
-        renderer,
-        axes_bbox=axes_bbox,
-        dpi=dpi,
+    try:
+        axes_box = tuple(ax.get_window_extent(renderer).extents)
+    except Exception:
+        axes_box = None
+
+    sizes = _measure_label_sizes(fig, labels, renderer)
+    cell_px = float(sizes.max()) + _NOTE_MARKER_BASE_STANDOFF_PTS * px_per_pt
+    directions = _label_directions(anchors, mid)
+    layout = _place_labels_greedy(
+        anchors,
+        sizes,
+        directions,
+        px_per_pt=px_per_pt,
+        cell_px=cell_px,
     )
+    _relax_labels(layout, axes_box=axes_box)
+    _settle_labels(layout, axes_box=axes_box)
+    _repair_text_overlaps(layout, directions, axes_box=axes_box)
+
+    for idx, label in enumerate(labels):
+        align_x, align_y = layout.align[idx]
+        _create_marker_annotation(
+            ax,
+            label,
+            lonlat[idx, 0],
+            lonlat[idx, 1],
+            float(layout.offsets[idx, 0]),
+            float(layout.offsets[idx, 1]),
+            ha={0.0: "left", -1.0: "right"}.get(float(align_x), "center"),
+            va={0.0: "bottom", -1.0: "top"}.get(float(align_y), "center"),
+        )
 
 
 def _pad_extent_to_aspect(
@@ -1388,7 +1625,8 @@ def plot_telemetry_page_with_notes(
     compass (left), scale bar (center), regional inset (right).
 
     ETOPO 2022 bathymetry depth contours (when enabled) are streamed for the
-    map bbox via ERDDAP griddap and drawn under the track.
+    map bbox via ERDDAP griddap and drawn under the track, over land and
+    coastlines from the pre-rendered basemap tiles (``geo.basemap_cache``).
 
     Mission notes are NOT rendered on this page — the PDF report pipeline
     renders a separate mission-notes section. The map only shows lettered markers.
@@ -1443,7 +1681,6 @@ def plot_telemetry_page_with_notes(
     padded_extent = _pad_extent_to_aspect(strip_extent, target_aspect)
     strip_fraction = _resolve_overlay_strip_fraction(strip_deg, padded_extent)
     _setup_report_map(map_ax, padded_extent)
-    _add_report_bathymetry_contours(map_ax, padded_extent)
 
     norm = mcolors.Normalize(vmin=0, vmax=4)
     cmap = cmo.speed
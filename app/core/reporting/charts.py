@@ -2,20 +2,26 @@
 
 Sizing uses ``LANDSCAPE_CONTENT_*`` / portrait helpers from ``styling``; ``pad_inches`` and
 ``tight_layout`` rects control whitespace inside the PNG, not the PDF margins.
+
+PNGs go through ``figure_cache`` keyed by the input frames and render parameters,
+so regenerating a report over an unchanged data window reuses every figure.
 """
 
 from __future__ import annotations
 
 import io
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import matplotlib.pyplot as plt
 import pandas as pd
 from PIL import Image as PILImage
 from reportlab.platypus import Image
 
+from ..geo.basemap_cache import basemap_cache_enabled
+from ..infra.feature_toggles import is_report_bathymetry_contours_enabled
 from ..plotting import (
+    REPORT_FIGURE_CACHEABLE_ATTR,
     plot_c3_for_report,
     plot_ctd_for_report,
     plot_power_for_report,
@@ -24,27 +30,33 @@ from ..plotting import (
     plot_weather_for_report,
     report_pdf_rc_context,
 )
+from . import figure_cache
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_DPI = 200
 
 
-def _fig_to_image(
-    fig: Any,
-    *,
-    dpi: int = DEFAULT_DPI,
-    max_width_pt: float,
-    max_height_pt: float | None = None,
-) -> Image:
+def _render_png(fig: Any, *, dpi: int = DEFAULT_DPI) -> tuple[bytes, bool]:
+    """PNG bytes and whether the figure is complete enough to cache."""
+    cacheable = getattr(fig, REPORT_FIGURE_CACHEABLE_ATTR, True)
     buf = io.BytesIO()
     try:
         fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", pad_inches=0.04, facecolor="white")
     finally:
         plt.close(fig)
-    buf.seek(0)
-    pil = PILImage.open(buf)
-    px_w, px_h = pil.size
+    return buf.getvalue(), cacheable
+
+
+def _png_to_image(
+    png: bytes,
+    *,
+    max_width_pt: float,
+    max_height_pt: float | None = None,
+) -> Image:
+    buf = io.BytesIO(png)
+    with PILImage.open(buf) as pil:
+        px_w, px_h = pil.size
     aspect = px_h / max(px_w, 1)
     width_pt = max_width_pt
     height_pt = width_pt * aspect
@@ -58,6 +70,25 @@ def _fig_to_image(
     return Image(buf, width=width_pt, height=height_pt)
 
 
+def _cached_chart_image(
+    kind: str,
+    build_fig: Callable[[], Any],
+    *,
+    frames: List[Optional[pd.DataFrame]],
+    params: Optional[Dict[str, Any]] = None,
+    dpi: int,
+    max_width_pt: float,
+    max_height_pt: float | None,
+) -> Image:
+    png = figure_cache.get_or_render(
+        kind,
+        lambda: _render_png(build_fig(), dpi=dpi),
+        frames=frames,
+        params={**(params or {}), "dpi": dpi},
+    )
+    return _png_to_image(png, max_width_pt=max_width_pt, max_height_pt=max_height_pt)
+
+
 def chart_telemetry_image(
     telemetry_df: pd.DataFrame,
     note_annotations: Optional[List[Dict[str, Any]]],
@@ -66,10 +97,28 @@ def chart_telemetry_image(
     max_height_pt: float | None = None,
     dpi: int = DEFAULT_DPI,
 ) -> Image:
-    with report_pdf_rc_context():
-        fig = plt.figure(figsize=(8.27, 11.69))
-        plot_telemetry_page_with_notes(fig, telemetry_df, note_annotations=note_annotations or [])
-    return _fig_to_image(fig, dpi=dpi, max_width_pt=max_width_pt, max_height_pt=max_height_pt)
+    def build() -> Any:
+        with report_pdf_rc_context():
+            fig = plt.figure(figsize=(8.27, 11.69))
+            plot_telemetry_page_with_notes(fig, telemetry_df, note_annotations=note_annotations or [])
+        return fig
+
+    return _cached_chart_image(
+        "telemetry",
+        build,
+        frames=[telemetry_df],
+        params={
+            # The map only draws lettered markers; note text lives in its own section.
+            "note_markers": [
+                [a.get("latitude"), a.get("longitude"), a.get("letter")] for a in note_annotations or []
+            ],
+            "bathymetry_contours": is_report_bathymetry_contours_enabled(),
+            "basemap_raster": basemap_cache_enabled(),
+        },
+        dpi=dpi,
+        max_width_pt=max_width_pt,
+        max_height_pt=max_height_pt,
+    )
 
 
 def chart_power_image(
@@ -81,16 +130,27 @@ def chart_power_image(
     max_height_pt: float | None = None,
     dpi: int = DEFAULT_DPI,
 ) -> Image:
-    with report_pdf_rc_context():
-        fig = plt.figure(figsize=(11.69, 8.27))
-        plot_power_for_report(
-            fig,
-            power_df,
-            solar_df,
-            battery_max_wh=battery_max_wh,
-        )
-        fig.tight_layout(rect=[0, 0.02, 1, 0.96])
-    return _fig_to_image(fig, dpi=dpi, max_width_pt=max_width_pt, max_height_pt=max_height_pt)
+    def build() -> Any:
+        with report_pdf_rc_context():
+            fig = plt.figure(figsize=(11.69, 8.27))
+            plot_power_for_report(
+                fig,
+                power_df,
+                solar_df,
+                battery_max_wh=battery_max_wh,
+            )
+            fig.tight_layout(rect=[0, 0.02, 1, 0.96])
+        return fig
+
+    return _cached_chart_image(
+        "power",
+        build,
+        frames=[power_df, solar_df],
+        params={"battery_max_wh": battery_max_wh},
+        dpi=dpi,
+        max_width_pt=max_width_pt,
+        max_height_pt=max_height_pt,
+    )
 
 
 def chart_ctd_image(
@@ -100,11 +160,21 @@ def chart_ctd_image(
     max_height_pt: float | None = None,
     dpi: int = DEFAULT_DPI,
 ) -> Image:
-    with report_pdf_rc_context():
-        fig = plt.figure(figsize=(11.69, 8.27))
-        plot_ctd_for_report(fig, ctd_df)
-        fig.tight_layout(rect=[0, 0.02, 1, 0.97])
-    return _fig_to_image(fig, dpi=dpi, max_width_pt=max_width_pt, max_height_pt=max_height_pt)
+    def build() -> Any:
+        with report_pdf_rc_context():
+            fig = plt.figure(figsize=(11.69, 8.27))
+            plot_ctd_for_report(fig, ctd_df)
+            fig.tight_layout(rect=[0, 0.02, 1, 0.97])
+        return fig
+
+    return _cached_chart_image(
+        "ctd",
+        build,
+        frames=[ctd_df],
+        dpi=dpi,
+        max_width_pt=max_width_pt,
+        max_height_pt=max_height_pt,
+    )
 
 
 def chart_weather_image(
@@ -114,11 +184,21 @@ def chart_weather_image(
     max_height_pt: float | None = None,
     dpi: int = DEFAULT_DPI,
 ) -> Image:
-    with report_pdf_rc_context():
-        fig = plt.figure(figsize=(11.69, 8.27))
-        plot_weather_for_report(fig, weather_df)
-        fig.tight_layout(rect=[0, 0.02, 1, 0.97])
-    return _fig_to_image(fig, dpi=dpi, max_width_pt=max_width_pt, max_height_pt=max_height_pt)
+    def build() -> Any:
+        with report_pdf_rc_context():
+            fig = plt.figure(figsize=(11.69, 8.27))
+            plot_weather_for_report(fig, weather_df)
+            fig.tight_layout(rect=[0, 0.02, 1, 0.97])
+        return fig
+
+    return _cached_chart_image(
+        "weather",
+        build,
+        frames=[weather_df],
+        dpi=dpi,
+        max_width_pt=max_width_pt,
+        max_height_pt=max_height_pt,
+    )
 
 
 def chart_wave_image(
@@ -128,11 +208,21 @@ def chart_wave_image(
     max_height_pt: float | None = None,
     dpi: int = DEFAULT_DPI,
 ) -> Image:
-    with report_pdf_rc_context():
-        fig = plt.figure(figsize=(11.69, 8.27))
-        plot_wave_for_report(fig, wave_df)
-        fig.tight_layout(rect=[0, 0.02, 1, 0.97])
-    return _fig_to_image(fig, dpi=dpi, max_width_pt=max_width_pt, max_height_pt=max_height_pt)
+    def build() -> Any:
+        with report_pdf_rc_context():
+            fig = plt.figure(figsize=(11.69, 8.27))
+            plot_wave_for_report(fig, wave_df)
+            fig.tight_layout(rect=[0, 0.02, 1, 0.97])
+        return fig
+
+    return _cached_chart_image(
+        "wave",
+        build,
+        frames=[wave_df],
+        dpi=dpi,
+        max_width_pt=max_width_pt,
+        max_height_pt=max_height_pt,
+    )
 
 
 def chart_c3_image(
@@ -143,8 +233,19 @@ def chart_c3_image(
     max_height_pt: float | None = None,
     dpi: int = DEFAULT_DPI,
 ) -> Image:
-    with report_pdf_rc_context():
-        fig = plt.figure(figsize=(11.69, 8.27))
-        plot_c3_for_report(fig, fluorometer_df, channel_map=channel_map)
-        fig.tight_layout(rect=[0, 0.02, 1, 0.97])
-    return _fig_to_image(fig, dpi=dpi, max_width_pt=max_width_pt, max_height_pt=max_height_pt)
+    def build() -> Any:
+        with report_pdf_rc_context():
+            fig = plt.figure(figsize=(11.69, 8.27))
+            plot_c3_for_report(fig, fluorometer_df, channel_map=channel_map)
+            fig.tight_layout(rect=[0, 0.02, 1, 0.97])
+        return fig
+
+    return _cached_chart_image(
+        "c3",
+        build,
+        frames=[fluorometer_df],
+        params={"channel_map": channel_map},
+        dpi=dpi,
+        max_width_pt=max_width_pt,
+        max_height_pt=max_height_pt,
+    )
@@ -0,0 +1,201 @@
+"""Content-addressed disk cache for rendered report figures (PNG bytes).
+
+A figure is keyed by a SHA-256 over its chart kind, ``FIGURE_STYLE_VERSION``,
+the matplotlib version, a digest of every input DataFrame slice and the
+render parameters (dpi, note annotations, toggles, ...). Regenerating a
+report whose data window did not change - e.g. after editing a note or one
+section - reuses every unchanged chart and track map instead of re-plotting.
+
+Sizing for the PDF (``max_width_pt`` etc.) is not part of the key: it only
+scales the ReportLab flowable, not the PNG.
+
+Files live under ``report_figure_cache_dir`` as ``<key[:2]>/<key>.png`` and are
+shared by all workers. A hit bumps the file mtime, so the daily cleanup (TTL
+plus ``report_figure_cache_max_bytes`` quota) evicts least recently used first.
+
+Bump ``FIGURE_STYLE_VERSION`` whenever report plotting output changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import matplotlib
+import pandas as pd
+
+from ...config import settings
+from ..utils import (
+    enforce_cache_dir_quota,
+    iter_cache_files,
+    purge_cache_dir,
+    resolve_data_path,
+    write_bytes_atomic,
+)
+
+logger = logging.getLogger(__name__)
+
+FIGURE_STYLE_VERSION = 4
+
+# render() -> (png bytes, cacheable); cacheable=False for degraded output
+# (e.g. bathymetry contours unavailable) so it is re-rendered next time.
+Renderer = Callable[[], tuple[bytes, bool]]
+
+_stats: dict[str, Any] = {
+    "hits": 0,
+    "misses": 0,
+    "renders_not_cached": 0,
+    "bytes_written": 0,
+    "last_cleanup_at": None,
+    "last_cleanup_summary": None,
+}
+
+
+def get_figure_cache_dir() -> Path:
+    return resolve_data_path(settings.report_figure_cache_dir)
+
+
+def _enabled() -> bool:
+    return bool(getattr(settings, "report_figure_cache_enabled", True))
+
+
+def frame_digest(df: Optional[pd.DataFrame]) -> str:
+    """Stable digest of a DataFrame's columns, dtypes, index and values."""
+    h = hashlib.sha256()
+    if df is None:
+        return "none"
+    h.update(json.dumps([str(c) for c in df.columns]).encode())
+    h.update(json.dumps([str(t) for t in df.dtypes]).encode())
+    try:
+        h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cells (lists/dicts in object columns).
+        h.update(df.to_json(date_format="iso", default_handler=str).encode())
+    return h.hexdigest()
+
+
+def figure_key(
+    kind: str,
+    *,
+    frames: Iterable[Optional[pd.DataFrame]] = (),
+    params: Optional[dict[str, Any]] = None,
+) -> str:
+    payload = {
+        "kind": kind,
+        "style": FIGURE_STYLE_VERSION,
+        "matplotlib": matplotlib.__version__,
+        "frames": [frame_digest(df) for df in frames],
+        "params": params or {},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return get_figure_cache_dir() / key[:2] / f"{key}.png"
+
+
+def _read_entry(path: Path) -> Optional[bytes]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        logger.warning("Failed to read report figure cache %s: %s", path, exc)
+        return None
+    try:
+        os.utime(path)  # LRU for the quota
+    except OSError:
+        pass
+    return data or None
+
+
+def _write_entry(path: Path, data: bytes) -> None:
+    if write_bytes_atomic(path, data, label="report figure cache"):
+        _stats["bytes_written"] += len(data)
+
+
+def get_or_render(
+    kind: str,
+    render: Renderer,
+    *,
+    frames: Iterable[Optional[pd.DataFrame]] = (),
+    params: Optional[dict[str, Any]] = None,
+) -> bytes:
+    """PNG for ``kind`` over ``frames``/``params``: cached copy, else ``render()`` and store."""
+    if not _enabled():
+        return render()[0]
+    path = _entry_path(figure_key(kind, frames=frames, params=params))
+    cached = _read_entry(path)
+    if cached is not None:
+        _stats["hits"] += 1
+        return cached
+    _stats["misses"] += 1
+    data, cacheable = render()
+    if cacheable:
+        _write_entry(path, data)
+    else:
+        _stats["renders_not_cached"] += 1
+    return data
+
+
+def _iter_entries() -> list[tuple[Path, float, int]]:
+    return iter_cache_files(get_figure_cache_dir(), "*/*.png")
+
+
+def get_figure_cache_status() -> dict[str, Any]:
+    entries = _iter_entries()
+    lookups = _stats["hits"] + _stats["misses"]
+    return {
+        "cache_dir": str(get_figure_cache_dir()),
+        "enabled": _enabled(),
+        "style_version": FIGURE_STYLE_VERSION,
+        "files": len(entries),
+        "total_bytes": sum(size for _, _, size in entries),
+        "max_bytes": int(getattr(settings, "report_figure_cache_max_bytes", 0) or 0),
+        "max_age_days": int(getattr(settings, "report_figure_cache_max_age_days", 60)),
+        "hit_rate": round(_stats["hits"] / lookups, 3) if lookups else None,
+        **_stats,
+    }
+
+
+def enforce_figure_cache_quota() -> dict[str, int]:
+    """Evict least recently used figures until under report_figure_cache_max_bytes."""
+    return enforce_cache_dir_quota(
+        get_figure_cache_dir(),
+        "*/*.png",
+        int(getattr(settings, "report_figure_cache_max_bytes", 0) or 0),
+        label="report figure",
+    )
+
+
+def purge_figure_cache(
+    *,
+    force_all: bool = False,
+    max_age_days: Optional[int] = None,
+    enforce_quota: bool = True,
+) -> dict[str, Any]:
+    """Remove figures unused for ``max_age_days`` (or all, plus stray tmp files), then enforce quota."""
+    if max_age_days is None:
+        max_age_days = int(getattr(settings, "report_figure_cache_max_age_days", 60))
+    return purge_cache_dir(
+        get_figure_cache_dir(),
+        "*/*.png",
+        max_age_days=max_age_days,
+        max_bytes=int(getattr(settings, "report_figure_cache_max_bytes", 0) or 0),
+        force_all=force_all,
+        enforce_quota=enforce_quota,
+        label="report figure",
+    )
+
+
+def run_figure_cache_cleanup() -> dict[str, Any]:
+    """Always-on disk cleanup: TTL purge + LRU quota."""
+    summary = purge_figure_cache(force_all=False, enforce_quota=True)
+    _stats["last_cleanup_at"] = datetime.now(timezone.utc).isoformat()
+    _stats["last_cleanup_summary"] = summary
+    return summary
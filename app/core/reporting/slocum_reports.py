@@ -25,6 +25,7 @@ from ..slocum_deployment_service import get_or_create_deployment_for_dataset
 from ..slocum_mirror_service import dashboard_df_to_track_df
 from ..slocum_overage_cache import OverageResult
 from ..utils import slocum_mission_key
+from . import figure_cache
 from .common import build_platform_cover_flowables, get_report_paragraph_styles
 from .constants import REPORTS_ROOT
 
@@ -120,15 +121,19 @@ def load_slocum_notes_for_report(session: SQLModelSession, deployment_id: int) -
     )
 
 
-def _fig_to_image(fig: Any, *, max_width_pt: float) -> Image:
+def _render_png(fig: Any) -> bytes:
     buf = io.BytesIO()
     try:
         fig.savefig(buf, format="png", dpi=180, bbox_inches="tight", pad_inches=0.05, facecolor="white")
     finally:
         plt.close(fig)
-    buf.seek(0)
-    pil = PILImage.open(buf)
-    px_w, px_h = pil.size
+    return buf.getvalue()
+
+
+def _png_to_image(png: bytes, *, max_width_pt: float) -> Image:
+    buf = io.BytesIO(png)
+    with PILImage.open(buf) as pil:
+        px_w, px_h = pil.size
     aspect = px_h / max(px_w, 1)
     width_pt = max_width_pt
     height_pt = width_pt * aspect
@@ -142,13 +147,23 @@ def _line_chart_image(df: pd.DataFrame, y_col: str, title: str, *, max_width_pt:
     series = df.set_index("Timestamp")[y_col].astype(float).dropna()
     if series.empty:
         return None
-    with report_pdf_rc_context():
-        fig, ax = plt.subplots(figsize=(8.27, 3.5))
-        ax.plot(series.index, series.values, linewidth=1.2)
-        ax.set_title(title)
-        ax.grid(True, alpha=0.3)
-        fig.autofmt_xdate()
-    return _fig_to_image(fig, max_width_pt=max_width_pt)
+
+    def render() -> tuple[bytes, bool]:
+        with report_pdf_rc_context():
+            fig, ax = plt.subplots(figsize=(8.27, 3.5))
+            ax.plot(series.index, series.values, linewidth=1.2)
+            ax.set_title(title)
+            ax.grid(True, alpha=0.3)
+            fig.autofmt_xdate()
+        return _render_png(fig), True
+
+    png = figure_cache.get_or_render(
+        "slocum_line",
+        render,
+        frames=[series.to_frame()],
+        params={"title": title},
+    )
+    return _png_to_image(png, max_width_pt=max_width_pt)
 
 
 def write_slocum_weekly_pdf(
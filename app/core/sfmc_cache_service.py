@@ -4,19 +4,32 @@ Persist and refresh SFMC-derived checklist autofill per Slocum deployment.
 One snapshot row per deployment is upserted by a leader-only background job
 (and by the pilot-facing force-refresh endpoint). Checklist template reads
 prefer the cache so page loads do not wait on live SFMC HTTP.
+
+The background job plans the whole fleet at once: eligible deployments are
+grouped by glider (one SFMC load per vehicle), gliders are loaded
+concurrently inside one ``sfmc_request_batch`` (identical GETs deduped), and
+the shared rate limiter in ``sfmc_client`` keeps the total under budget.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 from sqlmodel import Session, select
 
+from ..config import settings
 from . import models
-from .sfmc_client import load_sfmc_checklist_values, sfmc_is_configured
+from .sfmc_file_cache import enforce_sfmc_file_cache_quota
+from .sfmc_client import (
+    load_sfmc_checklist_values,
+    sfmc_is_configured,
+    sfmc_request_batch,
+)
 from .slocum_mirror_service import is_historical_dataset
 
 logger = logging.getLogger(__name__)
@@ -30,6 +43,12 @@ def _deployment_linked_to_historical(deployment: models.SlocumDeployment) -> boo
         return True
     return False
 
+
+def _is_placeholder_glider(glider: str) -> bool:
+    # Placeholder / sandbox briefings are not SFMC vehicles (legacy local "Testing" row).
+    return glider.lower() in {"testing", "test", "dummy"}
+
+
 def _parse_values_json(raw: Optional[str]) -> dict[str, str]:
     if not raw or not str(raw).strip():
         return {}
@@ -125,8 +144,7 @@ async def refresh_sfmc_snapshot(
         session.refresh(row)
         return row
 
-    # Placeholder / sandbox briefings are not SFMC vehicles (legacy local "Testing" row).
-    if glider.lower() in {"testing", "test", "dummy"}:
+    if _is_placeholder_glider(glider):
         row.fetch_error = f"Skipping SFMC for placeholder glider_name={glider!r}"
         session.add(row)
         session.commit()
@@ -149,9 +167,7 @@ async def refresh_sfmc_snapshot(
 
     try:
         values = await load_sfmc_checklist_values(glider)
-        row.values_json = _dump_values_json(values)
-        row.fetched_at_utc = datetime.now(timezone.utc)
-        row.fetch_error = None
+        error: Optional[str] = None
     except Exception as err:
         logger.warning(
             "SFMC snapshot refresh failed for deployment %s (%s): %s",
@@ -159,9 +175,27 @@ async def refresh_sfmc_snapshot(
             glider,
             err,
         )
+        values, error = None, str(err)
+
+    return _store_snapshot_result(session, row, values, error)
+
+
+def _store_snapshot_result(
+    session: Session,
+    row: models.SlocumSfmcSnapshot,
+    values: Optional[dict[str, str]],
+    error: Optional[str],
+) -> models.SlocumSfmcSnapshot:
+    """Persist one load outcome; ``values is None`` keeps last-known-good."""
+    now = datetime.now(timezone.utc)
+    if values is not None and error is None:
+        row.values_json = _dump_values_json(values)
+        row.fetched_at_utc = now
+        row.fetch_error = None
+    else:
         # Keep previous values_json; surface the error for UI freshness notes.
-        row.fetch_error = str(err)[:2000]
-        row.updated_at_utc = datetime.now(timezone.utc)
+        row.fetch_error = (error or "SFMC load failed")[:2000]
+    row.updated_at_utc = now
 
     session.add(row)
     session.commit()
@@ -169,6 +203,25 @@ async def refresh_sfmc_snapshot(
     return row
 
 
+def _refresh_concurrency() -> int:
+    return max(1, int(getattr(settings, "sfmc_refresh_max_concurrency", 4) or 1))
+
+
+async def _timed_glider_load(
+    glider: str,
+    gate: asyncio.Semaphore,
+) -> tuple[Optional[dict[str, str]], Optional[str], float]:
+    """Return ``(values, error, latency_sec)`` for one glider's SFMC load."""
+    async with gate:
+        started = time.monotonic()
+        try:
+            values = await load_sfmc_checklist_values(glider)
+            return values, None, time.monotonic() - started
+        except Exception as err:
+            logger.warning("SFMC snapshot load failed for %s: %s", glider, err)
+            return None, str(err), time.monotonic() - started
+
+
 async def refresh_all_active_sfmc_snapshots(session: Session) -> dict[str, Any]:
     """
     Refresh SFMC snapshots for every non-soft-deleted deployment with a glider name.
@@ -191,36 +244,64 @@ async def refresh_all_active_sfmc_snapshots(session: Session) -> dict[str, Any]:
         )
     ).all()
 
-    attempted = 0
-    succeeded = 0
-    failed = 0
+    # Plan: one SFMC load per glider, however many briefings point at it.
+    plan: dict[str, list[models.SlocumDeployment]] = {}
     for deployment in deployments:
         if _deployment_linked_to_historical(deployment):
             continue
         glider = (deployment.glider_name or "").strip()
-        if not glider or glider.lower() in {"testing", "test", "dummy"}:
+        if not glider or _is_placeholder_glider(glider):
             continue
         if not (deployment.erddap_dataset_id or "").strip():
             continue
-        attempted += 1
-        try:
-            row = await refresh_sfmc_snapshot(session, deployment)
-            if row.fetch_error:
+        plan.setdefault(glider, []).append(deployment)
+
+    started = time.monotonic()
+    gate = asyncio.Semaphore(_refresh_concurrency())
+    gliders = list(plan)
+    with sfmc_request_batch():
+        outcomes = await asyncio.gather(
+            *(_timed_glider_load(glider, gate) for glider in gliders)
+        )
+
+    # DB writes stay sequential on the caller's session.
+    attempted = 0
+    succeeded = 0
+    failed = 0
+    latency_sec: dict[str, float] = {}
+    for glider, (values, error, latency) in zip(gliders, outcomes):
+        latency_sec[glider] = round(latency, 3)
+        for deployment in plan[glider]:
+            attempted += 1
+            try:
+                row = _get_or_create_snapshot(session, deployment)
+                row.glider_name = glider
+                row = _store_snapshot_result(session, row, values, error)
+                if row.fetch_error:
+                    failed += 1
+                else:
+                    succeeded += 1
+            except Exception as err:
                 failed += 1
-            else:
-                succeeded += 1
-        except Exception as err:
-            failed += 1
-            logger.warning(
-                "SFMC snapshot job failed for deployment %s (%s): %s",
-                getattr(deployment, "id", None),
-                glider,
-                err,
-            )
+                session.rollback()
+                logger.warning(
+                    "SFMC snapshot job failed for deployment %s (%s): %s",
+                    getattr(deployment, "id", None),
+                    glider,
+                    err,
+                )
+
+    try:
+        enforce_sfmc_file_cache_quota()
+    except OSError as err:
+        logger.warning("SFMC file cache quota enforcement failed: %s", err)
 
     return {
         "skipped": False,
         "attempted": attempted,
         "succeeded": succeeded,
         "failed": failed,
+        "gliders": len(gliders),
+        "elapsed_sec": round(time.monotonic() - started, 3),
+        "glider_latency_sec": latency_sec,
     }
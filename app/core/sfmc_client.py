@@ -13,15 +13,19 @@ from __future__ import annotations
 
 import logging
 import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from pathlib import PurePosixPath
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from urllib.parse import quote
 
 import asyncio
 import httpx
 
 from ..config import settings
+from . import sfmc_file_cache
+from .sfmc_file_cache import Fingerprint, listing_fingerprint
 from .sfmc_transforms import (
     dialog_values_for_checklist,
     extract_from_dockserver_commands,
@@ -53,6 +57,32 @@ _SIGNIN_FAIL_COOLDOWN_SEC = 60.0
 _rate_lock: Optional[asyncio.Lock] = None
 _last_request_mono: float = 0.0
 _rate_limited_until_mono: float = 0.0
+# Concurrent refresh stages share one signin instead of racing for tokens.
+_signin_lock: Optional[asyncio.Lock] = None
+
+
+# Per-refresh-run GET memo (see ``sfmc_request_batch``). Maps request key →
+# shared task so identical lookups issued by concurrent gliders/stages hit
+# SFMC once. ``None`` outside a batch (pilot force-refresh stays uncached).
+_batch_memo: ContextVar[Optional[dict[tuple[Any, ...], "asyncio.Task[Any]"]]] = ContextVar(
+    "sfmc_batch_memo", default=None
+)
+
+
+@contextmanager
+def sfmc_request_batch() -> Iterator[None]:
+    """
+    Dedupe identical SFMC GETs for the duration of one refresh run.
+
+    Tasks spawned inside the block (``asyncio.gather``) inherit the memo, so a
+    lookup shared by several stages or deployments is requested once and every
+    caller awaits the same response.
+    """
+    token = _batch_memo.set({})
+    try:
+        yield
+    finally:
+        _batch_memo.reset(token)
 
 
 def _get_rate_lock() -> asyncio.Lock:
@@ -62,6 +92,13 @@ def _get_rate_lock() -> asyncio.Lock:
     return _rate_lock
 
 
+def _get_signin_lock() -> asyncio.Lock:
+    global _signin_lock
+    if _signin_lock is None:
+        _signin_lock = asyncio.Lock()
+    return _signin_lock
+
+
 def _max_requests_per_minute() -> int:
     return max(1, int(getattr(settings, "sfmc_max_requests_per_minute", 20) or 20))
 
@@ -153,6 +190,19 @@ async def get_access_token(*, force_refresh: bool = False) -> Optional[str]:
     if not force_refresh and cached and now < expires_at:
         return str(cached)
 
+    async with _get_signin_lock():
+        # Another stage may have signed in (or failed) while we waited.
+        now = time.monotonic()
+        if not force_refresh:
+            if now < float(_token_cache.get("fail_until") or 0.0):
+                return None
+            cached = _token_cache.get("token")
+            if cached and now < float(_token_cache.get("expires_at") or 0.0):
+                return str(cached)
+        return await _signin(now)
+
+
+async def _signin(now: float) -> Optional[str]:
     url = f"{_base_url()}/sfmc/api/signin"
     body = {
         "clientId": settings.sfmc_client_id,
@@ -282,8 +332,29 @@ async def _request(
     return response.text
 
 
+async def _batched_get(
+    path: str,
+    *,
+    params: Optional[dict[str, Any]] = None,
+    expect_json: bool,
+) -> Optional[Any]:
+    """``GET`` through the active ``sfmc_request_batch`` memo when one is set."""
+    memo = _batch_memo.get()
+    if memo is None:
+        return await _request("GET", path, params=params, expect_json=expect_json)
+    key = (path, tuple(sorted((params or {}).items())), expect_json)
+    task = memo.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _request("GET", path, params=params, expect_json=expect_json)
+        )
+        memo[key] = task
+    # shield: one cancelled waiter must not cancel the shared request.
+    return await asyncio.shield(task)
+
+
 async def _get_json(path: str, *, params: Optional[dict[str, Any]] = None) -> Optional[Any]:
-    payload = await _request("GET", path, params=params, expect_json=True)
+    payload = await _batched_get(path, params=params, expect_json=True)
     return _unwrap_data(payload)
 
 
@@ -295,18 +366,19 @@ def _unwrap_data(payload: Any) -> Any:
 
 
 async def _get_text(path: str, *, params: Optional[dict[str, Any]] = None) -> Optional[str]:
-    result = await _request("GET", path, params=params, expect_json=False)
+    result = await _batched_get(path, params=params, expect_json=False)
     return result if isinstance(result, str) else None
 
 
-def _folder_names_from_listing(payload: Any) -> list[str]:
+def _folder_entries_from_listing(payload: Any) -> list[tuple[str, Any]]:
+    """``(name, raw_item)`` pairs from a folder listing (raw item may be a bare string)."""
     if payload is None:
         return []
     if isinstance(payload, list):
-        names: list[str] = []
+        entries: list[tuple[str, Any]] = []
         for item in payload:
             if isinstance(item, str):
-                names.append(item)
+                entries.append((item, item))
             elif isinstance(item, dict):
                 name = (
                     item.get("fileName")
@@ -315,16 +387,30 @@ def _folder_names_from_listing(payload: Any) -> list[str]:
                     or item.get("path")
                 )
                 if name:
-                    names.append(str(name))
-        return names
+                    entries.append((str(name), item))
+        return entries
     if isinstance(payload, dict):
         # Live SFMC: {links, limit, results:[{fileName, dateTimeModified, fileSize}]}
         for key in ("results", "files", "listing", "content", "entries", "fileListing"):
             if key in payload:
-                return _folder_names_from_listing(payload[key])
+                return _folder_entries_from_listing(payload[key])
     return []
 
 
+def _folder_names_from_listing(payload: Any) -> list[str]:
+    return [name for name, _item in _folder_entries_from_listing(payload)]
+
+
+def _listing_fingerprints(payload: Any) -> dict[str, Fingerprint]:
+    """Map file name → ``(fileSize, dateTimeModified)`` for cacheable listing rows."""
+    out: dict[str, Fingerprint] = {}
+    for name, item in _folder_entries_from_listing(payload):
+        fingerprint = listing_fingerprint(item)
+        if fingerprint is not None:
+            out[name] = fingerprint
+    return out
+
+
 def _extract_script_from_scripts_payload(payload: Any) -> Optional[str]:
     """Best-effort assigned/current script name from scripts-for-glider JSON."""
     if payload is None:
@@ -435,14 +521,39 @@ async def fetch_folder_listing(
     return await _get_json(path, params=params)
 
 
-async def download_glider_file_text(glider_name: str, folder: str, file_name: str) -> Optional[str]:
+async def download_glider_file_text(
+    glider_name: str,
+    folder: str,
+    file_name: str,
+    *,
+    fingerprint: Optional[Fingerprint] = None,
+) -> Optional[str]:
+    """
+    Download a glider file as text.
+
+    With a listing ``fingerprint`` the shared-disk ``sfmc_file_cache`` is
+    consulted first and populated on success, so unchanged files are fetched
+    from SFMC only once. An HTML page in place of the file counts as a failed
+    download (``None``) and is never cached.
+    """
+    if fingerprint is not None:
+        cached = sfmc_file_cache.read_cached_text(glider_name, folder, file_name, fingerprint)
+        if cached is not None:
+            return cached
     path = (
         f"/sfmc/api/v1/download-glider-file/"
         f"{quote(glider_name, safe='')}/"
         f"{quote(folder, safe='')}/"
         f"{quote(file_name, safe='')}"
     )
-    return await _get_text(path)
+    text = await _get_text(path)
+    if text and sfmc_file_cache.is_error_page(text):
+        # _request already drops non-200s; this is a login / error page sent as a 200.
+        logger.warning("SFMC returned an HTML page for %s/%s/%s", glider_name, folder, file_name)
+        return None
+    if text and fingerprint is not None:
+        sfmc_file_cache.write_cached_text(glider_name, folder, file_name, fingerprint, text)
+    return text
 
 
 def _last_modified_after_24h() -> str:
@@ -499,10 +610,22 @@ async def fetch_latest_goto_from_archive(glider_name: str) -> Optional[dict[str,
     if not latest:
         return None
 
-    text = await download_glider_file_text(glider_name, "archive", latest)
-    if not text:
-        return None
-    parsed = parse_goto_ma(text)
+    fingerprint = _listing_fingerprints(payload).get(latest)
+    parsed: Optional[dict[str, Any]] = None
+    if fingerprint is not None:
+        parsed = sfmc_file_cache.get_parsed(
+            glider_name, "archive", latest, fingerprint, "goto_ma"
+        )
+    if parsed is None:
+        text = await download_glider_file_text(
+            glider_name, "archive", latest, fingerprint=fingerprint
+        )
+        if not text:
+            return None
+        parsed = sfmc_file_cache.cached_parse(
+            glider_name, "archive", latest, fingerprint, "goto_ma", text, parse_goto_ma
+        )
+    parsed = dict(parsed)
     parsed["archive_filename"] = latest
     return parsed
 
@@ -627,6 +750,8 @@ async def fetch_dialog_checklist_values(
     if deployment:
         candidates.extend(_collect_log_filenames(deployment))
 
+    # Listing fingerprints let unchanged logs come from sfmc_file_cache.
+    fingerprints: dict[str, Fingerprint] = {}
     if not candidates:
         # Live REST shapes lack connectionsMap.logFilePath — list dockserver logs.
         try:
@@ -637,6 +762,7 @@ async def fetch_dialog_checklist_values(
                 filter_glob="*_network_net_*.log",
             )
             candidates.extend(_folder_names_from_listing(listing))
+            fingerprints = _listing_fingerprints(listing)
         except Exception as err:
             logger.debug("SFMC logs folder listing failed for %s: %s", glider_name, err)
 
@@ -656,7 +782,17 @@ async def fetch_dialog_checklist_values(
         )
         return {}
 
-    text = await download_glider_file_text(glider_name, "logs", latest)
+    fingerprint = fingerprints.get(latest)
+    if fingerprint is not None:
+        parsed = sfmc_file_cache.get_parsed(
+            glider_name, "logs", latest, fingerprint, "surface_dialog"
+        )
+        if parsed is not None:
+            return dialog_values_for_checklist(parsed)
+
+    text = await download_glider_file_text(
+        glider_name, "logs", latest, fingerprint=fingerprint
+    )
     if not text:
         # Fallback: UI tail endpoint (may require session cookie on some hosts).
         glider_id = _glider_id_from_details(details)
@@ -672,7 +808,16 @@ async def fetch_dialog_checklist_values(
         return {}
 
     # Device Status / ABORT HISTORY sit at the end of the surface dialog.
-    return dialog_values_for_checklist(parse_surface_dialog_log(text[-24000:]))
+    parsed = sfmc_file_cache.cached_parse(
+        glider_name,
+        "logs",
+        latest,
+        fingerprint,
+        "surface_dialog",
+        text,
+        lambda raw: parse_surface_dialog_log(raw[-24000:]),
+    )
+    return dialog_values_for_checklist(parsed)
 
 
 def _normalize_active_deployment_for_transforms(payload: dict[str, Any]) -> dict[str, Any]:
@@ -699,6 +844,15 @@ def _normalize_active_deployment_for_transforms(payload: dict[str, Any]) -> dict
     return out
 
 
+async def _guarded(label: str, glider_name: str, coro: Any) -> Any:
+    """Await ``coro``; log and return ``None`` on failure (best-effort stage)."""
+    try:
+        return await coro
+    except Exception as err:
+        logger.warning("SFMC %s failed for %s: %s", label, glider_name, err)
+        return None
+
+
 async def load_sfmc_checklist_values(glider_name: str) -> dict[str, str]:
     """
     Pull SFMC-derived checklist autofill for ``glider_name`` (e.g. ``peggy``).
@@ -707,6 +861,14 @@ async def load_sfmc_checklist_values(glider_name: str) -> dict[str, str]:
     Requests are paced by ``sfmc_max_requests_per_minute`` and reuse payloads
     where possible to stay under SFMC's ~25 req/min limit.
 
+    Independent lookups run concurrently in two stages so their HTTP latency
+    overlaps inside the shared rate budget:
+
+    1. newest mission, active deployment, glider details, ``from-glider``
+       listing, goto archive (listing + download);
+    2. once the active deployment is known: network-log dialog and, only when
+       no running script was found, the scripts catalog.
+
     Scope: **active** SFMC deployments only (``active-deployment``, newest mission,
     live folder listings). Archived SFMC missions are not covered — callers must
     skip archived Buddy ``SlocumDeployment`` rows on the background refresh loop.
@@ -715,22 +877,24 @@ async def load_sfmc_checklist_values(glider_name: str) -> dict[str, str]:
     if not name or not sfmc_is_configured():
         return {}
 
+    mission, surface, details, offload, goto = await asyncio.gather(
+        _guarded("newest-mission-details", name, fetch_newest_mission_details(name)),
+        _guarded("active-deployment fetch", name, fetch_surface_events_payload(name)),
+        _guarded("glider details", name, fetch_glider_details(name)),
+        _guarded("from-glider listing", name, fetch_offload_hint(name)),
+        _guarded("goto archive fetch", name, fetch_latest_goto_from_archive(name)),
+    )
+
     parts: list[dict[str, str]] = []
     # Prefer active-deployment script name over scripts catalog (catalog has no assignment).
     active_script: Optional[str] = None
-    surface: Optional[dict[str, Any]] = None
 
-    try:
-        mission = await fetch_newest_mission_details(name)
-        mission_name = _mission_name_from_payload(mission)
-        if mission_name:
-            parts.append({"mission_file_running_val": mission_name})
-    except Exception as err:
-        logger.warning("SFMC newest-mission-details failed for %s: %s", name, err)
+    mission_name = _mission_name_from_payload(mission)
+    if mission_name:
+        parts.append({"mission_file_running_val": mission_name})
 
-    try:
-        surface = await fetch_surface_events_payload(name)
-        if surface:
+    if surface:
+        try:
             transformed = extract_from_surface_events_payload(
                 _normalize_active_deployment_for_transforms(surface)
             )
@@ -744,50 +908,44 @@ async def load_sfmc_checklist_values(glider_name: str) -> dict[str, str]:
                     display = f"{display} (not running)"
                 active_script = display
                 parts.append({"script_running_val": display})
-    except Exception as err:
-        logger.warning("SFMC active-deployment fetch failed for %s: %s", name, err)
-
-    try:
-        # Reuse active-deployment payload; only fetch /gliders/{name} for id/log paths.
-        dialog = await fetch_dialog_checklist_values(
-            name,
-            deployment=surface,
-        )
-        if dialog:
-            parts.append(dialog)
-    except Exception as err:
-        logger.warning("SFMC dialog log-tail failed for %s: %s", name, err)
+        except Exception as err:
+            logger.warning("SFMC active-deployment transform failed for %s: %s", name, err)
 
+    # Reuse active-deployment / glider details payloads for log paths.
+    dialog_stage = _guarded(
+        "dialog log-tail",
+        name,
+        fetch_dialog_checklist_values(name, details=details, deployment=surface),
+    )
     # Scripts catalog / dockserver command log only when active-deployment
     # did not already provide the running script.
-    if not active_script:
-        try:
-            scripts_payload = await fetch_scripts_for_glider(name)
-            script_name = _extract_script_from_scripts_payload(scripts_payload)
-            if script_name:
-                parts.append({"script_running_val": script_name})
-            # Reuse same payload when it is a command list; avoid a second GET.
-            if isinstance(scripts_payload, list) and scripts_payload and isinstance(
-                scripts_payload[0], dict
-            ):
-                if "dockServerScriptName" in scripts_payload[0] or "command" in scripts_payload[0]:
-                    parts.append(extract_from_dockserver_commands(scripts_payload))
-        except Exception as err:
-            logger.warning("SFMC scripts fetch failed for %s: %s", name, err)
+    if active_script:
+        dialog, scripts_payload = await dialog_stage, None
+    else:
+        dialog, scripts_payload = await asyncio.gather(
+            dialog_stage,
+            _guarded("scripts fetch", name, fetch_scripts_for_glider(name)),
+        )
 
-    try:
-        offload = await fetch_offload_hint(name)
-        if offload:
-            parts.append({"offloaded_24h_val": offload})
-    except Exception as err:
-        logger.warning("SFMC from-glider listing failed for %s: %s", name, err)
+    if dialog:
+        parts.append(dialog)
 
-    try:
-        goto = await fetch_latest_goto_from_archive(name)
-        if goto and goto.get("display"):
-            parts.append({"goto_state_val": str(goto["display"])})
-    except Exception as err:
-        logger.warning("SFMC goto archive fetch failed for %s: %s", name, err)
+    if scripts_payload is not None:
+        script_name = _extract_script_from_scripts_payload(scripts_payload)
+        if script_name:
+            parts.append({"script_running_val": script_name})
+        # Reuse same payload when it is a command list; avoid a second GET.
+        if isinstance(scripts_payload, list) and scripts_payload and isinstance(
+            scripts_payload[0], dict
+        ):
+            if "dockServerScriptName" in scripts_payload[0] or "command" in scripts_payload[0]:
+                parts.append(extract_from_dockserver_commands(scripts_payload))
+
+    if offload:
+        parts.append({"offloaded_24h_val": offload})
+
+    if goto and goto.get("display"):
+        parts.append({"goto_state_val": str(goto["display"])})
 
     merged = merge_sfmc_checklist_values(*parts)
     if merged:
@@ -0,0 +1,287 @@
+"""
+Shared-disk cache for SFMC glider file downloads and their parsed results.
+
+Archive goto ``.ma`` files and dockserver network logs are immutable once
+written (a growing log shows up with a new size / modified stamp), so each
+download is keyed by ``(glider, folder, filename, fileSize, dateTimeModified)``
+from the SFMC folder listing. A hit serves the raw text from disk and any
+parsed artifact stored beside it; the SFMC rate budget is only spent on files
+whose listing fingerprint changed.
+
+Files without a listing fingerprint (e.g. a ``logFilePath`` lifted from the
+active-deployment payload) are never cached, and neither is an HTML login or
+error page served with a 200 in place of the file: the fingerprint never
+changes, so a cached error page would never be re-fetched.
+
+Layout under ``sfmc_file_cache_dir``::
+
+    <glider>/<sha256>.txt    raw text
+    <glider>/<sha256>.json   {glider, folder, file_name, fingerprint, parsed: {...}}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ..config import settings
+from .utils import replace_path_with_retries, resolve_data_path, unique_sibling_tmp_path
+
+logger = logging.getLogger(__name__)
+
+# Bump when sfmc_transforms parsers change output so stale parsed blobs are ignored
+# (raw text stays valid and is simply reparsed).
+PARSED_SCHEMA_VERSION = 1
+
+Fingerprint = tuple[Optional[int], Optional[str]]
+
+def _cache_dir() -> Path:
+    return resolve_data_path(settings.sfmc_file_cache_dir)
+
+
+def _safe_segment(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", value or "") or "_"
+
+
+def listing_fingerprint(item: Any) -> Optional[Fingerprint]:
+    """
+    ``(fileSize, dateTimeModified)`` for one SFMC listing row, or ``None``.
+
+    At least one of the two must be present; otherwise the file cannot be
+    told apart from a later rewrite and is not cached.
+    """
+    if not isinstance(item, dict):
+        return None
+    size_raw = item.get("fileSize", item.get("size"))
+    modified_raw = (
+        item.get("dateTimeModified")
+        or item.get("lastModified")
+        or item.get("modified")
+    )
+    size: Optional[int] = None
+    try:
+        if size_raw is not None and str(size_raw).strip() != "":
+            size = int(size_raw)
+    except (TypeError, ValueError):
+        size = None
+    modified = str(modified_raw).strip() if modified_raw else None
+    if size is None and not modified:
+        return None
+    return size, modified
+
+
+def _entry_key(glider: str, folder: str, file_name: str, fingerprint: Fingerprint) -> str:
+    size, modified = fingerprint
+    raw = "\0".join((glider, folder, file_name, str(size), modified or ""))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _entry_paths(
+    glider: str, folder: str, file_name: str, fingerprint: Fingerprint
+) -> tuple[Path, Path]:
+    key = _entry_key(glider, folder, file_name, fingerprint)
+    root = _cache_dir() / _safe_segment(glider)
+    return root / f"{key}.txt", root / f"{key}.json"
+
+
+_ERROR_PAGE_PREFIXES = ("<!doctype", "<html")
+
+
+def is_error_page(text: str) -> bool:
+    """True when ``text`` is an HTML page (SFMC login / error) rather than a glider file."""
+    return text.lstrip()[:16].lower().startswith(_ERROR_PAGE_PREFIXES)
+
+
+def _touch(path: Path) -> None:
+    """Refresh mtime so quota eviction is least-recently-used."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = unique_sibling_tmp_path(path)
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(data)
+            handle.flush()
+        replace_path_with_retries(tmp_path, path)
+    except Exception:
+        try:
+            if tmp_path.is_file():
+                tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _read_meta(meta_path: Path) -> dict[str, Any]:
+    if not meta_path.is_file():
+        return {}
+    try:
+        payload = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as err:
+        logger.debug("Ignoring unreadable SFMC cache meta %s: %s", meta_path, err)
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _write_meta(
+    meta_path: Path,
+    glider: str,
+    folder: str,
+    file_name: str,
+    fingerprint: Fingerprint,
+    parsed: dict[str, Any],
+) -> None:
+    payload = {
+        "glider": glider,
+        "folder": folder,
+        "file_name": file_name,
+        "fingerprint": list(fingerprint),
+        "parsed": parsed,
+    }
+    _atomic_write_bytes(meta_path, json.dumps(payload, ensure_ascii=True).encode("utf-8"))
+
+
+def read_cached_text(
+    glider: str, folder: str, file_name: str, fingerprint: Fingerprint
+) -> Optional[str]:
+    text_path, _ = _entry_paths(glider, folder, file_name, fingerprint)
+    try:
+        text = text_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError) as err:
+        logger.debug("SFMC file cache read failed for %s: %s", text_path, err)
+        return None
+    if is_error_page(text):
+        # Written before error pages were rejected; drop it so the caller re-fetches.
+        logger.warning("Dropping cached SFMC error page for %s/%s", folder, file_name)
+        try:
+            text_path.unlink()
+        except OSError:
+            pass
+        return None
+    _touch(text_path)
+    return text
+
+
+def write_cached_text(
+    glider: str, folder: str, file_name: str, fingerprint: Fingerprint, text: str
+) -> None:
+    if is_error_page(text):
+        logger.warning("Not caching SFMC HTML response for %s/%s", folder, file_name)
+        return
+    text_path, _ = _entry_paths(glider, folder, file_name, fingerprint)
+    try:
+        _atomic_write_bytes(text_path, text.encode("utf-8"))
+    except OSError as err:
+        logger.warning("SFMC file cache write failed for %s/%s: %s", folder, file_name, err)
+
+
+def get_parsed(
+    glider: str,
+    folder: str,
+    file_name: str,
+    fingerprint: Fingerprint,
+    parser_name: str,
+) -> Optional[dict[str, Any]]:
+    _, meta_path = _entry_paths(glider, folder, file_name, fingerprint)
+    parsed = _read_meta(meta_path).get("parsed") or {}
+    entry = parsed.get(parser_name)
+    if isinstance(entry, dict) and entry.get("version") == PARSED_SCHEMA_VERSION:
+        result = entry.get("result")
+        if isinstance(result, dict):
+            _touch(meta_path)
+            return result
+    return None
+
+
+def put_parsed(
+    glider: str,
+    folder: str,
+    file_name: str,
+    fingerprint: Fingerprint,
+    parser_name: str,
+    result: dict[str, Any],
+) -> None:
+    _, meta_path = _entry_paths(glider, folder, file_name, fingerprint)
+    parsed = dict(_read_meta(meta_path).get("parsed") or {})
+    parsed[parser_name] = {"version": PARSED_SCHEMA_VERSION, "result": result}
+    try:
+        _write_meta(meta_path, glider, folder, file_name, fingerprint, parsed)
+    except (OSError, TypeError, ValueError) as err:
+        logger.warning("SFMC parsed cache write failed for %s/%s: %s", folder, file_name, err)
+
+
+def cached_parse(
+    glider: str,
+    folder: str,
+    file_name: str,
+    fingerprint: Optional[Fingerprint],
+    parser_name: str,
+    text: str,
+    parser: Callable[[str], dict[str, Any]],
+) -> dict[str, Any]:
+    """Run ``parser(text)``, memoised on disk when the file has a fingerprint."""
+    if fingerprint is None:
+        return parser(text)
+    result = get_parsed(glider, folder, file_name, fingerprint, parser_name)
+    if result is not None:
+        return result
+    result = parser(text)
+    put_parsed(glider, folder, file_name, fingerprint, parser_name, result)
+    return result
+
+
+def _iter_cache_files() -> list[tuple[Path, float, int]]:
+    """Return (path, mtime, byte_size) for every cached text/meta file."""
+    root = _cache_dir()
+    entries: list[tuple[Path, float, int]] = []
+    if not root.is_dir():
+        return entries
+    for path in root.glob("*/*"):
+        if path.suffix not in (".txt", ".json"):
+            continue
+        try:
+            st = path.stat()
+            entries.append((path, st.st_mtime, st.st_size))
+        except OSError:
+            continue
+    return entries
+
+
+def enforce_sfmc_file_cache_quota() -> dict[str, int]:
+    """Evict least-recently-used files until under ``sfmc_file_cache_max_bytes``."""
+    max_bytes = int(getattr(settings, "sfmc_file_cache_max_bytes", 0) or 0)
+    if max_bytes <= 0:
+        return {"evicted_files": 0, "freed_bytes": 0}
+
+    entries = _iter_cache_files()
+    total = sum(size for _, _, size in entries)
+    if total <= max_bytes:
+        return {"evicted_files": 0, "freed_bytes": 0}
+
+    entries.sort(key=lambda item: item[1])  # oldest mtime first
+    removed_files = 0
+    freed = 0
+    for path, _mtime, size in entries:
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            removed_files += 1
+            freed += size
+            total -= size
+        except OSError as err:
+            logger.warning("Failed to evict SFMC file cache entry %s: %s", path, err)
+
+    return {"evicted_files": removed_files, "freed_bytes": freed}
@@ -18,6 +18,8 @@ from __future__ import annotations
 
 from typing import Optional
 
+from sqlalchemy import and_
+
 from ..models.database import StationMetadata
 
 
@@ -26,6 +28,14 @@ def station_in_ops_registry_list(station: StationMetadata) -> bool:
     return not station.is_retired and not station.is_archived
 
 
+def ops_registry_station_filter():
+    """SQL ``WHERE`` clause for ``station_in_ops_registry_list`` (live, non-archived stations)."""
+    return and_(
+        StationMetadata.is_retired == False,  # noqa: E712
+        StationMetadata.is_archived == False,  # noqa: E712
+    )
+
+
 def station_blocks_edits(station: StationMetadata) -> bool:
     """True if offload logs and mutable registry fields must not change (retired or legacy archived)."""
     return station.is_retired or station.is_archived
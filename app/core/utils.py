@@ -210,6 +210,62 @@ def _is_retryable_replace_error(err: BaseException, *, is_windows: bool) -> bool
     return en in retryable
 
 
+def _lock_handle_nb(fh) -> bool:
+    """Non-blocking exclusive lock on an open lock file; False if another process holds it."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            fh.seek(0)
+            if fh.read(1) == b"":
+                fh.write(b"0")
+                fh.flush()
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+        # No platform lock available — proceed without blocking.
+        return True
+    except OSError:
+        return False
+
+
+def _unlock_handle(fh) -> None:
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        fh.seek(0)
+        try:
+            msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+
+
+def _handle_is_path(fh, lock_path: Path) -> bool:
+    """True while ``lock_path`` still names the file ``fh`` has open."""
+    try:
+        return os.fstat(fh.fileno()).st_ino == os.stat(lock_path).st_ino
+    except OSError:
+        return False
+
+
+def _lock_path_nb(lock_path: Path):
+    """Open and lock ``lock_path`` without waiting; the locked handle, or None if held.
+
+    A purge may unlink the lock file (while holding it) between our ``open``
+    and the lock call, leaving us locking an orphaned inode while another
+    worker creates and locks a fresh file at the path. So after locking, the
+    handle must still be the file at ``lock_path``; otherwise reopen and retry.
+    """
+    while True:
+        fh = open(lock_path, "a+b")
+        if not _lock_handle_nb(fh):
+            fh.close()
+            return None
+        if _handle_is_path(fh, lock_path):
+            return fh
+        _unlock_handle(fh)
+        fh.close()
+
+
 @contextmanager
 def cross_process_file_lock(
     lock_path: Path,
@@ -224,46 +280,63 @@ def cross_process_file_lock(
     """
     lock_path = Path(lock_path)
     lock_path.parent.mkdir(parents=True, exist_ok=True)
-    fh = open(lock_path, "a+b")
     start = time.monotonic()
-    locked = False
+    fh = _lock_path_nb(lock_path)
+    while fh is None:
+        if (time.monotonic() - start) >= timeout_seconds:
+            raise TimeoutError(f"Timed out waiting for file lock {lock_path}")
+        time.sleep(0.1)
+        fh = _lock_path_nb(lock_path)
     try:
-        while True:
-            try:
-                if fcntl is not None:
-                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    locked = True
-                    break
-                if msvcrt is not None:
-                    fh.seek(0)
-                    if fh.read(1) == b"":
-                        fh.write(b"0")
-                        fh.flush()
-                    fh.seek(0)
-                    msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
-                    locked = True
-                    break
-                # No platform lock available — proceed without blocking.
-                locked = True
-                break
-            except OSError:
-                if (time.monotonic() - start) >= timeout_seconds:
-                    raise TimeoutError(f"Timed out waiting for file lock {lock_path}")
-                time.sleep(0.1)
         yield
     finally:
-        try:
-            if locked:
-                if fcntl is not None:
-                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
-                elif msvcrt is not None:
-                    fh.seek(0)
-                    try:
-                        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
-                    except OSError:
-                        pass
-        finally:
-            fh.close()
+        release_cross_process_file_lock(fh)
+
+
+def try_cross_process_file_lock(lock_path: Path):
+    """
+    Take the ``cross_process_file_lock`` lock without waiting.
+
+    Returns the open lock handle (pass it to ``release_cross_process_file_lock``)
+    or ``None`` when another process holds the lock. The OS drops the lock if the
+    holder dies, so a crashed worker never leaves it stuck.
+    """
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    return _lock_path_nb(lock_path)
+
+
+def release_cross_process_file_lock(fh) -> None:
+    try:
+        _unlock_handle(fh)
+    finally:
+        fh.close()
+
+
+def unlink_unheld_lock_file(lock_path: Path) -> Optional[int]:
+    """
+    Delete a lock file no process holds; returns its size, or ``None`` if kept.
+
+    Lock files carry no age signal (locking never touches their mtime), so
+    cache purges must not remove them by age: a lock unlinked under a holder
+    lets the next worker lock a fresh file at the same path. Here the file is
+    unlinked while we hold it, and a worker that opened the old path meanwhile
+    notices the inode change after locking and reopens (``_lock_path_nb``).
+    """
+    lock_path = Path(lock_path)
+    if not lock_path.is_file():
+        return None
+    fh = _lock_path_nb(lock_path)
+    if fh is None:
+        return None
+    try:
+        size = lock_path.stat().st_size
+        lock_path.unlink()
+    except OSError:
+        return None
+    finally:
+        release_cross_process_file_lock(fh)
+    return size
 
 
 def replace_path_with_retries(
@@ -341,6 +414,124 @@ def replace_path_with_retries(
     ) from last_err
 
 
+def write_bytes_atomic(path: Path, data: bytes, *, label: str = "cache file") -> bool:
+    """Write ``data`` to ``path`` through a unique sibling tmp file; ``False`` (logged) on OSError."""
+    path = Path(path)
+    tmp_path = unique_sibling_tmp_path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+        replace_path_with_retries(tmp_path, path)
+        return True
+    except OSError as exc:
+        logger.warning("Failed to write %s %s: %s", label, path, exc)
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return False
+
+
+def iter_cache_files(root: Path, pattern: str) -> list[tuple[Path, float, int]]:
+    """(path, mtime, size) for files under ``root`` matching ``pattern``."""
+    root = Path(root)
+    if not root.is_dir():
+        return []
+    entries = []
+    for path in root.glob(pattern):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((path, st.st_mtime, st.st_size))
+    return entries
+
+
+def enforce_cache_dir_quota(
+    root: Path, pattern: str, max_bytes: int, *, label: str = "cache file"
+) -> dict[str, int]:
+    """Evict least recently used (oldest mtime) ``pattern`` files until under ``max_bytes``; 0 = no quota."""
+    if max_bytes <= 0:
+        return {"evicted_files": 0, "freed_bytes": 0}
+
+    entries = iter_cache_files(root, pattern)
+    total = sum(size for _, _, size in entries)
+    entries.sort(key=lambda item: item[1])  # oldest mtime (last use) first
+    removed_files = 0
+    freed = 0
+    for path, _mtime, size in entries:
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            removed_files += 1
+            freed += size
+            total -= size
+        except OSError as err:
+            logger.warning("Failed to evict %s %s: %s", label, path, err)
+    return {"evicted_files": removed_files, "freed_bytes": freed}
+
+
+def purge_cache_dir(
+    root: Path,
+    pattern: str,
+    *,
+    max_age_days: int,
+    max_bytes: int,
+    force_all: bool = False,
+    enforce_quota: bool = True,
+    label: str = "cache file",
+) -> dict[str, Any]:
+    """
+    TTL + quota cleanup for a directory of mtime-as-last-use cache files.
+
+    Removes ``pattern`` files unused for ``max_age_days`` (all with
+    ``force_all``) and stray tmp files (``pattern`` with a ``.tmp`` suffix)
+    older than an hour, then evicts down to ``max_bytes``.
+    """
+    root = Path(root)
+    cutoff = time.time() - max(0, max_age_days) * 24 * 60 * 60
+
+    removed_files = 0
+    freed_bytes = 0
+    for path, mtime, size in iter_cache_files(root, pattern):
+        if not force_all and mtime >= cutoff:
+            continue
+        try:
+            path.unlink()
+            removed_files += 1
+            freed_bytes += size
+        except OSError as err:
+            logger.warning("Failed to remove %s %s: %s", label, path, err)
+
+    tmp_cutoff = time.time() - 3600
+    tmp_pattern = f"{pattern.rsplit('.', 1)[0]}.tmp"
+    for tmp, mtime, size in iter_cache_files(root, tmp_pattern):
+        if mtime >= tmp_cutoff and not force_all:
+            continue
+        try:
+            tmp.unlink()
+            removed_files += 1
+            freed_bytes += size
+        except OSError:
+            continue
+
+    quota = {"evicted_files": 0, "freed_bytes": 0}
+    if enforce_quota:
+        quota = enforce_cache_dir_quota(root, pattern, max_bytes, label=label)
+        removed_files += quota["evicted_files"]
+        freed_bytes += quota["freed_bytes"]
+
+    return {
+        "removed_files": removed_files,
+        "freed_bytes": freed_bytes,
+        "quota_evicted_files": quota["evicted_files"],
+        "quota_freed_bytes": quota["freed_bytes"],
+        "force_all": force_all,
+        "max_age_days": max_age_days,
+    }
+
+
 def get_effective_local_path(
     source_preference: Optional[str], custom_local_path: Optional[str]
 ) -> Optional[str]:
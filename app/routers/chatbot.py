@@ -5,16 +5,21 @@ Handles HTTP endpoints for chatbot/FAQ functionality.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from fastapi.responses import HTMLResponse
-from typing import List, Optional
+from fastapi.responses import HTMLResponse, StreamingResponse
+from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+import asyncio
+import json
+import time
 
 from sqlmodel import select
 from ..core import models
 from ..core.infra.db import get_db_session, SQLModelSession
 from ..core.auth import get_current_active_user, get_current_admin_user, get_optional_current_user
+from ..services.answer_cache import AnswerCacheHit
 from ..services.chatbot_service import chatbot_service
-from ..services.llm_service import llm_service, ContextSource
+from ..services.llm_service import llm_service, ContextSource, LLMQueueFullError
 from ..core.templates import templates
 from ..core.template_context import get_template_context
 from ..config import settings
@@ -92,32 +97,52 @@ async def slocum_admin_faqs_page(
 async def get_chatbot_status(
     current_user: models.User = Depends(get_current_active_user)
 ):
-    """Get chatbot service status including LLM availability."""
+    """Get chatbot service status including LLM availability.
+
+    Never waits for the embedding model or the Ollama probe; ``ready`` flips
+    to true once both have finished warming (see ``readiness``).
+    """
     vector_enabled = False
     vector_doc_count = 0
     vector_tip_count = 0
     vector_faq_count = 0
     
-    if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
+    vector_service = chatbot_service.vector_service
+    if vector_service and vector_service.enabled:
         vector_enabled = True
         try:
-            vector_doc_count = chatbot_service.vector_service.documents_collection.count()
-            vector_tip_count = chatbot_service.vector_service.tips_collection.count()
-            vector_faq_count = chatbot_service.vector_service.faq_collection.count()
+            vector_doc_count = vector_service.documents_collection.count()
+            vector_tip_count = vector_service.tips_collection.count()
+            vector_faq_count = vector_service.faq_collection.count()
         except Exception:
             pass
+
+    vector_readiness = chatbot_service.readiness()
+    llm_readiness = llm_service.readiness()
+    ready = all(
+        r["state"] in ("ready", "disabled", "failed")
+        for r in (vector_readiness, llm_readiness)
+    )
     
     return {
+        "ready": ready,
+        "readiness": {
+            "vector_search": vector_readiness,
+            "llm": llm_readiness,
+        },
         "vector_search": {
             "enabled": vector_enabled,
             "documents_indexed": vector_doc_count,
             "tips_indexed": vector_tip_count,
-            "faqs_indexed": vector_faq_count
+            "faqs_indexed": vector_faq_count,
+            "query_cache": vector_service.query_cache_info() if vector_enabled else None,
         },
+        "answer_cache": chatbot_service.answer_cache.stats() if chatbot_service.answer_cache else None,
         "llm": {
             "enabled": settings.llm_enabled,
-            "available": llm_service.is_available(),
-            "model": settings.llm_model if settings.llm_enabled else None
+            "available": llm_service.enabled and await asyncio.to_thread(llm_service.is_available),
+            "model": llm_service.model if settings.llm_enabled else None,
+            "metrics": llm_service.metrics() if settings.llm_enabled else None,
         },
         "settings": {
             "similarity_threshold": settings.vector_similarity_threshold,
@@ -126,6 +151,320 @@ async def get_chatbot_status(
     }
 
 
+@dataclass
+class _QueryRetrieval:
+    """Everything retrieved for one chatbot query, before LLM synthesis."""
+    platform: str
+    user_id: Optional[int]
+    matched_faqs_with_scores: list
+    related_documents: List[models.RelatedResource]
+    related_tips: List[models.RelatedResource]
+    context_sources: List[ContextSource]
+    documents: list = field(default_factory=list)  # rows behind related_documents
+    tips: list = field(default_factory=list)  # rows behind related_tips
+
+    @property
+    def matched_faqs(self) -> list:
+        return [faq for faq, score in self.matched_faqs_with_scores]
+
+    @classmethod
+    def from_cache_hit(cls, hit: AnswerCacheHit, user_id: Optional[int]) -> "_QueryRetrieval":
+        return cls(
+            platform=hit.entry.platform,
+            user_id=user_id,
+            matched_faqs_with_scores=hit.faqs,
+            related_documents=[r.model_copy() for r in hit.entry.related_documents],
+            related_tips=[r.model_copy() for r in hit.entry.related_tips],
+            context_sources=[],
+        )
+
+
+async def _prepare_query(
+    query_request: models.ChatbotQueryRequest,
+    current_user: models.User,
+    session: SQLModelSession,
+) -> Tuple[str, Optional[int]]:
+    """Canonical platform and user id for a query, once the services are warm."""
+    # Normalize to canonical platform only; no cross-platform data
+    raw = (query_request.platform or "wave_glider").strip().lower()
+    platform = "slocum" if raw == "slocum" else "wave_glider"
+    
+    # Get user ID from database
+    from ..core import auth
+    user_in_db = auth.get_user_from_db(session, current_user.username)
+    user_id = user_in_db.id if user_in_db else None
+    
+    # First query after boot waits here (off the event loop) for warm-up.
+    await chatbot_service.get_vector_service()
+    await llm_service.ensure_ready()
+    return platform, user_id
+
+
+async def _lookup_cached_answer(
+    query: str,
+    platform: str,
+    session: SQLModelSession,
+) -> Tuple[Optional[AnswerCacheHit], Optional[List[float]]]:
+    """Cached LLM answer for a near-identical query, plus the query embedding.
+
+    The embedding is returned so a miss can store the fresh answer under it.
+    Answers are only cached (and served) while the LLM is enabled.
+    """
+    answer_cache = chatbot_service.answer_cache
+    if answer_cache is None or not llm_service.enabled:
+        return None, None
+    query_embedding = await chatbot_service.query_embedding(query)
+    hit = answer_cache.lookup(session, platform, query, query_embedding)
+    if hit is not None:
+        logger.info(f"Chatbot answer served from cache (similarity {hit.similarity:.3f})")
+    return hit, query_embedding
+
+
+def _cache_answer(
+    query: str,
+    query_embedding: Optional[List[float]],
+    retrieval: _QueryRetrieval,
+    synthesized_response: str,
+    sources_used: List[str],
+    generation_seconds: float,
+) -> None:
+    answer_cache = chatbot_service.answer_cache
+    if answer_cache is None:
+        return
+    answer_cache.store(
+        platform=retrieval.platform,
+        query=query,
+        embedding=query_embedding,
+        faqs=retrieval.matched_faqs_with_scores,
+        documents=retrieval.documents,
+        tips=retrieval.tips,
+        related_documents=retrieval.related_documents,
+        related_tips=retrieval.related_tips,
+        synthesized_response=synthesized_response,
+        sources_used=sources_used,
+        llm_model=llm_service.model,
+        generation_seconds=generation_seconds,
+    )
+
+
+async def _retrieve_for_query(
+    query_request: models.ChatbotQueryRequest,
+    platform: str,
+    user_id: Optional[int],
+    session: SQLModelSession,
+) -> _QueryRetrieval:
+    """Match FAQs, documents and tips for a query and build the LLM context.
+    All data (FAQs, documents, tips) is strictly scoped to the given platform;
+    Slocum context never sees or references Wave Glider content, and vice versa.
+    """
+    kb_base = "/slocum" if platform == "slocum" else ""
+
+    # Detect query intent for targeted searching
+    intent = chatbot_service.detect_query_intent(query_request.query)
+    
+    # Vector search for FAQs, documents and tips from a single query embedding.
+    # If troubleshooting query, prioritize troubleshooting documents and tips.
+    category_filter = "troubleshooting" if intent['troubleshooting'] else None
+    tag_filter = "troubleshooting" if intent['troubleshooting'] else None
+    
+    logger.debug(f"Query intent: {intent}, category_filter: {category_filter}")
+    
+    # FAQs come from the platform's in-memory keyword index (hybrid re-ranked
+    # with vector hits); only the matched FAQ rows are loaded.
+    matched_faqs_with_scores, vector_doc_results, vector_tip_results = await chatbot_service.search_all(
+        query_request.query,
+        session,
+        category_filter=category_filter,
+        tag_filter=tag_filter,
+        limit=5,
+        platform=platform,
+    )
+    
+    matched_faqs = [faq for faq, score in matched_faqs_with_scores]
+    
+    # Get related documents and tips from FAQs (manual links)
+    all_related_doc_ids = set()
+    all_related_tip_ids = set()
+    
+    for faq in matched_faqs:
+        if faq.related_document_ids:
+            doc_ids = [int(id.strip()) for id in faq.related_document_ids.split(',') if id.strip().isdigit()]
+            all_related_doc_ids.update(doc_ids)
+        if faq.related_tip_ids:
+            tip_ids = [int(id.strip()) for id in faq.related_tip_ids.split(',') if id.strip().isdigit()]
+            all_related_tip_ids.update(tip_ids)
+    
+    def _build_snippet(text: str, max_len: int = 240) -> str:
+        snippet = " ".join((text or "").split())
+        if len(snippet) <= max_len:
+            return snippet
+        return snippet[:max_len].rstrip() + "..."
+
+    logger.debug(f"Vector doc results: {len(vector_doc_results)} matches")
+    
+    doc_snippets = {}
+    # Add vector search document results
+    for metadata, similarity, content in vector_doc_results:
+        doc_id = int(metadata.get('doc_id', 0))
+        logger.debug(f"  Doc match: id={doc_id}, sim={similarity:.3f}, title={metadata.get('title', 'N/A')[:30]}")
+        if doc_id and doc_id not in all_related_doc_ids:
+            all_related_doc_ids.add(doc_id)
+        if doc_id and doc_id not in doc_snippets:
+            doc_snippets[doc_id] = {
+                "snippet": _build_snippet(content),
+                "similarity": similarity,
+                "chunk_index": int(metadata.get("chunk_index", 0)) if metadata.get("chunk_index") is not None else None,
+            }
+    
+    logger.debug(f"Vector tip results: {len(vector_tip_results)} matches")
+    
+    tip_snippets = {}
+    # Add vector search tip results
+    for metadata, similarity, content in vector_tip_results:
+        tip_id = int(metadata.get('tip_id', 0))
+        logger.debug(f"  Tip match: id={tip_id}, sim={similarity:.3f}, title={metadata.get('title', 'N/A')[:30]}")
+        if tip_id and tip_id not in all_related_tip_ids:
+            all_related_tip_ids.add(tip_id)
+        if tip_id and tip_id not in tip_snippets:
+            tip_snippets[tip_id] = {
+                "snippet": _build_snippet(content),
+                "similarity": similarity,
+                "chunk_index": None,
+            }
+    
+    # Fetch related documents from database
+    related_documents = []
+    docs_for_context = []
+    if all_related_doc_ids:
+        doc_stmt = select(models.KnowledgeDocument).where(
+            models.KnowledgeDocument.id.in_(list(all_related_doc_ids)),
+            models.KnowledgeDocument.is_active == True,
+            models.KnowledgeDocument.platform == platform,
+        )
+        docs = session.exec(doc_stmt).all()
+        for doc in docs:
+            snippet_meta = doc_snippets.get(doc.id, {})
+            related_documents.append(models.RelatedResource(
+                type="document",
+                id=doc.id,
+                title=doc.title,
+                url=f"{kb_base}/knowledge_base.html#document-{doc.id}" if kb_base else f"/knowledge_base.html#document-{doc.id}",
+                snippet=snippet_meta.get("snippet"),
+                similarity=snippet_meta.get("similarity"),
+                chunk_index=snippet_meta.get("chunk_index"),
+            ))
+            # Prepare context for LLM
+            docs_for_context.append(doc)
+    
+    # Fetch related tips from database
+    related_tips = []
+    tips_for_context = []
+    if all_related_tip_ids:
+        tip_stmt = select(models.SharedTip).where(
+            models.SharedTip.id.in_(list(all_related_tip_ids)),
+            models.SharedTip.is_archived == False,
+            models.SharedTip.platform == platform,
+        )
+        tips = session.exec(tip_stmt).all()
+        for tip in tips:
+            snippet_meta = tip_snippets.get(tip.id, {})
+            related_tips.append(models.RelatedResource(
+                type="tip",
+                id=tip.id,
+                title=tip.title,
+                url=f"{kb_base}/shared_tips.html?tip_id={tip.id}" if kb_base else f"/shared_tips.html?tip_id={tip.id}",
+                snippet=snippet_meta.get("snippet"),
+                similarity=snippet_meta.get("similarity"),
+                chunk_index=snippet_meta.get("chunk_index"),
+            ))
+            # Prepare context for LLM
+            tips_for_context.append(tip)
+    
+    # Build context sources for LLM
+    context_sources = []
+    
+    # Add FAQs to context
+    for faq, score in matched_faqs_with_scores:
+        context_sources.append(ContextSource(
+            source_type="faq",
+            title=faq.question,
+            content=faq.answer,
+            id=faq.id,
+            category=faq.category,
+            similarity=score / 100.0  # Normalize to 0-1
+        ))
+    
+    # Add documents to context (use vector search results for similarity)
+    for metadata, similarity, content in vector_doc_results:
+        doc_id = int(metadata.get('doc_id', 0))
+        doc_title = metadata.get('title', 'Document')
+        # Find full content from database
+        for doc in docs_for_context:
+            if doc.id == doc_id:
+                context_sources.append(ContextSource(
+                    source_type="document",
+                    title=doc_title,
+                    content=doc.searchable_content or content,
+                    id=doc_id,
+                    category=doc.category,
+                    similarity=similarity
+                ))
+                break
+    
+    # Add tips to context
+    for metadata, similarity, content in vector_tip_results:
+        tip_id = int(metadata.get('tip_id', 0))
+        tip_title = metadata.get('title', 'Tip')
+        for tip in tips_for_context:
+            if tip.id == tip_id:
+                context_sources.append(ContextSource(
+                    source_type="tip",
+                    title=tip_title,
+                    content=tip.content,
+                    id=tip_id,
+                    category=tip.category,
+                    similarity=similarity
+                ))
+                break
+
+    return _QueryRetrieval(
+        platform=platform,
+        user_id=user_id,
+        matched_faqs_with_scores=matched_faqs_with_scores,
+        related_documents=related_documents,
+        related_tips=related_tips,
+        context_sources=context_sources,
+        documents=docs_for_context,
+        tips=tips_for_context,
+    )
+
+
+def _record_interaction(
+    session: SQLModelSession,
+    query: str,
+    retrieval: _QueryRetrieval,
+) -> models.ChatbotInteraction:
+    """Log the interaction and bump view counts of the matched FAQs."""
+    matched_faqs = retrieval.matched_faqs
+    matched_faq_ids = [faq.id for faq in matched_faqs]
+    interaction = models.ChatbotInteraction(
+        user_id=retrieval.user_id,
+        query=query,
+        matched_faq_ids=','.join(map(str, matched_faq_ids)) if matched_faq_ids else None,
+        platform=retrieval.platform,
+    )
+    session.add(interaction)
+    session.commit()
+    session.refresh(interaction)
+    
+    # Increment view count for matched FAQs
+    for faq in matched_faqs:
+        faq.view_count += 1
+        session.add(faq)
+    session.commit()
+    return interaction
+
+
 @router.post("/api/chatbot/query", response_model=models.ChatbotResponse)
 async def query_chatbot(
     query_request: models.ChatbotQueryRequest,
@@ -137,204 +476,25 @@ async def query_chatbot(
     Slocum context never sees or references Wave Glider content, and vice versa.
     """
     try:
-        # Normalize to canonical platform only; no cross-platform data
-        raw = (query_request.platform or "wave_glider").strip().lower()
-        platform = "slocum" if raw == "slocum" else "wave_glider"
-        kb_base = "/slocum" if platform == "slocum" else ""
-        
-        # Get user ID from database
-        from ..core import auth
-        user_in_db = auth.get_user_from_db(session, current_user.username)
-        user_id = user_in_db.id if user_in_db else None
-        
-        # Detect query intent for targeted searching
-        intent = chatbot_service.detect_query_intent(query_request.query)
-        
-        # Get all active FAQs for this platform
-        faq_stmt = select(models.FAQEntry).where(
-            models.FAQEntry.is_active == True,
-            models.FAQEntry.platform == platform,
-        )
-        faq_entries = session.exec(faq_stmt).all()
-        
-        # Match FAQs to query (uses vector search if available)
-        matched_faqs_with_scores = chatbot_service.match_faqs(
-            query_request.query,
-            faq_entries,
-            limit=5
-        )
-        
-        matched_faqs = [faq for faq, score in matched_faqs_with_scores]
-        matched_faq_ids = [faq.id for faq in matched_faqs]
-        
-        # Get related documents and tips from FAQs (manual links)
-        all_related_doc_ids = set()
-        all_related_tip_ids = set()
-        
-        for faq in matched_faqs:
-            if faq.related_document_ids:
-                doc_ids = [int(id.strip()) for id in faq.related_document_ids.split(',') if id.strip().isdigit()]
-                all_related_doc_ids.update(doc_ids)
-            if faq.related_tip_ids:
-                tip_ids = [int(id.strip()) for id in faq.related_tip_ids.split(',') if id.strip().isdigit()]
-                all_related_tip_ids.update(tip_ids)
-        
-        def _build_snippet(text: str, max_len: int = 240) -> str:
-            snippet = " ".join((text or "").split())
-            if len(snippet) <= max_len:
-                return snippet
-            return snippet[:max_len].rstrip() + "..."
-
-        # Vector search for documents
-        # If troubleshooting query, prioritize troubleshooting documents
-        category_filter = "troubleshooting" if intent['troubleshooting'] else None
-        tag_filter = "troubleshooting" if intent['troubleshooting'] else None
-        
-        logger.debug(f"Query intent: {intent}, category_filter: {category_filter}")
-        
-        vector_doc_results = chatbot_service.search_documents(
-            query=query_request.query,
-            category_filter=category_filter,
-            tag_filter=tag_filter,
-            limit=5,
-            platform=platform,
-        )
-        
-        logger.debug(f"Vector doc results: {len(vector_doc_results)} matches")
-        
-        doc_snippets = {}
-        # Add vector search document results
-        for metadata, similarity, content in vector_doc_results:
-            doc_id = int(metadata.get('doc_id', 0))
-            logger.debug(f"  Doc match: id={doc_id}, sim={similarity:.3f}, title={metadata.get('title', 'N/A')[:30]}")
-            if doc_id and doc_id not in all_related_doc_ids:
-                all_related_doc_ids.add(doc_id)
-            if doc_id and doc_id not in doc_snippets:
-                doc_snippets[doc_id] = {
-                    "snippet": _build_snippet(content),
-                    "similarity": similarity,
-                    "chunk_index": int(metadata.get("chunk_index", 0)) if metadata.get("chunk_index") is not None else None,
-                }
-        
-        # Vector search for tips
-        vector_tip_results = chatbot_service.search_tips(
-            query=query_request.query,
-            category_filter=category_filter,
-            tag_filter=tag_filter,
-            limit=5,
-            platform=platform,
-        )
-        
-        logger.debug(f"Vector tip results: {len(vector_tip_results)} matches")
-        
-        tip_snippets = {}
-        # Add vector search tip results
-        for metadata, similarity, content in vector_tip_results:
-            tip_id = int(metadata.get('tip_id', 0))
-            logger.debug(f"  Tip match: id={tip_id}, sim={similarity:.3f}, title={metadata.get('title', 'N/A')[:30]}")
-            if tip_id and tip_id not in all_related_tip_ids:
-                all_related_tip_ids.add(tip_id)
-            if tip_id and tip_id not in tip_snippets:
-                tip_snippets[tip_id] = {
-                    "snippet": _build_snippet(content),
-                    "similarity": similarity,
-                    "chunk_index": None,
-                }
-        
-        # Fetch related documents from database
-        related_documents = []
-        docs_for_context = []
-        if all_related_doc_ids:
-            doc_stmt = select(models.KnowledgeDocument).where(
-                models.KnowledgeDocument.id.in_(list(all_related_doc_ids)),
-                models.KnowledgeDocument.is_active == True,
-                models.KnowledgeDocument.platform == platform,
+        platform, user_id = await _prepare_query(query_request, current_user, session)
+        hit, query_embedding = await _lookup_cached_answer(query_request.query, platform, session)
+        if hit is not None:
+            retrieval = _QueryRetrieval.from_cache_hit(hit, user_id)
+            interaction = _record_interaction(session, query_request.query, retrieval)
+            return models.ChatbotResponse(
+                matched_faqs=[models.FAQEntryRead.model_validate(faq) for faq in retrieval.matched_faqs],
+                related_documents=retrieval.related_documents,
+                related_tips=retrieval.related_tips,
+                interaction_id=interaction.id,
+                synthesized_response=hit.entry.synthesized_response,
+                sources_used=list(hit.entry.sources_used),
+                llm_used=True,
+                llm_model=hit.entry.llm_model,
+                cached=True,
             )
-            docs = session.exec(doc_stmt).all()
-            for doc in docs:
-                snippet_meta = doc_snippets.get(doc.id, {})
-                related_documents.append(models.RelatedResource(
-                    type="document",
-                    id=doc.id,
-                    title=doc.title,
-                    url=f"{kb_base}/knowledge_base.html#document-{doc.id}" if kb_base else f"/knowledge_base.html#document-{doc.id}",
-                    snippet=snippet_meta.get("snippet"),
-                    similarity=snippet_meta.get("similarity"),
-                    chunk_index=snippet_meta.get("chunk_index"),
-                ))
-                # Prepare context for LLM
-                docs_for_context.append(doc)
-        
-        # Fetch related tips from database
-        related_tips = []
-        tips_for_context = []
-        if all_related_tip_ids:
-            tip_stmt = select(models.SharedTip).where(
-                models.SharedTip.id.in_(list(all_related_tip_ids)),
-                models.SharedTip.is_archived == False,
-                models.SharedTip.platform == platform,
-            )
-            tips = session.exec(tip_stmt).all()
-            for tip in tips:
-                snippet_meta = tip_snippets.get(tip.id, {})
-                related_tips.append(models.RelatedResource(
-                    type="tip",
-                    id=tip.id,
-                    title=tip.title,
-                    url=f"{kb_base}/shared_tips.html?tip_id={tip.id}" if kb_base else f"/shared_tips.html?tip_id={tip.id}",
-                    snippet=snippet_meta.get("snippet"),
-                    similarity=snippet_meta.get("similarity"),
-                    chunk_index=snippet_meta.get("chunk_index"),
-                ))
-                # Prepare context for LLM
-                tips_for_context.append(tip)
-        
-        # Build context sources for LLM
-        context_sources = []
-        
-        # Add FAQs to context
-        for faq, score in matched_faqs_with_scores:
-            context_sources.append(ContextSource(
-                source_type="faq",
-                title=faq.question,
-                content=faq.answer,
-                id=faq.id,
-                category=faq.category,
-                similarity=score / 100.0  # Normalize to 0-1
-            ))
-        
-        # Add documents to context (use vector search results for similarity)
-        for metadata, similarity, content in vector_doc_results:
-            doc_id = int(metadata.get('doc_id', 0))
-            doc_title = metadata.get('title', 'Document')
-            # Find full content from database
-            for doc in docs_for_context:
-                if doc.id == doc_id:
-                    context_sources.append(ContextSource(
-                        source_type="document",
-                        title=doc_title,
-                        content=doc.searchable_content or content,
-                        id=doc_id,
-                        category=doc.category,
-                        similarity=similarity
-                    ))
-                    break
-        
-        # Add tips to context
-        for metadata, similarity, content in vector_tip_results:
-            tip_id = int(metadata.get('tip_id', 0))
-            tip_title = metadata.get('title', 'Tip')
-            for tip in tips_for_context:
-                if tip.id == tip_id:
-                    context_sources.append(ContextSource(
-                        source_type="tip",
-                        title=tip_title,
-                        content=tip.content,
-                        id=tip_id,
-                        category=tip.category,
-                        similarity=similarity
-                    ))
-                    break
+
+        retrieval = await _retrieve_for_query(query_request, platform, user_id, session)
+        context_sources = retrieval.context_sources
         
         # Try to synthesize response with LLM
         synthesized_response = None
@@ -342,42 +502,32 @@ async def query_chatbot(
         llm_used = False
         llm_model = None
         
-        if context_sources and llm_service.is_available():
+        if context_sources and llm_service.enabled:
             logger.debug(f"Attempting LLM synthesis with {len(context_sources)} context sources")
-            # Use async version to avoid blocking the event loop
+            # Streams from Ollama on the pooled async client (no worker thread held)
+            started = time.perf_counter()
             synthesized_response, sources_used = await llm_service.synthesize_response_async(
                 query=query_request.query,
                 context_sources=context_sources
             )
             if synthesized_response:
                 llm_used = True
-                llm_model = settings.llm_model  # Include the model name
+                llm_model = llm_service.model  # Include the model name
                 logger.info(f"LLM ({llm_model}) synthesized response from {len(sources_used)} sources")
+                _cache_answer(
+                    query_request.query, query_embedding, retrieval,
+                    synthesized_response, sources_used, time.perf_counter() - started,
+                )
         
-        # Log interaction
-        interaction = models.ChatbotInteraction(
-            user_id=user_id,
-            query=query_request.query,
-            matched_faq_ids=','.join(map(str, matched_faq_ids)) if matched_faq_ids else None,
-            platform=platform,
-        )
-        session.add(interaction)
-        session.commit()
-        session.refresh(interaction)
-        
-        # Increment view count for matched FAQs
-        for faq in matched_faqs:
-            faq.view_count += 1
-            session.add(faq)
-        session.commit()
+        interaction = _record_interaction(session, query_request.query, retrieval)
         
         # Convert FAQs to response models
-        faq_reads = [models.FAQEntryRead.model_validate(faq) for faq in matched_faqs]
+        faq_reads = [models.FAQEntryRead.model_validate(faq) for faq in retrieval.matched_faqs]
         
         return models.ChatbotResponse(
             matched_faqs=faq_reads,
-            related_documents=related_documents,
-            related_tips=related_tips,
+            related_documents=retrieval.related_documents,
+            related_tips=retrieval.related_tips,
             interaction_id=interaction.id,
             synthesized_response=synthesized_response,
             sources_used=sources_used,
@@ -390,6 +540,93 @@ async def query_chatbot(
         raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
 
 
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("/api/chatbot/query/stream")
+async def query_chatbot_stream(
+    query_request: models.ChatbotQueryRequest,
+    current_user: models.User = Depends(get_current_active_user),
+    session: SQLModelSession = Depends(get_db_session),
+):
+    """Streaming variant of ``/api/chatbot/query`` (Server-Sent Events).
+
+    Events, in order:
+    - ``context``: the ChatbotResponse fields without the synthesized answer
+    - ``token``: ``{"text": ...}`` for each generated fragment (LLM only)
+    - ``done``: ``sources_used``, ``llm_used``, ``llm_model``, ``ttft_ms``, ``cached``
+    - ``error``: ``{"detail": ...}`` if generation fails or the LLM queue is full
+
+    A cached answer is sent as a single ``token`` event.
+    """
+    try:
+        platform, user_id = await _prepare_query(query_request, current_user, session)
+        hit, query_embedding = await _lookup_cached_answer(query_request.query, platform, session)
+        if hit is not None:
+            retrieval = _QueryRetrieval.from_cache_hit(hit, user_id)
+        else:
+            retrieval = await _retrieve_for_query(query_request, platform, user_id, session)
+        interaction = _record_interaction(session, query_request.query, retrieval)
+    except Exception as e:
+        logger.error(f"Error processing chatbot query: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
+
+    context_payload = models.ChatbotResponse(
+        matched_faqs=[models.FAQEntryRead.model_validate(faq) for faq in retrieval.matched_faqs],
+        related_documents=retrieval.related_documents,
+        related_tips=retrieval.related_tips,
+        interaction_id=interaction.id,
+    ).model_dump(
+        mode="json",
+        exclude={"synthesized_response", "sources_used", "llm_used", "llm_model", "cached"},
+    )
+
+    async def event_stream():
+        yield _sse("context", context_payload)
+        done = {"sources_used": [], "llm_used": False, "llm_model": None, "ttft_ms": None, "cached": False}
+        if hit is not None:
+            yield _sse("token", {"text": hit.entry.synthesized_response})
+            done.update(
+                sources_used=hit.entry.sources_used,
+                llm_used=True,
+                llm_model=hit.entry.llm_model,
+                cached=True,
+            )
+        elif retrieval.context_sources and llm_service.enabled:
+            prompt, sources_used = llm_service.build_prompt(query_request.query, retrieval.context_sources)
+            generation = llm_service.stream_generate(prompt)
+            try:
+                fragments = []
+                async for fragment in generation:
+                    fragments.append(fragment)
+                    yield _sse("token", {"text": fragment})
+                done.update(
+                    sources_used=sources_used,
+                    llm_used=generation.ttft_seconds is not None,
+                    llm_model=llm_service.model,
+                    ttft_ms=round(generation.ttft_seconds * 1000) if generation.ttft_seconds is not None else None,
+                )
+                answer = "".join(fragments).strip()
+                if answer and generation.total_seconds is not None:
+                    _cache_answer(
+                        query_request.query, query_embedding, retrieval,
+                        answer, sources_used, generation.total_seconds,
+                    )
+            except LLMQueueFullError as e:
+                yield _sse("error", {"detail": str(e)})
+            except Exception as e:
+                logger.error(f"Error streaming LLM response: {e}", exc_info=True)
+                yield _sse("error", {"detail": "LLM generation failed"})
+        yield _sse("done", done)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/api/chatbot/feedback", status_code=status.HTTP_204_NO_CONTENT)
 async def submit_chatbot_feedback(
     feedback: models.ChatbotFeedbackRequest,
@@ -469,11 +706,13 @@ async def create_faq(
     session.add(faq)
     session.commit()
     session.refresh(faq)
+    chatbot_service.faq_index_upsert(faq)
     
     # Auto-vectorize FAQ for semantic search
     try:
-        if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-            chatbot_service.vector_service.add_faq(
+        vector_service = await chatbot_service.get_vector_service()
+        if vector_service and vector_service.enabled:
+            vector_service.add_faq(
                 faq_id=faq.id,
                 question=faq.question,
                 answer=faq.answer,
@@ -503,19 +742,21 @@ async def update_faq(
         raise HTTPException(status_code=404, detail="FAQ not found")
     
     update_dict = faq_data.model_dump(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(faq, field, value)
+    for field_name, value in update_dict.items():
+        setattr(faq, field_name, value)
     
     faq.updated_at_utc = datetime.now(timezone.utc)
     
     session.add(faq)
     session.commit()
     session.refresh(faq)
+    chatbot_service.faq_index_upsert(faq)
     
     # Update FAQ in vector store
     try:
-        if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-            chatbot_service.vector_service.add_faq(
+        vector_service = await chatbot_service.get_vector_service()
+        if vector_service and vector_service.enabled:
+            vector_service.add_faq(
                 faq_id=faq.id,
                 question=faq.question,
                 answer=faq.answer,
@@ -545,13 +786,15 @@ async def delete_faq(
     
     # Remove from vector store
     try:
-        if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-            chatbot_service.vector_service.delete_faq(faq_id)
+        vector_service = await chatbot_service.get_vector_service()
+        if vector_service and vector_service.enabled:
+            vector_service.delete_faq(faq_id)
     except Exception as e:
         logger.warning(f"Failed to delete FAQ {faq_id} from vector store: {e}")
     
     session.delete(faq)
     session.commit()
+    chatbot_service.faq_index_remove(faq_id)
     
     logger.info(f"Admin '{current_admin.username}' deleted FAQ {faq_id}")
     return None
@@ -15,6 +15,7 @@ from ..core import models
 from ..core.infra.db import get_db_session, SQLModelSession
 from ..core.auth import get_current_active_user, get_current_admin_user, get_optional_current_user
 from ..services.knowledge_base_service import KnowledgeBaseService
+from ..services.vector_index_service import document_index_item, vector_index_jobs
 from ..core.templates import templates
 from ..core.template_context import get_template_context
 from ..config import settings
@@ -54,6 +55,28 @@ def _normalize_file_url(file_path: str) -> str:
     return f"/{normalized_path}"
 
 
+async def _queue_document_vectorization(
+    document: models.KnowledgeDocument,
+    include_masterdata: bool = True,
+) -> Optional[str]:
+    """Queue batched embedding of ``document``; returns the job id (None if vector search is off)."""
+    try:
+        from ..services.chatbot_service import chatbot_service
+        vector_service = await chatbot_service.get_vector_service()
+        if not (vector_service and vector_service.enabled):
+            return None
+        job = vector_index_jobs.submit_document(
+            vector_service,
+            document_index_item(document),
+            include_masterdata=include_masterdata,
+        )
+        logger.info(f"Document {document.id} queued for vectorization (job {job.job_id})")
+        return job.job_id
+    except Exception as e:
+        logger.warning(f"Failed to queue vectorization for document {document.id}: {e}")
+        return None
+
+
 # --- HTML Page Endpoints ---
 @router.get("/knowledge_base.html", response_class=HTMLResponse)
 async def knowledge_base_page(
@@ -190,34 +213,9 @@ async def upload_document(
         session.commit()
         session.refresh(document)
         
-        # Auto-vectorize document for semantic search
-        try:
-            from ..services.chatbot_service import chatbot_service
-            if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-                chatbot_service.vector_service.add_document(
-                    doc_id=document.id,
-                    title=document.title,
-                    content=searchable_content or "",
-                    category=category,
-                    tags=tags,
-                    file_type=file_type,
-                    platform=platform,
-                )
-                logger.info(f"Document {document.id} vectorized for semantic search")
-                # If Slocum Masterdata, also load into slocum_masterdata collection
-                if (category or "").strip().lower() == "masterdata" and platform == "slocum":
-                    try:
-                        from ..services.slocum_masterdata_service import load_and_vectorize_masterdata
-                        load_and_vectorize_masterdata(
-                            searchable_content or "",
-                            document_id=document.id,
-                            vector_search_service=chatbot_service.vector_service,
-                        )
-                        logger.info(f"Document {document.id} loaded as Slocum masterdata")
-                    except Exception as md_e:
-                        logger.warning(f"Failed to load as Slocum masterdata: {md_e}")
-        except Exception as e:
-            logger.warning(f"Failed to vectorize document {document.id}: {e}")
+        # Auto-vectorize document for semantic search (background job; Slocum
+        # Masterdata is also loaded into the slocum_masterdata collection)
+        vector_job_id = await _queue_document_vectorization(document)
         
         # Build file URL (platform-specific path)
         static_subdir = "slocum_documents" if platform == "slocum" else "documents"
@@ -229,7 +227,8 @@ async def upload_document(
             id=document.id,
             title=document.title,
             file_url=file_url,
-            message="Document uploaded successfully"
+            message="Document uploaded successfully",
+            vector_index_job_id=vector_job_id,
         )
         
     except Exception as e:
@@ -485,21 +484,7 @@ async def update_document(
     session.refresh(document)
     
     # Update document in vector store
-    try:
-        from ..services.chatbot_service import chatbot_service
-        if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-            chatbot_service.vector_service.add_document(
-                doc_id=document.id,
-                title=document.title,
-                content=document.searchable_content or "",
-                category=document.category,
-                tags=document.tags,
-                file_type=document.file_type,
-                platform=document.platform,
-            )
-            logger.info(f"Document {document.id} updated in vector store")
-    except Exception as e:
-        logger.warning(f"Failed to update document {document.id} in vector store: {e}")
+    await _queue_document_vectorization(document, include_masterdata=False)
     
     logger.info(f"Admin '{current_user.username}' updated document {doc_id}")
     
@@ -576,8 +561,9 @@ async def delete_document(
     # Remove from vector store (inactive documents shouldn't be searchable)
     try:
         from ..services.chatbot_service import chatbot_service
-        if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-            chatbot_service.vector_service.delete_document(doc_id)
+        vector_service = await chatbot_service.get_vector_service()
+        if vector_service and vector_service.enabled:
+            vector_service.delete_document(doc_id)
             logger.info(f"Document {doc_id} removed from vector store")
     except Exception as e:
         logger.warning(f"Failed to delete document {doc_id} from vector store: {e}")
@@ -595,3 +581,38 @@ async def delete_document(
         "message": "Document deleted successfully",
         "id": doc_id
     }
+
+
+# --- Vector Index Jobs ---
+@router.post("/api/knowledge/vector_index/reindex", status_code=status.HTTP_202_ACCEPTED)
+async def reindex_vector_store(
+    current_user: models.User = Depends(get_current_admin_user),
+):
+    """Rebuild every vector collection from the database in the background. Admin only."""
+    from ..services.chatbot_service import chatbot_service
+    vector_service = await chatbot_service.get_vector_service()
+    if not (vector_service and vector_service.enabled):
+        raise HTTPException(status_code=503, detail="Vector search is not enabled")
+    job = vector_index_jobs.submit_reindex_all(vector_service)
+    logger.info(f"Admin '{current_user.username}' queued vector reindex job {job.job_id}")
+    return job.to_dict()
+
+
+@router.get("/api/knowledge/vector_index/jobs")
+async def list_vector_index_jobs(
+    current_user: models.User = Depends(get_current_admin_user),
+):
+    """Recent vector indexing jobs (newest first) with progress. Admin only."""
+    return [job.to_dict() for job in vector_index_jobs.recent()]
+
+
+@router.get("/api/knowledge/vector_index/jobs/{job_id}")
+async def get_vector_index_job(
+    job_id: str,
+    current_user: models.User = Depends(get_current_admin_user),
+):
+    """Progress of one vector indexing job. Admin only."""
+    job = vector_index_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Vector index job not found")
+    return job.to_dict()
@@ -19,7 +19,7 @@ import httpx
 from ..core.auth import get_current_active_user, get_current_admin_user, require_platform_access
 from ..core import models
 from ..core.geo.map_utils import prepare_track_points, generate_kml_from_track_points, get_track_bounds
-from ..core.geo import weather_map_cache, iridium_tle_cache
+from ..core.geo import weather_map_cache, iridium_tle_cache, iridium_passes
 from ..core.data.processors import preprocess_telemetry_df
 from ..core.data.data_service import get_data_service
 from ..core.slocum_cache_service import (
@@ -837,42 +837,88 @@ def _require_iridium_map_layer() -> None:
         )
 
 
-@router.get("/api/map/iridium/tles")
-async def get_iridium_tles(
-    current_user: models.User = Depends(get_current_active_user),
-):
-    """Return cached CelesTrak Iridium-E TLEs for browser-side SGP4 propagation."""
-    _require_iridium_map_layer()
-    try:
-        payload = await iridium_tle_cache.get_iridium_tles()
-    except RuntimeError as exc:
+def _iridium_unavailable(exc: Exception) -> HTTPException:
+    """Map TLE cache / propagation failures to the HTTP error shown by the overlay."""
+    if isinstance(exc, RuntimeError):
         message = str(exc)
         logger.warning("Iridium TLE unavailable: %s", message)
+        if not iridium_passes.SGP4_AVAILABLE and "sgp4" in message.lower():
+            return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=message)
         if "rate-limited" in message.lower() or "empty" in message.lower():
-            raise HTTPException(
+            return HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=(
                     "Iridium TLE cache is empty and CelesTrak is rate-limited for this "
                     "2-hour window. Retry later, or ask an admin to check "
                     "GET /api/map/iridium/cache/status (do not purge+refetch repeatedly)."
                 ),
-            ) from exc
-        raise HTTPException(
+            )
+        return HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail=message or "Unable to load Iridium TLE data.",
-        ) from exc
+        )
+    logger.error("Failed to load Iridium TLEs: %s", exc, exc_info=True)
+    return HTTPException(
+        status_code=status.HTTP_502_BAD_GATEWAY,
+        detail=(
+            "Unable to load Iridium TLE data from cache or CelesTrak. "
+            "Check host egress to celestrak.org and /api/map/iridium/cache/status."
+        ),
+    )
+
+
+@router.get("/api/map/iridium/tles")
+async def get_iridium_tles(
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Return cached CelesTrak Iridium-E TLEs (raw; the overlay uses /positions and /passes)."""
+    _require_iridium_map_layer()
+    try:
+        payload = await iridium_tle_cache.get_iridium_tles()
     except Exception as exc:
-        logger.error("Failed to load Iridium TLEs: %s", exc, exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
-            detail=(
-                "Unable to load Iridium TLE data from cache or CelesTrak. "
-                "Check host egress to celestrak.org and /api/map/iridium/cache/status."
-            ),
-        ) from exc
+        raise _iridium_unavailable(exc) from exc
+    return JSONResponse(content=payload)
+
+
+@router.get("/api/map/iridium/positions")
+async def get_iridium_positions(
+    minutes: int = Query(30, ge=1, le=360, description="Window length from now."),
+    step_seconds: int = Query(60, ge=10, le=600, description="Sample spacing."),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Server-side SGP4 positions of every Iridium satellite as compact per-satellite arrays."""
+    _require_iridium_map_layer()
+    try:
+        payload = await iridium_passes.satellite_positions(minutes=minutes, step_seconds=step_seconds)
+    except Exception as exc:
+        raise _iridium_unavailable(exc) from exc
+    return JSONResponse(content=payload)
+
+
+@router.get("/api/map/iridium/passes")
+async def get_iridium_passes(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Next Iridium pass (AOS / peak / LOS) and pass windows for one position over the next 2 h."""
+    _require_iridium_map_layer()
+    try:
+        payload = await iridium_passes.observer_passes(lat, lon)
+    except Exception as exc:
+        raise _iridium_unavailable(exc) from exc
     return JSONResponse(content=payload)
 
 
+@router.get("/api/map/iridium/passes/vehicles")
+async def get_iridium_vehicle_passes(
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Precomputed next-pass summaries for active Wave Glider missions and Slocum datasets."""
+    _require_iridium_map_layer()
+    return JSONResponse(content=iridium_passes.vehicle_next_passes())
+
+
 @router.get("/api/map/iridium/cache/status")
 async def get_iridium_tle_cache_status(
     current_user: models.User = Depends(get_current_active_user),
@@ -884,7 +930,9 @@ async def get_iridium_tle_cache_status(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Iridium map layer is disabled (feature_toggles.iridium_map_layer).",
             )
-    return JSONResponse(content=iridium_tle_cache.get_cache_status())
+    return JSONResponse(
+        content={**iridium_tle_cache.get_cache_status(), "propagation": iridium_passes.get_status()}
+    )
 
 
 @router.post("/api/map/iridium/cache/purge")
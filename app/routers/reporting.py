@@ -196,6 +196,64 @@ async def purge_bathy_cache_endpoint(
     return summary
 
 
+@router.get("/figure-cache/status")
+async def get_figure_cache_status_endpoint(
+    current_admin: models.User = Depends(get_current_admin_user),
+):
+    """Admin: rendered report figure cache size and hit/miss stats."""
+    from ..core.reporting.figure_cache import get_figure_cache_status
+
+    return get_figure_cache_status()
+
+
+@router.post("/figure-cache/purge")
+async def purge_figure_cache_endpoint(
+    force_all: bool = Query(False, description="Remove all cached figures, not only stale ones."),
+    current_admin: models.User = Depends(get_current_admin_user),
+):
+    """Admin: purge stale (or all) rendered report figures and enforce size quota."""
+    from ..core.reporting.figure_cache import purge_figure_cache
+
+    summary = purge_figure_cache(force_all=force_all, enforce_quota=True)
+    logger.info(
+        "Admin '%s' purged report figure cache (force_all=%s, removed=%s, freed_bytes=%s)",
+        current_admin.username,
+        force_all,
+        summary.get("removed_files"),
+        summary.get("freed_bytes"),
+    )
+    return summary
+
+
+@router.get("/basemap-cache/status")
+async def get_basemap_cache_status_endpoint(
+    current_admin: models.User = Depends(get_current_admin_user),
+):
+    """Admin: pre-rendered report map background cache size and hit/miss stats."""
+    from ..core.geo.basemap_cache import get_basemap_cache_status
+
+    return get_basemap_cache_status()
+
+
+@router.post("/basemap-cache/purge")
+async def purge_basemap_cache_endpoint(
+    force_all: bool = Query(False, description="Remove all cached basemap tiles, not only stale ones."),
+    current_admin: models.User = Depends(get_current_admin_user),
+):
+    """Admin: purge stale (or all) report basemap tiles and enforce size quota."""
+    from ..core.geo.basemap_cache import purge_basemap_cache
+
+    summary = purge_basemap_cache(force_all=force_all, enforce_quota=True)
+    logger.info(
+        "Admin '%s' purged report basemap cache (force_all=%s, removed=%s, freed_bytes=%s)",
+        current_admin.username,
+        force_all,
+        summary.get("removed_files"),
+        summary.get("freed_bytes"),
+    )
+    return summary
+
+
 @router.post(
     "/missions/{mission_id}/generate-report-with-sensor-tracker",
     response_model=models.MissionOverview,
@@ -260,8 +260,9 @@ async def create_shared_tip(
     # Auto-vectorize tip for semantic search
     try:
         from ..services.chatbot_service import chatbot_service
-        if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-            chatbot_service.vector_service.add_tip(
+        vector_service = await chatbot_service.get_vector_service()
+        if vector_service and vector_service.enabled:
+            vector_service.add_tip(
                 tip_id=tip.id,
                 title=tip.title,
                 content=tip.content,
@@ -319,8 +320,9 @@ async def update_shared_tip(
     # Update tip in vector store
     try:
         from ..services.chatbot_service import chatbot_service
-        if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-            chatbot_service.vector_service.add_tip(
+        vector_service = await chatbot_service.get_vector_service()
+        if vector_service and vector_service.enabled:
+            vector_service.add_tip(
                 tip_id=tip.id,
                 title=tip.title,
                 content=tip.content,
@@ -383,8 +385,9 @@ async def delete_shared_tip(
     # Remove from vector store (archived tips shouldn't be searchable)
     try:
         from ..services.chatbot_service import chatbot_service
-        if chatbot_service.vector_service and chatbot_service.vector_service.enabled:
-            chatbot_service.vector_service.delete_tip(tip_id)
+        vector_service = await chatbot_service.get_vector_service()
+        if vector_service and vector_service.enabled:
+            vector_service.delete_tip(tip_id)
             logger.info(f"Tip {tip_id} removed from vector store")
     except Exception as e:
         logger.warning(f"Failed to delete tip {tip_id} from vector store: {e}")
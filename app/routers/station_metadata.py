@@ -19,13 +19,28 @@ from ..core.crud import station_metadata_crud
 from ..core.models import User as UserModel # UserModel alias is used
 from ..core.infra.db import SQLModelSession, get_db_session, sqlite_engine
 from ..services.station_overview import (
-    build_status_overview_row,
     clear_display_status_override,
     count_stations_by_status_text,
     resolve_station_status_text_and_color,
     sync_display_status_override_timestamp,
 )
+from ..services.array_history_service import (
+    DEFAULT_ARRAY_LOG_PAGE_SIZE,
+    MAX_ARRAY_LOG_PAGE_SIZE,
+    array_logs_by_season_counts,
+    array_offload_stats,
+    array_station_filter,
+    array_station_summaries,
+    list_array_offload_logs,
+    load_array_stations,
+)
 from ..services.station_season_service import StationSeasonService
+from ..services.station_status_snapshot_service import (
+    get_status_overview_rows,
+    invalidate_station_status_snapshots,
+    resolve_overview_context,
+    resolve_station_flag_state as _resolve_station_flag_state,
+)
 from ..services.station_history_service import (
     aggregate_offload_stats,
     build_station_timeline,
@@ -33,10 +48,8 @@ from ..services.station_history_service import (
     group_stations_by_status,
     is_awaiting_first_offload_after_swap,
     latest_hardware_swap_ts_by_station,
-    logs_by_season_counts,
     offload_log_attribution_ts,
     resolve_hardware_at_time,
-    station_mini_summary,
 )
 from ..core.stations.station_registry_policy import (
     station_blocks_edits,
@@ -64,33 +77,6 @@ def _is_admin_or_pic_designated_pilot(user: UserModel) -> bool:
     return False
 
 
-def _resolve_station_flag_state(
-    events: List[models.StationFlagEvent],
-    *,
-    target_year: Optional[int],
-    season_is_closed: bool,
-) -> Dict[str, Dict[str, Any]]:
-    state_by_station: Dict[str, Dict[str, Any]] = {}
-    for event in sorted(events, key=lambda e: e.changed_at_utc):
-        include_event = False
-        if target_year is None:
-            include_event = event.field_season_year is None
-        elif offload_log_matches_season_year(
-            log_season=event.field_season_year,
-            target_year=target_year,
-            season_is_closed=season_is_closed,
-        ):
-            include_event = True
-        if not include_event:
-            continue
-        state_by_station[event.station_id] = {
-            "is_flagged": bool(event.is_flagged),
-            "flag_note": event.note,
-            "changed_at_utc": event.changed_at_utc,
-        }
-    return state_by_station
-
-
 def _load_hardware_history_for_stations(
     session: SQLModelSession,
     station_ids: List[str],
@@ -1162,87 +1148,15 @@ async def get_station_offload_status_overview(
         f"{f' for season {season_year}' if season_year else ' (active season)'}."
     )
 
-    statement = (
-        select(models.StationMetadata)
-        .options(selectinload(models.StationMetadata.offload_logs))
-        .where(
-            models.StationMetadata.is_retired == False,
-            models.StationMetadata.is_archived == False,
-        )
-        .order_by(models.StationMetadata.station_id)
-    )
-    stations_metadata = list(session.exec(statement).all())
-
-    station_ids = [s.station_id for s in stations_metadata]
-    latest_swap_by_station = latest_hardware_swap_ts_by_station(
-        _load_hardware_history_for_stations(session, station_ids)
-    )
-
-    if season_year is None:
-        active = StationSeasonService.get_active_season(session)
-        target_year: Optional[int] = active.year if active else None
-        season_is_closed = False
-    else:
-        target_year = season_year
-        season_row = StationSeasonService.get_season_by_year(session, season_year)
-        season_is_closed = bool(season_row and season_row.closed_at_utc) or (
-            season_row is None
-        )
-
-    all_flag_events = list(session.exec(select(models.StationFlagEvent)).all())
-    flag_state_by_station = _resolve_station_flag_state(
-        all_flag_events,
+    target_year, season_is_closed = resolve_overview_context(session, season_year)
+    overview_list = get_status_overview_rows(
+        session,
         target_year=target_year,
         season_is_closed=season_is_closed,
     )
 
-    overview_list: List[Dict[str, Any]] = []
-    for station in stations_metadata:
-        if season_year is None:
-            if target_year is None:
-                relevant_logs = [
-                    log
-                    for log in station.offload_logs
-                    if log.field_season_year is None
-                ]
-            else:
-                relevant_logs = [
-                    log
-                    for log in station.offload_logs
-                    if offload_log_matches_season_year(
-                        log_season=log.field_season_year,
-                        target_year=target_year,
-                        season_is_closed=False,
-                    )
-                ]
-        else:
-            relevant_logs = [
-                log
-                for log in station.offload_logs
-                if target_year is not None
-                and offload_log_matches_season_year(
-                    log_season=log.field_season_year,
-                    target_year=target_year,
-                    season_is_closed=season_is_closed,
-                )
-            ]
-        flag_state = flag_state_by_station.get(station.station_id, {})
-        swap_ts = latest_swap_by_station.get(station.station_id)
-        overview_list.append(
-            build_status_overview_row(
-                station,
-                relevant_logs,
-                is_flagged_for_scope=bool(flag_state.get("is_flagged")),
-                flag_note=flag_state.get("flag_note"),
-                awaiting_first_offload_after_swap=is_awaiting_first_offload_after_swap(
-                    station.offload_logs,
-                    swap_ts,
-                ),
-            )
-        )
-
     logger.info(
-        f"Built status overview for {len(stations_metadata)} registry stations "
+        f"Built status overview for {len(overview_list)} registry stations "
         f"(season context={season_year!r})."
     )
     return overview_list
@@ -1402,6 +1316,22 @@ async def get_station_history(
     }
 
 
+def _array_group_payload(
+    session: SQLModelSession, code: str
+) -> Optional[Dict[str, Any]]:
+    ag_stmt = select(models.StationArrayGroup).where(
+        models.StationArrayGroup.code == code
+    )
+    array_group = session.exec(ag_stmt).first()
+    if not array_group:
+        return None
+    return {
+        "code": array_group.code,
+        "display_name": array_group.display_name,
+        "notes": array_group.notes,
+    }
+
+
 @router.get(
     "/arrays/{array_code}/history",
     tags=["Station History"],
@@ -1411,96 +1341,69 @@ async def get_array_history(
     session: Annotated[SQLModelSession, Depends(get_db_session)],
     current_user: Annotated[UserModel, Depends(get_current_active_user)],
     season_year: Optional[int] = Query(None),
+    logs_limit: int = Query(
+        DEFAULT_ARRAY_LOG_PAGE_SIZE,
+        ge=1,
+        le=MAX_ARRAY_LOG_PAGE_SIZE,
+        description="Page size for offload_logs (see /arrays/{array_code}/offload_logs)",
+    ),
+    logs_offset: int = Query(0, ge=0),
 ):
     code = array_code.upper()
-    ag_stmt = select(models.StationArrayGroup).where(
-        models.StationArrayGroup.code == code
-    )
-    array_group = session.exec(ag_stmt).first()
-    stations_stmt = select(models.StationMetadata).where(
-        models.StationMetadata.station_id.ilike(f"{code}%")
-    )
-    stations = list(session.exec(stations_stmt).all())
+    stations = load_array_stations(session, code)
     station_ids = [s.station_id for s in stations]
-    if not station_ids:
-        return {
-            "array_code": code,
-            "array_group": (
-                {
-                    "code": array_group.code,
-                    "display_name": array_group.display_name,
-                    "notes": array_group.notes,
-                }
-                if array_group
-                else None
-            ),
-            "stations": [],
-            "station_summaries": [],
-            "stations_by_status": {},
-            "offload_logs": [],
-            "hardware_history": [],
-            "logs_by_season": {},
-            "aggregate_stats": aggregate_offload_stats([]),
-        }
-    logs_stmt = select(models.OffloadLog).where(
-        models.OffloadLog.station_id.in_(station_ids)
-    )
-    if season_year is not None:
-        logs_stmt = logs_stmt.where(models.OffloadLog.field_season_year == season_year)
-    logs_stmt = logs_stmt.order_by(models.OffloadLog.log_timestamp_utc.desc())
-    hw_stmt = (
-        select(models.StationHardwareHistory)
-        .where(models.StationHardwareHistory.station_id.in_(station_ids))
-        .order_by(models.StationHardwareHistory.effective_start_utc.desc())
-    )
-    logs = list(session.exec(logs_stmt).all())
-    hardware = list(session.exec(hw_stmt).all())
-    all_logs_unfiltered = list(
-        session.exec(
-            select(models.OffloadLog)
-            .where(models.OffloadLog.station_id.in_(station_ids))
-            .order_by(models.OffloadLog.log_timestamp_utc.desc())
-        ).all()
+    logs, logs_total = list_array_offload_logs(
+        session, station_ids, season_year, limit=logs_limit, offset=logs_offset
     )
-    logs_by_station: Dict[str, List[Any]] = defaultdict(list)
-    for log in logs:
-        logs_by_station[log.station_id].append(log)
-    all_logs_by_station: Dict[str, List[Any]] = defaultdict(list)
-    for log in all_logs_unfiltered:
-        all_logs_by_station[log.station_id].append(log)
-    latest_swap_by_station = latest_hardware_swap_ts_by_station(hardware)
-    summaries = [
-        station_mini_summary(
-            st,
-            logs_by_station.get(st.station_id, []),
-            awaiting_first_offload_after_swap=is_awaiting_first_offload_after_swap(
-                all_logs_by_station.get(st.station_id, []),
-                latest_swap_by_station.get(st.station_id),
-            ),
-        )
-        for st in stations
-    ]
+    hardware = _load_hardware_history_for_stations(session, station_ids)
+    hardware.sort(key=lambda h: h.effective_start_utc, reverse=True)
+    summaries = array_station_summaries(session, stations, season_year)
     return {
         "array_code": code,
-        "array_group": (
-            {
-                "code": array_group.code,
-                "display_name": array_group.display_name,
-                "notes": array_group.notes,
-            }
-            if array_group
-            else None
-        ),
+        "array_group": _array_group_payload(session, code),
         "season_filter": season_year,
         "stations": [s.model_dump() for s in stations],
         "station_summaries": summaries,
         "stations_by_status": group_stations_by_status(summaries),
         "offload_logs": [enrich_offload_log_read(l) for l in logs],
+        "offload_logs_total": logs_total,
+        "offload_logs_limit": logs_limit,
+        "offload_logs_offset": logs_offset,
         "hardware_history": [h.model_dump() for h in hardware],
-        "logs_by_season": logs_by_season_counts(all_logs_unfiltered)
-        if season_year is None
-        else logs_by_season_counts(logs),
-        "aggregate_stats": aggregate_offload_stats(logs),
+        "logs_by_season": array_logs_by_season_counts(session, station_ids, season_year),
+        "aggregate_stats": array_offload_stats(session, station_ids, season_year),
+    }
+
+
+@router.get(
+    "/arrays/{array_code}/offload_logs",
+    tags=["Station History"],
+)
+async def list_array_offload_logs_endpoint(
+    array_code: str,
+    session: Annotated[SQLModelSession, Depends(get_db_session)],
+    current_user: Annotated[UserModel, Depends(get_current_active_user)],
+    season_year: Optional[int] = Query(None),
+    limit: int = Query(DEFAULT_ARRAY_LOG_PAGE_SIZE, ge=1, le=MAX_ARRAY_LOG_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+):
+    """Paged offload logs for every station in an array, newest first."""
+    code = array_code.upper()
+    station_ids = list(
+        session.exec(
+            select(models.StationMetadata.station_id).where(array_station_filter(code))
+        ).all()
+    )
+    logs, total = list_array_offload_logs(
+        session, station_ids, season_year, limit=limit, offset=offset
+    )
+    return {
+        "array_code": code,
+        "season_filter": season_year,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "offload_logs": [enrich_offload_log_read(l) for l in logs],
     }
 
 
@@ -2263,6 +2166,8 @@ async def delete_field_season(
         models.StationMetadataSeasonSnapshot.field_season_year == year
     )
     session.exec(delete_snapshots_stmt)
+    # Bulk DELETE bypasses the flush hook; post-swap status spans all seasons.
+    invalidate_station_status_snapshots(session)
 
     session.delete(season)
     session.commit()
@@ -2757,6 +2662,8 @@ async def clear_all_stations_testing(
                 models.Announcement.created_by_username == "wg_vm4_auto"
             )
         )
+        invalidate_station_status_snapshots(session)
+        StationSeasonService.invalidate_statistics_rollups(session, include_frozen=True)
         session.exec(delete(models.OffloadLog))
         session.exec(delete(models.StationHardwareHistory))
         session.exec(delete(models.StationMetadataSeasonSnapshot))
@@ -0,0 +1,254 @@
+"""
+Semantic Answer Cache
+
+Caches synthesized chatbot answers so near-identical questions ("how do I
+reset the float" / "float reset procedure") skip retrieval and LLM generation.
+
+An entry is found by cosine similarity between query embeddings (at or above
+``chatbot_answer_cache_similarity``) within one platform; without an embedding
+(vector search disabled) only the same normalized query matches.
+
+Each entry records a fingerprint of every FAQ, document and tip the answer was
+built from. On lookup the referenced rows are re-read and re-fingerprinted; if
+any of them changed, was deactivated or deleted (by any worker) the entry is
+dropped and the query is answered fresh. Fingerprints cover the content that
+reaches the answer, not ``updated_at_utc``, so view-count bumps do not evict.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlmodel import select
+from sqlmodel import Session as SQLModelSession
+
+from ..core.models.database import FAQEntry, KnowledgeDocument, SharedTip
+from ..core.models.schemas import RelatedResource
+from .embedding_store import content_hash
+from .vector_search_service import normalize_query
+
+SourceKey = Tuple[str, int]  # ("faq" | "document" | "tip", id)
+
+_SOURCE_MODELS = {
+    "faq": FAQEntry,
+    "document": KnowledgeDocument,
+    "tip": SharedTip,
+}
+
+
+def source_fingerprint(source_type: str, row) -> str:
+    """Hash of the fields of a FAQ/document/tip that shape a cached answer."""
+    if source_type == "faq":
+        parts = (row.question, row.answer, row.category, row.related_document_ids,
+                 row.related_tip_ids, row.platform, row.is_active)
+    elif source_type == "document":
+        parts = (row.version, row.title, row.category, row.searchable_content,
+                 row.platform, row.is_active)
+    elif source_type == "tip":
+        parts = (row.title, row.content, row.category, row.platform, row.is_archived)
+    else:
+        raise ValueError(f"Unknown source type: {source_type}")
+    return content_hash("\x1f".join("" if p is None else str(p) for p in parts))
+
+
+def _unit(embedding: Optional[Sequence[float]]) -> Optional[np.ndarray]:
+    if embedding is None:
+        return None
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else None
+
+
+@dataclass
+class CachedAnswer:
+    """A synthesized answer plus everything needed to replay the response."""
+    platform: str
+    query: str
+    faq_scores: List[Tuple[int, float]]
+    related_documents: List[RelatedResource]
+    related_tips: List[RelatedResource]
+    synthesized_response: str
+    sources_used: List[str]
+    llm_model: Optional[str]
+    generation_seconds: float
+    fingerprints: Dict[SourceKey, str]
+    embedding: Optional[np.ndarray] = None
+    created_at: float = field(default_factory=time.monotonic)
+    hits: int = 0
+
+
+@dataclass
+class AnswerCacheHit:
+    entry: CachedAnswer
+    similarity: float
+    faqs: List[Tuple[FAQEntry, float]]  # current rows, in the cached order
+
+
+class SemanticAnswerCache:
+    """Per-worker LRU of answers, looked up by query-embedding similarity."""
+
+    def __init__(self, max_entries: int, similarity_threshold: float, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, CachedAnswer]" = OrderedDict()
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.saved_generation_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expired(self, entry: CachedAnswer, now: float) -> bool:
+        return now - entry.created_at > self.ttl_seconds
+
+    def _best_match(
+        self, platform: str, query: str, embedding: Optional[np.ndarray]
+    ) -> Optional[Tuple[int, CachedAnswer, float]]:
+        normalized = normalize_query(query)
+        now = time.monotonic()
+        with self._lock:
+            for entry_id in [i for i, e in self._entries.items() if self._expired(e, now)]:
+                del self._entries[entry_id]
+            ids, vectors = [], []
+            for entry_id, entry in self._entries.items():
+                if entry.platform != platform:
+                    continue
+                if normalize_query(entry.query) == normalized:
+                    return entry_id, entry, 1.0
+                if embedding is not None and entry.embedding is not None:
+                    ids.append(entry_id)
+                    vectors.append(entry.embedding)
+            if not ids:
+                return None
+            similarities = np.stack(vectors) @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                return None
+            return ids[best], self._entries[ids[best]], float(similarities[best])
+
+    @staticmethod
+    def _load_sources(
+        session: SQLModelSession, keys: Iterable[SourceKey]
+    ) -> Dict[SourceKey, object]:
+        ids_by_type: Dict[str, List[int]] = {}
+        for source_type, source_id in keys:
+            ids_by_type.setdefault(source_type, []).append(source_id)
+        rows: Dict[SourceKey, object] = {}
+        for source_type, ids in ids_by_type.items():
+            model = _SOURCE_MODELS[source_type]
+            for row in session.exec(select(model).where(model.id.in_(ids))).all():
+                rows[(source_type, row.id)] = row
+        return rows
+
+    def lookup(
+        self,
+        session: SQLModelSession,
+        platform: str,
+        query: str,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> Optional[AnswerCacheHit]:
+        """Cached answer for a similar query whose sources are all unchanged."""
+        match = self._best_match(platform, query, _unit(embedding))
+        if match is None:
+            self.misses += 1
+            return None
+        entry_id, entry, similarity = match
+
+        rows = self._load_sources(session, entry.fingerprints)
+        for key, fingerprint in entry.fingerprints.items():
+            row = rows.get(key)
+            if row is None or source_fingerprint(key[0], row) != fingerprint:
+                with self._lock:
+                    self._entries.pop(entry_id, None)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+
+        with self._lock:
+            if entry_id in self._entries:
+                self._entries.move_to_end(entry_id)
+        entry.hits += 1
+        self.hits += 1
+        self.saved_generation_seconds += entry.generation_seconds
+        faqs = [(rows[("faq", faq_id)], score) for faq_id, score in entry.faq_scores]
+        return AnswerCacheHit(entry=entry, similarity=similarity, faqs=faqs)
+
+    def store(
+        self,
+        platform: str,
+        query: str,
+        embedding: Optional[Sequence[float]],
+        faqs: Sequence[Tuple[FAQEntry, float]],
+        documents: Sequence[KnowledgeDocument],
+        tips: Sequence[SharedTip],
+        related_documents: List[RelatedResource],
+        related_tips: List[RelatedResource],
+        synthesized_response: str,
+        sources_used: List[str],
+        llm_model: Optional[str],
+        generation_seconds: float,
+    ) -> None:
+        """Cache an answer; ``faqs``/``documents``/``tips`` are the rows it was built from."""
+        fingerprints: Dict[SourceKey, str] = {}
+        for faq, _ in faqs:
+            fingerprints[("faq", faq.id)] = source_fingerprint("faq", faq)
+        for doc in documents:
+            fingerprints[("document", doc.id)] = source_fingerprint("document", doc)
+        for tip in tips:
+            fingerprints[("tip", tip.id)] = source_fingerprint("tip", tip)
+        entry = CachedAnswer(
+            platform=platform,
+            query=query,
+            faq_scores=[(faq.id, score) for faq, score in faqs],
+            related_documents=list(related_documents),
+            related_tips=list(related_tips),
+            synthesized_response=synthesized_response,
+            sources_used=list(sources_used),
+            llm_model=llm_model,
+            generation_seconds=generation_seconds,
+            fingerprints=fingerprints,
+            embedding=_unit(embedding),
+        )
+        match = self._best_match(platform, query, entry.embedding)
+        with self._lock:
+            if match is not None:
+                # Replace the near-duplicate rather than keeping both.
+                self._entries.pop(match[0], None)
+            self._next_id += 1
+            self._entries[self._next_id] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, source_type: str, source_id: int) -> int:
+        """Drop entries built from one FAQ/document/tip (in-process fast path)."""
+        key = (source_type, source_id)
+        with self._lock:
+            stale = [i for i, e in self._entries.items() if key in e.fingerprints]
+            for entry_id in stale:
+                del self._entries[entry_id]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "similarity_threshold": self.similarity_threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "invalidations": self.invalidations,
+            "saved_generation_seconds": round(self.saved_generation_seconds, 2),
+        }
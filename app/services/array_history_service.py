@@ -0,0 +1,242 @@
+"""
+Set-based queries behind ``GET /arrays/{array_code}/history``.
+
+Array membership is a case-insensitive ``station_id`` prefix served by the
+``upper(station_id)`` expression index as a range scan. Aggregates, season
+counts and latest hardware swaps are grouped in SQL; per-station summaries
+only fetch the latest log rows via window functions, and the offload log
+listing is paged so large arrays (HFX) never load every log into memory.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, case, func, or_
+from sqlmodel import select
+from sqlmodel import Session as SQLModelSession
+
+from ..core import models
+from .station_history_service import (
+    _aware_ts,
+    offload_stats_from_totals,
+    station_mini_summary,
+)
+
+DEFAULT_ARRAY_LOG_PAGE_SIZE = 100
+MAX_ARRAY_LOG_PAGE_SIZE = 1000
+
+_Log = models.OffloadLog
+
+
+def _effective_ts_column():
+    """SQL twin of ``_offload_effective_ts`` (without the tz normalisation)."""
+    return func.coalesce(
+        _Log.offload_end_time_utc,
+        _Log.offload_start_time_utc,
+        _Log.log_timestamp_utc,
+    )
+
+
+def array_prefix_bounds(array_code: str) -> Tuple[str, str]:
+    """Half-open ``[low, high)`` range of upper-cased ids starting with ``array_code``."""
+    low = array_code.upper()
+    return low, low[:-1] + chr(ord(low[-1]) + 1)
+
+
+def array_station_filter(array_code: str):
+    low, high = array_prefix_bounds(array_code)
+    station_id_upper = func.upper(models.StationMetadata.station_id)
+    return and_(station_id_upper >= low, station_id_upper < high)
+
+
+def load_array_stations(
+    session: SQLModelSession, array_code: str
+) -> List[models.StationMetadata]:
+    statement = (
+        select(models.StationMetadata)
+        .where(array_station_filter(array_code))
+        .order_by(models.StationMetadata.station_id)
+    )
+    return list(session.exec(statement).all())
+
+
+def _log_scope(station_ids: List[str], season_year: Optional[int]):
+    clauses = [_Log.station_id.in_(station_ids)]
+    if season_year is not None:
+        clauses.append(_Log.field_season_year == season_year)
+    return and_(*clauses)
+
+
+def array_offload_stats(
+    session: SQLModelSession,
+    station_ids: List[str],
+    season_year: Optional[int] = None,
+) -> Dict[str, Any]:
+    """``aggregate_offload_stats`` computed with one grouped query."""
+    if not station_ids:
+        return offload_stats_from_totals(0, 0, 0)
+    has_duration = and_(_Log.arrival_date.is_not(None), _Log.departure_date.is_not(None))
+    duration_sec = (func.julianday(_Log.departure_date) - func.julianday(_Log.arrival_date)) * 86400.0
+    row = session.exec(
+        select(
+            func.count(_Log.id),
+            func.coalesce(func.sum(case((_Log.was_offloaded.is_(True), 1), else_=0)), 0),
+            func.coalesce(func.sum(case((_Log.was_offloaded.is_(False), 1), else_=0)), 0),
+            func.coalesce(func.sum(case((has_duration, duration_sec), else_=0.0)), 0.0),
+            func.coalesce(func.sum(case((has_duration, 1), else_=0)), 0),
+        ).where(_log_scope(station_ids, season_year))
+    ).one()
+    total, successful, failed, duration_sum, duration_count = row
+    return offload_stats_from_totals(
+        int(total), int(successful), int(failed), float(duration_sum), int(duration_count)
+    )
+
+
+def array_logs_by_season_counts(
+    session: SQLModelSession,
+    station_ids: List[str],
+    season_year: Optional[int] = None,
+) -> Dict[Optional[int], int]:
+    """``logs_by_season_counts`` as a GROUP BY (no-season bucket last)."""
+    if not station_ids:
+        return {}
+    rows = session.exec(
+        select(_Log.field_season_year, func.count(_Log.id))
+        .where(_log_scope(station_ids, season_year))
+        .group_by(_Log.field_season_year)
+    ).all()
+    return dict(sorted(rows, key=lambda kv: (kv[0] is None, kv[0] or 0)))
+
+
+def latest_swap_ts_by_station_sql(
+    session: SQLModelSession, station_ids: List[str]
+) -> Dict[str, datetime]:
+    """``latest_hardware_swap_ts_by_station`` as a GROUP BY max."""
+    if not station_ids:
+        return {}
+    hw = models.StationHardwareHistory
+    rows = session.exec(
+        select(hw.station_id, func.max(hw.effective_start_utc))
+        .where(hw.station_id.in_(station_ids), hw.effective_start_utc.is_not(None))
+        .group_by(hw.station_id)
+    ).all()
+    return {station_id: ts for station_id, ts in rows if ts is not None}
+
+
+def _latest_effective_ts_by_station(
+    session: SQLModelSession, station_ids: List[str]
+) -> Dict[str, datetime]:
+    """Newest offload effective time per station across all seasons."""
+    effective = _effective_ts_column()
+    rows = session.exec(
+        select(_Log.station_id, func.max(effective))
+        .where(_Log.station_id.in_(station_ids))
+        .group_by(_Log.station_id)
+    ).all()
+    return {station_id: ts for station_id, ts in rows if ts is not None}
+
+
+def _latest_logs_by_station(
+    session: SQLModelSession,
+    station_ids: List[str],
+    season_year: Optional[int],
+) -> Dict[str, List[models.OffloadLog]]:
+    """
+    The newest in-scope log per station by effective time and by logged time.
+
+    These two rows are all ``station_mini_summary`` needs: the first drives the
+    last-offload fields and the override check, the second the log status.
+    """
+    effective = _effective_ts_column()
+    ranked = (
+        select(
+            _Log.id.label("log_id"),
+            func.row_number()
+            .over(partition_by=_Log.station_id, order_by=(effective.desc(), _Log.id.desc()))
+            .label("rn_effective"),
+            func.row_number()
+            .over(partition_by=_Log.station_id, order_by=(_Log.log_timestamp_utc.desc(), _Log.id.desc()))
+            .label("rn_logged"),
+        )
+        .where(_log_scope(station_ids, season_year))
+        .subquery()
+    )
+    statement = (
+        select(_Log)
+        .join(ranked, ranked.c.log_id == _Log.id)
+        .where(or_(ranked.c.rn_effective == 1, ranked.c.rn_logged == 1))
+    )
+    out: Dict[str, List[models.OffloadLog]] = {}
+    for log in session.exec(statement).all():
+        out.setdefault(log.station_id, []).append(log)
+    return out
+
+
+def _log_counts_by_station(
+    session: SQLModelSession,
+    station_ids: List[str],
+    season_year: Optional[int],
+) -> Dict[str, int]:
+    rows = session.exec(
+        select(_Log.station_id, func.count(_Log.id))
+        .where(_log_scope(station_ids, season_year))
+        .group_by(_Log.station_id)
+    ).all()
+    return {station_id: int(count) for station_id, count in rows}
+
+
+def array_station_summaries(
+    session: SQLModelSession,
+    stations: List[models.StationMetadata],
+    season_year: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """``station_mini_summary`` rows without loading every log of the array."""
+    station_ids = [s.station_id for s in stations]
+    if not station_ids:
+        return []
+    latest_logs = _latest_logs_by_station(session, station_ids, season_year)
+    counts = _log_counts_by_station(session, station_ids, season_year)
+    latest_swap = latest_swap_ts_by_station_sql(session, station_ids)
+    latest_effective = _latest_effective_ts_by_station(session, station_ids)
+
+    summaries = []
+    for station in stations:
+        swap_ts = latest_swap.get(station.station_id)
+        newest = latest_effective.get(station.station_id)
+        awaiting = swap_ts is not None and (
+            newest is None or _aware_ts(newest) <= _aware_ts(swap_ts)
+        )
+        summaries.append(
+            station_mini_summary(
+                station,
+                latest_logs.get(station.station_id, []),
+                awaiting_first_offload_after_swap=awaiting,
+                log_count=counts.get(station.station_id, 0),
+            )
+        )
+    return summaries
+
+
+def list_array_offload_logs(
+    session: SQLModelSession,
+    station_ids: List[str],
+    season_year: Optional[int] = None,
+    *,
+    limit: int = DEFAULT_ARRAY_LOG_PAGE_SIZE,
+    offset: int = 0,
+) -> Tuple[List[models.OffloadLog], int]:
+    """One page of the array's offload logs (newest logged first) and the total count."""
+    if not station_ids:
+        return [], 0
+    scope = _log_scope(station_ids, season_year)
+    total = session.exec(select(func.count(_Log.id)).where(scope)).one()
+    page = list(
+        session.exec(
+            select(_Log)
+            .where(scope)
+            .order_by(_Log.log_timestamp_utc.desc(), _Log.id.desc())
+            .offset(max(offset, 0))
+            .limit(max(1, min(limit, MAX_ARRAY_LOG_PAGE_SIZE)))
+        ).all()
+    )
+    return page, int(total)
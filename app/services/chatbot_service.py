@@ -1,17 +1,22 @@
 """
 Chatbot Service
 
-Handles keyword-based FAQ matching and query processing.
-Enhanced with vector search for semantic matching.
+Handles keyword-based FAQ matching (BM25 inverted index, see faq_index) and
+query processing. Enhanced with vector search for semantic matching, and a
+semantic cache of synthesized answers (see answer_cache).
 """
 
+import asyncio
 import logging
 from typing import List, Tuple, Optional, Dict
-from pathlib import Path
-from sqlmodel import select, or_, func
+from sqlmodel import Session, select
 from ..core.models.database import FAQEntry, KnowledgeDocument, SharedTip
 from ..core.models.schemas import FAQEntryRead, RelatedResource
 from ..config import settings
+from ..core.utils import resolve_data_path
+from .answer_cache import SemanticAnswerCache
+from .faq_index import FAQIndex, FAQIndexRegistry, keyword_confidence
+from .lazy_service import LazyService
 
 logger = logging.getLogger(__name__)
 
@@ -24,150 +29,210 @@ except ImportError:
     logger.warning("Vector search not available - dependencies may not be installed")
 
 
+def _build_vector_service() -> "VectorSearchService":
+    service = VectorSearchService(storage_path=resolve_data_path(settings.vector_store_dir))
+    if service.enabled:
+        logger.info("Vector search service initialized successfully")
+    else:
+        logger.warning("Vector search service disabled - dependencies not available")
+    return service
+
+
 class ChatbotService:
     """Service for chatbot operations with vector search support."""
     
     def __init__(self):
-        """Initialize the chatbot service."""
-        self.vector_service = None
-        
-        # Initialize vector search if enabled and available
+        """Initialize the chatbot service (the vector store is built lazily)."""
+        self._faq_indexes = FAQIndexRegistry(settings.faq_index_max_age_seconds)
+        self.answer_cache: Optional[SemanticAnswerCache] = None
+        if settings.chatbot_answer_cache_enabled:
+            self.answer_cache = SemanticAnswerCache(
+                max_entries=settings.chatbot_answer_cache_size,
+                similarity_threshold=settings.chatbot_answer_cache_similarity,
+                ttl_seconds=settings.chatbot_answer_cache_ttl_seconds,
+            )
+        self._vector: Optional[LazyService] = None
         if settings.vector_search_enabled and VECTOR_SEARCH_AVAILABLE:
-            try:
-                storage_path = Path("data_store/chroma_db")
-                self.vector_service = VectorSearchService(storage_path=storage_path)
-                if self.vector_service.enabled:
-                    logger.info("Vector search service initialized successfully")
-                else:
-                    logger.warning("Vector search service disabled - dependencies not available")
-            except Exception as e:
-                logger.error(f"Failed to initialize vector search: {e}")
-                self.vector_service = None
+            self._vector = LazyService("vector_search", _build_vector_service)
+
+    @property
+    def vector_service(self) -> Optional["VectorSearchService"]:
+        """
+        The vector store if it has finished loading, else ``None``.
+
+        Never blocks: callers fall back to keyword matching during warm-up.
+        Use ``await get_vector_service()`` where the vector store is required.
+        """
+        if self._vector is None:
+            return None
+        instance = self._vector.get_if_ready()
+        if instance is None:
+            self._vector.warm_in_background()
+        return instance
+
+    async def get_vector_service(self) -> Optional["VectorSearchService"]:
+        """Wait (off the event loop) for the vector store to finish loading."""
+        if self._vector is None:
+            return None
+        return await self._vector.aget()
+
+    def load_vector_service(self) -> Optional["VectorSearchService"]:
+        """Blocking accessor for sync callers running outside the event loop."""
+        if self._vector is None:
+            return None
+        return self._vector.get()
+
+    def warm_in_background(self) -> None:
+        """Start loading the embedding model and Chroma client in a daemon thread."""
+        if self._vector is not None:
+            self._vector.warm_in_background()
+
+    def readiness(self) -> Dict[str, object]:
+        if self._vector is None:
+            return {"state": "disabled", "ready": False, "load_seconds": None, "error": None}
+        return self._vector.status()
     
-    def match_faqs(
+    def faq_index(self, session: Session, platform: str) -> FAQIndex:
+        """The platform's FAQ inverted index (built from the database on first use)."""
+        return self._faq_indexes.get(session, platform)
+
+    def faq_index_upsert(self, faq: FAQEntry) -> None:
+        """Apply a created/updated FAQ to the in-memory keyword indexes."""
+        self._faq_indexes.upsert(faq)
+        if self.answer_cache is not None:
+            self.answer_cache.invalidate("faq", faq.id)
+
+    def faq_index_remove(self, faq_id: int) -> None:
+        self._faq_indexes.remove(faq_id)
+        if self.answer_cache is not None:
+            self.answer_cache.invalidate("faq", faq_id)
+
+    async def query_embedding(self, query: str) -> Optional[List[float]]:
+        """
+        Embedding of ``query`` (``None`` without vector search).
+
+        Served from the vector store's query cache, so the search that
+        follows a cache miss does not embed the query again.
+        """
+        vector_service = await self.get_vector_service()
+        if not vector_service or not vector_service.enabled or not query.strip():
+            return None
+        try:
+            return await asyncio.to_thread(vector_service.embed_query, query)
+        except Exception as e:
+            logger.warning(f"Query embedding failed: {e}")
+            return None
+
+    @staticmethod
+    def rank_faqs(
+        query: str,
+        index: FAQIndex,
+        vector_matches: List[Tuple[Dict, float]],
+        limit: int = 5,
+    ) -> List[Tuple[int, float]]:
+        """
+        Rank FAQ ids for ``query`` as ``(faq_id, confidence 0-100)``.
+
+        With vector hits, the candidates are the vector hits plus the top
+        keyword hits, scored as a weighted blend of vector similarity and
+        saturated BM25 (``faq_hybrid_keyword_weight``). Without vector hits
+        the BM25 ranking is used on its own. Hits for FAQs not in ``index``
+        (inactive or another platform) are dropped.
+        """
+        similarity_by_id: Dict[int, float] = {}
+        for metadata, similarity in vector_matches:
+            faq_id = int(metadata.get('faq_id', 0))
+            if faq_id in index:
+                similarity_by_id[faq_id] = max(similarity, similarity_by_id.get(faq_id, 0.0))
+
+        keyword_hits = index.search(query, limit=limit * 2)
+        if not similarity_by_id:
+            return [(faq_id, keyword_confidence(score) * 100.0) for faq_id, score in keyword_hits[:limit]]
+
+        candidates = set(similarity_by_id) | {faq_id for faq_id, _ in keyword_hits}
+        keyword_scores = index.scores(query, candidates)
+        weight = min(max(settings.faq_hybrid_keyword_weight, 0.0), 1.0)
+        blended = [
+            (
+                faq_id,
+                100.0 * (
+                    (1.0 - weight) * similarity_by_id.get(faq_id, 0.0)
+                    + weight * keyword_confidence(keyword_scores.get(faq_id, 0.0))
+                ),
+            )
+            for faq_id in candidates
+        ]
+        blended.sort(key=lambda x: (-x[1], x[0]))
+        return blended[:limit]
+
+    async def search_all(
         self,
         query: str,
-        faq_entries: List[FAQEntry],
+        session: Session,
+        category_filter: Optional[str] = None,
+        tag_filter: Optional[str] = None,
         limit: int = 5,
-        use_vector_search: bool = True
-    ) -> List[Tuple[FAQEntry, float]]:
+        platform: str = "wave_glider",
+    ) -> Tuple[List[Tuple[FAQEntry, float]], List[Tuple[Dict, float, str]], List[Tuple[Dict, float, str]]]:
         """
-        Match FAQ entries to a query using vector search (if available) or keyword matching.
-        
-        Args:
-            query: User's query text
-            faq_entries: List of FAQ entries to search
-            limit: Maximum number of results to return
-            use_vector_search: Whether to use vector search (falls back to keyword if unavailable)
-            
+        FAQ, document and tip matches for one query, embedding it only once.
+
+        FAQs are ranked with ``rank_faqs`` against the platform's inverted
+        index and only the matched rows are loaded; category/tag filters apply
+        to documents and tips only. The vector collections are queried
+        concurrently off the event loop.
+
         Returns:
-            List of tuples (FAQEntry, confidence_score) sorted by confidence
+            Tuple of (faq_matches_with_scores, document_results, tip_results)
         """
         if not query or not query.strip():
-            return []
-        
-        # Try vector search first if available
-        if use_vector_search and self.vector_service and self.vector_service.enabled:
+            return [], [], []
+
+        vector_faqs: List[Tuple[Dict, float]] = []
+        doc_results: List[Tuple[Dict, float, str]] = []
+        tip_results: List[Tuple[Dict, float, str]] = []
+        vector_service = self.vector_service
+        if vector_service and vector_service.enabled:
+            filtered = {
+                "category_filter": category_filter,
+                "tag_filter": tag_filter,
+                "limit": limit,
+                "similarity_threshold": settings.vector_similarity_threshold,
+                "platform": platform,
+            }
             try:
-                vector_matches = self.vector_service.search_faqs(
-                    query=query,
-                    limit=limit,
-                    similarity_threshold=settings.vector_similarity_threshold
+                result = await vector_service.search_many(
+                    query,
+                    {
+                        "faqs": {
+                            "limit": limit,
+                            "similarity_threshold": settings.vector_similarity_threshold,
+                        },
+                        "documents": filtered,
+                        "tips": filtered,
+                    },
                 )
-                
-                if vector_matches:
-                    # Convert vector search results to FAQEntry objects
-                    faq_dict = {faq.id: faq for faq in faq_entries}
-                    results = []
-                    
-                    for metadata, similarity in vector_matches:
-                        faq_id = int(metadata.get('faq_id', 0))
-                        if faq_id in faq_dict:
-                            # Convert similarity (0-1) to confidence score (0-100)
-                            confidence = similarity * 100.0
-                            results.append((faq_dict[faq_id], confidence))
-                    
-                    if results:
-                        logger.debug(f"Vector search found {len(results)} FAQ matches")
-                        return results
+                vector_faqs = result.get("faqs")
+                doc_results = result.get("documents")
+                tip_results = result.get("tips")
             except Exception as e:
-                logger.warning(f"Vector search failed, falling back to keyword matching: {e}")
-        
-        # Fallback to keyword matching
-        return self._match_faqs_keyword(query, faq_entries, limit)
-    
-    def _match_faqs_keyword(
-        self,
-        query: str,
-        faq_entries: List[FAQEntry],
-        limit: int = 5
-    ) -> List[Tuple[FAQEntry, float]]:
-        """Keyword-based FAQ matching (fallback method)."""
-        if not query or not query.strip():
-            return []
-        
-        query_lower = query.lower().strip()
-        query_words = set(query_lower.split())
-        
-        matches = []
-        
-        for faq in faq_entries:
-            if not faq.is_active:
-                continue
-            
-            score = 0.0
-            
-            # Check question match
-            question_lower = faq.question.lower()
-            if query_lower in question_lower:
-                score += 50.0  # Exact phrase match in question
-            else:
-                # Count matching words in question
-                question_words = set(question_lower.split())
-                matching_words = query_words.intersection(question_words)
-                if matching_words:
-                    score += len(matching_words) * 10.0
-            
-            # Check answer match
-            if faq.answer:
-                answer_lower = faq.answer.lower()
-                if query_lower in answer_lower:
-                    score += 20.0  # Exact phrase match in answer
-                else:
-                    answer_words = set(answer_lower.split())
-                    matching_words = query_words.intersection(answer_words)
-                    if matching_words:
-                        score += len(matching_words) * 5.0
-            
-            # Check keywords match
-            if faq.keywords:
-                keywords_lower = [k.strip().lower() for k in faq.keywords.split(',')]
-                for keyword in keywords_lower:
-                    if keyword in query_lower:
-                        score += 30.0  # Keyword match
-                    # Also check if query contains keyword
-                    if keyword in query_words:
-                        score += 15.0
-            
-            # Check tags match
-            if faq.tags:
-                tags_lower = [t.strip().lower() for t in faq.tags.split(',')]
-                for tag in tags_lower:
-                    if tag in query_lower:
-                        score += 10.0
-            
-            # Boost score for shorter queries that match well
-            if len(query_words) <= 3 and score > 20:
-                score *= 1.2
-            
-            if score > 0:
-                matches.append((faq, score))
-        
-        # Sort by score descending
-        matches.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return top matches
-        return matches[:limit]
+                logger.warning(f"Vector multi-search failed, falling back to keyword matching: {e}")
+
+        ranked = self.rank_faqs(query, self.faq_index(session, platform), vector_faqs, limit)
+        if not ranked:
+            return [], doc_results, tip_results
+        rows = {
+            faq.id: faq
+            for faq in session.exec(
+                select(FAQEntry).where(
+                    FAQEntry.id.in_([faq_id for faq_id, _ in ranked]),
+                    FAQEntry.is_active == True,  # noqa: E712
+                    FAQEntry.platform == platform,
+                )
+            ).all()
+        }
+        faq_matches = [(rows[faq_id], confidence) for faq_id, confidence in ranked if faq_id in rows]
+        return faq_matches, doc_results, tip_results
     
     def search_documents(
         self,
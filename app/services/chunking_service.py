@@ -9,15 +9,74 @@ Optimized for structured documents following the RAG document template:
 - Keeps tables intact when possible
 - Maintains numbered procedure steps together
 - Adds context from parent sections to isolated chunks
+
+``chunk_with_context`` is linear in document length: header offsets and the
+breadcrumb in effect after each header are recorded in one pass
+(``SectionIndex``), and each chunk's context is a bisect lookup instead of a
+rescan of everything before it.
 """
 
 import re
 import logging
-from typing import List, Tuple, Optional
+from bisect import bisect_right
+from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_HEADER_RE = re.compile(r'^(#{1,6})\s+(.+?)$', re.MULTILINE)
+_SECTION_SPLIT_RE = re.compile(r'(^#{1,6}\s+.+$)', re.MULTILINE)
+_HEADER_START_RE = re.compile(r'^#{1,6}\s+')
+
+Hierarchy = Tuple[Tuple[int, str], ...]  # (level, title), shallowest first
+
+
+def _push_header(hierarchy: Hierarchy, level: int, title: str) -> Hierarchy:
+    """Hierarchy after a header: deeper levels are dropped, this level replaced."""
+    return tuple(item for item in hierarchy if item[0] < level) + ((level, title),)
+
+
+def _format_hierarchy(hierarchy: Hierarchy) -> str:
+    if not hierarchy:
+        return ""
+    return f"[Context: {' > '.join(title for _, title in hierarchy)}]\n\n"
+
+
+class SectionIndex:
+    """
+    Markdown header offsets of one document, scanned once.
+
+    ``context(position)`` returns what ``ChunkingService._extract_section_hierarchy``
+    would for the same position, in O(log h) plus the (short) text between the
+    last complete header and ``position``.
+    """
+
+    def __init__(self, content: str):
+        self._content = content
+        self._ends: List[int] = []
+        self._hierarchies: List[Hierarchy] = []
+        self._memo: Dict[int, str] = {}
+        hierarchy: Hierarchy = ()
+        for match in _HEADER_RE.finditer(content):
+            hierarchy = _push_header(hierarchy, len(match.group(1)), match.group(2).strip())
+            self._ends.append(match.end())
+            self._hierarchies.append(hierarchy)
+
+    def context(self, position: int) -> str:
+        cached = self._memo.get(position)
+        if cached is not None:
+            return cached
+        count = bisect_right(self._ends, position)
+        hierarchy = self._hierarchies[count - 1] if count else ()
+        boundary = self._ends[count - 1] if count else 0
+        # A header straddling ``position`` is seen truncated by the reference
+        # scan of content[:position]; endpos reproduces that exactly.
+        for match in _HEADER_RE.finditer(self._content, boundary, position):
+            hierarchy = _push_header(hierarchy, len(match.group(1)), match.group(2).strip())
+        result = _format_hierarchy(hierarchy)
+        self._memo[position] = result
+        return result
+
 
 @dataclass
 class DocumentChunk:
@@ -289,6 +348,9 @@ class ChunkingService:
         """
         Extract the section hierarchy (headers) leading up to a position in the document.
         This provides context for isolated chunks.
+
+        Scans ``content[:position]``; ``chunk_with_context`` uses ``SectionIndex``
+        for the same result without rescanning per chunk.
         
         Returns a string like:
         "# Document Title > ## Section Name > ### Subsection Name"
@@ -336,6 +398,9 @@ class ChunkingService:
         numbered_lines = sum(1 for line in lines if re.match(numbered_pattern, line.strip()))
         return numbered_lines >= 3
     
+    def _section_index(self, content: str) -> SectionIndex:
+        return SectionIndex(content)
+
     def chunk_with_context(
         self,
         doc_id: int,
@@ -381,26 +446,32 @@ class ChunkingService:
             doc_metadata = metadata_match.group(1).strip() + "\n\n"
         
         # Split by section headers while keeping headers with content
-        section_pattern = r'(^#{1,6}\s+.+$)'
-        parts = re.split(section_pattern, content, flags=re.MULTILINE)
+        parts = _SECTION_SPLIT_RE.split(content)
         
-        # Reconstruct sections with their headers
+        # Reconstruct sections with their headers. The parts concatenate back
+        # to ``content``, so a running offset gives each header's position.
         sections = []
-        current_section = ""
+        current_section: List[str] = []
         current_start = 0
+        offset = 0
         
         for part in parts:
-            if re.match(r'^#{1,6}\s+', part):
+            if _HEADER_START_RE.match(part):
                 # This is a header - save current section and start new one
-                if current_section.strip():
-                    sections.append((current_section, current_start))
-                current_section = part + "\n"
-                current_start = content.find(part, current_start)
+                section_text = "".join(current_section)
+                if section_text.strip():
+                    sections.append((section_text, current_start))
+                current_section = [part, "\n"]
+                current_start = offset
             else:
-                current_section += part
+                current_section.append(part)
+            offset += len(part)
+        
+        section_text = "".join(current_section)
+        if section_text.strip():
+            sections.append((section_text, current_start))
         
-        if current_section.strip():
-            sections.append((current_section, current_start))
+        section_index = self._section_index(content)
         
         # Process sections into chunks
         chunks = []
@@ -418,7 +489,7 @@ class ChunkingService:
             if len(section_content) <= self.chunk_size * 1.2 or (is_structured and len(section_content) <= self.chunk_size * 2):
                 # Add context header if enabled
                 if self.include_headers:
-                    context = self._extract_section_hierarchy(content, section_start)
+                    context = section_index.context(section_start)
                     if context and not section_content.startswith('#'):
                         section_content = context + section_content
                 
@@ -443,7 +514,7 @@ class ChunkingService:
                     
                     # Add context header
                     if self.include_headers:
-                        context = self._extract_section_hierarchy(content, section_start)
+                        context = section_index.context(section_start)
                         if context and not para_chunk.startswith('#'):
                             para_chunk = context + para_chunk
                     
@@ -0,0 +1,148 @@
+"""
+Persistent content-hash -> embedding store (``embedding_cache`` table).
+
+Vector ingestion looks up every text by the hash of its whitespace-normalized
+content before calling the embedding model, so re-uploaded documents, full
+reindexes and boilerplate sections shared between manuals only pay for text
+that has never been embedded with the current model.
+"""
+
+import hashlib
+import logging
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select
+from sqlmodel import Session as SQLModelSession
+
+from ..core import models
+
+logger = logging.getLogger(__name__)
+
+# Stay well under SQLite's bound-parameter limit for IN (...) lookups.
+_LOOKUP_BATCH_SIZE = 500
+# Consecutive database errors before the store stops trying for this process.
+# A transient lock timeout retries on the next call; a missing table gives up
+# after a few attempts instead of logging on every batch.
+_MAX_CONSECUTIVE_FAILURES = 3
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of ``text`` with runs of whitespace collapsed."""
+    return hashlib.sha256(" ".join((text or "").split()).encode("utf-8")).hexdigest()
+
+
+def _pack(vector: List[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class EmbeddingStore:
+    """Read-through store of embeddings for one model, backed by SQLite."""
+
+    def __init__(self, model_name: str, engine=None):
+        self.model_name = model_name
+        self._engine = engine
+        self._available = True
+        self._consecutive_failures = 0
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from ..core.infra.db import sqlite_engine
+
+            self._engine = sqlite_engine
+        return self._engine
+
+    def _record_failure(self, e: Exception) -> None:
+        # Missing table (migrations not applied) or a locked DB must never
+        # block indexing; this call falls back to embedding everything.
+        self._consecutive_failures += 1
+        if self._consecutive_failures < _MAX_CONSECUTIVE_FAILURES:
+            logger.warning(
+                f"Embedding store error ({self._consecutive_failures}/"
+                f"{_MAX_CONSECUTIVE_FAILURES}), embedding without cache for now: {e}"
+            )
+            return
+        if self._available:
+            logger.warning(
+                f"Embedding store unavailable after {self._consecutive_failures} "
+                f"consecutive errors, embedding without cache: {e}"
+            )
+        self._available = False
+
+    def _record_success(self) -> None:
+        self._consecutive_failures = 0
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, List[float]]:
+        wanted = sorted(set(hashes))
+        if not wanted or not self._available:
+            return {}
+        entry = models.EmbeddingCacheEntry
+        found: Dict[str, List[float]] = {}
+        try:
+            with SQLModelSession(self.engine) as session:
+                for start in range(0, len(wanted), _LOOKUP_BATCH_SIZE):
+                    rows = session.exec(
+                        select(entry.content_hash, entry.embedding).where(
+                            entry.model_name == self.model_name,
+                            entry.content_hash.in_(wanted[start:start + _LOOKUP_BATCH_SIZE]),
+                        )
+                    ).all()
+                    for digest, blob in rows:
+                        found[digest] = _unpack(blob)
+        except SQLAlchemyError as e:
+            self._record_failure(e)
+            return {}
+        self._record_success()
+        return found
+
+    def put_many(self, vectors: Dict[str, List[float]]) -> None:
+        if not vectors or not self._available:
+            return
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "model_name": self.model_name,
+                "content_hash": digest,
+                "dimensions": len(vector),
+                "embedding": _pack(vector),
+                "created_at_utc": now,
+            }
+            for digest, vector in vectors.items()
+        ]
+        statement = sqlite_insert(models.EmbeddingCacheEntry).on_conflict_do_nothing(
+            index_elements=["model_name", "content_hash"]
+        )
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(statement, rows)
+        except SQLAlchemyError as e:
+            self._record_failure(e)
+            return
+        self._record_success()
+
+    def count(self) -> Optional[int]:
+        if not self._available:
+            return None
+        try:
+            with SQLModelSession(self.engine) as session:
+                total = int(session.exec(
+                    select(func.count(models.EmbeddingCacheEntry.id)).where(
+                        models.EmbeddingCacheEntry.model_name == self.model_name
+                    )
+                ).one())
+        except SQLAlchemyError as e:
+            self._record_failure(e)
+            return None
+        self._record_success()
+        return total
@@ -0,0 +1,185 @@
+"""
+FAQ Inverted Index
+
+In-memory BM25F index over active FAQ entries of one platform, replacing the
+per-query scan in keyword FAQ matching. Postings map token -> FAQ id -> term
+frequency per field (question, answer, keywords, tags); fields are weighted
+and length-normalized BM25F-style, so a hit in the question or keywords
+outranks the same word buried in a long answer.
+
+The index is built once per platform, updated incrementally on FAQ
+create/update/delete in this process, and rebuilt from the database after
+``faq_index_max_age_seconds`` so edits made through other workers show up.
+"""
+
+import math
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlmodel import select
+from sqlmodel import Session as SQLModelSession
+
+from ..core.models.database import FAQEntry
+
+FIELDS = ("question", "answer", "keywords", "tags")
+FIELD_WEIGHTS = (3.0, 1.0, 2.5, 1.5)
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# BM25 score that maps to 50% keyword confidence (see ``keyword_confidence``).
+BM25_HALF_CONFIDENCE_SCORE = 4.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for",
+    "from", "how", "i", "if", "in", "is", "it", "my", "of", "on", "or", "the",
+    "this", "to", "was", "what", "when", "where", "which", "why", "with", "you",
+})
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS]
+
+
+def keyword_confidence(score: float) -> float:
+    """Map an unbounded BM25 score onto 0-1 (saturating)."""
+    return score / (score + BM25_HALF_CONFIDENCE_SCORE) if score > 0 else 0.0
+
+
+class FAQIndex:
+    """BM25F inverted index for one platform's active FAQs."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[int, Tuple[int, ...]]] = defaultdict(dict)
+        self._tokens_by_faq: Dict[int, Set[str]] = {}
+        self._lengths: Dict[int, Tuple[int, ...]] = {}
+        self._length_totals = [0] * len(FIELDS)
+        self.built_at = time.monotonic()
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[FAQEntry]) -> "FAQIndex":
+        index = cls()
+        for faq in entries:
+            index.upsert(faq)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, faq_id: int) -> bool:
+        return faq_id in self._lengths
+
+    def upsert(self, faq: FAQEntry) -> None:
+        """Add or replace ``faq``; inactive entries are removed instead."""
+        with self._lock:
+            self.remove(faq.id)
+            if not faq.is_active:
+                return
+            field_tokens = [
+                tokenize(faq.question),
+                tokenize(faq.answer),
+                tokenize(faq.keywords),
+                tokenize(faq.tags),
+            ]
+            frequencies: Dict[str, List[int]] = defaultdict(lambda: [0] * len(FIELDS))
+            for field_index, tokens in enumerate(field_tokens):
+                for token in tokens:
+                    frequencies[token][field_index] += 1
+            for token, tf in frequencies.items():
+                self._postings[token][faq.id] = tuple(tf)
+            self._tokens_by_faq[faq.id] = set(frequencies)
+            lengths = tuple(len(tokens) for tokens in field_tokens)
+            self._lengths[faq.id] = lengths
+            for i, length in enumerate(lengths):
+                self._length_totals[i] += length
+
+    def remove(self, faq_id: Optional[int]) -> None:
+        with self._lock:
+            tokens = self._tokens_by_faq.pop(faq_id, None)
+            if tokens is None:
+                return
+            for token in tokens:
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.pop(faq_id, None)
+                    if not postings:
+                        del self._postings[token]
+            for i, length in enumerate(self._lengths.pop(faq_id)):
+                self._length_totals[i] -= length
+
+    def scores(self, query: str, candidate_ids: Optional[Iterable[int]] = None) -> Dict[int, float]:
+        """BM25F score per FAQ id sharing at least one query token with it."""
+        query_tokens = set(tokenize(query))
+        with self._lock:
+            n_docs = len(self._lengths)
+            if not query_tokens or not n_docs:
+                return {}
+            avg_lengths = [max(total / n_docs, 1.0) for total in self._length_totals]
+            restrict = set(candidate_ids) if candidate_ids is not None else None
+            scores: Dict[int, float] = defaultdict(float)
+            for token in query_tokens:
+                postings = self._postings.get(token)
+                if not postings:
+                    continue
+                idf = math.log(1.0 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for faq_id, tf in postings.items():
+                    if restrict is not None and faq_id not in restrict:
+                        continue
+                    lengths = self._lengths[faq_id]
+                    weighted_tf = sum(
+                        FIELD_WEIGHTS[i] * tf[i] / (1.0 - BM25_B + BM25_B * lengths[i] / avg_lengths[i])
+                        for i in range(len(FIELDS))
+                        if tf[i]
+                    )
+                    scores[faq_id] += idf * weighted_tf * (BM25_K1 + 1.0) / (weighted_tf + BM25_K1)
+            return dict(scores)
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[int, float]]:
+        """Top ``limit`` ``(faq_id, bm25_score)`` pairs, best first."""
+        ranked = sorted(self.scores(query).items(), key=lambda kv: (-kv[1], kv[0]))
+        return ranked[:limit]
+
+
+class FAQIndexRegistry:
+    """One ``FAQIndex`` per platform, built lazily from the database."""
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._indexes: Dict[str, FAQIndex] = {}
+
+    def get(self, session: SQLModelSession, platform: str) -> FAQIndex:
+        index = self._indexes.get(platform)
+        if index is not None and time.monotonic() - index.built_at < self.max_age_seconds:
+            return index
+        entries = session.exec(
+            select(FAQEntry).where(
+                FAQEntry.is_active == True,  # noqa: E712
+                FAQEntry.platform == platform,
+            )
+        ).all()
+        index = FAQIndex.from_entries(entries)
+        with self._lock:
+            self._indexes[platform] = index
+        return index
+
+    def upsert(self, faq: FAQEntry) -> None:
+        """Apply a saved FAQ to the built indexes (moves it if its platform changed)."""
+        with self._lock:
+            indexes = dict(self._indexes)
+        for platform, index in indexes.items():
+            if platform == faq.platform:
+                index.upsert(faq)
+            else:
+                index.remove(faq.id)
+
+    def remove(self, faq_id: int) -> None:
+        with self._lock:
+            indexes = list(self._indexes.values())
+        for index in indexes:
+            index.remove(faq_id)
@@ -2,123 +2,223 @@
 Knowledge Base Service
 
 Handles document processing, text extraction, and search logic.
+
+Text extraction runs in a small process pool (``knowledge_base_extraction_workers``)
+so parsing large manuals neither blocks the event loop nor holds the GIL
+against request handling. PDFs are split into page ranges that are extracted
+in parallel and streamed back in page order (``iter_pdf_text``).
+
+Extracted text is cached on disk keyed by the SHA-256 of the file bytes, so
+re-uploading the same file, or re-ingesting after a chunker/embedding model
+change, never parses it twice. Layout under ``knowledge_base_text_cache_dir``::
+
+    <sha256>.<file_type>.v<EXTRACTOR_VERSION>.txt
 """
 
+import asyncio
+import hashlib
+import importlib.util
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Optional
-import asyncio
+from typing import AsyncIterator, Callable, List, Optional
+
+from ..config import settings
+from ..core.utils import replace_path_with_retries, resolve_data_path, unique_sibling_tmp_path
 
 logger = logging.getLogger(__name__)
 
+# Bump when extraction output changes so cached text is re-extracted.
+EXTRACTOR_VERSION = 1
+
+_EXTRACTOR_PACKAGES = {
+    "pdf": ("PyPDF2", "PyPDF2"),
+    "docx": ("docx", "python-docx"),
+    "pptx": ("pptx", "python-pptx"),
+}
+
+
+# --- Process-pool workers (module level so they can be pickled) ---
+
+def _pdf_page_count(file_path: str) -> int:
+    import PyPDF2
+    with open(file_path, "rb") as f:
+        return len(PyPDF2.PdfReader(f).pages)
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int) -> str:
+    """Text of pages ``[start, stop)``, one trailing newline per page."""
+    import PyPDF2
+    parts: List[str] = []
+    with open(file_path, "rb") as f:
+        pdf_reader = PyPDF2.PdfReader(f)
+        for page_number in range(start, min(stop, len(pdf_reader.pages))):
+            try:
+                parts.append(pdf_reader.pages[page_number].extract_text() + "\n")
+            except Exception as e:
+                logger.warning(f"Error extracting text from PDF page {page_number + 1}: {e}")
+    return "".join(parts)
+
+
+def _extract_docx(file_path: str) -> str:
+    from docx import Document
+    doc = Document(file_path)
+    return "\n".join([paragraph.text for paragraph in doc.paragraphs])
+
+
+def _extract_pptx(file_path: str) -> str:
+    from pptx import Presentation
+    prs = Presentation(file_path)
+    text = ""
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            if hasattr(shape, "text"):
+                text += shape.text + "\n"
+    return text
+
+
+def _file_sha256(file_path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
 
 class KnowledgeBaseService:
     """Service for knowledge base operations."""
-    
+
     def __init__(self):
-        """Initialize the knowledge base service."""
-        pass
-    
+        """Initialize the knowledge base service (the process pool starts on first use)."""
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn, not fork: the web worker has live threads (scheduler,
+                # warm-up loaders) whose locks must not be copied into children.
+                self._pool = ProcessPoolExecutor(
+                    max_workers=max(1, settings.knowledge_base_extraction_workers),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    async def _run(self, fn: Callable, *args):
+        """Run ``fn`` in the process pool; fall back to a thread if the pool died."""
+        try:
+            return await asyncio.wrap_future(self._get_pool().submit(fn, *args))
+        except BrokenProcessPool:
+            logger.warning("Extraction process pool broke; retrying in a thread")
+            with self._pool_lock:
+                self._pool = None
+            return await asyncio.to_thread(fn, *args)
+
+    # --- Extracted-text cache ---
+
+    @staticmethod
+    def _cache_path(file_hash: str, file_type: str) -> Path:
+        root = resolve_data_path(settings.knowledge_base_text_cache_dir)
+        return root / f"{file_hash}.{file_type}.v{EXTRACTOR_VERSION}.txt"
+
+    @staticmethod
+    def _read_cached_text(cache_path: Path) -> Optional[str]:
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Extracted-text cache read failed for {cache_path}: {e}")
+            return None
+
+    @staticmethod
+    def _write_cached_text(cache_path: Path, text: str) -> None:
+        tmp_path = unique_sibling_tmp_path(cache_path)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(text, encoding="utf-8")
+            replace_path_with_retries(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Extracted-text cache write failed for {cache_path}: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    # --- Extraction ---
+
     async def extract_text_from_document(
         self,
         file_path: Path,
         file_type: str
     ) -> str:
         """
-        Extract searchable text from a document.
-        
+        Extract searchable text from a document (served from the disk cache
+        when the same file bytes were extracted before).
+
         Args:
             file_path: Path to the document file
             file_type: Type of file (pdf, docx, pptx)
-            
+
         Returns:
             Extracted text content
         """
+        if file_type not in _EXTRACTOR_PACKAGES:
+            logger.warning(f"Unsupported file type for text extraction: {file_type}")
+            return ""
+        module_name, package_name = _EXTRACTOR_PACKAGES[file_type]
+        if importlib.util.find_spec(module_name) is None:
+            logger.warning(f"{package_name} not installed, skipping {file_type.upper()} text extraction")
+            return ""
+
         try:
+            file_hash = await asyncio.to_thread(_file_sha256, Path(file_path))
+            cache_path = self._cache_path(file_hash, file_type)
+            cached = await asyncio.to_thread(self._read_cached_text, cache_path)
+            if cached is not None:
+                logger.info(f"Extracted text for {file_path} served from cache")
+                return cached
+
             if file_type == "pdf":
-                return await self._extract_pdf_text(file_path)
+                text = "".join([part async for part in self.iter_pdf_text(file_path)])
             elif file_type == "docx":
-                return await self._extract_docx_text(file_path)
-            elif file_type == "pptx":
-                return await self._extract_pptx_text(file_path)
+                text = await self._run(_extract_docx, str(file_path))
             else:
-                logger.warning(f"Unsupported file type for text extraction: {file_type}")
-                return ""
-        except Exception as e:
-            logger.error(f"Error extracting text from {file_path}: {e}")
-            return ""
-    
-    async def _extract_pdf_text(self, file_path: Path) -> str:
-        """Extract text from PDF."""
-        try:
-            import PyPDF2
-            # Run in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            text = await loop.run_in_executor(None, self._extract_pdf_sync, file_path)
-            return text
-        except ImportError:
-            logger.warning("PyPDF2 not installed, skipping PDF text extraction")
-            return ""
-        except Exception as e:
-            logger.error(f"Error extracting PDF text: {e}")
-            return ""
-    
-    def _extract_pdf_sync(self, file_path: Path) -> str:
-        """Synchronous PDF extraction (runs in thread pool)."""
-        import PyPDF2
-        text = ""
-        with open(file_path, "rb") as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            for page in pdf_reader.pages:
-                try:
-                    text += page.extract_text() + "\n"
-                except Exception as e:
-                    logger.warning(f"Error extracting text from PDF page: {e}")
-        return text
-    
-    async def _extract_docx_text(self, file_path: Path) -> str:
-        """Extract text from Word document."""
-        try:
-            from docx import Document
-            loop = asyncio.get_event_loop()
-            text = await loop.run_in_executor(None, self._extract_docx_sync, file_path)
-            return text
-        except ImportError:
-            logger.warning("python-docx not installed, skipping DOCX text extraction")
-            return ""
-        except Exception as e:
-            logger.error(f"Error extracting DOCX text: {e}")
-            return ""
-    
-    def _extract_docx_sync(self, file_path: Path) -> str:
-        """Synchronous DOCX extraction (runs in thread pool)."""
-        from docx import Document
-        doc = Document(file_path)
-        text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        return text
-    
-    async def _extract_pptx_text(self, file_path: Path) -> str:
-        """Extract text from PowerPoint."""
-        try:
-            from pptx import Presentation
-            loop = asyncio.get_event_loop()
-            text = await loop.run_in_executor(None, self._extract_pptx_sync, file_path)
+                text = await self._run(_extract_pptx, str(file_path))
+
+            await asyncio.to_thread(self._write_cached_text, cache_path, text)
             return text
-        except ImportError:
-            logger.warning("python-pptx not installed, skipping PPTX text extraction")
-            return ""
         except Exception as e:
-            logger.error(f"Error extracting PPTX text: {e}")
+            logger.error(f"Error extracting text from {file_path}: {e}")
             return ""
-    
-    def _extract_pptx_sync(self, file_path: Path) -> str:
-        """Synchronous PPTX extraction (runs in thread pool)."""
-        from pptx import Presentation
-        prs = Presentation(file_path)
-        text = ""
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    text += shape.text + "\n"
-        return text
 
+    async def iter_pdf_text(self, file_path: Path) -> AsyncIterator[str]:
+        """
+        Yield a PDF's text in page order, one page range at a time.
+
+        All ranges (``knowledge_base_pdf_pages_per_task`` pages each) are
+        submitted to the pool up front; each is yielded as soon as it and
+        every range before it have finished.
+        """
+        path = str(file_path)
+        page_count = await self._run(_pdf_page_count, path)
+        step = max(1, settings.knowledge_base_pdf_pages_per_task)
+        tasks = [
+            asyncio.ensure_future(self._run(_extract_pdf_pages, path, start, start + step))
+            for start in range(0, page_count, step)
+        ]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
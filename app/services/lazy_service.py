@@ -0,0 +1,97 @@
+"""
+Lazily constructed, thread-safe service holder.
+
+Heavy services (embedding model + Chroma client, Ollama probe) used to be
+built at import time, so every worker paid for the ML stack before serving
+its first request. ``LazyService`` defers the factory until first use or an
+explicit ``warm_in_background()`` call after startup, and exposes a readiness
+snapshot for status endpoints.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+STATE_IDLE = "idle"
+STATE_LOADING = "loading"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+
+
+class LazyService(Generic[T]):
+    """Build ``factory()`` once, on demand or in a background thread."""
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        self.name = name
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._instance: Optional[T] = None
+        self._state = STATE_IDLE
+        self._error: Optional[str] = None
+        self._load_seconds: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._state == STATE_READY
+
+    def get_if_ready(self) -> Optional[T]:
+        """Return the instance without blocking; ``None`` while not built yet."""
+        if self._state == STATE_READY:
+            return self._instance
+        return None
+
+    def get(self) -> Optional[T]:
+        """Return the instance, building it in the calling thread if needed.
+
+        A failed build is not retried; the error is kept for ``status()``.
+        """
+        if self._state in (STATE_READY, STATE_FAILED):
+            return self._instance
+        with self._lock:
+            if self._state in (STATE_READY, STATE_FAILED):
+                return self._instance
+            self._state = STATE_LOADING
+            started = time.perf_counter()
+            try:
+                instance = self._factory()
+            except Exception as e:
+                self._error = str(e)
+                self._state = STATE_FAILED
+                logger.error("Failed to initialize %s: %s", self.name, e, exc_info=True)
+                return None
+            finally:
+                self._load_seconds = round(time.perf_counter() - started, 3)
+            self._instance = instance
+            self._state = STATE_READY
+            logger.info("%s ready in %.2fs", self.name, self._load_seconds)
+            return instance
+
+    async def aget(self) -> Optional[T]:
+        """Async accessor: never builds on the event loop thread."""
+        if self._state in (STATE_READY, STATE_FAILED):
+            return self._instance
+        return await asyncio.to_thread(self.get)
+
+    def warm_in_background(self) -> None:
+        """Start building in a daemon thread (no-op once started)."""
+        if self._state != STATE_IDLE or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self.get, name=f"warm-{self.name}", daemon=True
+        )
+        self._thread.start()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self._state,
+            "ready": self._state == STATE_READY,
+            "load_seconds": self._load_seconds,
+            "error": self._error,
+        }
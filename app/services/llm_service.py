@@ -5,17 +5,26 @@ Handles communication with local Ollama LLM for response synthesis.
 Provides intelligent responses based on retrieved context from documents, tips, and FAQs.
 Uses direct HTTP calls to Ollama for reliability.
 
-Note: LLM calls are synchronous but can be run asynchronously via synthesize_response_async()
-which wraps the blocking call in a thread pool to avoid blocking the FastAPI event loop.
+Async callers use stream_generate() / synthesize_response_async(), which stream
+from /api/generate on a pooled httpx.AsyncClient. At most
+``llm_max_concurrent_requests`` generations run at once per worker; up to
+``llm_max_queued_requests`` more wait for a slot, beyond that requests are
+rejected with LLMQueueFullError rather than oversubscribing the model server.
+Time-to-first-token is recorded for every generation (see metrics()).
 """
 
+import json
 import logging
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import deque
+import httpx
 import requests
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from .lazy_service import LazyService
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,25 +39,214 @@ class ContextSource:
     similarity: float = 0.0
 
 
+class LLMQueueFullError(RuntimeError):
+    """Raised when every generation slot is busy and the wait queue is full."""
+
+
+class LLMMetrics:
+    """Rolling latency metrics; time-to-first-token is the headline number."""
+
+    def __init__(self, window: int = 200):
+        self.ttft_seconds: deque = deque(maxlen=window)
+        self.total_seconds: deque = deque(maxlen=window)
+        self.generations = 0
+        self.failures = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.queued = 0
+
+    @staticmethod
+    def _percentile(values, pct: float) -> Optional[float]:
+        if not values:
+            return None
+        ordered = sorted(values)
+        return round(ordered[min(len(ordered) - 1, int(pct * len(ordered)))], 3)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "ttft_p50_seconds": self._percentile(self.ttft_seconds, 0.5),
+            "ttft_p95_seconds": self._percentile(self.ttft_seconds, 0.95),
+            "total_p50_seconds": self._percentile(self.total_seconds, 0.5),
+            "generations": self.generations,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+        }
+
+
+class LLMGeneration:
+    """
+    One streamed generation: iterate for text fragments.
+
+    ``ttft_seconds`` is set when the first fragment arrives (queue wait
+    included) and stays ``None`` if nothing was generated.
+    """
+
+    def __init__(self, service: "LLMService", prompt: str):
+        self._service = service
+        self._prompt = prompt
+        self.ttft_seconds: Optional[float] = None
+        self.total_seconds: Optional[float] = None
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._stream()
+
+    async def _stream(self) -> AsyncIterator[str]:
+        service = self._service
+        metrics = service._metrics
+        started = time.perf_counter()
+        async with service._generation_slot():
+            metrics.in_flight += 1
+            try:
+                async with service._get_client().stream(
+                    "POST",
+                    f"{service.host}/api/generate",
+                    json={
+                        "model": service.model,
+                        "prompt": self._prompt,
+                        "stream": True,
+                        "options": {
+                            "temperature": service.temperature,
+                            "num_predict": service.max_tokens,
+                        },
+                    },
+                ) as resp:
+                    if resp.status_code != 200:
+                        raise RuntimeError(f"LLM generation failed: HTTP {resp.status_code}")
+                    async for line in resp.aiter_lines():
+                        if not line:
+                            continue
+                        chunk = json.loads(line)
+                        if chunk.get("error"):
+                            raise RuntimeError(f"LLM generation failed: {chunk['error']}")
+                        fragment = chunk.get("response", "")
+                        if fragment:
+                            if self.ttft_seconds is None:
+                                self.ttft_seconds = time.perf_counter() - started
+                                metrics.ttft_seconds.append(self.ttft_seconds)
+                            yield fragment
+                        if chunk.get("done"):
+                            break
+                self.total_seconds = time.perf_counter() - started
+                metrics.total_seconds.append(self.total_seconds)
+                metrics.generations += 1
+            except Exception:
+                metrics.failures += 1
+                raise
+            finally:
+                metrics.in_flight -= 1
+
+
+class _GenerationSlot:
+    """Bounded queue in front of the generation semaphore."""
+
+    def __init__(self, service: "LLMService"):
+        self._service = service
+
+    async def __aenter__(self):
+        service = self._service
+        metrics = service._metrics
+        semaphore = service._get_semaphore()
+        if semaphore.locked() and metrics.queued >= service.max_queued:
+            metrics.rejected += 1
+            raise LLMQueueFullError("The assistant is busy answering other questions; please retry shortly.")
+        metrics.queued += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            metrics.queued -= 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._service._get_semaphore().release()
+        return False
+
+
 class LLMService:
     """Service for LLM-powered response generation using Ollama via HTTP."""
     
     def __init__(self):
-        """Initialize the LLM service."""
+        """Initialize the LLM service (the Ollama probe runs lazily)."""
         from ..config import settings
         
-        self.enabled = False
         self.host = settings.llm_host
         self.model = settings.llm_model
         self.temperature = settings.llm_temperature
         self.max_tokens = settings.llm_max_tokens
         self.timeout = settings.llm_timeout
         self.max_context_chars = getattr(settings, 'llm_max_context_chars', 6000)
+        self.max_concurrent = max(1, settings.llm_max_concurrent_requests)
+        self.max_queued = max(0, settings.llm_max_queued_requests)
+        self._probe: Optional[LazyService] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._metrics = LLMMetrics()
         
         if not settings.llm_enabled:
             logger.info("LLM is disabled in settings")
             return
-        
+        self._probe = LazyService("llm", self._probe_ollama)
+
+    @property
+    def enabled(self) -> bool:
+        """True once the Ollama probe succeeded; never blocks (starts the probe if idle)."""
+        if self._probe is None:
+            return False
+        result = self._probe.get_if_ready()
+        if result is None:
+            self._probe.warm_in_background()
+        return bool(result)
+
+    async def ensure_ready(self) -> bool:
+        """Wait (off the event loop) for the Ollama probe; returns ``enabled``."""
+        if self._probe is None:
+            return False
+        return bool(await self._probe.aget())
+
+    def warm_in_background(self) -> None:
+        if self._probe is not None:
+            self._probe.warm_in_background()
+
+    def readiness(self) -> Dict[str, object]:
+        if self._probe is None:
+            return {"state": "disabled", "ready": False, "load_seconds": None, "error": None}
+        return {**self._probe.status(), "model": self.model}
+
+    def metrics(self) -> Dict[str, object]:
+        return {
+            **self._metrics.snapshot(),
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Pooled client, created on first use inside the running event loop."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrent + 2,
+                    max_keepalive_connections=self.max_concurrent,
+                ),
+            )
+        return self._client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    def _generation_slot(self) -> _GenerationSlot:
+        return _GenerationSlot(self)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _probe_ollama(self) -> bool:
+        """List installed models; pick a fallback model if the configured one is missing."""
         try:
             # Test connection by listing models via HTTP
             resp = requests.get(f"{self.host}/api/tags", timeout=5)
@@ -59,7 +257,7 @@ class LLMService:
                 
                 if not available_models:
                     logger.warning("No models installed in Ollama. Run: ollama pull mistral:7b")
-                    return
+                    return False
                 
                 # Check if configured model is available
                 model_found = any(self.model in m or m in self.model for m in available_models)
@@ -69,15 +267,15 @@ class LLMService:
                     self.model = available_models[0]
                     logger.info(f"Using fallback model: {self.model}")
                 
-                self.enabled = True
                 logger.info(f"LLM service initialized with model: {self.model}")
-            else:
-                logger.error(f"Failed to connect to Ollama: HTTP {resp.status_code}")
+                return True
+            logger.error(f"Failed to connect to Ollama: HTTP {resp.status_code}")
                 
         except requests.exceptions.ConnectionError:
             logger.warning(f"Cannot connect to Ollama at {self.host}. LLM features disabled.")
         except Exception as e:
             logger.error(f"Failed to initialize LLM service: {e}")
+        return False
     
     def is_available(self) -> bool:
         """Check if LLM service is available."""
@@ -115,14 +313,7 @@ class LLMService:
             max_context_length = self.max_context_chars
         
         try:
-            # Build context from sources
-            context, sources = self._build_context(context_sources, max_context_length)
-            
-            if not context:
-                # No context available, use general knowledge
-                prompt = self._build_general_prompt(query)
-            else:
-                prompt = self._build_rag_prompt(query, context)
+            prompt, sources = self.build_prompt(query, context_sources, max_context_length)
             
             # Generate response via HTTP
             resp = requests.post(
@@ -157,6 +348,25 @@ class LLMService:
             logger.error(f"Error generating LLM response: {e}")
             return None, []
     
+    def build_prompt(
+        self,
+        query: str,
+        context_sources: List[ContextSource],
+        max_context_length: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
+        """Prompt for ``query`` plus the source references that made it into the context."""
+        if max_context_length is None:
+            max_context_length = self.max_context_chars
+        context, sources = self._build_context(context_sources, max_context_length)
+        if not context:
+            # No context available, use general knowledge
+            return self._build_general_prompt(query), sources
+        return self._build_rag_prompt(query, context), sources
+
+    def stream_generate(self, prompt: str) -> LLMGeneration:
+        """Stream a completion for ``prompt`` (see ``LLMGeneration``)."""
+        return LLMGeneration(self, prompt)
+
     async def synthesize_response_async(
         self,
         query: str,
@@ -164,17 +374,29 @@ class LLMService:
         max_context_length: Optional[int] = None
     ) -> Tuple[Optional[str], List[str]]:
         """
-        Async wrapper for synthesize_response.
+        Async counterpart of synthesize_response.
         
-        Runs the blocking LLM call in a thread pool to avoid blocking
-        the FastAPI event loop, allowing other requests to be processed
-        while waiting for the LLM response.
+        Streams from Ollama on the pooled async client and joins the
+        fragments, so no worker thread is held while the model generates.
         """
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,  # Uses default ThreadPoolExecutor
-            lambda: self.synthesize_response(query, context_sources, max_context_length)
-        )
+        if not self.enabled:
+            return None, []
+        prompt, sources = self.build_prompt(query, context_sources, max_context_length)
+        try:
+            fragments = [fragment async for fragment in self.stream_generate(prompt)]
+        except LLMQueueFullError as e:
+            logger.warning(f"LLM request rejected: {e}")
+            return None, []
+        except httpx.TimeoutException:
+            logger.warning(f"LLM request timed out after {self.timeout}s")
+            return None, []
+        except Exception as e:
+            logger.error(f"Error generating LLM response: {e}")
+            return None, []
+        response_text = "".join(fragments).strip()
+        if not response_text:
+            return None, sources
+        return response_text, sources
     
     def _build_context(
         self,
@@ -103,7 +103,8 @@ def load_and_vectorize_masterdata(
         vector_search_service.add_slocum_masterdata_chunks(chunks, replace_existing=True)
     else:
         try:
-            from .vector_search_service import vector_search_service as vss
+            from .chatbot_service import chatbot_service
+            vss = chatbot_service.load_vector_service()
             if vss and getattr(vss, "add_slocum_masterdata_chunks", None):
                 vss.add_slocum_masterdata_chunks(chunks, replace_existing=True)
         except Exception as e:
@@ -123,20 +123,31 @@ def is_awaiting_first_offload_after_swap(
     )
 
 
+def offload_stats_from_totals(
+    total: int,
+    successful: int,
+    failed: int,
+    duration_seconds_sum: float = 0.0,
+    duration_count: int = 0,
+) -> Dict[str, Any]:
+    """Shape pre-aggregated counts like ``aggregate_offload_stats``."""
+    avg_h = (
+        duration_seconds_sum / duration_count / 3600.0 if duration_count else None
+    )
+    return {
+        "total_offload_logs": total,
+        "successful_offloads": successful,
+        "failed_offloads": failed,
+        "unknown_outcome": total - successful - failed,
+        "success_rate": (successful / total * 100.0) if total else 0.0,
+        "average_time_at_station_hours": avg_h,
+    }
+
+
 def aggregate_offload_stats(logs: List[Any]) -> Dict[str, Any]:
     """Success counts and average hours at station for a list of offload logs."""
-    if not logs:
-        return {
-            "total_offload_logs": 0,
-            "successful_offloads": 0,
-            "failed_offloads": 0,
-            "unknown_outcome": 0,
-            "success_rate": 0.0,
-            "average_time_at_station_hours": None,
-        }
     successful = sum(1 for l in logs if l.was_offloaded is True)
     failed = sum(1 for l in logs if l.was_offloaded is False)
-    unknown = len(logs) - successful - failed
     durations_sec: List[float] = []
     for log in logs:
         if log.arrival_date and log.departure_date:
@@ -146,17 +157,9 @@ def aggregate_offload_stats(logs: List[Any]) -> Dict[str, Any]:
                     durations_sec.append(float(d.total_seconds()))
             except (TypeError, ValueError):
                 continue
-    avg_h = (
-        sum(durations_sec) / len(durations_sec) / 3600.0 if durations_sec else None
+    return offload_stats_from_totals(
+        len(logs), successful, failed, sum(durations_sec), len(durations_sec)
     )
-    return {
-        "total_offload_logs": len(logs),
-        "successful_offloads": successful,
-        "failed_offloads": failed,
-        "unknown_outcome": unknown,
-        "success_rate": (successful / len(logs) * 100.0) if logs else 0.0,
-        "average_time_at_station_hours": avg_h,
-    }
 
 
 def build_station_timeline(
@@ -215,8 +218,15 @@ def station_mini_summary(
     logs: List[Any],
     *,
     awaiting_first_offload_after_swap: bool = False,
+    log_count: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Per-station row for array overview and history analytics."""
+    """
+    Per-station row for array overview and history analytics.
+
+    ``logs`` may be just the latest rows (by effective and logged time) when
+    ``log_count`` carries the full count; status and last-offload fields only
+    depend on those.
+    """
     sorted_logs = sorted(logs, key=_offload_effective_ts, reverse=True)
     latest = sorted_logs[0] if sorted_logs else None
     last_ts = None
@@ -240,7 +250,7 @@ def station_mini_summary(
         "status_text": status_text,
         "last_offload_timestamp_utc": last_ts,
         "last_log_was_offloaded": last_success,
-        "log_count": len(logs),
+        "log_count": len(logs) if log_count is None else log_count,
         "field_season_year": getattr(station, "field_season_year", None),
     }
 
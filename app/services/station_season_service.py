@@ -3,12 +3,17 @@ Station Season Service
 
 Handles field season management, statistics calculation, and season closing workflows.
 """
+import json
 import logging
 from datetime import datetime, timezone, timedelta
 from types import SimpleNamespace
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from collections import defaultdict
 
+from sqlalchemy import delete, event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as OrmSession
 from sqlmodel import select
 from sqlmodel import Session as SQLModelSession
 
@@ -16,10 +21,12 @@ from ..core import models
 from ..core.models import (
     FieldSeason,
     OffloadLog,
+    SeasonStatisticsRollup,
     StationFlagEvent,
     StationMetadata,
     StationMetadataSeasonSnapshot,
 )
+from ..core.stations.station_registry_policy import ops_registry_station_filter
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +42,14 @@ def _season_is_closed(session: SQLModelSession, year: int) -> bool:
     return bool(row and row.closed_at_utc)
 
 
-def _season_logs_query(year: int, season_is_closed: bool):
+def _season_logs_filter(year: int, season_is_closed: bool):
     if season_is_closed:
-        return select(OffloadLog).where(OffloadLog.field_season_year == year)
-    return select(OffloadLog).where(
-        (OffloadLog.field_season_year == year) | (OffloadLog.field_season_year.is_(None))
-    )
+        return OffloadLog.field_season_year == year
+    return (OffloadLog.field_season_year == year) | (OffloadLog.field_season_year.is_(None))
+
+
+def _season_logs_query(year: int, season_is_closed: bool):
+    return select(OffloadLog).where(_season_logs_filter(year, season_is_closed))
 
 
 def _minimal_station_for_stats(station_id: str) -> Any:
@@ -51,6 +60,441 @@ def _minimal_station_for_stats(station_id: str) -> Any:
     )
 
 
+def _load_season_inputs(
+    session: SQLModelSession,
+    year: int,
+    season_is_closed: bool,
+    station_ids: Optional[List[str]] = None,
+) -> Tuple[List[Any], List[OffloadLog]]:
+    """
+    Roster and offload logs for a season, optionally limited to ``station_ids``.
+
+    See ``StationSeasonService.calculate_season_statistics`` for roster rules.
+    """
+    offload_statement = _season_logs_query(year, season_is_closed)
+    if station_ids is not None:
+        offload_statement = offload_statement.where(OffloadLog.station_id.in_(station_ids))
+    offload_logs = list(session.exec(offload_statement).all())
+
+    if season_is_closed:
+        snap_stmt = (
+            select(StationMetadataSeasonSnapshot)
+            .where(StationMetadataSeasonSnapshot.field_season_year == year)
+            .order_by(StationMetadataSeasonSnapshot.station_id)
+        )
+        stations = list(session.exec(snap_stmt).all())
+        if not stations:
+            ids = sorted({log.station_id for log in offload_logs})
+            if not ids:
+                stations = []
+            else:
+                live_stmt = select(StationMetadata).where(
+                    StationMetadata.station_id.in_(ids)
+                )
+                by_id = {r.station_id: r for r in session.exec(live_stmt).all()}
+                stations = [
+                    by_id.get(sid) or _minimal_station_for_stats(sid) for sid in ids
+                ]
+    else:
+        station_statement = (
+            select(StationMetadata)
+            .where(ops_registry_station_filter())
+            .order_by(StationMetadata.station_id)
+        )
+        if station_ids is not None:
+            station_statement = station_statement.where(
+                StationMetadata.station_id.in_(station_ids)
+            )
+        stations = list(session.exec(station_statement).all())
+    return stations, offload_logs
+
+
+def _empty_outcome_counts() -> Dict[str, int]:
+    return {"successful": 0, "failed": 0, "skipped": 0, "total": 0}
+
+
+def _empty_partial() -> Dict[str, Any]:
+    return {
+        "station_count": 0,
+        "unique_stations": 0,
+        "skipped_stations": 0,
+        "failed_stations": 0,
+        "failed_station_ids": [],
+        "status_counts": _empty_outcome_counts(),
+        "success_by_mission": {},
+        "station_attempt_details": {},
+        "total_offload_attempts": 0,
+        "successful_offloads": 0,
+        "failed_offloads": 0,
+        "remote_health_logs_with_data": 0,
+        "remote_health_stations_with_data": 0,
+        "first_offload_date": None,
+        "last_offload_date": None,
+        "time_at_station_seconds_sum": 0.0,
+        "time_at_station_count": 0,
+    }
+
+
+def _compute_type_partials(
+    stations: List[Any], offload_logs: List[OffloadLog]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-station-type statistics partials for one season.
+
+    Station and log sets never overlap between types, so the partials can be
+    merged by ``_finalize_statistics`` without double counting.
+    """
+    extract_type = StationSeasonService._extract_station_type
+    partials: Dict[str, Dict[str, Any]] = {}
+    unique_by_type: Dict[str, set] = defaultdict(set)
+    remote_health_by_type: Dict[str, set] = defaultdict(set)
+    first_by_type: Dict[str, datetime] = {}
+    last_by_type: Dict[str, datetime] = {}
+    durations_by_type: Dict[str, List[float]] = defaultdict(list)
+
+    def partial_for(station_type: str) -> Dict[str, Any]:
+        if station_type not in partials:
+            partials[station_type] = _empty_partial()
+        return partials[station_type]
+
+    # Create a mapping of station_id to its logs for efficient lookup
+    logs_by_station = defaultdict(list)
+    for log in offload_logs:
+        logs_by_station[log.station_id].append(log)
+
+    # Process stations to determine their status
+    for station in stations:
+        station_type = extract_type(station.station_id)
+        partial = partial_for(station_type)
+        partial["station_count"] += 1
+        unique_by_type[station_type].add(station.station_id)
+
+        station_logs = logs_by_station.get(station.station_id, [])
+
+        # An attempt is indicated by either time_first_command_sent_utc or offload_start_time_utc
+        attempt_timestamps = sorted(
+            attempt_time
+            for log in station_logs
+            if (attempt_time := log.offload_start_time_utc or log.time_first_command_sent_utc)
+        )
+        partial["station_attempt_details"][station.station_id] = {
+            "attempt_count": len(attempt_timestamps),
+            "attempt_timestamps": [ts.isoformat() for ts in attempt_timestamps],
+        }
+
+        is_explicitly_skipped = (
+            station.display_status_override and
+            station.display_status_override.upper() == "SKIPPED"
+        )
+        if is_explicitly_skipped or not station_logs:
+            # Explicit override, or no offload attempts = skipped
+            outcome = "skipped"
+        elif any(log.was_offloaded is True for log in station_logs):
+            # At least one successful offload = station is successful
+            outcome = "successful"
+        elif any(
+            (log.offload_start_time_utc or log.time_first_command_sent_utc)
+            for log in station_logs
+        ):
+            # Command sent, no confirmed offload response → failed
+            outcome = "failed"
+            logger.debug(
+                f"Station {station.station_id} marked as failed: "
+                f"attempt(s) but no success. "
+                f"Logs: {[(getattr(l, 'offload_start_time_utc'), getattr(l, 'time_first_command_sent_utc'), l.was_offloaded) for l in station_logs]}"
+            )
+        else:
+            # Has logs but no timestamps indicating an attempt = skipped
+            outcome = "skipped"
+
+        if outcome == "skipped":
+            partial["skipped_stations"] += 1
+        elif outcome == "failed":
+            partial["failed_stations"] += 1
+            partial["failed_station_ids"].append(station.station_id)
+        partial["status_counts"][outcome] += 1
+        partial["status_counts"]["total"] += 1
+        mission_id = station.last_offload_by_glider or "unknown"
+        mission_counts = partial["success_by_mission"].setdefault(
+            mission_id, _empty_outcome_counts()
+        )
+        mission_counts[outcome] += 1
+        mission_counts["total"] += 1
+
+    # Process offload logs for detailed statistics
+    for log in offload_logs:
+        station_type = extract_type(log.station_id)
+        partial = partial_for(station_type)
+        partial["total_offload_attempts"] += 1
+        unique_by_type[station_type].add(log.station_id)
+
+        # Track remote health presence on logs
+        if (
+            getattr(log, "remote_health_model_id", None) is not None
+            or getattr(log, "remote_health_temperature_c", None) is not None
+            or getattr(log, "remote_health_humidity", None) is not None
+        ):
+            partial["remote_health_logs_with_data"] += 1
+            remote_health_by_type[station_type].add(log.station_id)
+
+        # Track first and last offload dates
+        for ts in (log.offload_start_time_utc, log.offload_end_time_utc):
+            if ts is None:
+                continue
+            if station_type not in first_by_type or ts < first_by_type[station_type]:
+                first_by_type[station_type] = ts
+            if station_type not in last_by_type or ts > last_by_type[station_type]:
+                last_by_type[station_type] = ts
+
+        # Count success/failure at log level
+        if log.was_offloaded is True:
+            partial["successful_offloads"] += 1
+        elif log.was_offloaded is False:
+            partial["failed_offloads"] += 1
+        elif log.offload_start_time_utc is not None:
+            # Has start time but was_offloaded is None or not True → assume failed
+            # This catches cases where an offload was attempted but no confirmation was received
+            partial["failed_offloads"] += 1
+
+        # Calculate time at station
+        if log.arrival_date and log.departure_date:
+            time_diff = log.departure_date - log.arrival_date
+            if isinstance(time_diff, timedelta):
+                durations_by_type[station_type].append(time_diff.total_seconds())
+
+    for station_type, partial in partials.items():
+        partial["unique_stations"] = len(unique_by_type[station_type])
+        partial["remote_health_stations_with_data"] = len(remote_health_by_type[station_type])
+        if station_type in first_by_type:
+            partial["first_offload_date"] = first_by_type[station_type].isoformat()
+            partial["last_offload_date"] = last_by_type[station_type].isoformat()
+        durations = durations_by_type[station_type]
+        partial["time_at_station_seconds_sum"] = sum(durations)
+        partial["time_at_station_count"] = len(durations)
+    return partials
+
+
+def _iso_sort_key(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _rate_entry(counts: Dict[str, int]) -> Dict[str, Any]:
+    total = counts["total"]
+    return {
+        "total": total,
+        "successful": counts["successful"],
+        "failed": counts["failed"],
+        "skipped": counts["skipped"],
+        "success_rate": round((counts["successful"] / total * 100), 2) if total > 0 else 0.0,
+    }
+
+
+def _finalize_statistics(
+    year: int, partials: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Merge per-type partials into the ``FieldSeasonSummary`` payload."""
+    ordered = [(station_type, partials[station_type]) for station_type in sorted(partials)]
+
+    def total(key: str) -> Any:
+        return sum(partial[key] for _, partial in ordered)
+
+    total_stations = total("station_count")
+    total_offload_attempts = total("total_offload_attempts")
+    successful_offloads = total("successful_offloads")
+    failed_offloads = total("failed_offloads")
+    failed_stations = total("failed_stations")
+    skipped_stations = total("skipped_stations")
+
+    success_by_mission: Dict[str, Dict[str, int]] = defaultdict(_empty_outcome_counts)
+    station_attempt_details: Dict[str, Any] = {}
+    failed_station_ids: List[str] = []
+    first_dates: List[str] = []
+    last_dates: List[str] = []
+    for _, partial in ordered:
+        for mission_id, counts in partial["success_by_mission"].items():
+            merged = success_by_mission[mission_id]
+            for key, value in counts.items():
+                merged[key] += value
+        station_attempt_details.update(partial["station_attempt_details"])
+        failed_station_ids.extend(partial["failed_station_ids"])
+        if partial["first_offload_date"]:
+            first_dates.append(partial["first_offload_date"])
+            last_dates.append(partial["last_offload_date"])
+
+    success_rate = (
+        (successful_offloads / total_offload_attempts * 100)
+        if total_offload_attempts > 0
+        else 0.0
+    )
+    duration_count = total("time_at_station_count")
+    average_time_at_station_hours = (
+        total("time_at_station_seconds_sum") / duration_count / 3600
+        if duration_count
+        else None
+    )
+
+    # Log summary for debugging
+    logger.info(
+        f"Season {year} statistics: "
+        f"{total_stations} total stations, "
+        f"{failed_stations} failed stations, "
+        f"{skipped_stations} skipped stations, "
+        f"{total_offload_attempts} total offload attempts, "
+        f"{successful_offloads} successful, {failed_offloads} failed"
+    )
+
+    # Calculate summary statistics for attempts
+    total_attempts_all_stations = sum(d["attempt_count"] for d in station_attempt_details.values())
+    stations_with_attempts = sum(1 for d in station_attempt_details.values() if d["attempt_count"] > 0)
+    stations_with_multiple_attempts = sum(1 for d in station_attempt_details.values() if d["attempt_count"] > 1)
+    avg_attempts_per_station = (
+        total_attempts_all_stations / total_stations if total_stations else 0
+    )
+
+    return {
+        "year": year,
+        "total_stations": total_stations,
+        "stations_by_type": {
+            station_type: partial["station_count"]
+            for station_type, partial in ordered
+            if partial["station_count"] > 0
+        },
+        "total_offload_attempts": total_offload_attempts,
+        "successful_offloads": successful_offloads,
+        "failed_offloads": failed_offloads,
+        "failed_stations": failed_stations,
+        "failed_station_ids": sorted(failed_station_ids),  # For feedback: which stations failed
+        "skipped_stations": skipped_stations,
+        "success_rate": round(success_rate, 2),
+        "average_time_at_station_hours": (
+            round(average_time_at_station_hours, 2)
+            if average_time_at_station_hours is not None
+            else None
+        ),
+        "unique_stations_deployed": total("unique_stations"),
+        "first_offload_date": min(first_dates, key=_iso_sort_key) if first_dates else None,
+        "last_offload_date": max(last_dates, key=_iso_sort_key) if last_dates else None,
+        "success_by_station_type": {
+            station_type: _rate_entry(partial["status_counts"])
+            for station_type, partial in ordered
+            if partial["status_counts"]["total"] > 0
+        },
+        "success_by_mission": {
+            mission_id: _rate_entry(counts)
+            for mission_id, counts in success_by_mission.items()
+            if counts["total"] > 0
+        },
+        "remote_health_logs_with_data": total("remote_health_logs_with_data"),
+        "remote_health_stations_with_data": total("remote_health_stations_with_data"),
+        # Offload attempt tracking
+        "total_connection_attempts": total_attempts_all_stations,
+        "stations_with_attempts": stations_with_attempts,
+        "stations_with_multiple_attempts": stations_with_multiple_attempts,
+        "average_attempts_per_station": round(avg_attempts_per_station, 2),
+        "station_attempt_details": dict(sorted(station_attempt_details.items())),
+    }
+
+
+def _store_rollups(
+    session: SQLModelSession,
+    year: int,
+    partials: Dict[str, Dict[str, Any]],
+    *,
+    frozen: bool,
+) -> None:
+    """Add rollup rows for ``partials``; caller commits."""
+    now = datetime.now(timezone.utc)
+    for station_type, partial in partials.items():
+        session.add(
+            SeasonStatisticsRollup(
+                field_season_year=year,
+                station_type=station_type,
+                rollup_json=json.dumps(partial),
+                is_frozen=frozen,
+                computed_at_utc=now,
+            )
+        )
+
+
+def _closed_season_partials(
+    session: SQLModelSession, year: int
+) -> Dict[str, Dict[str, Any]]:
+    """Frozen partials for a closed season (computed once if the season predates rollups)."""
+    rows = session.exec(
+        select(SeasonStatisticsRollup).where(
+            SeasonStatisticsRollup.field_season_year == year,
+            SeasonStatisticsRollup.is_frozen == True,  # noqa: E712
+        )
+    ).all()
+    if rows:
+        return {row.station_type: json.loads(row.rollup_json) for row in rows}
+
+    stations, offload_logs = _load_season_inputs(session, year, True)
+    partials = _compute_type_partials(stations, offload_logs)
+    if partials:
+        StationSeasonService.invalidate_statistics_rollups(session, year, include_frozen=True)
+        _store_rollups(session, year, partials, frozen=True)
+        try:
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+    return partials
+
+
+def _open_season_partials(
+    session: SQLModelSession, year: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Partials for an open season: stored rows for unchanged station types,
+    recomputed (and stored) rows for types written since the last read.
+    """
+    ids_by_type: Dict[str, set] = defaultdict(set)
+    extract_type = StationSeasonService._extract_station_type
+    roster_ids = session.exec(
+        select(StationMetadata.station_id).where(ops_registry_station_filter())
+    ).all()
+    log_ids = session.exec(
+        select(OffloadLog.station_id).where(_season_logs_filter(year, False)).distinct()
+    ).all()
+    for station_id in (*roster_ids, *log_ids):
+        ids_by_type[extract_type(station_id)].add(station_id)
+    if not ids_by_type:
+        return {}
+
+    rows = session.exec(
+        select(SeasonStatisticsRollup).where(
+            SeasonStatisticsRollup.field_season_year == year,
+            SeasonStatisticsRollup.is_frozen == False,  # noqa: E712
+            SeasonStatisticsRollup.station_type.in_(sorted(ids_by_type)),
+        )
+    ).all()
+    partials = {row.station_type: json.loads(row.rollup_json) for row in rows}
+
+    missing_types = [t for t in ids_by_type if t not in partials]
+    if missing_types:
+        missing_ids = sorted(sid for t in missing_types for sid in ids_by_type[t])
+        stations, offload_logs = _load_season_inputs(
+            session, year, False, station_ids=missing_ids
+        )
+        built = _compute_type_partials(stations, offload_logs)
+        _store_rollups(session, year, built, frozen=False)
+        try:
+            session.commit()
+        except IntegrityError:
+            # Another worker stored the same types first; theirs are equivalent.
+            session.rollback()
+        partials.update(built)
+        logger.debug(
+            "Rebuilt season %s statistics rollups for types %s",
+            year,
+            sorted(built),
+        )
+    return partials
+
+
 class StationSeasonService:
     """Service for managing field seasons and station data."""
 
@@ -94,7 +538,7 @@ class StationSeasonService:
 
     @staticmethod
     def calculate_season_statistics(
-        session: SQLModelSession, year: int
+        session: SQLModelSession, year: int, *, use_rollups: bool = True
     ) -> Dict[str, Any]:
         """
         Calculate comprehensive statistics for a field season.
@@ -106,302 +550,21 @@ class StationSeasonService:
 
         Assumption: If a command was sent and we never have a confirmed offload
         response (was_offloaded True), the station is counted as failed.
+
+        With ``use_rollups`` (default) the result is merged from per-station-type
+        rows in ``season_statistics_rollups``; only types without a current row
+        are recomputed from raw logs. ``use_rollups=False`` recomputes everything
+        and is the verification path.
         """
         season_is_closed = _season_is_closed(session, year)
-        offload_statement = _season_logs_query(year, season_is_closed)
-        offload_logs = list(session.exec(offload_statement).all())
-
-        if season_is_closed:
-            snap_stmt = (
-                select(StationMetadataSeasonSnapshot)
-                .where(StationMetadataSeasonSnapshot.field_season_year == year)
-                .order_by(StationMetadataSeasonSnapshot.station_id)
-            )
-            stations = list(session.exec(snap_stmt).all())
-            if not stations:
-                ids = sorted({log.station_id for log in offload_logs})
-                if not ids:
-                    stations = []
-                else:
-                    live_stmt = select(StationMetadata).where(
-                        StationMetadata.station_id.in_(ids)
-                    )
-                    by_id = {r.station_id: r for r in session.exec(live_stmt).all()}
-                    stations = [
-                        by_id.get(sid) or _minimal_station_for_stats(sid) for sid in ids
-                    ]
+        if not use_rollups:
+            stations, offload_logs = _load_season_inputs(session, year, season_is_closed)
+            partials = _compute_type_partials(stations, offload_logs)
+        elif season_is_closed:
+            partials = _closed_season_partials(session, year)
         else:
-            station_statement = (
-                select(StationMetadata)
-                .where(
-                    StationMetadata.is_retired == False,
-                    StationMetadata.is_archived == False,
-                )
-                .order_by(StationMetadata.station_id)
-            )
-            stations = list(session.exec(station_statement).all())
-        
-        # Create a mapping of station_id to its logs for efficient lookup
-        logs_by_station = defaultdict(list)
-        for log in offload_logs:
-            logs_by_station[log.station_id].append(log)
-        
-        # Calculate statistics
-        stations_by_type = defaultdict(int)
-        successful_offloads = 0
-        failed_offloads = 0
-        skipped_stations = 0
-        failed_stations = 0  # Track failed stations (not just failed log attempts)
-        failed_station_ids: List[str] = []  # IDs of stations that had attempts but no success
-        total_time_at_station_seconds = []
-        unique_stations = set()
-        first_offload_date = None
-        last_offload_date = None
-        # Remote health coverage
-        remote_health_logs_with_data = 0
-        remote_health_stations_with_data = set()
-        
-        # Statistics by station type
-        success_by_type = defaultdict(lambda: {"successful": 0, "failed": 0, "skipped": 0, "total": 0})
-        
-        # Statistics by mission ID
-        success_by_mission = defaultdict(lambda: {"successful": 0, "failed": 0, "skipped": 0, "total": 0})
-        
-        # Track offload attempts per station (for log notes)
-        station_attempt_details = {}  # station_id -> {"attempt_count": int, "attempt_timestamps": [datetime, ...]}
-        
-        # Process stations to determine their status
-        for station in stations:
-            # Count by type (extract prefix from station_id)
-            station_type = StationSeasonService._extract_station_type(station.station_id)
-            stations_by_type[station_type] += 1
-            unique_stations.add(station.station_id)
-            
-            # Get logs for this station
-            station_logs = logs_by_station.get(station.station_id, [])
-            
-            # Track offload attempts for this station
-            # An attempt is indicated by either time_first_command_sent_utc or offload_start_time_utc
-            attempt_timestamps = []
-            for log in station_logs:
-                # Use offload_start_time_utc if available, otherwise time_first_command_sent_utc
-                attempt_time = log.offload_start_time_utc or log.time_first_command_sent_utc
-                if attempt_time:
-                    attempt_timestamps.append(attempt_time)
-            
-            # Sort timestamps chronologically
-            attempt_timestamps.sort()
-            
-            # Store attempt details for this station
-            station_attempt_details[station.station_id] = {
-                "attempt_count": len(attempt_timestamps),
-                "attempt_timestamps": [ts.isoformat() for ts in attempt_timestamps] if attempt_timestamps else []
-            }
-            
-            # Determine station status
-            is_explicitly_skipped = (
-                station.display_status_override and 
-                station.display_status_override.upper() == "SKIPPED"
-            )
-            
-            if is_explicitly_skipped:
-                skipped_stations += 1
-                success_by_type[station_type]["skipped"] += 1
-                success_by_type[station_type]["total"] += 1
-                # Try to get mission ID from station metadata
-                mission_id = station.last_offload_by_glider or "unknown"
-                success_by_mission[mission_id]["skipped"] += 1
-                success_by_mission[mission_id]["total"] += 1
-            elif not station_logs:
-                # No offload attempts = skipped
-                skipped_stations += 1
-                success_by_type[station_type]["skipped"] += 1
-                success_by_type[station_type]["total"] += 1
-                mission_id = station.last_offload_by_glider or "unknown"
-                success_by_mission[mission_id]["skipped"] += 1
-                success_by_mission[mission_id]["total"] += 1
-            else:
-                # Has logs - analyze each log to determine station status
-                # Check for any successful offloads first
-                has_successful = any(log.was_offloaded is True for log in station_logs)
-                
-                if has_successful:
-                    # At least one successful offload = station is successful
-                    success_by_type[station_type]["successful"] += 1
-                    success_by_type[station_type]["total"] += 1
-                    # Get mission from the successful log's station metadata
-                    mission_id = station.last_offload_by_glider or "unknown"
-                    success_by_mission[mission_id]["successful"] += 1
-                    success_by_mission[mission_id]["total"] += 1
-                else:
-                    # No confirmed offload (was_offloaded True). If command was sent, count as failed.
-                    # Attempt = any log with offload_start_time_utc or time_first_command_sent_utc
-                    has_any_attempt = any(
-                        (log.offload_start_time_utc or log.time_first_command_sent_utc)
-                        for log in station_logs
-                    )
-                    
-                    if has_any_attempt:
-                        # Command sent, no confirmed offload response → failed
-                        failed_stations += 1
-                        failed_station_ids.append(station.station_id)
-                        success_by_type[station_type]["failed"] += 1
-                        success_by_type[station_type]["total"] += 1
-                        mission_id = station.last_offload_by_glider or "unknown"
-                        success_by_mission[mission_id]["failed"] += 1
-                        success_by_mission[mission_id]["total"] += 1
-                        
-                        logger.debug(
-                            f"Station {station.station_id} marked as failed: "
-                            f"attempt(s) but no success. "
-                            f"Logs: {[(getattr(l, 'offload_start_time_utc'), getattr(l, 'time_first_command_sent_utc'), l.was_offloaded) for l in station_logs]}"
-                        )
-                    else:
-                        # Has logs but no timestamps indicating an attempt = skipped
-                        skipped_stations += 1
-                        success_by_type[station_type]["skipped"] += 1
-                        success_by_type[station_type]["total"] += 1
-                        mission_id = station.last_offload_by_glider or "unknown"
-                        success_by_mission[mission_id]["skipped"] += 1
-                        success_by_mission[mission_id]["total"] += 1
-        
-        # Process offload logs for detailed statistics
-        for log in offload_logs:
-            unique_stations.add(log.station_id)
-
-            # Track remote health presence on logs
-            if (
-                getattr(log, "remote_health_model_id", None) is not None
-                or getattr(log, "remote_health_temperature_c", None) is not None
-                or getattr(log, "remote_health_humidity", None) is not None
-            ):
-                remote_health_logs_with_data += 1
-                remote_health_stations_with_data.add(log.station_id)
-            
-            # Track first and last offload dates
-            if log.offload_start_time_utc:
-                if first_offload_date is None or log.offload_start_time_utc < first_offload_date:
-                    first_offload_date = log.offload_start_time_utc
-                if last_offload_date is None or log.offload_start_time_utc > last_offload_date:
-                    last_offload_date = log.offload_start_time_utc
-            
-            if log.offload_end_time_utc:
-                if first_offload_date is None or log.offload_end_time_utc < first_offload_date:
-                    first_offload_date = log.offload_end_time_utc
-                if last_offload_date is None or log.offload_end_time_utc > last_offload_date:
-                    last_offload_date = log.offload_end_time_utc
-            
-            # Count success/failure at log level
-            if log.was_offloaded is True:
-                successful_offloads += 1
-            elif log.was_offloaded is False:
-                failed_offloads += 1
-            elif log.offload_start_time_utc is not None:
-                # Has start time but was_offloaded is None or not True → assume failed
-                # This catches cases where an offload was attempted but no confirmation was received
-                failed_offloads += 1
-            
-            # Calculate time at station
-            if log.arrival_date and log.departure_date:
-                time_diff = log.departure_date - log.arrival_date
-                if isinstance(time_diff, timedelta):
-                    total_time_at_station_seconds.append(time_diff.total_seconds())
-        
-        total_offload_attempts = len(offload_logs)
-        success_rate = (
-            (successful_offloads / total_offload_attempts * 100)
-            if total_offload_attempts > 0
-            else 0.0
-        )
-        
-        average_time_at_station_hours = (
-            sum(total_time_at_station_seconds) / len(total_time_at_station_seconds) / 3600
-            if total_time_at_station_seconds
-            else None
-        )
-        
-        # Calculate success rates by type
-        success_rate_by_type = {}
-        for station_type, counts in success_by_type.items():
-            total = counts["total"]
-            if total > 0:
-                success_rate_by_type[station_type] = {
-                    "total": total,
-                    "successful": counts["successful"],
-                    "failed": counts["failed"],
-                    "skipped": counts["skipped"],
-                    "success_rate": round((counts["successful"] / total * 100), 2) if total > 0 else 0.0
-                }
-        
-        # Calculate success rates by mission
-        success_rate_by_mission = {}
-        for mission_id, counts in success_by_mission.items():
-            total = counts["total"]
-            if total > 0:
-                success_rate_by_mission[mission_id] = {
-                    "total": total,
-                    "successful": counts["successful"],
-                    "failed": counts["failed"],
-                    "skipped": counts["skipped"],
-                    "success_rate": round((counts["successful"] / total * 100), 2) if total > 0 else 0.0
-                }
-        
-        # Convert datetime objects to ISO format strings for JSON serialization
-        first_offload_date_str = (
-            first_offload_date.isoformat() if first_offload_date else None
-        )
-        last_offload_date_str = (
-            last_offload_date.isoformat() if last_offload_date else None
-        )
-        
-        # Log summary for debugging
-        logger.info(
-            f"Season {year} statistics: "
-            f"{len(stations)} total stations, "
-            f"{failed_stations} failed stations, "
-            f"{skipped_stations} skipped stations, "
-            f"{total_offload_attempts} total offload attempts, "
-            f"{successful_offloads} successful, {failed_offloads} failed"
-        )
-        
-        # Calculate summary statistics for attempts
-        total_attempts_all_stations = sum(details["attempt_count"] for details in station_attempt_details.values())
-        stations_with_attempts = sum(1 for details in station_attempt_details.values() if details["attempt_count"] > 0)
-        stations_with_multiple_attempts = sum(1 for details in station_attempt_details.values() if details["attempt_count"] > 1)
-        avg_attempts_per_station = (
-            total_attempts_all_stations / len(stations) if stations else 0
-        )
-        
-        return {
-            "year": year,
-            "total_stations": len(stations),
-            "stations_by_type": dict(stations_by_type),
-            "total_offload_attempts": total_offload_attempts,
-            "successful_offloads": successful_offloads,
-            "failed_offloads": failed_offloads,
-            "failed_stations": failed_stations,
-            "failed_station_ids": sorted(failed_station_ids),  # For feedback: which stations failed
-            "skipped_stations": skipped_stations,
-            "success_rate": round(success_rate, 2),
-            "average_time_at_station_hours": (
-                round(average_time_at_station_hours, 2)
-                if average_time_at_station_hours is not None
-                else None
-            ),
-            "unique_stations_deployed": len(unique_stations),
-            "first_offload_date": first_offload_date_str,
-            "last_offload_date": last_offload_date_str,
-            "success_by_station_type": success_rate_by_type,
-            "success_by_mission": success_rate_by_mission,
-            "remote_health_logs_with_data": remote_health_logs_with_data,
-            "remote_health_stations_with_data": len(remote_health_stations_with_data),
-            # Offload attempt tracking
-            "total_connection_attempts": total_attempts_all_stations,
-            "stations_with_attempts": stations_with_attempts,
-            "stations_with_multiple_attempts": stations_with_multiple_attempts,
-            "average_attempts_per_station": round(avg_attempts_per_station, 2),
-            "station_attempt_details": station_attempt_details,  # Detailed per-station attempt info
-        }
+            partials = _open_season_partials(session, year)
+        return _finalize_statistics(year, partials)
 
     @staticmethod
     def _extract_station_type(station_id: str) -> str:
@@ -433,7 +596,10 @@ class StationSeasonService:
         if season.closed_at_utc:
             raise ValueError(f"Season {year} is already closed")
 
-        statistics = StationSeasonService.calculate_season_statistics(session, year)
+        # Full recompute: these partials become the season's frozen rollups.
+        roster, season_logs = _load_season_inputs(session, year, False)
+        partials = _compute_type_partials(roster, season_logs)
+        statistics = _finalize_statistics(year, partials)
 
         archive_time = datetime.now(timezone.utc)
         station_statement = select(StationMetadata).order_by(StationMetadata.station_id)
@@ -481,8 +647,8 @@ class StationSeasonService:
         )
         current_events = list(session.exec(current_events_stmt).all())
         events_by_station: Dict[str, List[StationFlagEvent]] = defaultdict(list)
-        for event in current_events:
-            events_by_station[event.station_id].append(event)
+        for flag_event in current_events:
+            events_by_station[flag_event.station_id].append(flag_event)
         next_season_year = season.year + 1
         next_season = StationSeasonService.get_season_by_year(session, next_season_year)
         if not next_season:
@@ -495,9 +661,9 @@ class StationSeasonService:
         for station_id, station_events in events_by_station.items():
             is_flagged = False
             latest_flag_note: Optional[str] = None
-            for event in sorted(station_events, key=lambda row: row.changed_at_utc):
-                is_flagged = bool(event.is_flagged)
-                latest_flag_note = event.note
+            for flag_event in sorted(station_events, key=lambda row: row.changed_at_utc):
+                is_flagged = bool(flag_event.is_flagged)
+                latest_flag_note = flag_event.note
             if not is_flagged:
                 continue
             reminder_note = (
@@ -523,6 +689,9 @@ class StationSeasonService:
         season.summary_statistics = statistics
         session.add(season)
 
+        StationSeasonService.invalidate_statistics_rollups(session, year, include_frozen=True)
+        _store_rollups(session, year, partials, frozen=True)
+
         session.commit()
         session.refresh(season)
 
@@ -554,15 +723,61 @@ class StationSeasonService:
         if not season.closed_at_utc:
             raise ValueError(f"Season {year} is not closed; reprocess is only for closed seasons")
 
-        statistics = StationSeasonService.calculate_season_statistics(session, year)
+        stations, offload_logs = _load_season_inputs(session, year, True)
+        partials = _compute_type_partials(stations, offload_logs)
+        statistics = _finalize_statistics(year, partials)
         season.summary_statistics = statistics
         session.add(season)
+        StationSeasonService.invalidate_statistics_rollups(session, year, include_frozen=True)
+        _store_rollups(session, year, partials, frozen=True)
         session.commit()
         session.refresh(season)
 
         logger.info(f"Reprocessed statistics for closed season {year}.")
         return season
 
+    @staticmethod
+    def verify_season_statistics(
+        session: SQLModelSession, year: int
+    ) -> Dict[str, Any]:
+        """
+        Compare rollup-backed statistics with a full recomputation.
+
+        Returns ``{"year", "matches", "mismatched_keys"}``; a mismatch on a
+        closed season is expected after post-close log edits until the season
+        is reprocessed.
+        """
+        from_rollups = StationSeasonService.calculate_season_statistics(session, year)
+        recomputed = StationSeasonService.calculate_season_statistics(
+            session, year, use_rollups=False
+        )
+        mismatched = sorted(
+            key
+            for key in set(from_rollups) | set(recomputed)
+            if from_rollups.get(key) != recomputed.get(key)
+        )
+        return {"year": year, "matches": not mismatched, "mismatched_keys": mismatched}
+
+    @staticmethod
+    def invalidate_statistics_rollups(
+        session: SQLModelSession,
+        year: Optional[int] = None,
+        *,
+        include_frozen: bool = False,
+    ) -> None:
+        """
+        Drop statistics rollup rows (one season, or all when ``year`` is None).
+
+        Frozen rows are kept unless ``include_frozen``. Needed around bulk
+        ``DELETE`` statements, which bypass the flush hook; caller commits.
+        """
+        statement = delete(SeasonStatisticsRollup)
+        if year is not None:
+            statement = statement.where(SeasonStatisticsRollup.field_season_year == year)
+        if not include_frozen:
+            statement = statement.where(SeasonStatisticsRollup.is_frozen == False)  # noqa: E712
+        session.connection().execute(statement)
+
     @staticmethod
     def prepare_master_list_for_next_season(
         session: SQLModelSession, _current_year: int
@@ -653,3 +868,33 @@ class StationSeasonService:
             ]
         
         return logs
+
+
+@event.listens_for(OrmSession, "before_flush")
+def _invalidate_rollups_on_flush(session: OrmSession, flush_context: Any, instances: Any) -> None:
+    """Drop open-season rollups for station types whose stations or logs changed."""
+    station_types = set()
+    reopened_years = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (StationMetadata, OffloadLog)):
+            station_types.add(StationSeasonService._extract_station_type(obj.station_id))
+        elif isinstance(obj, FieldSeason) and obj.year is not None and obj not in session.new:
+            if obj in session.deleted or (
+                obj.closed_at_utc is None
+                and sa_inspect(obj).attrs.closed_at_utc.history.has_changes()
+            ):
+                reopened_years.add(obj.year)
+    if station_types:
+        session.connection().execute(
+            delete(SeasonStatisticsRollup).where(
+                SeasonStatisticsRollup.is_frozen == False,  # noqa: E712
+                SeasonStatisticsRollup.station_type.in_(sorted(station_types)),
+            )
+        )
+    if reopened_years:
+        # Reopened or deleted seasons lose their frozen rollups too.
+        session.connection().execute(
+            delete(SeasonStatisticsRollup).where(
+                SeasonStatisticsRollup.field_season_year.in_(sorted(reopened_years))
+            )
+        )
@@ -0,0 +1,334 @@
+"""
+Materialized station status overview (``station_status_snapshots``).
+
+``GET /stations/status_overview`` used to load every live station with all of
+its offload logs, every flag event and the full hardware history, then build
+each row in Python on every page load. Rows are now stored per
+``(context_key, station_id)`` and served with one indexed SELECT.
+
+Maintenance:
+- Any ORM flush that touches a station, its offload logs, flag events or
+  hardware history deletes that station's snapshot rows (``before_flush``
+  hook registered on import of this module).
+- The overview read rebuilds only the stations whose row is missing for the
+  requested context, so the first load after a write pays for one station.
+- Bulk ``DELETE`` statements bypass the ORM; callers use
+  ``invalidate_station_status_snapshots`` explicitly.
+- ``python -m app.cli.rebuild_station_status_snapshots`` drops and rebuilds
+  every context.
+"""
+
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import select
+from sqlmodel import Session as SQLModelSession
+
+from ..core import models
+from ..core.stations.station_registry_policy import (
+    offload_log_matches_season_year,
+    ops_registry_station_filter,
+)
+from .station_history_service import (
+    is_awaiting_first_offload_after_swap,
+    latest_hardware_swap_ts_by_station,
+)
+from .station_overview import build_status_overview_row
+from .station_season_service import StationSeasonService
+
+logger = logging.getLogger(__name__)
+
+NO_SEASON_CONTEXT_KEY = "none"
+
+# Rows touching these tables invalidate the owning station's snapshots.
+_INVALIDATING_MODELS = (
+    models.StationMetadata,
+    models.OffloadLog,
+    models.StationFlagEvent,
+    models.StationHardwareHistory,
+)
+
+
+def overview_context_key(target_year: Optional[int], season_is_closed: bool) -> str:
+    if target_year is None:
+        return NO_SEASON_CONTEXT_KEY
+    return f"{int(target_year)}:{'closed' if season_is_closed else 'open'}"
+
+
+def resolve_overview_context(
+    session: SQLModelSession,
+    season_year: Optional[int],
+) -> Tuple[Optional[int], bool]:
+    """
+    Return ``(target_year, season_is_closed)`` for an overview request.
+
+    ``season_year=None`` means the active season (never closed); an explicit
+    year with no ``FieldSeason`` row is treated as closed.
+    """
+    if season_year is None:
+        active = StationSeasonService.get_active_season(session)
+        return (active.year if active else None), False
+    season_row = StationSeasonService.get_season_by_year(session, season_year)
+    return season_year, bool(season_row and season_row.closed_at_utc) or season_row is None
+
+
+def resolve_station_flag_state(
+    events: List[models.StationFlagEvent],
+    *,
+    target_year: Optional[int],
+    season_is_closed: bool,
+) -> Dict[str, Dict[str, Any]]:
+    """Latest in-scope flag state per station (events replayed oldest first)."""
+    state_by_station: Dict[str, Dict[str, Any]] = {}
+    for event_row in sorted(events, key=lambda e: e.changed_at_utc):
+        include_event = False
+        if target_year is None:
+            include_event = event_row.field_season_year is None
+        elif offload_log_matches_season_year(
+            log_season=event_row.field_season_year,
+            target_year=target_year,
+            season_is_closed=season_is_closed,
+        ):
+            include_event = True
+        if not include_event:
+            continue
+        state_by_station[event_row.station_id] = {
+            "is_flagged": bool(event_row.is_flagged),
+            "flag_note": event_row.note,
+            "changed_at_utc": event_row.changed_at_utc,
+        }
+    return state_by_station
+
+
+def _logs_in_context(
+    logs: Iterable[models.OffloadLog],
+    target_year: Optional[int],
+    season_is_closed: bool,
+) -> List[models.OffloadLog]:
+    if target_year is None:
+        return [log for log in logs if log.field_season_year is None]
+    return [
+        log
+        for log in logs
+        if offload_log_matches_season_year(
+            log_season=log.field_season_year,
+            target_year=target_year,
+            season_is_closed=season_is_closed,
+        )
+    ]
+
+
+def build_overview_rows_for_stations(
+    session: SQLModelSession,
+    stations: List[models.StationMetadata],
+    *,
+    target_year: Optional[int],
+    season_is_closed: bool,
+) -> Dict[str, Dict[str, Any]]:
+    """Compute overview rows for ``stations`` only (logs/flags/hardware scoped by id)."""
+    if not stations:
+        return {}
+    station_ids = [s.station_id for s in stations]
+
+    logs_by_station: Dict[str, List[models.OffloadLog]] = defaultdict(list)
+    for log in session.exec(
+        select(models.OffloadLog).where(models.OffloadLog.station_id.in_(station_ids))
+    ).all():
+        logs_by_station[log.station_id].append(log)
+
+    latest_swap_by_station = latest_hardware_swap_ts_by_station(
+        list(
+            session.exec(
+                select(models.StationHardwareHistory).where(
+                    models.StationHardwareHistory.station_id.in_(station_ids)
+                )
+            ).all()
+        )
+    )
+    flag_state_by_station = resolve_station_flag_state(
+        list(
+            session.exec(
+                select(models.StationFlagEvent).where(
+                    models.StationFlagEvent.station_id.in_(station_ids)
+                )
+            ).all()
+        ),
+        target_year=target_year,
+        season_is_closed=season_is_closed,
+    )
+
+    rows: Dict[str, Dict[str, Any]] = {}
+    for station in stations:
+        all_logs = logs_by_station.get(station.station_id, [])
+        flag_state = flag_state_by_station.get(station.station_id, {})
+        rows[station.station_id] = build_status_overview_row(
+            station,
+            _logs_in_context(all_logs, target_year, season_is_closed),
+            is_flagged_for_scope=bool(flag_state.get("is_flagged")),
+            flag_note=flag_state.get("flag_note"),
+            awaiting_first_offload_after_swap=is_awaiting_first_offload_after_swap(
+                all_logs,
+                latest_swap_by_station.get(station.station_id),
+            ),
+        )
+    return rows
+
+
+def _store_rows(
+    session: SQLModelSession,
+    context_key: str,
+    rows: Dict[str, Dict[str, Any]],
+) -> None:
+    now = datetime.now(timezone.utc)
+    for station_id, row in rows.items():
+        session.add(
+            models.StationStatusSnapshot(
+                context_key=context_key,
+                station_id=station_id,
+                row_json=json.dumps(row, default=str),
+                computed_at_utc=now,
+            )
+        )
+    try:
+        session.commit()
+    except IntegrityError:
+        # Another worker materialized the same rows first; theirs are equivalent.
+        session.rollback()
+
+
+def get_status_overview_rows(
+    session: SQLModelSession,
+    *,
+    target_year: Optional[int],
+    season_is_closed: bool,
+) -> List[Dict[str, Any]]:
+    """
+    Live-registry overview rows for one season context, ordered by station_id.
+
+    One LEFT JOIN over ``uq_station_status_snapshot_context_station``; stations
+    without a stored row for this context are built and persisted first.
+    """
+    context_key = overview_context_key(target_year, season_is_closed)
+    snapshot = models.StationStatusSnapshot
+    statement = (
+        select(models.StationMetadata.station_id, snapshot.row_json)
+        .outerjoin(
+            snapshot,
+            and_(
+                snapshot.station_id == models.StationMetadata.station_id,
+                snapshot.context_key == context_key,
+            ),
+        )
+        .where(ops_registry_station_filter())
+        .order_by(models.StationMetadata.station_id)
+    )
+    stored = list(session.exec(statement).all())
+
+    missing_ids = [station_id for station_id, row_json in stored if row_json is None]
+    built: Dict[str, Dict[str, Any]] = {}
+    if missing_ids:
+        stations = list(
+            session.exec(
+                select(models.StationMetadata).where(
+                    models.StationMetadata.station_id.in_(missing_ids)
+                )
+            ).all()
+        )
+        built = build_overview_rows_for_stations(
+            session,
+            stations,
+            target_year=target_year,
+            season_is_closed=season_is_closed,
+        )
+        _store_rows(session, context_key, built)
+        logger.debug(
+            "Materialized %s station status rows for context %s",
+            len(built),
+            context_key,
+        )
+
+    out: List[Dict[str, Any]] = []
+    for station_id, row_json in stored:
+        if row_json is None:
+            row = built.get(station_id)
+            if row is not None:
+                out.append(row)
+            continue
+        out.append(json.loads(row_json))
+    return out
+
+
+def invalidate_station_status_snapshots(
+    session: SQLModelSession,
+    station_ids: Optional[Iterable[str]] = None,
+) -> None:
+    """Drop snapshot rows for ``station_ids`` (all rows when ``None``); caller commits."""
+    statement = delete(models.StationStatusSnapshot)
+    if station_ids is not None:
+        ids = sorted({sid for sid in station_ids if sid})
+        if not ids:
+            return
+        statement = statement.where(models.StationStatusSnapshot.station_id.in_(ids))
+    session.connection().execute(statement)
+
+
+def rebuild_station_status_snapshots(session: SQLModelSession) -> Dict[str, Any]:
+    """Drop every snapshot row and rebuild all season contexts for live stations."""
+    invalidate_station_status_snapshots(session)
+    session.commit()
+
+    contexts: List[Tuple[Optional[int], bool]] = [(None, False)]
+    for season in session.exec(select(models.FieldSeason)).all():
+        contexts.append((season.year, bool(season.closed_at_utc)))
+
+    stations = list(
+        session.exec(
+            select(models.StationMetadata)
+            .where(ops_registry_station_filter())
+            .order_by(models.StationMetadata.station_id)
+        ).all()
+    )
+    rows_written = 0
+    for target_year, season_is_closed in contexts:
+        rows = build_overview_rows_for_stations(
+            session,
+            stations,
+            target_year=target_year,
+            season_is_closed=season_is_closed,
+        )
+        _store_rows(session, overview_context_key(target_year, season_is_closed), rows)
+        rows_written += len(rows)
+
+    return {
+        "stations": len(stations),
+        "contexts": [overview_context_key(y, c) for y, c in contexts],
+        "rows_written": rows_written,
+    }
+
+
+def _station_id_of(obj: Any) -> Optional[str]:
+    if isinstance(obj, _INVALIDATING_MODELS):
+        return getattr(obj, "station_id", None)
+    return None
+
+
+@event.listens_for(OrmSession, "before_flush")
+def _invalidate_on_flush(session: OrmSession, flush_context: Any, instances: Any) -> None:
+    station_ids = {
+        sid
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if (sid := _station_id_of(obj))
+    }
+    if not station_ids:
+        return
+    session.connection().execute(
+        delete(models.StationStatusSnapshot).where(
+            models.StationStatusSnapshot.station_id.in_(sorted(station_ids))
+        )
+    )
@@ -0,0 +1,269 @@
+"""
+Vector Index Jobs
+
+Batched (re)indexing of the chatbot vector store, run off the request path.
+
+- ``reindex_all`` rebuilds every collection (FAQs, documents, tips, Slocum
+  masterdata) from the database: each collection is cleared, embedded with
+  batched ``encode`` calls and upserted in bulk.
+- ``vector_index_jobs`` runs document ingestion and full reindexes on a single
+  background worker thread and keeps per-job progress for the admin API.
+- ``python -m app.cli.vector_index_cli reindex-all --threads N`` runs the full
+  rebuild in the foreground with more CPU threads than the web app uses.
+"""
+
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlmodel import select
+from sqlmodel import Session as SQLModelSession
+
+from ..core import models
+
+logger = logging.getLogger(__name__)
+
+MAX_TRACKED_JOBS = 50
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+@dataclass
+class VectorIndexJob:
+    """Progress of one background indexing job."""
+    job_id: str
+    kind: str  # "document" or "reindex_all"
+    description: str
+    state: str = JOB_QUEUED
+    stage: Optional[str] = None
+    done: int = 0
+    total: int = 0
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    created_at_utc: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at_utc: Optional[datetime] = None
+    finished_at_utc: Optional[datetime] = None
+
+    def report(self, stage: str, done: int, total: int) -> None:
+        self.stage, self.done, self.total = stage, done, total
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["percent"] = round(100.0 * self.done / self.total, 1) if self.total else None
+        return data
+
+
+ProgressFn = Callable[[str, int, int], None]
+
+
+def document_index_item(document: models.KnowledgeDocument) -> Dict[str, Any]:
+    return {
+        "doc_id": document.id,
+        "title": document.title,
+        "content": document.searchable_content or "",
+        "category": document.category,
+        "tags": document.tags,
+        "file_type": document.file_type,
+        "platform": document.platform,
+    }
+
+
+def is_slocum_masterdata(category: Optional[str], platform: Optional[str]) -> bool:
+    return (category or "").strip().lower() == "masterdata" and platform == "slocum"
+
+
+def ingest_document(
+    vector_service: Any,
+    document: Dict[str, Any],
+    progress: Optional[ProgressFn] = None,
+    include_masterdata: bool = True,
+) -> Dict[str, Any]:
+    """Vectorize one document (``add_document`` keyword dict), plus masterdata if applicable."""
+    def report(done: int, total: int) -> None:
+        if progress:
+            progress("documents", done, total)
+
+    entries = vector_service.add_documents([document], progress=report)
+    result: Dict[str, Any] = {"doc_id": document["doc_id"], "entries": entries}
+    if include_masterdata and is_slocum_masterdata(document.get("category"), document.get("platform")):
+        from .slocum_masterdata_service import load_and_vectorize_masterdata
+
+        if progress:
+            progress("slocum_masterdata", 0, 1)
+        result["masterdata"] = load_and_vectorize_masterdata(
+            document["content"],
+            document_id=document["doc_id"],
+            vector_search_service=vector_service,
+        )
+        if progress:
+            progress("slocum_masterdata", 1, 1)
+    return result
+
+
+def reindex_all(
+    vector_service: Any,
+    session: SQLModelSession,
+    progress: Optional[ProgressFn] = None,
+) -> Dict[str, Any]:
+    """
+    Clear and rebuild every vector collection from the database.
+
+    Only active FAQs/documents and unarchived tips are indexed; the Slocum
+    masterdata collection is rebuilt from the newest active masterdata document.
+    """
+    if not vector_service or not vector_service.enabled:
+        raise RuntimeError("Vector search is not enabled")
+
+    def stage_progress(stage: str) -> Callable[[int, int], None]:
+        def report(done: int, total: int) -> None:
+            if progress:
+                progress(stage, done, total)
+        return report
+
+    faqs = session.exec(
+        select(models.FAQEntry).where(models.FAQEntry.is_active == True)  # noqa: E712
+    ).all()
+    tips = session.exec(
+        select(models.SharedTip).where(models.SharedTip.is_archived == False)  # noqa: E712
+    ).all()
+    documents = session.exec(
+        select(models.KnowledgeDocument)
+        .where(models.KnowledgeDocument.is_active == True)  # noqa: E712
+        .order_by(models.KnowledgeDocument.id)
+    ).all()
+
+    summary: Dict[str, Any] = {"removed": {}, "indexed": {}}
+    for name in ("faqs", "documents", "tips"):
+        summary["removed"][name] = vector_service.reset_collection(name)
+
+    summary["indexed"]["faqs"] = vector_service.add_faqs(
+        [
+            {
+                "faq_id": faq.id,
+                "question": faq.question,
+                "answer": faq.answer,
+                "category": faq.category,
+                "tags": faq.tags,
+                "keywords": faq.keywords,
+                "platform": faq.platform,
+            }
+            for faq in faqs
+        ],
+        progress=stage_progress("faqs"),
+    )
+    summary["indexed"]["tips"] = vector_service.add_tips(
+        [
+            {
+                "tip_id": tip.id,
+                "title": tip.title,
+                "content": tip.content,
+                "category": tip.category,
+                "tags": tip.tags,
+                "platform": tip.platform,
+            }
+            for tip in tips
+        ],
+        progress=stage_progress("tips"),
+    )
+    summary["indexed"]["documents"] = vector_service.add_documents(
+        [document_index_item(doc) for doc in documents],
+        progress=stage_progress("documents"),
+    )
+
+    masterdata = [doc for doc in documents if is_slocum_masterdata(doc.category, doc.platform)]
+    if masterdata:
+        from .slocum_masterdata_service import load_and_vectorize_masterdata
+
+        latest = max(masterdata, key=lambda doc: doc.id)
+        stage_progress("slocum_masterdata")(0, 1)
+        md = load_and_vectorize_masterdata(
+            latest.searchable_content or "",
+            document_id=latest.id,
+            vector_search_service=vector_service,
+        )
+        stage_progress("slocum_masterdata")(1, 1)
+        summary["indexed"]["slocum_masterdata"] = md["chunk_count"]
+
+    logger.info("Vector store reindexed: %s", summary)
+    return summary
+
+
+class VectorIndexJobs:
+    """Single-worker queue for indexing jobs, with bounded job history."""
+
+    def __init__(self, max_tracked: int = MAX_TRACKED_JOBS):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, VectorIndexJob]" = OrderedDict()
+        self._max_tracked = max_tracked
+
+    def _submit(
+        self,
+        kind: str,
+        description: str,
+        work: Callable[[ProgressFn], Dict[str, Any]],
+    ) -> VectorIndexJob:
+        job = VectorIndexJob(job_id=uuid.uuid4().hex, kind=kind, description=description)
+        with self._lock:
+            if self._executor is None:
+                # One worker: jobs share the embedding model and Chroma client.
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vector-index")
+            self._jobs[job.job_id] = job
+            while len(self._jobs) > self._max_tracked:
+                self._jobs.popitem(last=False)
+            self._executor.submit(self._run, job, work)
+        return job
+
+    @staticmethod
+    def _run(job: VectorIndexJob, work: Callable[[ProgressFn], Dict[str, Any]]) -> None:
+        job.state = JOB_RUNNING
+        job.started_at_utc = datetime.now(timezone.utc)
+        try:
+            job.result = work(job.report) or {}
+            job.state = JOB_COMPLETED
+        except Exception as e:
+            job.error = str(e)
+            job.state = JOB_FAILED
+            logger.error("Vector index job %s (%s) failed: %s", job.job_id, job.description, e, exc_info=True)
+        finally:
+            job.finished_at_utc = datetime.now(timezone.utc)
+
+    def submit_document(
+        self,
+        vector_service: Any,
+        document: Dict[str, Any],
+        include_masterdata: bool = True,
+    ) -> VectorIndexJob:
+        return self._submit(
+            "document",
+            f"document {document['doc_id']}",
+            lambda progress: ingest_document(vector_service, document, progress, include_masterdata),
+        )
+
+    def submit_reindex_all(self, vector_service: Any) -> VectorIndexJob:
+        def work(progress: ProgressFn) -> Dict[str, Any]:
+            from ..core.infra.db import sqlite_engine
+
+            with SQLModelSession(sqlite_engine) as session:
+                return reindex_all(vector_service, session, progress)
+
+        return self._submit("reindex_all", "all collections", work)
+
+    def get(self, job_id: str) -> Optional[VectorIndexJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def recent(self) -> List[VectorIndexJob]:
+        with self._lock:
+            return list(reversed(self._jobs.values()))
+
+
+vector_index_jobs = VectorIndexJobs()
@@ -3,46 +3,257 @@ Vector Search Service
 
 Handles semantic search using ChromaDB for FAQs, documents, and tips.
 Supports category/tag filtering for targeted searches (e.g., troubleshooting).
+
+Collections are created in ``vector_distance_metric`` space (cosine by default,
+which is what MiniLM embeddings are trained for) with explicit HNSW parameters
+(``vector_hnsw_*``). Collections created with other settings keep working
+(distances are converted to cosine similarity from each collection's own
+space) until they are rebuilt with ``rebuild_collections`` - see the
+20261018_vector_cosine_hnsw migration and
+``python -m app.cli.vector_index_cli rebuild-collections``.
 """
 
+import asyncio
+import importlib.util
 import logging
-from typing import List, Dict, Optional, Tuple
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from pathlib import Path
 import json
 
+from cachetools import LRUCache
+
+from .embedding_store import EmbeddingStore, content_hash
+
 logger = logging.getLogger(__name__)
 from ..config import settings
+from ..core.utils import resolve_data_path
 
-try:
-    import chromadb
-    from sentence_transformers import SentenceTransformer
-    CHROMADB_AVAILABLE = True
-except ImportError:
-    CHROMADB_AVAILABLE = False
+# Only probe for the packages here: importing sentence-transformers pulls in
+# torch, which is deferred until the service is actually constructed.
+CHROMADB_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("chromadb", "sentence_transformers")
+)
+if not CHROMADB_AVAILABLE:
     logger.warning("ChromaDB or sentence-transformers not installed. Vector search disabled.")
 
+EMBEDDING_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+
+# Rows per Chroma upsert / embedding window during (re)indexing.
+_UPSERT_BATCH_SIZE = 256
+
+# (id, text to embed, stored document, metadata)
+_IndexRecord = Tuple[str, str, str, Dict[str, str]]
+
+# Collection name -> description stored in the Chroma collection metadata.
+VECTOR_COLLECTIONS = {
+    "faqs": "FAQ entries with semantic search",
+    "documents": "Knowledge base documents",
+    "tips": "Shared tips and tricks",
+    "slocum_masterdata": "Slocum glider masterdata parameter definitions",
+}
+
+_HNSW_KEYS = ("hnsw:space", "hnsw:M", "hnsw:construction_ef", "hnsw:search_ef")
+
+# Collection name -> search method used by ``search_many``.
+_SEARCH_METHODS = {
+    "faqs": "search_faqs",
+    "documents": "search_documents",
+    "tips": "search_tips",
+    "slocum_masterdata": "search_slocum_masterdata",
+}
+
+
+def collection_metadata(name: str, tuned: bool = True) -> Dict[str, Any]:
+    """Chroma metadata for a collection: configured space + HNSW params, or Chroma defaults."""
+    metadata: Dict[str, Any] = {"description": VECTOR_COLLECTIONS[name]}
+    if tuned:
+        metadata.update({
+            "hnsw:space": settings.vector_distance_metric,
+            "hnsw:M": settings.vector_hnsw_m,
+            "hnsw:construction_ef": settings.vector_hnsw_ef_construction,
+            "hnsw:search_ef": settings.vector_hnsw_ef_search,
+        })
+    return metadata
+
+
+def collection_space(collection: Any) -> str:
+    return (collection.metadata or {}).get("hnsw:space", "l2")
+
+
+def collection_matches(collection: Any, metadata: Dict[str, Any]) -> bool:
+    """Whether an existing collection was built with ``metadata``'s space and HNSW params."""
+    current = collection.metadata or {}
+    return all(current.get(key) == metadata.get(key) for key in _HNSW_KEYS)
+
+
+def distance_to_similarity(distance: float, space: str) -> float:
+    """
+    Chroma distance -> cosine similarity, whatever the collection's space.
+
+    MiniLM embeddings are unit length, so squared L2 is ``2 - 2 cos`` and
+    ``ip`` distance is ``1 - cos``; one ``vector_similarity_threshold`` then
+    means the same in legacy L2 collections and rebuilt cosine ones.
+    """
+    if space == "l2":
+        return 1.0 - distance / 2.0
+    return 1.0 - distance
+
+
+def open_collection(client: Any, name: str) -> Any:
+    """
+    Existing collection as built, or a new one with the configured settings.
+
+    Never passes metadata to an existing collection: Chroma would relabel its
+    space without rebuilding the index.
+    """
+    try:
+        collection = client.get_collection(name=name)
+    except Exception:
+        return client.create_collection(name=name, metadata=collection_metadata(name))
+    if not collection_matches(collection, collection_metadata(name)):
+        logger.warning(
+            f"Vector collection '{name}' uses {collection.metadata}; run the vector "
+            f"collection migration to rebuild it with the configured HNSW settings"
+        )
+    return collection
+
+
+def _copy_into(collection: Any, data: Dict[str, Any]) -> None:
+    ids = data["ids"]
+    for start in range(0, len(ids), _UPSERT_BATCH_SIZE):
+        stop = start + _UPSERT_BATCH_SIZE
+        collection.add(
+            ids=ids[start:stop],
+            embeddings=[list(e) for e in data["embeddings"][start:stop]],
+            documents=data["documents"][start:stop],
+            metadatas=data["metadatas"][start:stop],
+        )
+
+
+def _drop_collection(client: Any, name: str) -> None:
+    try:
+        client.delete_collection(name=name)
+    except Exception:
+        pass
+
+
+def rebuild_collections(
+    client: Any,
+    tuned: bool = True,
+    names: Optional[List[str]] = None,
+    force: bool = False,
+) -> Dict[str, int]:
+    """
+    Recreate collections whose space/HNSW settings differ from the target.
+
+    Stored embeddings, documents and metadata are copied over as-is (the
+    embedding model is not needed), so this is cheap even for large stores.
+    The copy is built as ``<name>__rebuild`` and only swapped in once it holds
+    every entry; the original is renamed aside first and restored if the swap
+    fails, so an error at any point leaves the original collection in place.
+    Returns ``{collection: entries copied}`` for the rebuilt collections.
+    """
+    rebuilt: Dict[str, int] = {}
+    for name in names or list(VECTOR_COLLECTIONS):
+        target = collection_metadata(name, tuned=tuned)
+        try:
+            old = client.get_collection(name=name)
+        except Exception:
+            continue
+        if not force and collection_matches(old, target):
+            continue
+        data = old.get(include=["embeddings", "documents", "metadatas"])
+        ids = data["ids"]
+
+        staging_name, backup_name = f"{name}__rebuild", f"{name}__previous"
+        _drop_collection(client, staging_name)  # left over from an interrupted run
+        try:
+            staging = client.create_collection(name=staging_name, metadata=target)
+            _copy_into(staging, data)
+            if staging.count() != len(ids):
+                raise RuntimeError(f"copied {staging.count()} of {len(ids)} entries")
+        except Exception:
+            _drop_collection(client, staging_name)
+            raise
+
+        _drop_collection(client, backup_name)
+        old.modify(name=backup_name)
+        try:
+            staging.modify(name=name)
+        except Exception:
+            old.modify(name=name)
+            _drop_collection(client, staging_name)
+            raise
+        _drop_collection(client, backup_name)
+        rebuilt[name] = len(ids)
+        logger.info(f"Rebuilt vector collection '{name}' ({len(ids)} entries) with {target}")
+    return rebuilt
+
+
+def normalize_query(query: str) -> str:
+    """Cache key text: all-MiniLM-L6-v2 is uncased, so case/whitespace don't change the embedding."""
+    return " ".join((query or "").lower().split())
+
+
+@dataclass
+class MultiSearchResult:
+    """Per-collection matches from one query embedding, plus a combined ranking."""
+    by_collection: Dict[str, List[Tuple]] = field(default_factory=dict)
+
+    def get(self, collection: str) -> List[Tuple]:
+        return self.by_collection.get(collection, [])
+
+    @property
+    def ranked(self) -> List[Tuple[str, Dict, float, str]]:
+        """``(collection, metadata, similarity, content)`` across collections, best first."""
+        combined = []
+        for collection, matches in self.by_collection.items():
+            for match in matches:
+                metadata, similarity = match[0], match[1]
+                content = match[2] if len(match) > 2 else ""
+                combined.append((collection, metadata, similarity, content))
+        combined.sort(key=lambda x: x[2], reverse=True)
+        return combined
+
 
 class VectorSearchService:
     """Service for vector-based semantic search."""
     
-    def __init__(self, storage_path: Optional[Path] = None):
-        """Initialize vector search service."""
+    def __init__(self, storage_path: Optional[Path] = None, cpu_threads: int = 1):
+        """Initialize vector search service.
+
+        ``cpu_threads`` caps torch intra-op threads; the web app keeps 1 so
+        embedding never starves request workers, ``reindex-all`` raises it.
+        """
         if not CHROMADB_AVAILABLE:
             self.enabled = False
             logger.warning("Vector search disabled - dependencies not installed")
             return
 
+        import chromadb
+        from sentence_transformers import SentenceTransformer
+
         # Disable MKLDNN in-process to avoid CPU kernel crashes.
         try:
             import torch
             torch.backends.mkldnn.enabled = False
-            torch.set_num_threads(1)
+            torch.set_num_threads(max(1, cpu_threads))
             torch.set_num_interop_threads(1)
         except Exception as e:
             logger.warning(f"Failed to set torch CPU knobs: {e}")
         
         self.enabled = True
-        self.storage_path = storage_path or Path("data_store/chroma_db")
+        self._query_cache: LRUCache[Tuple[str, str], Tuple[float, ...]] = LRUCache(
+            maxsize=max(1, settings.vector_query_cache_size)
+        )
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+        self.embedding_store = EmbeddingStore(EMBEDDING_MODEL_NAME)
+        self.storage_path = storage_path or resolve_data_path(settings.vector_store_dir)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
         # Initialize ChromaDB client
@@ -50,7 +261,7 @@ class VectorSearchService:
         
         # Initialize embedding model
         try:
-            self.embedding_model = SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+            self.embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
             logger.info("Embedding model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
@@ -58,27 +269,172 @@ class VectorSearchService:
             return
         
         # Create collections for different content types
-        self.faq_collection = self.client.get_or_create_collection(
-            name="faqs",
-            metadata={"description": "FAQ entries with semantic search"}
-        )
-        
-        self.documents_collection = self.client.get_or_create_collection(
-            name="documents",
-            metadata={"description": "Knowledge base documents"}
-        )
+        self.collections = {name: open_collection(self.client, name) for name in VECTOR_COLLECTIONS}
+        self.faq_collection = self.collections["faqs"]
+        self.documents_collection = self.collections["documents"]
+        self.tips_collection = self.collections["tips"]
+        self.slocum_masterdata_collection = self.collections["slocum_masterdata"]
         
-        self.tips_collection = self.client.get_or_create_collection(
-            name="tips",
-            metadata={"description": "Shared tips and tricks"}
+        logger.info("Vector search service initialized")
+
+    def embed_query(self, query: str) -> List[float]:
+        """Embedding for a search query, served from the LRU cache when possible."""
+        key = (EMBEDDING_MODEL_NAME, normalize_query(query))
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache_hits += 1
+                return list(cached)
+            self._query_cache_misses += 1
+        embedding = tuple(self.embedding_model.encode(key[1]).tolist())
+        with self._query_cache_lock:
+            self._query_cache[key] = embedding
+        return list(embedding)
+
+    def query_cache_info(self) -> Dict[str, int]:
+        with self._query_cache_lock:
+            return {
+                "size": len(self._query_cache),
+                "maxsize": int(self._query_cache.maxsize),
+                "hits": self._query_cache_hits,
+                "misses": self._query_cache_misses,
+            }
+
+    async def search_many(
+        self,
+        query: str,
+        searches: Dict[str, Dict[str, Any]],
+    ) -> MultiSearchResult:
+        """
+        Embed ``query`` once and search several collections concurrently.
+
+        ``searches`` maps a collection name (``faqs``, ``documents``, ``tips``,
+        ``slocum_masterdata``) to the keyword arguments of its ``search_*``
+        method. Embedding and Chroma queries run in worker threads so the
+        event loop is never blocked.
+        """
+        if not self.enabled or not searches:
+            return MultiSearchResult()
+        unknown = set(searches) - set(_SEARCH_METHODS)
+        if unknown:
+            raise ValueError(f"Unknown vector collections: {sorted(unknown)}")
+
+        query_embedding = await asyncio.to_thread(self.embed_query, query)
+        names = list(searches)
+        results = await asyncio.gather(*(
+            asyncio.to_thread(
+                getattr(self, _SEARCH_METHODS[name]),
+                query,
+                query_embedding=query_embedding,
+                **searches[name],
+            )
+            for name in names
+        ))
+        return MultiSearchResult(by_collection=dict(zip(names, results)))
+    
+    def encode_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed ``texts`` with one batched ``encode`` call (``vector_embedding_batch_size``)."""
+        if not texts:
+            return []
+        return self.embedding_model.encode(
+            list(texts),
+            batch_size=max(1, settings.vector_embedding_batch_size),
+            show_progress_bar=False,
+        ).tolist()
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embeddings for ``texts`` via the content-hash store.
+
+        Only texts whose normalized hash has never been embedded with this
+        model are encoded (once per distinct hash); results are persisted.
+        """
+        hashes = [content_hash(text) for text in texts]
+        known = self.embedding_store.get_many(hashes)
+        missing: Dict[str, str] = {}
+        for digest, text in zip(hashes, texts):
+            if digest not in known and digest not in missing:
+                missing[digest] = text
+        if missing:
+            fresh = dict(zip(missing, self.encode_texts(list(missing.values()))))
+            self.embedding_store.put_many(fresh)
+            known.update(fresh)
+        logger.debug(
+            f"Embedded {len(texts)} texts: {len(missing)} encoded, {len(texts) - len(missing)} reused"
         )
+        return [known[digest] for digest in hashes]
+
+    def _upsert_records(
+        self,
+        collection: Any,
+        records: List[_IndexRecord],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """
+        Embed and upsert ``(id, text_to_embed, stored_document, metadata)`` records.
+
+        Each entry's metadata records the ``content_hash`` of its embedded
+        text. Works in windows of ``_UPSERT_BATCH_SIZE`` so memory stays
+        bounded and ``progress(done, total)`` can report after each window.
+        """
+        total = len(records)
+        for start in range(0, total, _UPSERT_BATCH_SIZE):
+            window = records[start:start + _UPSERT_BATCH_SIZE]
+            texts = [r[1] for r in window]
+            collection.upsert(
+                ids=[r[0] for r in window],
+                embeddings=self.embed_texts(texts),
+                documents=[r[2] for r in window],
+                metadatas=[{**r[3], "content_hash": content_hash(t)} for r, t in zip(window, texts)],
+            )
+            if progress:
+                progress(start + len(window), total)
+        return total
+
+    def reset_collection(self, name: str) -> int:
+        """Delete every entry of a collection; returns the number removed."""
+        if not self.enabled:
+            return 0
+        collection = self.collections[name]
+        ids = collection.get(include=[])["ids"]
+        for start in range(0, len(ids), _UPSERT_BATCH_SIZE):
+            collection.delete(ids=ids[start:start + _UPSERT_BATCH_SIZE])
+        return len(ids)
+
+    @staticmethod
+    def _faq_record(
+        faq_id: int,
+        question: str,
+        answer: str,
+        category: Optional[str] = None,
+        tags: Optional[str] = None,
+        keywords: Optional[str] = None,
+        platform: str = "wave_glider",
+    ) -> _IndexRecord:
+        # Combine question and answer for better semantic matching;
+        # the answer is stored as the document.
+        metadata = {
+            "faq_id": str(faq_id),
+            "question": question,
+            "category": category or "general",
+            "tags": tags or "",
+            "keywords": keywords or "",
+            "type": "faq",
+            "platform": platform,
+        }
+        return f"faq_{faq_id}", f"{question}\n\n{answer}", answer, metadata
 
-        self.slocum_masterdata_collection = self.client.get_or_create_collection(
-            name="slocum_masterdata",
-            metadata={"description": "Slocum glider masterdata parameter definitions"}
+    def add_faqs(
+        self,
+        faqs: List[Dict[str, Any]],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Upsert FAQs (``add_faq`` keyword dicts) with batched embedding."""
+        if not self.enabled or not faqs:
+            return 0
+        return self._upsert_records(
+            self.faq_collection, [self._faq_record(**faq) for faq in faqs], progress
         )
-        
-        logger.info("Vector search service initialized")
     
     def add_faq(
         self,
@@ -95,32 +451,144 @@ class VectorSearchService:
             return
         
         try:
-            # Combine question and answer for better semantic matching
-            content = f"{question}\n\n{answer}"
-            embedding = self.embedding_model.encode(content).tolist()
-            
-            # Prepare metadata
-            metadata = {
-                "faq_id": str(faq_id),
+            self.add_faqs([{
+                "faq_id": faq_id,
                 "question": question,
+                "answer": answer,
+                "category": category,
+                "tags": tags,
+                "keywords": keywords,
+                "platform": platform,
+            }])
+            logger.debug(f"Added FAQ {faq_id} to vector store")
+        except Exception as e:
+            logger.error(f"Error adding FAQ to vector store: {e}")
+
+    @staticmethod
+    def _document_records(
+        doc_id: int,
+        title: str,
+        content: str,
+        category: Optional[str] = None,
+        tags: Optional[str] = None,
+        file_type: Optional[str] = None,
+        use_chunking: bool = True,
+        platform: str = "wave_glider",
+    ) -> List[_IndexRecord]:
+        """Index records for one document: chunks for large documents, else a single entry."""
+        def single_entry(text: str) -> _IndexRecord:
+            return f"doc_{doc_id}", text, text, {
+                "doc_id": str(doc_id),
+                "title": title,
                 "category": category or "general",
                 "tags": tags or "",
-                "keywords": keywords or "",
-                "type": "faq",
+                "file_type": file_type or "",
+                "type": "document",
+                "chunk_index": "0",
+                "is_chunked": "false",
                 "platform": platform,
             }
-            
-            # Add to collection (will update if ID exists)
-            self.faq_collection.upsert(
-                ids=[f"faq_{faq_id}"],
-                embeddings=[embedding],
-                documents=[answer],  # Store answer as the document
-                metadatas=[metadata]
+
+        should_chunk = use_chunking and settings.vector_chunking_enabled
+        if not (should_chunk and len(content) > settings.vector_chunking_min_chars):
+            return [single_entry(content)]
+
+        try:
+            from .chunking_service import chunking_service
+
+            # Use context-aware chunking for better hierarchy preservation
+            # Falls back to basic chunking if structure isn't detected
+            chunks = chunking_service.chunk_with_context(
+                doc_id=doc_id,
+                content=content,
+                title=title,
+                category=category or "general",
+                tags=tags or ""
             )
-            
-            logger.debug(f"Added FAQ {faq_id} to vector store")
         except Exception as e:
-            logger.error(f"Error adding FAQ to vector store: {e}")
+            logger.error(f"Error chunking document {doc_id}: {e}")
+            # Fallback to single entry
+            return [single_entry(content[:5000])]  # Truncate for safety
+
+        return [
+            (chunk.chunk_id, chunk.content, chunk.content, {
+                "doc_id": str(doc_id),
+                "title": chunk.title,
+                "category": chunk.category or "general",
+                "tags": chunk.tags or "",
+                "file_type": file_type or "",
+                "type": "document",
+                "chunk_index": str(chunk.chunk_index),
+                "is_chunked": "true",
+                "start_char": str(chunk.start_char),
+                "end_char": str(chunk.end_char),
+                "platform": platform,
+            })
+            for chunk in chunks
+        ]
+
+    def add_documents(
+        self,
+        documents: List[Dict[str, Any]],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """
+        Replace documents (``add_document`` keyword dicts) in the vector store.
+
+        Chunk-level diff against what is stored for each document: entries
+        that no longer exist are deleted, entries whose ``content_hash`` is
+        unchanged keep their vectors (metadata is refreshed if it changed),
+        and only new or changed chunks are embedded, in batches. Returns the
+        number of entries the documents now have.
+        """
+        if not self.enabled or not documents:
+            return 0
+        to_embed: List[_IndexRecord] = []
+        metadata_only: List[_IndexRecord] = []
+        stale_ids: List[str] = []
+        entry_count = 0
+        for document in documents:
+            records = self._document_records(**document)
+            entry_count += len(records)
+            stored = self._stored_document_entries(document["doc_id"])
+            new_ids = {r[0] for r in records}
+            # Drops chunks past the new end, and the single entry when a
+            # document switches between chunked and single-entry storage.
+            stale_ids.extend(entry_id for entry_id in stored if entry_id not in new_ids)
+            for record in records:
+                previous = stored.get(record[0])
+                digest = content_hash(record[1])
+                if previous is None or previous.get("content_hash") != digest:
+                    to_embed.append(record)
+                elif previous != {**record[3], "content_hash": digest}:
+                    metadata_only.append((record[0], record[1], record[2], {**record[3], "content_hash": digest}))
+
+        for start in range(0, len(stale_ids), _UPSERT_BATCH_SIZE):
+            self.documents_collection.delete(ids=stale_ids[start:start + _UPSERT_BATCH_SIZE])
+        for start in range(0, len(metadata_only), _UPSERT_BATCH_SIZE):
+            window = metadata_only[start:start + _UPSERT_BATCH_SIZE]
+            self.documents_collection.update(
+                ids=[r[0] for r in window],
+                documents=[r[2] for r in window],
+                metadatas=[r[3] for r in window],
+            )
+        self._upsert_records(self.documents_collection, to_embed, progress)
+        logger.debug(
+            f"Indexed {len(documents)} documents: {len(to_embed)} entries embedded, "
+            f"{len(metadata_only)} metadata-only, "
+            f"{entry_count - len(to_embed) - len(metadata_only)} unchanged, {len(stale_ids)} removed"
+        )
+        if progress and not to_embed:
+            progress(0, 0)
+        return entry_count
+
+    def _stored_document_entries(self, doc_id: int) -> Dict[str, Dict[str, Any]]:
+        """``{entry_id: metadata}`` currently stored for a document (chunks or single entry)."""
+        results = self.documents_collection.get(
+            where={"doc_id": str(doc_id)},
+            include=["metadatas"],
+        )
+        return dict(zip(results["ids"], results["metadatas"] or []))
     
     def add_document(
         self,
@@ -132,12 +600,13 @@ class VectorSearchService:
         file_type: Optional[str] = None,
         use_chunking: bool = True,
         platform: str = "wave_glider",
+        progress: Optional[Callable[[int, int], None]] = None,
     ):
         """
         Add or update a document in the vector store.
         
-        Always removes old chunks/entries before adding new ones to prevent
-        orphaned data when documents are updated or replaced.
+        Only chunks whose content changed are re-embedded; entries that no
+        longer exist are removed so no orphaned data is left behind.
         
         Args:
             doc_id: Document ID
@@ -147,138 +616,26 @@ class VectorSearchService:
             tags: Document tags
             file_type: File type
             use_chunking: If True, split large documents into chunks
+            progress: Optional ``(entries_done, entries_total)`` callback
         """
         if not self.enabled:
             return
         
         try:
-            # Always clean up old chunks/entries first to prevent orphaned data
-            # This handles cases where a document changes from chunked to single entry
-            # or vice versa, or when a file is replaced with a new version
-            self._delete_document_chunks(doc_id)
-            # Also delete single-entry version if it exists
-            try:
-                self.documents_collection.delete(ids=[f"doc_{doc_id}"])
-            except Exception:
-                pass  # May not exist if document was chunked
-            
-            # For large documents, use chunking for better precision
-            should_chunk = use_chunking and settings.vector_chunking_enabled
-            if should_chunk and len(content) > settings.vector_chunking_min_chars:
-                self._add_document_chunked(doc_id, title, content, category, tags, file_type, platform)
-            else:
-                # Small document - store as single entry
-                embedding = self.embedding_model.encode(content).tolist()
-                
-                metadata = {
-                    "doc_id": str(doc_id),
-                    "title": title,
-                    "category": category or "general",
-                    "tags": tags or "",
-                    "file_type": file_type or "",
-                    "type": "document",
-                    "chunk_index": "0",
-                    "is_chunked": "false",
-                    "platform": platform,
-                }
-                
-                self.documents_collection.upsert(
-                    ids=[f"doc_{doc_id}"],
-                    embeddings=[embedding],
-                    documents=[content],
-                    metadatas=[metadata]
-                )
-                
-                logger.debug(f"Added document {doc_id} to vector store (single entry)")
+            count = self.add_documents([{
+                "doc_id": doc_id,
+                "title": title,
+                "content": content,
+                "category": category,
+                "tags": tags,
+                "file_type": file_type,
+                "use_chunking": use_chunking,
+                "platform": platform,
+            }], progress=progress)
+            logger.info(f"Added document {doc_id} ({title}) to vector store as {count} entries")
         except Exception as e:
             logger.error(f"Error adding document to vector store: {e}")
     
-    def _add_document_chunked(
-        self,
-        doc_id: int,
-        title: str,
-        content: str,
-        category: Optional[str] = None,
-        tags: Optional[str] = None,
-        file_type: Optional[str] = None,
-        platform: str = "wave_glider",
-    ):
-        """Add a document as multiple chunks for better search precision."""
-        try:
-            from .chunking_service import chunking_service
-            
-            # First, remove any existing chunks for this document
-            self._delete_document_chunks(doc_id)
-            
-            # Use context-aware chunking for better hierarchy preservation
-            # Falls back to basic chunking if structure isn't detected
-            chunks = chunking_service.chunk_with_context(
-                doc_id=doc_id,
-                content=content,
-                title=title,
-                category=category or "general",
-                tags=tags or ""
-            )
-            
-            # Add each chunk to the vector store
-            ids = []
-            embeddings = []
-            documents = []
-            metadatas = []
-            
-            for chunk in chunks:
-                # Create embedding for chunk
-                chunk_embedding = self.embedding_model.encode(chunk.content).tolist()
-                
-                ids.append(chunk.chunk_id)
-                embeddings.append(chunk_embedding)
-                documents.append(chunk.content)
-                metadatas.append({
-                    "doc_id": str(doc_id),
-                    "title": chunk.title,
-                    "category": chunk.category or "general",
-                    "tags": chunk.tags or "",
-                    "file_type": file_type or "",
-                    "type": "document",
-                    "chunk_index": str(chunk.chunk_index),
-                    "is_chunked": "true",
-                    "start_char": str(chunk.start_char),
-                    "end_char": str(chunk.end_char),
-                    "platform": platform,
-                })
-            
-            # Batch upsert all chunks
-            if ids:
-                self.documents_collection.upsert(
-                    ids=ids,
-                    embeddings=embeddings,
-                    documents=documents,
-                    metadatas=metadatas
-                )
-            
-            logger.info(f"Added document {doc_id} ({title}) as {len(chunks)} chunks")
-            
-        except Exception as e:
-            logger.error(f"Error chunking document {doc_id}: {e}")
-            # Fallback to single entry
-            embedding = self.embedding_model.encode(content[:5000]).tolist()  # Truncate for safety
-            self.documents_collection.upsert(
-                ids=[f"doc_{doc_id}"],
-                embeddings=[embedding],
-                documents=[content[:5000]],
-                metadatas=[{
-                    "doc_id": str(doc_id),
-                    "title": title,
-                    "category": category or "general",
-                    "tags": tags or "",
-                    "file_type": file_type or "",
-                    "type": "document",
-                    "chunk_index": "0",
-                    "is_chunked": "false",
-                    "platform": platform,
-                }]
-            )
-    
     def _delete_document_chunks(self, doc_id: int):
         """Delete all chunks for a document."""
         try:
@@ -293,6 +650,38 @@ class VectorSearchService:
                 logger.debug(f"Deleted {len(results['ids'])} chunks for document {doc_id}")
         except Exception as e:
             logger.warning(f"Error deleting document chunks: {e}")
+
+    @staticmethod
+    def _tip_record(
+        tip_id: int,
+        title: str,
+        content: str,
+        category: Optional[str] = None,
+        tags: Optional[str] = None,
+        platform: str = "wave_glider",
+    ) -> _IndexRecord:
+        # Combine title and content
+        metadata = {
+            "tip_id": str(tip_id),
+            "title": title,
+            "category": category or "general",
+            "tags": tags or "",
+            "type": "tip",
+            "platform": platform,
+        }
+        return f"tip_{tip_id}", f"{title}\n\n{content}", content, metadata
+
+    def add_tips(
+        self,
+        tips: List[Dict[str, Any]],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Upsert tips (``add_tip`` keyword dicts) with batched embedding."""
+        if not self.enabled or not tips:
+            return 0
+        return self._upsert_records(
+            self.tips_collection, [self._tip_record(**tip) for tip in tips], progress
+        )
     
     def add_tip(
         self,
@@ -308,26 +697,14 @@ class VectorSearchService:
             return
         
         try:
-            # Combine title and content
-            full_content = f"{title}\n\n{content}"
-            embedding = self.embedding_model.encode(full_content).tolist()
-            
-            metadata = {
-                "tip_id": str(tip_id),
+            self.add_tips([{
+                "tip_id": tip_id,
                 "title": title,
-                "category": category or "general",
-                "tags": tags or "",
-                "type": "tip",
+                "content": content,
+                "category": category,
+                "tags": tags,
                 "platform": platform,
-            }
-            
-            self.tips_collection.upsert(
-                ids=[f"tip_{tip_id}"],
-                embeddings=[embedding],
-                documents=[content],
-                metadatas=[metadata]
-            )
-            
+            }])
             logger.debug(f"Added tip {tip_id} to vector store")
         except Exception as e:
             logger.error(f"Error adding tip to vector store: {e}")
@@ -343,32 +720,67 @@ class VectorSearchService:
         try:
             if replace_existing:
                 try:
-                    existing = self.slocum_masterdata_collection.get(include=[])
-                    if existing["ids"]:
-                        self.slocum_masterdata_collection.delete(ids=existing["ids"])
+                    self.reset_collection("slocum_masterdata")
                 except Exception:
                     pass
             if not chunks:
                 return
-            ids = [c[0] for c in chunks]
-            documents = [c[1] for c in chunks]
-            embeddings = self.embedding_model.encode(documents).tolist()
-            metadatas = [{"type": "masterdata", "chunk_id": cid} for cid in ids]
-            self.slocum_masterdata_collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=documents,
-                metadatas=metadatas,
+            self._upsert_records(
+                self.slocum_masterdata_collection,
+                [
+                    (cid, content, content, {"type": "masterdata", "chunk_id": cid})
+                    for cid, content in chunks
+                ],
             )
             logger.info(f"Added {len(chunks)} Slocum masterdata chunks to vector store")
         except Exception as e:
             logger.error(f"Error adding Slocum masterdata: {e}")
 
+    @staticmethod
+    def _query(
+        collection: Any,
+        query_embedding: List[float],
+        limit: int,
+        similarity_threshold: float,
+        where: Optional[Dict[str, Any]] = None,
+        with_documents: bool = True,
+    ) -> List[Tuple[Dict, float, str]]:
+        """
+        Top ``limit`` ``(metadata, similarity, content)`` at or above the threshold.
+
+        Chroma returns hits nearest first and the threshold only removes hits,
+        so exactly ``limit`` are requested and no re-sort is needed.
+        """
+        include = ["metadatas", "distances"] + (["documents"] if with_documents else [])
+        results = collection.query(
+            query_embeddings=[query_embedding],
+            n_results=limit,
+            where=where or None,
+            include=include,
+        )
+        if not results.get("distances") or not results["distances"][0]:
+            return []
+        space = collection_space(collection)
+        metadatas = results["metadatas"][0] if results.get("metadatas") else []
+        documents = results["documents"][0] if with_documents and results.get("documents") else []
+        matches = []
+        for i, distance in enumerate(results["distances"][0]):
+            similarity = distance_to_similarity(distance, space)
+            if similarity < similarity_threshold:
+                break
+            matches.append((
+                metadatas[i] if i < len(metadatas) else {},
+                similarity,
+                documents[i] if i < len(documents) else "",
+            ))
+        return matches
+
     def search_slocum_masterdata(
         self,
         query: str,
         limit: int = 8,
-        similarity_threshold: float = 0.3,
+        similarity_threshold: float = 0.0,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Tuple[Dict, float, str]]:
         """
         Search Slocum masterdata by semantic similarity.
@@ -377,22 +789,11 @@ class VectorSearchService:
         if not self.enabled:
             return []
         try:
-            query_embedding = self.embedding_model.encode(query).tolist()
-            results = self.slocum_masterdata_collection.query(
-                query_embeddings=[query_embedding],
-                n_results=limit * 2,
-                include=["metadatas", "documents", "distances"],
+            if query_embedding is None:
+                query_embedding = self.embed_query(query)
+            return self._query(
+                self.slocum_masterdata_collection, query_embedding, limit, similarity_threshold
             )
-            matches = []
-            if results.get("distances") and results["distances"][0]:
-                for i, distance in enumerate(results["distances"][0]):
-                    similarity = 1 / (1 + distance)
-                    if similarity >= similarity_threshold:
-                        meta = results["metadatas"][0][i] if results["metadatas"] else {}
-                        doc = results["documents"][0][i] if results.get("documents") and results["documents"][0] else ""
-                        matches.append((meta, similarity, doc))
-            matches.sort(key=lambda x: x[1], reverse=True)
-            return matches[:limit]
         except Exception as e:
             logger.error(f"Error searching Slocum masterdata: {e}", exc_info=True)
             return []
@@ -403,8 +804,9 @@ class VectorSearchService:
         category_filter: Optional[str] = None,
         tag_filter: Optional[str] = None,
         limit: int = 5,
-        similarity_threshold: float = 0.35,
+        similarity_threshold: float = 0.07,
         platform: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Tuple[Dict, float]]:
         """
         Search FAQs using vector similarity.
@@ -416,6 +818,7 @@ class VectorSearchService:
             limit: Maximum results
             similarity_threshold: Minimum similarity score (lower = more strict)
             platform: If set, filter by platform (wave_glider or slocum).
+            query_embedding: Precomputed embedding of ``query`` (see ``search_many``).
             
         Returns:
             List of (metadata_dict, similarity_score) tuples
@@ -424,7 +827,8 @@ class VectorSearchService:
             return []
         
         try:
-            query_embedding = self.embedding_model.encode(query).tolist()
+            if query_embedding is None:
+                query_embedding = self.embed_query(query)
             
             # Build where clause for filtering
             where_clause = {}
@@ -435,27 +839,11 @@ class VectorSearchService:
             if platform:
                 where_clause["platform"] = platform
             
-            # Search with filters
-            results = self.faq_collection.query(
-                query_embeddings=[query_embedding],
-                n_results=limit * 2,  # Get more to filter
-                where=where_clause if where_clause else None,
-                include=['metadatas', 'distances']
+            matches = self._query(
+                self.faq_collection, query_embedding, limit, similarity_threshold,
+                where=where_clause, with_documents=False,
             )
-            
-            # Filter by similarity threshold and return
-            # Note: ChromaDB uses L2 (Euclidean) distance by default
-            # Convert to similarity using: 1 / (1 + distance) which gives values in [0, 1]
-            matches = []
-            if results['metadatas'] and results['distances']:
-                for metadata, distance in zip(results['metadatas'][0], results['distances'][0]):
-                    similarity = 1 / (1 + distance)  # Convert L2 distance to similarity
-                    if similarity >= similarity_threshold:
-                        matches.append((metadata, similarity))
-            
-            # Sort by similarity and limit
-            matches.sort(key=lambda x: x[1], reverse=True)
-            return matches[:limit]
+            return [(metadata, similarity) for metadata, similarity, _ in matches]
             
         except Exception as e:
             logger.error(f"Error searching FAQs: {e}", exc_info=True)
@@ -467,8 +855,9 @@ class VectorSearchService:
         category_filter: Optional[str] = None,
         tag_filter: Optional[str] = None,
         limit: int = 5,
-        similarity_threshold: float = 0.35,
+        similarity_threshold: float = 0.07,
         platform: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Tuple[Dict, float, str]]:
         """
         Search documents using vector similarity.
@@ -481,6 +870,7 @@ class VectorSearchService:
             limit: Maximum results
             similarity_threshold: Minimum similarity score
             platform: If set, filter by platform (wave_glider or slocum).
+            query_embedding: Precomputed embedding of ``query`` (see ``search_many``).
             
         Returns:
             List of (metadata_dict, similarity_score, content) tuples
@@ -489,7 +879,8 @@ class VectorSearchService:
             return []
         
         try:
-            query_embedding = self.embedding_model.encode(query).tolist()
+            if query_embedding is None:
+                query_embedding = self.embed_query(query)
             
             # Build where clause
             where_clause = {}
@@ -500,27 +891,10 @@ class VectorSearchService:
             if platform:
                 where_clause["platform"] = platform
             
-            results = self.documents_collection.query(
-                query_embeddings=[query_embedding],
-                n_results=limit * 2,
-                where=where_clause if where_clause else None,
-                include=['metadatas', 'distances', 'documents']
+            return self._query(
+                self.documents_collection, query_embedding, limit, similarity_threshold, where=where_clause
             )
             
-            matches = []
-            if results['metadatas'] and results['distances'] and results['documents']:
-                for metadata, distance, content in zip(
-                    results['metadatas'][0],
-                    results['distances'][0],
-                    results['documents'][0]
-                ):
-                    similarity = 1 / (1 + distance)  # Convert L2 distance to similarity
-                    if similarity >= similarity_threshold:
-                        matches.append((metadata, similarity, content))
-            
-            matches.sort(key=lambda x: x[1], reverse=True)
-            return matches[:limit]
-            
         except Exception as e:
             logger.error(f"Error searching documents: {e}", exc_info=True)
             return []
@@ -531,8 +905,9 @@ class VectorSearchService:
         category_filter: Optional[str] = None,
         tag_filter: Optional[str] = None,
         limit: int = 5,
-        similarity_threshold: float = 0.35,
+        similarity_threshold: float = 0.07,
         platform: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Tuple[Dict, float, str]]:
         """
         Search shared tips using vector similarity.
@@ -544,6 +919,7 @@ class VectorSearchService:
             limit: Maximum results
             similarity_threshold: Minimum similarity score
             platform: If set, filter by platform (wave_glider or slocum).
+            query_embedding: Precomputed embedding of ``query`` (see ``search_many``).
             
         Returns:
             List of (metadata_dict, similarity_score, content) tuples
@@ -552,7 +928,8 @@ class VectorSearchService:
             return []
         
         try:
-            query_embedding = self.embedding_model.encode(query).tolist()
+            if query_embedding is None:
+                query_embedding = self.embed_query(query)
             
             where_clause = {}
             if category_filter:
@@ -562,27 +939,10 @@ class VectorSearchService:
             if platform:
                 where_clause["platform"] = platform
             
-            results = self.tips_collection.query(
-                query_embeddings=[query_embedding],
-                n_results=limit * 2,
-                where=where_clause if where_clause else None,
-                include=['metadatas', 'distances', 'documents']
+            return self._query(
+                self.tips_collection, query_embedding, limit, similarity_threshold, where=where_clause
             )
             
-            matches = []
-            if results['metadatas'] and results['distances'] and results['documents']:
-                for metadata, distance, content in zip(
-                    results['metadatas'][0],
-                    results['distances'][0],
-                    results['documents'][0]
-                ):
-                    similarity = 1 / (1 + distance)  # Convert L2 distance to similarity
-                    if similarity >= similarity_threshold:
-                        matches.append((metadata, similarity, content))
-            
-            matches.sort(key=lambda x: x[1], reverse=True)
-            return matches[:limit]
-            
         except Exception as e:
             logger.error(f"Error searching tips: {e}", exc_info=True)
             return []
@@ -0,0 +1,298 @@
+"""
+Exercise the bathymetry tile pyramid against a local fake ERDDAP griddap server.
+
+Starts a threaded HTTP server that answers the two griddap calls erddapy makes
+(``<dataset>.ncml`` metadata and ``<dataset>.csvp?z[(lat):stride:(lat)][...]``)
+for a synthetic, cell-centred 15" depth field in 0-360 longitude, with a fixed
+per-request latency. It then:
+
+1. renders the report maps of a drifting deployment (overlapping extents that
+   grow with the track) both ways - the previous per-extent behaviour (one
+   griddap request and one .npz per extent) and ``fetch_etopo_bathymetry`` on
+   the tile store - comparing upstream requests, rows transferred, disk use
+   and wall time;
+2. checks every mosaic against the synthetic field (values up to the 0.1 m
+   output rounding, regular axis spacing across tile seams, full coverage of
+   the padded bounds);
+3. runs track/point depth lookups inside the rendered area (must not go
+   upstream) and outside it (one tile fetch, then served from disk);
+4. mosaics an extent across the prime meridian (two requests, one seamless grid);
+5. enforces a byte quota, which evicts whole tiles; re-rendering an extent only
+   refetches the tiles it lost; and checks that a purge drops legacy files.
+
+Usage: python scripts/bench_bathy_tiles.py [--maps 30] [--latency-ms 80] [--seed 7]
+"""
+
+import argparse
+import math
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.config import settings  # noqa: E402
+from app.core.geo import bathymetry as bathy  # noqa: E402
+
+DATASET_ID = "ETOPO_FAKE_15s"
+CELLS_PER_DEG = 240
+STEP = 1.0 / CELLS_PER_DEG
+N_LAT = 180 * CELLS_PER_DEG
+N_LON = 360 * CELLS_PER_DEG
+
+NCML = f"""<?xml version="1.0" encoding="UTF-8"?>
+<netcdf xmlns="https://www.unidata.ucar.edu/namespaces/netcdf/ncml-2.2">
+  <dimension name="latitude" length="{N_LAT}"/>
+  <dimension name="longitude" length="{N_LON}"/>
+  <variable name="latitude" shape="latitude" type="double">
+    <attribute name="actual_range" type="double" value="{-90 + STEP / 2} {90 - STEP / 2}"/>
+  </variable>
+  <variable name="longitude" shape="longitude" type="double">
+    <attribute name="actual_range" type="double" value="{STEP / 2} {360 - STEP / 2}"/>
+  </variable>
+  <variable name="z" shape="latitude longitude" type="float"/>
+</netcdf>
+"""
+QUERY_RE = re.compile(
+    r"z\[\(([-\d.eE+]+)\):(\d+):\(([-\d.eE+]+)\)\]\[\(([-\d.eE+]+)\):(\d+):\(([-\d.eE+]+)\)\]"
+)
+
+
+def synthetic_z(lat: np.ndarray, lon360: np.ndarray) -> np.ndarray:
+    """Smooth basin with a seamount and an island, rounded like ERDDAP's float output."""
+    lon = np.where(lon360 > 180.0, lon360 - 360.0, lon360)
+    z = -2200.0 - 1400.0 * np.sin(np.radians(lat * 37.0)) * np.cos(np.radians(lon * 23.0))
+    z += 2300.0 * np.exp(-((lat - 42.6) ** 2 + (lon + 67.4) ** 2) / 0.08)  # island
+    z += 900.0 * np.exp(-((lat - 41.2) ** 2 + (lon + 69.3) ** 2) / 0.3)
+    return np.round(z, 1)
+
+
+def nearest_index(value: float, origin: float, count: int) -> int:
+    return int(min(count - 1, max(0, round((value - origin) / STEP - 0.5))))
+
+
+class FakeGriddap:
+    """``/erddap/griddap/<id>.ncml`` and ``.csvp`` for the synthetic field."""
+
+    def __init__(self, latency_s: float):
+        self.requests = 0
+        self.rows = 0
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                path, _, query = self.path.partition("?")
+                if path == f"/erddap/griddap/{DATASET_ID}.ncml":
+                    self._send(200, NCML.encode(), "application/xml")
+                    return
+                match = QUERY_RE.search(unquote(query))
+                if path != f"/erddap/griddap/{DATASET_ID}.csvp" or not match:
+                    self._send(404, b"not found", "text/plain")
+                    return
+                time.sleep(latency_s)
+                lat_lo, lat_step, lat_hi, lon_lo, lon_step, lon_hi = match.groups()
+                i0, i1 = (nearest_index(float(v), -90.0, N_LAT) for v in (lat_lo, lat_hi))
+                j0, j1 = (nearest_index(float(v), 0.0, N_LON) for v in (lon_lo, lon_hi))
+                lats = -90.0 + (np.arange(i0, i1 + 1, int(lat_step)) + 0.5) * STEP
+                lons = (np.arange(j0, j1 + 1, int(lon_step)) + 0.5) * STEP
+                lat_grid, lon_grid = np.meshgrid(lats, lons, indexing="ij")
+                z = synthetic_z(lat_grid, lon_grid)
+                lines = ["latitude (degrees_north),longitude (degrees_east),z (m)"]
+                lines += [
+                    f"{a:.9f},{b:.9f},{c:.1f}"
+                    for a, b, c in zip(lat_grid.ravel(), lon_grid.ravel(), z.ravel())
+                ]
+                outer.requests += 1
+                outer.rows += z.size
+                self._send(200, ("\n".join(lines) + "\n").encode(), "text/csv")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self._server.server_port}/erddap"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+
+
+def deployment_extents(count: int, seed: int) -> list[list[float]]:
+    """Report maps of one deployment: the track drifts and the map grows with it."""
+    rng = random.Random(seed)
+    lon_c, lat_c, span = -68.4, 42.3, 0.6
+    extents = []
+    for _ in range(count):
+        lon_c += rng.uniform(-0.08, 0.12)
+        lat_c += rng.uniform(-0.06, 0.08)
+        span = min(3.0, span * rng.uniform(1.0, 1.08))
+        extents.append([lon_c - span / 2, lon_c + span / 2, lat_c - span / 3, lat_c + span / 3])
+    return extents
+
+
+def use_cache(directory: Path) -> None:
+    settings.bathy_cache_dir = directory
+    bathy._fetch_cached.cache_clear()
+    bathy._TILE_INDEX.invalidate()
+
+
+def dir_bytes(directory: Path) -> int:
+    return sum(p.stat().st_size for p in directory.rglob("*.npz")) if directory.is_dir() else 0
+
+
+def check_mosaic(grid: bathy.BathyGrid, extent: list[float]) -> None:
+    assert grid is not None, f"no grid for {extent}"
+    stride = bathy.pyramid_stride(bathy.choose_stride(extent))
+    for axis in (grid.latitude, grid.longitude):
+        assert np.allclose(np.diff(axis), stride * STEP, atol=1e-6), "irregular spacing across tiles"
+    bounds = bathy.bathy_query_bounds(list(bathy._cache_key(extent, stride)[:4]))  # as cached: 3 decimals
+    assert grid.latitude[0] <= bounds["south"] and grid.latitude[-1] >= bounds["north"]
+    assert grid.longitude[0] <= bounds["west"] and grid.longitude[-1] >= bounds["east"]
+    lat_grid, lon_grid = np.meshgrid(grid.latitude, grid.longitude % 360.0, indexing="ij")
+    assert np.allclose(grid.z, synthetic_z(lat_grid, lon_grid), atol=0.11), "mosaic values differ"
+
+
+def legacy_render(extent: list[float], directory: Path) -> None:
+    """Previous behaviour: one griddap request and one .npz per exact extent."""
+    stride = bathy.choose_stride(extent)
+    grid = bathy._fetch_from_erddap(bathy.bathy_query_bounds(extent), stride=stride, timeout=30)
+    directory.mkdir(parents=True, exist_ok=True)
+    west, east, south, north, _ = bathy._cache_key(extent, stride)
+    with open(directory / f"bathy_{west}_{east}_{south}_{north}_{stride}.npz", "wb") as handle:
+        np.savez(handle, longitude=grid.longitude, latitude=grid.latitude, z=grid.z)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--maps", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    server = FakeGriddap(args.latency_ms / 1000.0)
+    settings.etopo_erddap_server = server.base
+    settings.etopo_dataset_id = DATASET_ID
+    settings.bathy_cache_max_bytes = 0
+    extents = deployment_extents(args.maps, args.seed)
+    print(f"fake griddap: {len(extents)} report maps of a drifting deployment, {args.latency_ms:.0f} ms per request")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_dir = Path(tmp) / "legacy"
+        before = (server.requests, server.rows)
+        started = time.perf_counter()
+        for extent in extents:
+            legacy_render(extent, legacy_dir)
+        legacy_s = time.perf_counter() - started
+        legacy = (server.requests - before[0], server.rows - before[1], dir_bytes(legacy_dir))
+
+        tiles_dir = Path(tmp) / "tiles"
+        use_cache(tiles_dir)
+        before = (server.requests, server.rows)
+        started = time.perf_counter()
+        for extent in extents:
+            check_mosaic(bathy.fetch_etopo_bathymetry(extent), extent)
+        tiles_s = time.perf_counter() - started
+        tiled = (server.requests - before[0], server.rows - before[1], dir_bytes(tiles_dir))
+
+        print(f"{'':<12}{'requests':>10}{'rows':>12}{'disk MB':>10}{'time s':>9}")
+        for label, (requests, rows, size), seconds in (
+            ("per-extent", legacy, legacy_s),
+            ("tiles", tiled, tiles_s),
+        ):
+            print(f"{label:<12}{requests:>10}{rows:>12}{size / 1024 / 1024:>10.2f}{seconds:>9.2f}")
+        print(f"index: {bathy._TILE_INDEX.status()}")
+
+        # Re-render every map from a fresh process view: all tiles come from disk.
+        use_cache(tiles_dir)
+        requests_before = server.requests
+        for extent in extents:
+            check_mosaic(bathy.fetch_etopo_bathymetry(extent), extent)
+        assert server.requests == requests_before, "warm re-render went upstream"
+
+        # Track lookups inside rendered tiles stay local.
+        rng = np.random.default_rng(args.seed)
+        covered = {(lat0, lon0) for lvl, lat0, lon0 in bathy._TILE_INDEX._tiles}
+        keys = sorted(covered)
+        picks = [keys[i] for i in rng.integers(0, len(keys), 500)]
+        lats = np.array([lat0 + rng.uniform(0.05, 0.95) for lat0, _ in picks])
+        lons = np.array([lon0 + rng.uniform(0.05, 0.95) for _, lon0 in picks])
+        requests_before = server.requests
+        started = time.perf_counter()
+        depths = bathy.depths_at(lats, lons)
+        track_ms = (time.perf_counter() - started) * 1000
+        assert server.requests == requests_before, "track lookup inside cached tiles went upstream"
+        truth = -synthetic_z(lats, lons % 360.0)
+        water = truth > 50
+        error = np.nanmax(np.abs(depths[water] - truth[water]))
+        print(f"track: {len(lats)} points in {track_ms:.1f} ms, 0 requests, max |error| {error:.0f} m "
+              f"(finest cached level per tile)")
+
+        # Point lookup outside the rendered area: one stride-1 tile, then local.
+        requests_before = server.requests
+        first = bathy.fetch_etopo_depth_at(38.3, -72.6)
+        second = bathy.fetch_etopo_depth_at(38.8, -72.1)
+        assert server.requests == requests_before + 1, "second point in the same tile went upstream"
+        for (lat, lon), depth in (((38.3, -72.6), first), ((38.8, -72.1), second)):
+            assert depth is not None and abs(depth + synthetic_z(np.array(lat), np.array(lon % 360))) < 15
+        print(f"points outside: 1 request for 2 lookups in the same tile ({first:.0f} m, {second:.0f} m)")
+
+        # Across the prime meridian: one request per side, seamless mosaic.
+        requests_before = server.requests
+        extent = [-0.6, 0.7, 49.2, 49.9]
+        grid = bathy.fetch_etopo_bathymetry(extent)
+        check_mosaic(grid, extent)
+        assert server.requests == requests_before + 2
+        print(f"prime meridian: 2 requests, {grid.z.shape} grid, lon {grid.longitude[0]:.3f}..{grid.longitude[-1]:.3f}")
+
+        # Quota evicts whole tiles; a re-render refetches only what it lost.
+        total = dir_bytes(tiles_dir)
+        settings.bathy_cache_max_bytes = total // 2
+        quota = bathy.enforce_bathy_cache_quota()
+        assert quota["evicted_files"] > 0 and dir_bytes(tiles_dir) <= total // 2
+        bathy._fetch_cached.cache_clear()
+        extent = extents[0]
+        stride = bathy.pyramid_stride(bathy.choose_stride(extent))
+        bounds = bathy.bathy_query_bounds(list(bathy._cache_key(extent, stride)[:4]))
+        margin = stride * bathy.ETOPO_DEG_STEP
+        keys = bathy.tiles_for_bounds({
+            "west": bounds["west"] - margin,
+            "east": bounds["east"] + margin,
+            "south": bounds["south"] - margin,
+            "north": bounds["north"] + margin,
+        })
+        lost = sum(1 for key in keys if not bathy._tile_path(stride, *key).exists())
+        fetched_before = bathy._tile_stats["tiles_fetched"]
+        check_mosaic(bathy.fetch_etopo_bathymetry(extent), extent)
+        assert bathy._tile_stats["tiles_fetched"] - fetched_before == lost
+        print(f"quota: evicted {quota['evicted_files']} tiles ({quota['freed_bytes'] / 1024:.0f} KB); "
+              f"re-render refetched {lost}/{len(keys)} tiles")
+
+        settings.bathy_cache_max_bytes = 0
+        (tiles_dir / "bathy_-70.0_-69.0_41.0_42.0_2.npz").write_bytes(b"legacy")
+        summary = bathy.purge_bathy_cache()
+        assert summary["legacy_files_removed"] == 1 and summary["stale_files_removed"] == 1
+        print("purge: legacy per-extent file removed, tiles kept")
+
+        speedup = legacy_s / tiles_s if tiles_s else math.inf
+        print(f"requests {legacy[0]} -> {tiled[0]}, disk {legacy[2] / tiled[2]:.1f}x smaller, "
+              f"cold render {speedup:.1f}x")
+    server.close()
+
+
+if __name__ == "__main__":
+    main()
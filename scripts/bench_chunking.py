@@ -0,0 +1,114 @@
+"""
+Benchmark context-aware chunking on a large markdown manual.
+
+Generates a synthetic manual (default ~2 MB: nested ``#``/``##``/``###``
+sections, prose paragraphs, numbered procedures and tables), then times
+``ChunkingService.chunk_with_context`` with the one-pass ``SectionIndex``
+against the previous behaviour of rescanning the document for every chunk's
+section hierarchy. Both runs must produce identical chunks.
+
+Usage: python scripts/bench_chunking.py [--size-mb 2] [--seed 7]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.chunking_service import ChunkingService  # noqa: E402
+
+WORDS = (
+    "glider float sensor battery mission waypoint payload ballast pump iridium "
+    "antenna firmware reset calibrate thruster rudder depth heading telemetry "
+    "recovery deploy check verify confirm replace inspect procedure warning"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(6, 18))]
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random) -> str:
+    return " ".join(_sentence(rng) for _ in range(rng.randint(2, 9)))
+
+
+def _block(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.15:
+        steps = [f"{i}. {_sentence(rng)}" for i in range(1, rng.randint(4, 9))]
+        return "\n".join(steps)
+    if roll < 0.25:
+        rows = ["| Item | Value | Notes |", "|---|---|---|"]
+        rows += [f"| {rng.choice(WORDS)} | {rng.randint(1, 999)} | {_sentence(rng)} |" for _ in range(rng.randint(2, 8))]
+        return "\n".join(rows)
+    return _paragraph(rng)
+
+
+def build_manual(size_bytes: int, seed: int) -> str:
+    rng = random.Random(seed)
+    parts = ["**Platform:** wave_glider\n**Revision:** 12\n"]
+    total = len(parts[0])
+    chapter = 0
+    while total < size_bytes:
+        chapter += 1
+        parts.append(f"# Chapter {chapter}: {rng.choice(WORDS).title()} operations")
+        for section in range(1, rng.randint(3, 7)):
+            parts.append(f"## {chapter}.{section} {rng.choice(WORDS).title()} {rng.choice(WORDS)}")
+            for sub in range(rng.randint(0, 4)):
+                parts.append(f"### {chapter}.{section}.{sub + 1} {rng.choice(WORDS).title()}")
+                parts.extend(_block(rng) for _ in range(rng.randint(1, 6)))
+            parts.extend(_block(rng) for _ in range(rng.randint(1, 4)))
+        total = sum(len(p) + 2 for p in parts)
+    return "\n\n".join(parts)
+
+
+class _RescanIndex:
+    """Previous behaviour: rescan content[:position] for every chunk."""
+
+    def __init__(self, service: ChunkingService, content: str):
+        self._service = service
+        self._content = content
+
+    def context(self, position: int) -> str:
+        return self._service._extract_section_hierarchy(self._content, position)
+
+
+class RescanChunkingService(ChunkingService):
+    def _section_index(self, content: str):
+        return _RescanIndex(self, content)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    content = build_manual(int(args.size_mb * 1024 * 1024), args.seed)
+    headers = sum(1 for line in content.splitlines() if line.startswith("#"))
+    print(f"manual: {len(content) / 1024 / 1024:.2f} MB, {headers} headers")
+
+    kwargs = dict(doc_id=1, content=content, title="Manual", category="manual", tags="")
+    indexed, indexed_s = _timed(lambda: ChunkingService().chunk_with_context(**kwargs))
+    rescanned, rescan_s = _timed(lambda: RescanChunkingService().chunk_with_context(**kwargs))
+
+    if indexed != rescanned:
+        print("MISMATCH: SectionIndex chunks differ from the rescan reference")
+        sys.exit(1)
+    print(f"chunks: {len(indexed)} (identical)")
+    print(f"rescan per chunk : {rescan_s * 1000:10.1f} ms")
+    print(f"SectionIndex     : {indexed_s * 1000:10.1f} ms  ({rescan_s / indexed_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
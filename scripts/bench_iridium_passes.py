@@ -0,0 +1,168 @@
+"""
+Compare server-side vectorized Iridium propagation with the former per-satellite scan.
+
+Writes a synthetic 66-satellite Iridium-like constellation (6 planes x 11,
+86.4 deg, 14.34 rev/day, built through ``omm_record_to_tle``) into a temporary
+TLE cache, then:
+
+1. times the former browser algorithm ported to Python - for every 30 s sample
+   of the next 2 h and every satellite, one scalar SGP4 call plus look angles -
+   against one ``SatrecArray`` ephemeris plus a vectorized elevation profile
+   per observer, for ``--observers`` vehicle positions;
+2. checks the best-elevation profile matches the scalar scan and that the
+   next-pass summary (in view / AOS / peak / LOS) matches the former scan;
+3. times repeat lookups (per-cell profile cache) and the positions payload,
+   and reports its JSON size against the raw TLE payload.
+
+Usage: python scripts/bench_iridium_passes.py [--observers 8] [--planes 6] [--seed 3]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.config import settings  # noqa: E402
+from app.core.geo import iridium_passes as passes  # noqa: E402
+from app.core.geo import iridium_tle_cache as tle_cache  # noqa: E402
+
+
+def synthetic_constellation(planes: int) -> list[dict]:
+    epoch = (datetime.now(timezone.utc) - timedelta(hours=6)).strftime("%Y-%m-%dT%H:%M:%S.%f")
+    satellites = []
+    for plane in range(planes):
+        for slot in range(11):
+            satellites.append(tle_cache.omm_record_to_tle({
+                "NORAD_CAT_ID": 43000 + plane * 11 + slot,
+                "OBJECT_NAME": f"IRIDIUM {100 + plane * 11 + slot}",
+                "EPOCH": epoch,
+                "INCLINATION": 86.4,
+                "RA_OF_ASC_NODE": plane * 31.6,
+                "ECCENTRICITY": 0.0002,
+                "ARG_OF_PERICENTER": 90.0,
+                "MEAN_ANOMALY": (slot * 360 / 11 + plane * 16.4) % 360,
+                "MEAN_MOTION": 14.342,
+                "BSTAR": 1e-5,
+                "OBJECT_ID": "2019-002A",
+            }))
+    return satellites
+
+
+def scalar_profile(satellites: list[dict], start: float, steps: int, lat: float, lon: float) -> np.ndarray:
+    """Former per-frame approach: one SGP4 call per satellite per sample."""
+    records = [passes.Satrec.twoline2rv(s["line1"], s["line2"]) for s in satellites]
+    position, up = passes._observer_frame(lat, lon)
+    best = np.full(steps, -90.0)
+    for i in range(steps):
+        jd, fr = passes._julian(np.array(start + i * passes.PASS_STEP_SECONDS))
+        gmst = passes._gmst_rad(jd, fr)
+        for record in records:
+            error, r, _v = record.sgp4(float(jd), float(fr))
+            if error:
+                continue
+            rng = passes._teme_to_ecef(np.array(r), gmst) - position
+            elevation = math.degrees(math.asin(float(rng @ up) / float(np.linalg.norm(rng))))
+            best[i] = max(best[i], elevation)
+    return best
+
+
+def scan_next_pass(best: np.ndarray, start: float) -> dict | None:
+    """The former browser ``scanNextPass`` on a best-elevation profile."""
+    in_view = best >= passes.MIN_ELEVATION_DEG
+    if in_view[0]:
+        aos = 0
+    else:
+        rising = np.flatnonzero(~in_view[:-1] & in_view[1:])
+        if not rising.size:
+            return None
+        aos = int(rising[0]) + 1
+    los = aos
+    while los + 1 < best.size and in_view[los + 1]:
+        los += 1
+    peak = aos + int(np.argmax(best[aos : los + 1]))
+    step = passes.PASS_STEP_SECONDS
+    return {
+        "currently_in_view": bool(in_view[0]),
+        "aos_time": passes._iso(start + aos * step),
+        "los_time": passes._iso(start + los * step),
+        "peak_time": passes._iso(start + peak * step),
+    }
+
+
+async def run(args) -> None:
+    rng = random.Random(args.seed)
+    observers = [(rng.uniform(-70, 70), rng.uniform(-180, 180)) for _ in range(args.observers)]
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.iridium_tle_cache_dir = Path(tmp)
+        satellites = synthetic_constellation(args.planes)
+        payload = {"fetched_at": datetime.now(timezone.utc).isoformat(), "source": "bench", "satellites": satellites}
+        tle_cache.write_tle_payload(payload)
+
+        t0 = time.perf_counter()
+        ephemeris, _ = await passes._current_ephemeris()
+        for lat, lon in observers:
+            await passes.observer_passes(lat, lon)
+        vector_s = time.perf_counter() - t0
+
+        steps = passes.PASS_DISPLAY_HORIZON_SECONDS // passes.PASS_STEP_SECONDS + 1
+        # The scalar scan is slow; pin "now" so both sides start at the same sample.
+        now = time.time()
+        first = int(math.ceil((now - ephemeris.start) / ephemeris.step))
+        start = ephemeris.start + first * ephemeris.step
+        t0 = time.perf_counter()
+        for lat, lon in observers:
+            snapped = passes._snap_observer(lat, lon)
+            reference = scalar_profile(satellites, start, steps, *snapped)
+            best, best_sat = passes._PASS_CACHE[snapped]
+            np.testing.assert_allclose(best[first : first + steps], reference, atol=1e-6)
+            summary = passes._summarize(ephemeris, best, best_sat, now, passes.PASS_DISPLAY_HORIZON_SECONDS)
+            expected = scan_next_pass(reference, start)
+            if expected is None:
+                assert summary["none_in_horizon"]
+            else:
+                for key in ("currently_in_view", "aos_time", "los_time", "peak_time"):
+                    assert summary[key] == expected[key], (key, summary[key], expected[key])
+        scalar_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for lat, lon in observers:
+            await passes.observer_passes(lat + 0.001, lon)
+        repeat_ms = (time.perf_counter() - t0) * 1000 / len(observers)
+
+        t0 = time.perf_counter()
+        positions = await passes.satellite_positions(minutes=30)
+        positions_ms = (time.perf_counter() - t0) * 1000
+        raw_bytes = len(json.dumps(payload, separators=(",", ":")))
+        positions_bytes = len(json.dumps(positions, separators=(",", ":")))
+
+        print(f"{len(satellites)} satellites, {len(observers)} observers, {steps} samples over 2 h")
+        print(f"scalar scan {scalar_s:.2f}s, vectorized (incl. ephemeris) {vector_s * 1000:.0f} ms "
+              f"-> {scalar_s / vector_s:.0f}x; cached lookup {repeat_ms:.2f} ms")
+        print(f"30 min positions ({positions['steps']} steps) in {positions_ms:.0f} ms, "
+              f"{positions_bytes / 1024:.0f} KB vs raw TLEs {raw_bytes / 1024:.0f} KB")
+        print("pass summaries match scalar scan")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--observers", type=int, default=8)
+    parser.add_argument("--planes", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+    if not passes.SGP4_AVAILABLE:
+        sys.exit("sgp4 is not installed")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Compare report telemetry maps drawn with vector basemap layers against the
+pre-rendered basemap tile cache (``app.core.geo.basemap_cache``).
+
+Renders the full-page telemetry map (``plot_telemetry_page_with_notes`` +
+``charts._render_png``, report figure cache off) for a synthetic week of
+Wave Glider fixes. Each scenario runs in a fresh interpreter, like a report
+job in a new worker, and times its first map (shapefiles, bathymetry tiles
+and basemap tiles loaded from disk) and a second map in the same process:
+
+1. vector - cache disabled, cartopy draws land/coast/borders;
+2. cold - cache enabled and empty (tiles rendered around the week and stored);
+3. warm - tiles read from disk, then mosaics from the per-worker LRU;
+4. more fixes - week 1 regenerated with 6 h more fixes (slightly larger
+   bbox), and next week - the track drifts on by most of a map width.
+
+It asserts that the last two render no tiles (no shapefile load), checks the
+warm PNG against the vector one (mean absolute pixel difference) and prints
+the tile cache size. Depth contours are drawn live in every scenario.
+
+``--synthetic`` (default when cartopy has no Natural Earth data on disk)
+writes a made-up coastline as Natural Earth shapefiles into a temporary
+cartopy data dir and matching ETOPO tiles into a temporary bathymetry cache,
+so the bench runs offline; land detail then comes from a 0.005 deg elevation
+field rather than the real 10m coastline, and the files are padded with
+out-of-view islands to roughly the size of the real ones (``FILLER_POINTS``).
+
+Usage: python scripts/bench_report_basemap.py [--days 7] [--synthetic]
+"""
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import cartopy
+import contourpy
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import shapefile
+from PIL import Image as PILImage
+from shapely.geometry import LineString, MultiLineString, Polygon, box
+from shapely.geometry.polygon import orient
+from shapely.ops import polygonize, unary_union
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.config import settings  # noqa: E402
+from app.core import plotting  # noqa: E402
+from app.core.geo import basemap_cache, bathymetry  # noqa: E402
+from app.core.reporting import charts  # noqa: E402
+
+REGION = (-70.0, -54.0, 40.0, 50.0)  # west, east, south, north of the synthetic world
+# Out-of-view filler vertices per synthetic shapefile, roughly the size of the
+# Natural Earth 5.x files cartopy reads (e.g. ne_10m_land.shp is ~10 MB), so a
+# fresh process pays a comparable read/parse cost.
+FILLER_POINTS = {
+    "10m": {"land": 600_000, "ocean": 650_000, "coastline": 220_000, "admin_0_boundary_lines_land": 90_000},
+    "50m": {"land": 80_000, "ocean": 90_000, "coastline": 60_000, "admin_0_boundary_lines_land": 20_000},
+    "110m": {"land": 8_000, "ocean": 9_000, "coastline": 6_000, "admin_0_boundary_lines_land": 2_000},
+}
+
+
+def elevation(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    """Synthetic topography (m): land to the north of a wiggly coast, shelf then deep water."""
+    coast = 44.9 + 0.25 * np.sin(2.1 * lon) + 0.08 * np.sin(7.3 * lon + 5 * lat) + 0.03 * np.sin(31 * lon)
+    above = (lat - coast) * 600.0 + 25 * np.sin(17 * lon) * np.cos(13 * lat)
+    return np.where(above < 0, above * (1 + 3 * np.clip(coast - lat, 0, None)), above)
+
+
+def write_natural_earth(data_dir: Path) -> None:
+    west, east, south, north = REGION
+    lon = np.arange(west, east, 0.005)
+    lat = np.arange(south, north, 0.005)
+    z = elevation(*np.meshgrid(lon, lat))
+    lines = contourpy.contour_generator(lon, lat, z).lines(0.0)
+    coast = [LineString(seg) for seg in lines if len(seg) > 1]
+    frame = box(west, south, east, north)
+    pieces = polygonize(unary_union(coast + [frame.exterior]))
+    land = [
+        p for p in pieces
+        if elevation(np.array(p.representative_point().x), np.array(p.representative_point().y)) >= 0
+    ]
+    ocean = frame.difference(unary_union(land))
+    border = LineString([(-64.5, 45.6), (-64.2, 47.0), (-64.6, 49.9)])
+
+    def polygons(geom):
+        return list(geom.geoms) if hasattr(geom, "geoms") else [geom]
+
+    rng = np.random.default_rng(11)
+
+    def filler(points: int, kind: str) -> list:
+        """Ragged 1000-vertex islands in the Southern Ocean, never inside the bench maps."""
+        theta = np.linspace(0, 2 * np.pi, 1000, endpoint=False)
+        shapes = []
+        for _ in range(points // 1000):
+            lon0, lat0 = rng.uniform(-179, 179), rng.uniform(-58, -45)
+            radius = 0.3 * np.exp(0.05 * np.sin(theta * rng.integers(20, 60)) + 0.02 * rng.standard_normal(1000))
+            ring = np.column_stack([lon0 + radius * np.cos(theta), lat0 + 0.6 * radius * np.sin(theta)])
+            shapes.append(LineString(ring) if kind == "line" else Polygon(ring))
+        return shapes
+
+    def write(category: str, resolution: str, name: str, shapes, kind: str, tolerance: float) -> None:
+        path = data_dir / "shapefiles" / "natural_earth" / category / f"ne_{resolution}_{name}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with shapefile.Writer(str(path), shapeType=shapefile.POLYGON if kind == "poly" else shapefile.POLYLINE) as w:
+            w.field("featurecla", "C")
+            for shape in shapes:
+                shape = shape.simplify(tolerance) if tolerance else shape
+                if shape.is_empty:
+                    continue
+                if kind == "poly":
+                    for poly in polygons(shape):
+                        poly = orient(poly, sign=-1.0)  # shapefile outer rings are clockwise
+                        w.poly([list(poly.exterior.coords)] + [list(r.coords) for r in poly.interiors])
+                        w.record(name)
+                else:
+                    parts = list(shape.geoms) if isinstance(shape, MultiLineString) else [shape]
+                    w.line([list(part.coords) for part in parts])
+                    w.record(name)
+
+    for resolution, tolerance in (("10m", 0.0), ("50m", 0.02), ("110m", 0.08)):
+        extra = FILLER_POINTS[resolution]
+        write("physical", resolution, "land", land + filler(extra["land"], "poly"), "poly", tolerance)
+        write("physical", resolution, "ocean", polygons(ocean) + filler(extra["ocean"], "poly"), "poly", tolerance)
+        write("physical", resolution, "coastline", coast + filler(extra["coastline"], "line"), "line", tolerance)
+        write("cultural", resolution, "admin_0_boundary_lines_land",
+              [border] + filler(extra["admin_0_boundary_lines_land"], "line"), "line", tolerance)
+    cartopy.config["pre_existing_data_dir"] = str(data_dir)
+    cartopy.config["data_dir"] = str(data_dir)
+
+
+def write_bathymetry_tiles() -> None:
+    west, east, south, north = REGION
+    for stride in bathymetry.BATHY_TILE_STRIDES:
+        offsets = (np.arange(0, 240, stride) + 0.5) * bathymetry.ETOPO_DEG_STEP
+        for lat0 in range(int(south), int(north)):
+            for lon0 in range(int(west), int(east)):
+                lon = lon0 + offsets
+                lat = lat0 + offsets
+                z = elevation(*np.meshgrid(lon, lat))
+                bathymetry._save_tile(stride, lat0, lon0, bathymetry.BathyGrid(longitude=lon, latitude=lat, z=z))
+
+
+def synthetic_track(days: int, start: str, lon0: float, lat0: float, seed: int = 5) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    fixes = pd.date_range(start, periods=days * 144, freq="10min", tz="UTC")
+    n = len(fixes)
+    return pd.DataFrame({
+        "lastLocationFix": fixes,
+        "latitude": lat0 - np.cumsum(np.abs(rng.normal(0.0003, 0.0004, n))),
+        "longitude": lon0 + np.cumsum(rng.normal(0.0008, 0.0006, n)),
+        "speedOverGround": np.clip(rng.normal(1.2, 0.4, n), 0, None),
+    })
+
+
+def render_map(track: pd.DataFrame, notes: list[dict]) -> bytes:
+    with plotting.report_pdf_rc_context():
+        fig = plt.figure(figsize=(8.27, 11.69))
+        plotting.plot_telemetry_page_with_notes(fig, track, note_annotations=[dict(n) for n in notes])
+    png, cacheable = charts._render_png(fig, dpi=charts.DEFAULT_DPI)
+    assert cacheable
+    return png
+
+
+SCENARIOS = {
+    # name: (basemap cache enabled, track week)
+    "vector": (False, 1),
+    "cold": (True, 1),
+    "warm": (True, 1),
+    "more_fixes": (True, 3),
+    "next_week": (True, 2),
+}
+
+
+def tracks(days: int) -> tuple[pd.DataFrame, pd.DataFrame, list[dict]]:
+    """Week 1, the following week, and notes; week 3 is week 1 regenerated with 6 h more fixes."""
+    week1 = synthetic_track(days, "2026-09-01", -62.6, 44.5)
+    week2 = synthetic_track(days, "2026-09-08", float(week1.longitude.iloc[-1]),
+                            float(week1.latitude.iloc[-1]), seed=6)
+    notes = [{"note_id": 1, "latitude": week1.latitude.iloc[300], "longitude": week1.longitude.iloc[300],
+              "full_note_text": "Course change"}]
+    return week1, week2, notes
+
+
+def configure(workdir: Path) -> None:
+    settings.report_figure_cache_enabled = False
+    settings.report_basemap_cache_dir = workdir / "basemap"
+    settings.bathy_cache_dir = workdir / "bathy"
+    if (workdir / "cartopy").is_dir():
+        cartopy.config["pre_existing_data_dir"] = str(workdir / "cartopy")
+        cartopy.config["data_dir"] = str(workdir / "cartopy")
+
+
+def child(scenario: str, workdir: Path, days: int) -> None:
+    """One scenario in a fresh interpreter: first map (cold per-process caches), then a second one."""
+    configure(workdir)
+    enabled, week = SCENARIOS[scenario]
+    settings.report_basemap_cache_enabled = enabled
+    week1, week2, notes = tracks(days)
+    if week == 2:
+        track, notes = week2, []
+    elif week == 3:
+        track = pd.concat([week1, week2.head(36)], ignore_index=True)
+    else:
+        track = week1
+    result = {}
+    for run in ("first", "second"):
+        before = dict(basemap_cache._stats)
+        t0 = time.perf_counter()
+        png = render_map(track, notes)
+        result[run] = time.perf_counter() - t0
+        result[f"{run}_stats"] = {
+            k: basemap_cache._stats[k] - before[k] for k in ("hits", "memory_hits", "misses", "tiles_rendered")
+        }
+    (workdir / f"{scenario}.png").write_bytes(png)
+    print(json.dumps(result))
+
+
+def run_scenario(scenario: str, workdir: Path, days: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", scenario, "--workdir", str(workdir), "--days", str(days)],
+        check=True, capture_output=True, text=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    first, second = result["first_stats"], result["second_stats"]
+    print(f"{scenario:<10} first map {result['first']:6.2f}s (disk_hits={first['hits']} renders={first['misses']} "
+          f"tiles_rendered={first['tiles_rendered']})"
+          f"   second map {result['second']:6.2f}s (memory_hits={second['memory_hits']})")
+    return result
+
+
+def pixels(png: bytes) -> np.ndarray:
+    with PILImage.open(io.BytesIO(png)) as img:
+        return np.asarray(img.convert("RGB"), dtype=np.int16)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--synthetic", action="store_true",
+                        help="Use a synthetic Natural Earth coastline and ETOPO tiles (offline).")
+    parser.add_argument("--child", choices=sorted(SCENARIOS), help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.workdir, args.days)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        configure(workdir)
+        coastline = Path(cartopy.config["data_dir"]) / "shapefiles/natural_earth/physical/ne_10m_coastline.shp"
+        if args.synthetic or not coastline.is_file():
+            print("synthetic Natural Earth coastline + ETOPO tiles")
+            write_natural_earth(workdir / "cartopy")
+            write_bathymetry_tiles()
+        else:
+            # Real ETOPO: fetch the tiles once so every scenario reads them from disk.
+            settings.report_basemap_cache_enabled = False
+            render_map(tracks(args.days)[0], [])
+
+        results = {name: run_scenario(name, workdir, args.days) for name in SCENARIOS}
+        vector = (workdir / "vector.png").read_bytes()
+        warm = (workdir / "warm.png").read_bytes()
+        diff = np.abs(pixels(warm) - pixels(vector))
+        print(f"warm vs vector: {diff.shape[1]}x{diff.shape[0]} px, mean abs diff {diff.mean():.2f}/255, "
+              f"{(diff.max(axis=2) > 64).mean() * 100:.2f}% pixels differ by >64")
+        assert diff.mean() < 8
+
+        for name, label in (("more_fixes", "week 1 + 6 h of fixes"), ("next_week", "next week")):
+            first = results[name]["first_stats"]
+            print(f"{label}: {first['hits']} of 2 maps from cached tiles, {first['tiles_rendered']} tiles rendered")
+            assert first["misses"] == 0, f"{label} rendered basemap tiles"
+        status = basemap_cache.get_basemap_cache_status()
+        print(f"cache: {status['files']} tiles, {status['total_bytes'] / 1e6:.1f} MB")
+        v, w = results["vector"], results["warm"]
+        n = results["next_week"]
+        print(f"map render, fresh process: vector {v['first']:.2f}s -> warm tiles {w['first']:.2f}s "
+              f"({v['first'] / w['first']:.1f}x), next week {n['first']:.2f}s ({v['first'] / n['first']:.1f}x); "
+              f"same process: {v['second']:.2f}s -> {w['second']:.2f}s ({v['second'] / w['second']:.1f}x); "
+              f"cold tiles {results['cold']['first']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Measure the report figure cache on a synthetic weekly Wave Glider + Slocum report.
+
+Builds one week of telemetry (10 min fixes along a drifting track), power,
+CTD, weather and wave frames plus Slocum dashboard/CTD frames, then renders
+every report figure through ``reporting.charts`` / ``slocum_reports``:
+
+1. cold - every figure rendered and stored;
+2. regenerate after editing a note's text - all figures reused (the map only
+   draws note markers), PNG bytes identical to the cold render;
+3. regenerate after adding a note marker and one more hour of CTD - only the
+   telemetry map and CTD chart re-render;
+4. with ETOPO unreachable, the telemetry map is rendered without contours and
+   not stored (so the next report retries);
+5. the LRU quota evicts the least recently used figures first.
+
+The track map needs cartopy's Natural Earth data (downloaded on first use);
+``--no-map`` skips it and steps that depend on it.
+
+Usage: python scripts/bench_report_figures.py [--days 7] [--no-map]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.config import settings  # noqa: E402
+from app.core.reporting import charts, figure_cache, slocum_reports  # noqa: E402
+
+WIDTH_PT = 770.0
+HEIGHT_PT = 500.0
+
+
+def synthetic_frames(days: int, seed: int = 5) -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    fixes = pd.date_range("2026-09-01", periods=days * 144, freq="10min", tz="UTC")
+    n = len(fixes)
+    lat = 44.0 + np.cumsum(rng.normal(0.0004, 0.0006, n))
+    lon = -63.0 + np.cumsum(rng.normal(0.0008, 0.0006, n))
+    telemetry = pd.DataFrame({
+        "lastLocationFix": fixes,
+        "latitude": lat,
+        "longitude": lon,
+        "speedOverGround": np.clip(rng.normal(1.2, 0.4, n), 0, None),
+    })
+    power = pd.DataFrame({
+        "gliderTimeStamp": fixes.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "totalBatteryPower": 2_500_000 + np.cumsum(rng.normal(0, 2000, n)),
+        "solarPowerGenerated": np.clip(40_000 * np.sin(np.arange(n) / 144 * 2 * np.pi), 0, None),
+        "outputPortPower": rng.normal(9_000, 500, n),
+    })
+    minutes = pd.date_range("2026-09-01", periods=days * 288, freq="5min", tz="UTC")
+    m = len(minutes)
+    ctd = pd.DataFrame({
+        "Timestamp": minutes,
+        "WaterTemperature": 12 + np.sin(np.arange(m) / 288 * 2 * np.pi) + rng.normal(0, 0.05, m),
+        "Conductivity": 3.8 + rng.normal(0, 0.01, m),
+        "Salinity": 31.5 + rng.normal(0, 0.02, m),
+    })
+    weather = pd.DataFrame({
+        "Timestamp": fixes,
+        "AirTemperature": 14 + rng.normal(0, 1, n),
+        "WindSpeed": np.abs(rng.normal(12, 4, n)),
+        "WindGust": np.abs(rng.normal(16, 5, n)),
+        "BarometricPressure": 1012 + np.cumsum(rng.normal(0, 0.1, n)),
+    })
+    waves = pd.DataFrame({
+        "Timestamp": fixes,
+        "SignificantWaveHeight": np.abs(rng.normal(1.5, 0.3, n)),
+        "WavePeriod": np.abs(rng.normal(8, 1, n)),
+        "MeanWaveDirection": rng.uniform(0, 360, n),
+    })
+    dashboard = pd.DataFrame({
+        "Timestamp": minutes,
+        "MDepth": np.abs(100 * np.sin(np.arange(m) / 12)),
+        "MBattery": 14.5 - np.arange(m) * 1e-4,
+    })
+    return {
+        "telemetry": telemetry,
+        "power": power,
+        "ctd": ctd,
+        "weather": weather,
+        "waves": waves,
+        "dashboard": dashboard,
+    }
+
+
+_rendered: list[bytes] = []
+
+
+def _recording(to_image):
+    """Wrap a module's ``_png_to_image`` to capture the PNG behind each flowable."""
+    def wrapper(png, **kwargs):
+        _rendered.append(png)
+        return to_image(png, **kwargs)
+    return wrapper
+
+
+charts._png_to_image = _recording(charts._png_to_image)
+slocum_reports._png_to_image = _recording(slocum_reports._png_to_image)
+
+
+def render_report(frames: dict[str, pd.DataFrame], notes: list[dict], with_map: bool) -> list[bytes]:
+    """Render every figure; returns the PNG bytes in a fixed order (map first, or None)."""
+    _rendered.clear()
+    if with_map:
+        charts.chart_telemetry_image(frames["telemetry"], [dict(n) for n in notes], max_width_pt=WIDTH_PT)
+    else:
+        _rendered.append(None)
+    charts.chart_power_image(frames["power"], max_width_pt=WIDTH_PT, max_height_pt=HEIGHT_PT)
+    charts.chart_ctd_image(frames["ctd"], max_width_pt=WIDTH_PT, max_height_pt=HEIGHT_PT)
+    charts.chart_weather_image(frames["weather"], max_width_pt=WIDTH_PT, max_height_pt=HEIGHT_PT)
+    charts.chart_wave_image(frames["waves"], max_width_pt=WIDTH_PT, max_height_pt=HEIGHT_PT)
+    for y_col, title in (("MDepth", "Measured depth (m)"), ("MBattery", "Battery (V)")):
+        slocum_reports._line_chart_image(frames["dashboard"], y_col, title, max_width_pt=WIDTH_PT)
+    return list(_rendered)
+
+
+def timed(
+    label: str, frames: dict[str, pd.DataFrame], notes: list[dict], with_map: bool
+) -> tuple[list[bytes], dict[str, int]]:
+    before = dict(figure_cache._stats)
+    t0 = time.perf_counter()
+    pngs = render_report(frames, notes, with_map)
+    elapsed = time.perf_counter() - t0
+    delta = {k: figure_cache._stats[k] - before[k] for k in ("hits", "misses", "renders_not_cached")}
+    print(f"{label:<38} {elapsed:6.2f}s  hits={delta['hits']} renders={delta['misses']}"
+          f"{' not_cached=' + str(delta['renders_not_cached']) if delta['renders_not_cached'] else ''}")
+    return pngs, delta
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--no-map", action="store_true",
+                        help="Skip the cartopy track map (needs Natural Earth data, downloaded on first use).")
+    args = parser.parse_args()
+    with_map = not args.no_map
+
+    frames = synthetic_frames(args.days)
+    track = frames["telemetry"]
+    notes = [
+        {"note_id": 1, "latitude": track.latitude.iloc[100], "longitude": track.longitude.iloc[100],
+         "full_note_text": "Recovered float line"},
+        {"note_id": 2, "latitude": track.latitude.iloc[600], "longitude": track.longitude.iloc[600],
+         "full_note_text": "Course change"},
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.report_figure_cache_dir = Path(tmp)
+        settings.feature_toggles["report_bathymetry_contours"] = False
+
+        cold, _ = timed("cold render", frames, notes, with_map)
+        edited = [dict(notes[0], full_note_text="Recovered float line (edited)"), notes[1]]
+        warm, delta = timed("regenerate after note text edit", frames, edited, with_map)
+        assert delta["misses"] == 0 and warm == cold
+
+        more = dict(frames)
+        extra = frames["ctd"].tail(12).copy()
+        extra["Timestamp"] = extra["Timestamp"] + pd.Timedelta(hours=1)
+        more["ctd"] = pd.concat([frames["ctd"], extra], ignore_index=True)
+        added = edited + [{"note_id": 3, "latitude": track.latitude.iloc[900],
+                           "longitude": track.longitude.iloc[900], "full_note_text": "Pilot handover"}]
+        partial, delta = timed("regenerate after new note + CTD hour", more, added, with_map)
+        assert delta["misses"] == 1 + with_map and partial[1:2] == cold[1:2] and partial[3:] == cold[3:]
+
+        if with_map:
+            settings.feature_toggles["report_bathymetry_contours"] = True
+            settings.etopo_erddap_server = "http://127.0.0.1:9/erddap"
+            settings.etopo_request_timeout = 1
+            settings.bathy_cache_dir = Path(tmp) / "bathy"
+            _, delta = timed("ETOPO unreachable (map not stored)", frames, notes, with_map)
+            assert delta["renders_not_cached"] == 1
+            _, delta = timed("again: map retried, rest reused", frames, notes, with_map)
+            assert delta["misses"] == 1 and delta["renders_not_cached"] == 1
+
+        status = figure_cache.get_figure_cache_status()
+        settings.report_figure_cache_max_bytes = status["total_bytes"] // 2
+        before = {path: mtime for path, mtime, _ in figure_cache._iter_entries()}
+        summary = figure_cache.purge_figure_cache()
+        left = figure_cache.get_figure_cache_status()
+        kept = {path for path, _, _ in figure_cache._iter_entries()}
+        evicted = set(before) - kept
+        assert max(before[p] for p in evicted) <= min(before[p] for p in kept)
+        print(f"cache: {status['files']} figures, {status['total_bytes'] / 1e6:.1f} MB; quota "
+              f"{settings.report_figure_cache_max_bytes / 1e6:.1f} MB evicted {summary['quota_evicted_files']} "
+              f"-> {left['files']} figures, {left['total_bytes'] / 1e6:.1f} MB")
+        assert left["total_bytes"] <= settings.report_figure_cache_max_bytes
+
+
+if __name__ == "__main__":
+    main()
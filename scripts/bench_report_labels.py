@@ -0,0 +1,134 @@
+"""
+Time note-marker label placement on the report telemetry map.
+
+Drops N synthetic mission notes (a few sharing a fix, so some clusters read
+"A+2") along a drifting one-week track on a blank full-page PlateCarree map
+and runs ``plotting._annotate_note_markers``. For each N it reports the
+placement time, the time of the draw that follows, and layout quality
+measured on the drawn annotations: label pairs whose text still overlaps,
+labels poking out of the axes and the mean leader length.
+
+``--baseline REV`` also runs the implementation of ``app/core/plotting.py``
+at git revision REV (loaded from ``git show`` into a throwaway module) on the
+same notes, e.g. the revision before the display-space layout engine, to
+compare speed and layout quality side by side. The former engine measures
+every candidate through a live annotation and its relaxation is all-pairs,
+so 1000 notes take minutes there.
+
+Usage: python scripts/bench_report_labels.py [--sizes 50 200 1000] [--baseline REV]
+"""
+
+import argparse
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import cartopy.crs as ccrs
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.text import Text  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.core import plotting  # noqa: E402
+
+EXTENT = (-63.4, -61.6, 43.6, 45.0)  # west, east, south, north
+PAGE_IN = (8.27, 11.69)
+
+
+def synthetic_notes(count: int, seed: int = 11) -> list[dict]:
+    """Notes at fixes of a drifting track; roughly one in eight shares the previous note's fix."""
+    rng = np.random.default_rng(seed)
+    west, east, south, north = EXTENT
+    steps = 1008  # one week of 10 min fixes
+    lon = np.clip(-63.2 + np.cumsum(rng.normal(0.0013, 0.004, steps)), west + 0.05, east - 0.05)
+    lat = np.clip(43.8 + np.cumsum(rng.normal(0.001, 0.004, steps)), south + 0.05, north - 0.05)
+    fixes = np.sort(rng.integers(0, steps, count))
+    notes = []
+    for idx, fix in enumerate(fixes):
+        if idx and rng.random() < 0.125:
+            fix = fixes[idx - 1]
+        notes.append({
+            "note_id": idx + 1,
+            "latitude": float(lat[fix]),
+            "longitude": float(lon[fix]),
+            "full_note_text": f"Note {idx + 1}",
+        })
+    return plotting.assign_note_letters(notes)
+
+
+def load_baseline(rev: str):
+    """Import ``app/core/plotting.py`` as of git revision ``rev`` as ``app.core.plotting_baseline``."""
+    source = subprocess.run(
+        ["git", "show", f"{rev}:app/core/plotting.py"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    path = Path(tempfile.mkdtemp()) / "plotting_baseline.py"
+    path.write_text(source)
+    spec = importlib.util.spec_from_file_location("app.core.plotting_baseline", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def layout_quality(ax, renderer) -> tuple[int, int, float]:
+    """Label pairs whose text boxes overlap, labels outside the axes, and mean leader length (pt).
+
+    Text boxes only (``Text.get_window_extent``), so crossing leader lines don't count.
+    """
+    annotations = [child for child in ax.texts if isinstance(child, matplotlib.text.Annotation)]
+    boxes = np.array([Text.get_window_extent(a, renderer).extents for a in annotations])
+    overlaps = plotting._boxes_overlap(boxes[:, None, :], boxes[None, :, :], pad=0.0)
+    pairs = int(np.triu(overlaps, k=1).sum())
+    x0, y0, x1, y1 = ax.get_window_extent(renderer).extents
+    outside = int(((boxes[:, 0] < x0) | (boxes[:, 1] < y0) | (boxes[:, 2] > x1) | (boxes[:, 3] > y1)).sum())
+    leader = float(np.mean([np.hypot(*a.xyann) for a in annotations]))
+    return pairs, outside, leader
+
+
+def run(module, notes: list[dict]) -> dict:
+    fig = plt.figure(figsize=PAGE_IN, dpi=100)
+    ax = fig.add_axes([0.05, 0.05, 0.9, 0.9], projection=ccrs.PlateCarree())
+    ax.set_extent(EXTENT, crs=ccrs.PlateCarree())
+    t0 = time.perf_counter()
+    module._annotate_note_markers(ax, [dict(note) for note in notes])
+    placed = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fig.canvas.draw()
+    drawn = time.perf_counter() - t0
+    pairs, outside, leader = layout_quality(ax, fig.canvas.get_renderer())
+    plt.close(fig)
+    return {"place": placed, "draw": drawn, "pairs": pairs, "outside": outside, "leader": leader}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--baseline", metavar="REV",
+                        help="Also run app/core/plotting.py from this git revision for comparison.")
+    args = parser.parse_args()
+
+    engines = [("current", plotting)]
+    if args.baseline:
+        engines.insert(0, (args.baseline, load_baseline(args.baseline)))
+
+    print(f"{'notes':>5} {'labels':>6} {'engine':<10} {'place':>8} {'draw':>7} "
+          f"{'overlaps':>8} {'outside':>7} {'leader pt':>9}")
+    for size in args.sizes:
+        notes = synthetic_notes(size)
+        labels = len({(round(n["latitude"], 5), round(n["longitude"], 5)) for n in notes})
+        for name, module in engines:
+            result = run(module, notes)
+            print(f"{size:>5} {labels:>6} {name:<10} {result['place']:7.2f}s {result['draw']:6.2f}s "
+                  f"{result['pairs']:>8} {result['outside']:>7} {result['leader']:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark season statistics: full recomputation vs. per-type rollups.
+
+Builds a synthetic in-memory SQLite dataset (default 5 seasons x 1000
+stations, four closed seasons and one open), then times
+``calculate_season_statistics`` with ``use_rollups=False`` (full scan), with
+cold rollups, with warm rollups, and after a single offload log edit. Every
+rollup result is checked against the full recomputation.
+
+Usage: python scripts/bench_season_statistics.py [--seasons 5] [--stations 1000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core import models  # noqa: E402
+from app.services.station_season_service import StationSeasonService  # noqa: E402
+
+STATION_TYPES = ("CBS", "NCAT", "HFX", "SAB", "MAH")
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000.0
+
+
+def _add_season_logs(session, rng, station_ids, year, logs_per_station):
+    base = datetime(year, 5, 1, tzinfo=timezone.utc)
+    for station_id in station_ids:
+        for _ in range(rng.randint(0, logs_per_station)):
+            start = base + timedelta(hours=rng.randint(0, 24 * 150))
+            outcome = rng.random()
+            session.add(
+                models.OffloadLog(
+                    station_id=station_id,
+                    arrival_date=start - timedelta(hours=1),
+                    departure_date=start + timedelta(hours=rng.randint(1, 6)),
+                    offload_start_time_utc=start,
+                    offload_end_time_utc=start + timedelta(minutes=40),
+                    was_offloaded=True if outcome < 0.7 else (False if outcome < 0.9 else None),
+                    log_timestamp_utc=start,
+                    logged_by_username="bench",
+                )
+            )
+
+
+def build_dataset(session, seasons, stations, logs_per_station, seed):
+    rng = random.Random(seed)
+    station_ids = [
+        f"{STATION_TYPES[i % len(STATION_TYPES)]}{i:04d}" for i in range(stations)
+    ]
+    for station_id in station_ids:
+        session.add(
+            models.StationMetadata(
+                station_id=station_id,
+                serial_number=f"SN{station_id}",
+                last_offload_by_glider=rng.choice(("fundy", "sentinel", "cabot", None)),
+            )
+        )
+    session.commit()
+
+    first_year = 2020
+    for offset in range(seasons):
+        year = first_year + offset
+        season = StationSeasonService.get_season_by_year(session, year)
+        if season is None:
+            StationSeasonService.create_season(session, year, is_active=True)
+        else:
+            # close_season already created the following season row.
+            season.is_active = True
+            session.add(season)
+        _add_season_logs(session, rng, station_ids, year, logs_per_station)
+        session.commit()
+        if offset < seasons - 1:
+            StationSeasonService.close_season(session, year, "bench")
+    return first_year + seasons - 1, station_ids
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seasons", type=int, default=5)
+    parser.add_argument("--stations", type=int, default=1000)
+    parser.add_argument("--logs-per-station", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        _, build_ms = _timed(
+            lambda: build_dataset(
+                session, args.seasons, args.stations, args.logs_per_station, args.seed
+            )
+        )
+        years = [season.year for season in StationSeasonService.get_all_seasons(session)]
+        open_year = max(years)
+        log_count = len(session.exec(select(models.OffloadLog.id)).all())
+        print(
+            f"dataset: {len(years)} seasons, {args.stations} stations, "
+            f"{log_count} offload logs (built in {build_ms:.0f} ms)"
+        )
+
+        failures = 0
+
+        def check(year, result):
+            nonlocal failures
+            full = StationSeasonService.calculate_season_statistics(
+                session, year, use_rollups=False
+            )
+            if full != result:
+                failures += 1
+                diff = sorted(k for k in full if full.get(k) != result.get(k))
+                print(f"  MISMATCH season {year}: {diff}")
+
+        for year in sorted(years):
+            full_ms = min(
+                _timed(
+                    lambda: StationSeasonService.calculate_season_statistics(
+                        session, year, use_rollups=False
+                    )
+                )[1]
+                for _ in range(args.repeat)
+            )
+            StationSeasonService.invalidate_statistics_rollups(
+                session, year, include_frozen=year != open_year
+            )
+            session.commit()
+            cold, cold_ms = _timed(
+                lambda: StationSeasonService.calculate_season_statistics(session, year)
+            )
+            check(year, cold)
+            warm_ms = min(
+                _timed(lambda: StationSeasonService.calculate_season_statistics(session, year))[1]
+                for _ in range(args.repeat)
+            )
+            label = "open" if year == open_year else "closed"
+            print(
+                f"season {year} ({label}): full {full_ms:8.1f} ms | "
+                f"rollup cold {cold_ms:8.1f} ms | warm {warm_ms:6.1f} ms | "
+                f"speedup x{full_ms / max(warm_ms, 1e-6):.1f}"
+            )
+
+        log = session.exec(
+            select(models.OffloadLog).where(models.OffloadLog.field_season_year.is_(None))
+        ).first()
+        if log is not None:
+            log.was_offloaded = not bool(log.was_offloaded)
+            session.add(log)
+            session.commit()
+            after_edit, edit_ms = _timed(
+                lambda: StationSeasonService.calculate_season_statistics(session, open_year)
+            )
+            check(open_year, after_edit)
+            print(
+                f"open season after one log edit ({log.station_id}): "
+                f"{edit_ms:.1f} ms (one station type rebuilt)"
+            )
+
+    print("verification:", "OK" if not failures else f"{failures} mismatch(es)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+"""
+Recall/latency harness for the chatbot vector store (distance space + HNSW).
+
+Embeds the active FAQ and document corpus from the app database with the
+production index records (FAQ question+answer, document chunks), then for each
+configuration builds an in-memory Chroma collection and measures:
+
+- build time,
+- query latency p50/p95 over FAQ questions and document-chunk lead sentences,
+- recall@k against exact cosine top-k computed with numpy.
+
+Defaults sweep l2 vs cosine and a few M / ef_search values; the live settings
+are vector_distance_metric and vector_hnsw_* (see app/config.py).
+
+Requires chromadb and sentence-transformers.
+
+Usage: python scripts/bench_vector_search.py [--k 5] [--queries 200]
+           [--m 8 16 32] [--ef-search 16 64 128] [--ef-construction 200]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlmodel import Session, select  # noqa: E402
+
+from app.core import models  # noqa: E402
+from app.core.infra.db import sqlite_engine  # noqa: E402
+from app.services.vector_index_service import document_index_item  # noqa: E402
+from app.services.vector_search_service import (  # noqa: E402
+    CHROMADB_AVAILABLE,
+    EMBEDDING_MODEL_NAME,
+    VectorSearchService,
+)
+
+
+def load_corpus():
+    """``(ids, texts)`` exactly as the index embeds them."""
+    records = []
+    with Session(sqlite_engine) as session:
+        for faq in session.exec(select(models.FAQEntry).where(models.FAQEntry.is_active == True)):  # noqa: E712
+            records.append(VectorSearchService._faq_record(
+                faq.id, faq.question, faq.answer, faq.category, faq.tags, faq.keywords, faq.platform
+            ))
+        for doc in session.exec(
+            select(models.KnowledgeDocument).where(models.KnowledgeDocument.is_active == True)  # noqa: E712
+        ):
+            records.extend(VectorSearchService._document_records(**document_index_item(doc)))
+    return [r[0] for r in records], [r[1] for r in records]
+
+
+def load_queries(texts, count, seed):
+    """FAQ questions and the lead sentence of document chunks."""
+    rng = random.Random(seed)
+    candidates = []
+    for text in texts:
+        lead = text.strip().split("\n", 1)[0].split(". ", 1)[0].strip()
+        if len(lead) > 12:
+            candidates.append(lead[:200])
+    rng.shuffle(candidates)
+    return candidates[:count]
+
+
+def exact_top_k(corpus, queries, k):
+    corpus_n = corpus / np.linalg.norm(corpus, axis=1, keepdims=True)
+    queries_n = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    scores = queries_n @ corpus_n.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def run_config(client, name, metadata, ids, corpus, queries, truth, k):
+    collection = client.create_collection(name=name, metadata=metadata)
+    started = time.perf_counter()
+    for start in range(0, len(ids), 512):
+        collection.add(ids=ids[start:start + 512], embeddings=corpus[start:start + 512].tolist())
+    build_s = time.perf_counter() - started
+
+    index_of = {doc_id: i for i, doc_id in enumerate(ids)}
+    latencies, recalls = [], []
+    for query, expected in zip(queries, truth):
+        t0 = time.perf_counter()
+        result = collection.query(query_embeddings=[query.tolist()], n_results=k, include=["distances"])
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+        found = {index_of[i] for i in result["ids"][0]}
+        recalls.append(len(found & set(expected.tolist())) / len(expected))
+    client.delete_collection(name=name)
+    return build_s, np.percentile(latencies, 50), np.percentile(latencies, 95), float(np.mean(recalls))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--m", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[16, 64, 128])
+    parser.add_argument("--ef-construction", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if not CHROMADB_AVAILABLE:
+        sys.exit("chromadb and sentence-transformers are required")
+    import chromadb
+    from sentence_transformers import SentenceTransformer
+
+    ids, texts = load_corpus()
+    if len(ids) <= args.k:
+        sys.exit(f"Corpus too small ({len(ids)} entries) for k={args.k}")
+    query_texts = load_queries(texts, args.queries, args.seed)
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    corpus = np.asarray(model.encode(texts, batch_size=64), dtype=np.float32)
+    queries = np.asarray(model.encode(query_texts, batch_size=64), dtype=np.float32)
+    truth = exact_top_k(corpus, queries, args.k)
+    print(f"corpus: {len(ids)} entries, {len(query_texts)} queries, recall@{args.k} vs exact cosine")
+
+    client = chromadb.EphemeralClient()
+    print(f"{'space':<7}{'M':>4}{'ef_s':>6}{'build s':>10}{'p50 ms':>9}{'p95 ms':>9}{'recall':>9}")
+    configs = [("l2", 16, 10)]  # Chroma defaults (previous behaviour)
+    configs += [("cosine", m, ef) for m in args.m for ef in args.ef_search]
+    for n, (space, m, ef_search) in enumerate(configs):
+        metadata = {
+            "hnsw:space": space,
+            "hnsw:M": m,
+            "hnsw:construction_ef": args.ef_construction,
+            "hnsw:search_ef": ef_search,
+        }
+        build_s, p50, p95, recall = run_config(
+            client, f"bench_{n}", metadata, ids, corpus, queries, truth, args.k
+        )
+        print(f"{space:<7}{m:>4}{ef_search:>6}{build_s:>10.2f}{p50:>9.2f}{p95:>9.2f}{recall:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
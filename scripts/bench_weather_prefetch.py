@@ -0,0 +1,184 @@
+"""
+Exercise the weather map prefetcher against a local HTTP fixture server.
+
+Starts a threaded HTTP server that serves synthetic ``.om`` files (random bytes,
+``ETag`` = SHA-256 prefix) with a fixed per-request latency and a per-connection
+bandwidth cap, points the cache module at it, and runs ``prefetch_om_urls``:
+
+1. serially (concurrency 1, the previous behaviour) vs. bounded-concurrent;
+2. an interrupted run (cancelled after a few files) followed by a resume that
+   must only download what the first run did not finish;
+3. a re-run for the same model run, which must skip every cached file without
+   contacting upstream.
+
+Every cached body is checked byte-for-byte against the fixture.
+
+Usage: python scripts/bench_weather_prefetch.py [--files 24] [--size-mb 4]
+           [--mbps 40] [--latency-ms 150] [--concurrency 6] [--per-host 4]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.config import settings  # noqa: E402
+from app.core.geo import weather_map_cache as wmc  # noqa: E402
+
+REFERENCE_TIME = "2026-10-18T00:00Z"
+
+
+class FixtureServer:
+    """Serves ``/data_spatial/dwd_icon/.../<n>.om`` from an in-memory table."""
+
+    def __init__(self, files: dict[str, bytes], bytes_per_second: float, latency_s: float):
+        self.files = files
+        self.requests = 0
+        outer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                outer.requests += 1
+                time.sleep(latency_s)
+                body = outer.files.get(self.path.split("?", 1)[0])
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", f'"{hashlib.sha256(body).hexdigest()[:16]}"')
+                self.end_headers()
+                step = 64 * 1024
+                for start in range(0, len(body), step):
+                    try:
+                        self.wfile.write(body[start : start + step])
+                    except OSError:
+                        return
+                    time.sleep(step / bytes_per_second)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self._server.server_port}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+
+
+def build_fixture(count: int, size: int, seed: int) -> tuple[dict[str, bytes], dict[str, str]]:
+    rng = random.Random(seed)
+    files, om_urls = {}, {}
+    for index in range(count):
+        path = f"/data_spatial/dwd_icon/2026/10/18/0000Z/2026-10-{18 + index // 8:02d}T{(index % 8) * 3:02d}00.om"
+        files[path] = rng.randbytes(size)
+        om_urls[f"valid_times_{index * 3}"] = path
+    return files, om_urls
+
+
+def use_cache(directory: Path) -> None:
+    settings.weather_map_cache_dir = directory
+    wmc._HOT_TIER.clear()
+
+
+def verify(files: dict[str, bytes], om_urls: dict[str, str]) -> None:
+    for path in om_urls.values():
+        entry = wmc._open_cache_entry(wmc._make_cache_key(path, None))
+        assert entry is not None, f"missing cache entry for {path}"
+        assert entry.read(0, entry.size - 1) == files[path.split("?", 1)[0].replace(wmc.OPEN_METEO_BASE, "")]
+
+
+async def interrupted_run(om_urls: dict[str, str], stop_after: int) -> None:
+    task = asyncio.create_task(wmc.prefetch_om_urls(om_urls, reference_time=REFERENCE_TIME))
+    while True:
+        await asyncio.sleep(0.02)
+        files = wmc.load_prefetch_progress().get("files") or {}
+        if sum(1 for r in files.values() if r["state"] == "downloaded") >= stop_after:
+            break
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    for download in list(wmc._DOWNLOADS.values()):
+        download.task.cancel()
+    await asyncio.sleep(0.1)
+
+
+def report(label: str, summary: dict) -> None:
+    rate = summary["throughput_bytes_per_second"]
+    print(
+        f"{label:<22} {summary['elapsed_seconds']:8.2f} s  downloaded={summary['downloaded']:<3} "
+        f"skipped={summary['skipped']:<3} failed={summary['failed']:<3} "
+        f"throughput={(rate or 0) / 1024 / 1024:6.1f} MB/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=24)
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--mbps", type=float, default=40.0, help="per-connection bandwidth, MB/s")
+    parser.add_argument("--latency-ms", type=float, default=150.0)
+    parser.add_argument("--concurrency", type=int, default=6)
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    files, paths = build_fixture(args.files, int(args.size_mb * 1024 * 1024), args.seed)
+    server = FixtureServer(files, args.mbps * 1024 * 1024, args.latency_ms / 1000.0)
+    wmc.OPEN_METEO_BASE = server.base
+    om_urls = {step: f"{server.base}{path}?variable={wmc.WIND_VARIABLE}" for step, path in paths.items()}
+    print(f"fixture: {args.files} files x {args.size_mb:.1f} MB, {args.mbps:.0f} MB/s per connection, "
+          f"{args.latency_ms:.0f} ms latency")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.weather_map_prefetch_concurrency = 1
+        settings.weather_map_prefetch_per_host_limit = 1
+        use_cache(Path(tmp) / "serial")
+        serial = asyncio.run(wmc.prefetch_om_urls(om_urls, reference_time=REFERENCE_TIME))
+        verify(files, om_urls)
+        report("serial", serial)
+
+        settings.weather_map_prefetch_concurrency = args.concurrency
+        settings.weather_map_prefetch_per_host_limit = args.per_host
+        use_cache(Path(tmp) / "concurrent")
+        concurrent = asyncio.run(wmc.prefetch_om_urls(om_urls, reference_time=REFERENCE_TIME))
+        verify(files, om_urls)
+        report(f"concurrent ({args.concurrency}/{args.per_host})", concurrent)
+        print(f"speedup: {serial['elapsed_seconds'] / concurrent['elapsed_seconds']:.1f}x")
+
+        use_cache(Path(tmp) / "resume")
+        asyncio.run(interrupted_run(om_urls, stop_after=max(1, args.files // 3)))
+        done_before = sum(
+            1 for r in wmc.load_prefetch_progress()["files"].values() if r["state"] == "downloaded"
+        )
+        requests_before = server.requests
+        resumed = asyncio.run(wmc.prefetch_om_urls(om_urls, reference_time=REFERENCE_TIME))
+        verify(files, om_urls)
+        report(f"resume (after {done_before})", resumed)
+        assert resumed["resumed"] and resumed["skipped"] >= done_before
+        assert resumed["downloaded"] == server.requests - requests_before
+
+        requests_before = server.requests
+        rerun = asyncio.run(wmc.prefetch_om_urls(om_urls, reference_time=REFERENCE_TIME))
+        report("re-run (all cached)", rerun)
+        assert rerun["skipped"] == args.files and server.requests == requests_before
+        wmc._HOT_TIER.clear()
+    server.close()
+
+
+if __name__ == "__main__":
+    main()
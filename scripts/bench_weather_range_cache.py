@@ -0,0 +1,137 @@
+"""
+Benchmark weather tile proxy range serving: whole-body reads vs. the hot tier.
+
+Writes a fixture ``.om`` body (default 24 MB of random bytes) into a temporary
+weather cache, then replays a browser range-request sequence against it:
+
+- ``full read``: the previous path - parse meta JSON and ``read_bytes()`` the
+  whole body for every request, then slice;
+- ``hot tier``: ``_get_or_fetch_cached`` (mmap/pread slices, cached meta).
+
+Every response is checked byte-for-byte against the fixture.
+
+The built-in sequence mimics the om-file reader as seen in the browser network
+panel for one map pan: trailer + index reads at the end of the file, then
+runs of 64-512 KB data-block ranges with some re-reads. Pass ``--sequence
+ranges.json`` (a JSON list of ``"bytes=a-b"`` strings exported from devtools)
+to replay a real recording instead.
+
+Usage: python scripts/bench_weather_range_cache.py [--size-mb 24] [--pans 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.config import settings  # noqa: E402
+from app.core.geo import weather_map_cache as wmc  # noqa: E402
+
+FIXTURE_URL = (
+    f"{wmc.OPEN_METEO_BASE}/data_spatial/dwd_icon/2026/10/18/0000Z/"
+    f"2026-10-18T0300.om?variable={wmc.WIND_VARIABLE}"
+)
+
+
+def browser_sequence(size: int, pans: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    ranges: list[str] = []
+    for _ in range(pans):
+        ranges.append(f"bytes={size - 256}-{size - 1}")  # trailer
+        index_start = size - 256 - rng.randint(32, 64) * 1024
+        ranges.append(f"bytes={index_start}-{size - 257}")  # index
+        block = rng.randrange(0, max(1, size - 4 * 1024 * 1024))
+        for _ in range(rng.randint(12, 30)):
+            length = rng.choice((64, 128, 256, 512)) * 1024
+            ranges.append(f"bytes={block}-{min(size - 1, block + length - 1)}")
+            block = min(size - length, block + length + rng.randint(0, 64) * 1024)
+    return ranges
+
+
+def write_fixture_entry(cache_key: str, meta: dict, body: bytes) -> None:
+    """Store ``body`` as a cached upstream response (meta JSON + body file)."""
+    meta_path, body_path = wmc._cache_entry_paths(cache_key)
+    body_path.parent.mkdir(parents=True, exist_ok=True)
+    body_path.write_bytes(body)
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+
+def slice_body(body: bytes, range_header: str) -> bytes:
+    """Previous range handling: slice the whole in-memory body."""
+    parsed = wmc._parse_range_header(range_header, len(body))
+    if parsed is None:
+        return body
+    start, end = parsed
+    return body[start : end + 1]
+
+
+def full_read(cache_key: str, range_header: str) -> bytes:
+    """Previous behaviour: meta JSON + whole body from disk on every request."""
+    meta_path, body_path = wmc._cache_entry_paths(cache_key)
+    json.loads(meta_path.read_text(encoding="utf-8"))  # headers came from the meta
+    return slice_body(body_path.read_bytes(), range_header)
+
+
+async def hot_tier(range_header: str) -> bytes:
+    _, chunk, _, from_cache = await wmc._get_or_fetch_cached(FIXTURE_URL, range_header)
+    assert from_cache
+    return chunk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=24.0)
+    parser.add_argument("--pans", type=int, default=20)
+    parser.add_argument("--sequence", type=Path, default=None)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.weather_map_cache_dir = Path(tmp)
+        body = os.urandom(int(args.size_mb * 1024 * 1024))
+        cache_key = wmc._make_cache_key(FIXTURE_URL, None)
+        write_fixture_entry(
+            cache_key,
+            {"upstream_url": FIXTURE_URL, "content_type": "application/octet-stream", "status_code": 200},
+            body,
+        )
+        if args.sequence:
+            sequence = json.loads(args.sequence.read_text(encoding="utf-8"))
+        else:
+            sequence = browser_sequence(len(body), args.pans, args.seed)
+
+        def expected(range_header: str) -> bytes:
+            start, end = wmc._parse_range_header(range_header, len(body))
+            return body[start : end + 1]
+
+        started = time.perf_counter()
+        for range_header in sequence:
+            assert full_read(cache_key, range_header) == expected(range_header)
+        full_s = time.perf_counter() - started
+
+        async def replay() -> float:
+            t0 = time.perf_counter()
+            for range_header in sequence:
+                assert await hot_tier(range_header) == expected(range_header)
+            return time.perf_counter() - t0
+
+        hot_s = asyncio.run(replay())
+        served = sum(len(expected(r)) for r in sequence)
+        print(f"fixture: {len(body) / 1024 / 1024:.1f} MB, {len(sequence)} range requests, "
+              f"{served / 1024 / 1024:.1f} MB served")
+        print(f"full read per request : {full_s * 1000:9.1f} ms  "
+              f"({len(sequence) * len(body) / 1024 / 1024:.0f} MB read)")
+        print(f"hot tier (mmap/pread) : {hot_s * 1000:9.1f} ms  ({full_s / hot_s:.1f}x)")
+        print(f"hot tier status       : {wmc._HOT_TIER.status()}")
+        wmc._HOT_TIER.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,32 @@
  * @file iridium_map_layer.js
  * @description Iridium constellation overlay for the home-page Leaflet map.
  *
- * - Fetches cached TLEs from /api/map/iridium/tles
- * - Propagates with satellite.js (SGP4)
+ * - Fetches server-side SGP4 positions from /api/map/iridium/positions
+ *   (per-satellite lat/lon/alt arrays, interpolated between steps)
  * - Shows sats above loaded gliders (elev >= 8.2°), elevation-mask footprints,
- *   and a next-pass timeline for the selected observer
+ *   and a next-pass timeline for the selected observer: active vehicles read the
+ *   leader-precomputed windows (/api/map/iridium/passes/vehicles), anything else
+ *   or a vehicle that has moved since falls back to /api/map/iridium/passes
  */
 
 import { showToast, fetchWithAuth } from '/static/js/api.js';
 
-const TLE_URL = '/api/map/iridium/tles';
+const POSITIONS_URL = '/api/map/iridium/positions';
+const PASSES_URL = '/api/map/iridium/passes';
+const VEHICLE_PASSES_URL = '/api/map/iridium/passes/vehicles';
+// Observer id prefix (map_generator.getIridiumObservers) -> vehicle platform.
+const OBSERVER_PLATFORMS = { wg: 'wave_glider', slocum: 'slocum' };
+// Precomputed windows are used while the observer is this close to the
+// vehicle position they were computed for (two server observer cells).
+const VEHICLE_PASS_MAX_OFFSET_DEG = 0.1;
 const MIN_ELEVATION_DEG = 8.2;
 const EARTH_RADIUS_M = 6371000;
+const WGS84_A_M = 6378137;
+const WGS84_E2 = 6.69437999014e-3;
 const TICK_MS = 5000;
-const PASS_HORIZON_MS = 2 * 60 * 60 * 1000;
-const PASS_STEP_MS = 30 * 1000;
+const POSITIONS_WINDOW_MIN = 30;
+// Refetch positions this long before the current window runs out.
+const POSITIONS_REFRESH_MARGIN_MS = 5 * 60 * 1000;
 const IRIDIUM_PANE = 'iridiumPane';
 const IRIDIUM_PANE_Z = 450;
 const MARKER_COLOR = '#c45c26';
@@ -25,11 +37,12 @@ let missionMapRef = null;
 let getObserversRef = null;
 let isIridiumEnabled = false;
 let tickTimer = null;
-let satRecords = [];
-let tleMeta = null;
+let satPositions = null;
+let positionsRefreshPending = null;
 let markerLayerGroup = null;
 let footprintLayerGroup = null;
 let lastPassScanAt = 0;
+let lastPassObserverKey = null;
 const PASS_SCAN_INTERVAL_MS = 60000;
 
 /**
@@ -41,10 +54,6 @@ export function bindIridiumOverlayContext(map, getObservers) {
     getObserversRef = getObservers;
 }
 
-function getSatelliteApi() {
-    return typeof window !== 'undefined' ? window.satellite : undefined;
-}
-
 function ensureIridiumPane() {
     if (!missionMapRef) {
         return;
@@ -120,79 +129,83 @@ function formatDuration(ms) {
     return `${s}s`;
 }
 
-function buildSatRecords(satellites) {
-    const api = getSatelliteApi();
-    if (!api) {
-        throw new Error('satellite.js is not loaded');
-    }
-    const records = [];
-    for (const sat of satellites || []) {
-        if (!sat?.line1 || !sat?.line2) {
-            continue;
-        }
-        try {
-            const satrec = api.twoline2satrec(sat.line1, sat.line2);
-            if (!satrec || satrec.error) {
-                continue;
-            }
-            records.push({
-                noradId: sat.norad_id,
-                name: sat.name || `NORAD ${sat.norad_id}`,
-                satrec,
-            });
-        } catch {
-            // Skip malformed TLEs
-        }
-    }
-    return records;
+function radians(deg) {
+    return (deg * Math.PI) / 180;
 }
 
 /**
- * Propagate one sat at date; return geodetic + ECF position or null.
- * @param {{satrec: object, name: string, noradId?: number}} record
- * @param {Date} date
+ * Position of satellite ``index`` at ``nowMs``, linearly interpolated between
+ * server samples (longitude across the antimeridian). Null outside the window.
+ * @returns {{lat: number, lon: number, altM: number}|null}
  */
-function propagateGeodetic(record, date) {
-    const api = getSatelliteApi();
-    if (!api) {
+function satPositionAt(index, nowMs) {
+    if (!satPositions) {
+        return null;
+    }
+    const { start_ms: startMs, step_seconds: stepSeconds, steps } = satPositions;
+    const offset = (nowMs - startMs) / (stepSeconds * 1000);
+    if (!(offset >= 0) || offset > steps - 1) {
         return null;
     }
-    const pv = api.propagate(record.satrec, date);
-    if (!pv?.position || pv.position.x == null) {
+    const i0 = Math.min(Math.floor(offset), steps - 1);
+    const i1 = Math.min(i0 + 1, steps - 1);
+    const frac = offset - i0;
+    const lats = satPositions.lat[index];
+    const lons = satPositions.lon[index];
+    const alts = satPositions.alt_km[index];
+    if (lats[i0] == null || lats[i1] == null) {
         return null;
     }
-    const gmst = api.gstime(date);
-    const gd = api.eciToGeodetic(pv.position, gmst);
-    const ecf = api.eciToEcf(pv.position, gmst);
+    let dLon = lons[i1] - lons[i0];
+    if (dLon > 180) {
+        dLon -= 360;
+    } else if (dLon < -180) {
+        dLon += 360;
+    }
+    let lon = lons[i0] + dLon * frac;
+    if (lon > 180) {
+        lon -= 360;
+    } else if (lon < -180) {
+        lon += 360;
+    }
+    return {
+        lat: lats[i0] + (lats[i1] - lats[i0]) * frac,
+        lon,
+        altM: (alts[i0] + (alts[i1] - alts[i0]) * frac) * 1000,
+    };
+}
+
+function geodeticToEcef(latDeg, lonDeg, heightM) {
+    const phi = radians(latDeg);
+    const lam = radians(lonDeg);
+    const n = WGS84_A_M / Math.sqrt(1 - WGS84_E2 * Math.sin(phi) ** 2);
     return {
-        lat: degrees(gd.latitude),
-        lon: degrees(gd.longitude),
-        altM: gd.height * 1000,
-        positionEcf: ecf,
+        x: (n + heightM) * Math.cos(phi) * Math.cos(lam),
+        y: (n + heightM) * Math.cos(phi) * Math.sin(lam),
+        z: (n * (1 - WGS84_E2) + heightM) * Math.sin(phi),
     };
 }
 
 /**
- * Look angles from observer to satellite ECF position.
- * @returns {{elevationDeg: number, azimuthDeg: number}|null}
+ * Look angles from a sea-level observer to a satellite geodetic position.
+ * @returns {{elevationDeg: number, azimuthDeg: number}}
  */
-function lookAngles(observer, positionEcf, date) {
-    const api = getSatelliteApi();
-    if (!api || !positionEcf) {
-        return null;
-    }
-    const toRad = api.degreesToRadians
-        ? (deg) => api.degreesToRadians(deg)
-        : (deg) => (deg * Math.PI) / 180;
-    const observerGd = {
-        longitude: toRad(observer.lon),
-        latitude: toRad(observer.lat),
-        height: 0,
-    };
-    const look = api.ecfToLookAngles(observerGd, positionEcf);
+function lookAngles(observer, geo) {
+    const o = geodeticToEcef(observer.lat, observer.lon, 0);
+    const s = geodeticToEcef(geo.lat, geo.lon, geo.altM);
+    const dx = s.x - o.x;
+    const dy = s.y - o.y;
+    const dz = s.z - o.z;
+    const phi = radians(observer.lat);
+    const lam = radians(observer.lon);
+    const east = -Math.sin(lam) * dx + Math.cos(lam) * dy;
+    const north =
+        -Math.sin(phi) * Math.cos(lam) * dx - Math.sin(phi) * Math.sin(lam) * dy + Math.cos(phi) * dz;
+    const up = Math.cos(phi) * Math.cos(lam) * dx + Math.cos(phi) * Math.sin(lam) * dy + Math.sin(phi) * dz;
+    const range = Math.hypot(dx, dy, dz);
     return {
-        elevationDeg: degrees(look.elevation),
-        azimuthDeg: degrees(look.azimuth),
+        elevationDeg: degrees(Math.asin(up / range)),
+        azimuthDeg: (degrees(Math.atan2(east, north)) + 360) % 360,
     };
 }
 
@@ -265,105 +278,107 @@ function selectedObserver(observers) {
     return observers[0] || null;
 }
 
+async function fetchJson(url, label) {
+    const response = await fetchWithAuth(url);
+    if (!response.ok) {
+        let detail = `${label} fetch failed (${response.status})`;
+        try {
+            const body = await response.json();
+            if (body?.detail) {
+                detail = typeof body.detail === 'string' ? body.detail : JSON.stringify(body.detail);
+            }
+        } catch {
+            // keep status-based message
+        }
+        const err = new Error(detail);
+        err.status = response.status;
+        throw err;
+    }
+    return response.json();
+}
+
 /**
- * Scan next PASS_HORIZON_MS for AOS / peak / LOS for one observer.
+ * Precomputed next pass for an observer that is an active vehicle, or null when
+ * there is none (not a vehicle, no or expired document, vehicle moved since).
  */
-function scanNextPass(observer, now = new Date()) {
-    if (!observer || !satRecords.length) {
+async function fetchVehicleNextPass(observer) {
+    const [prefix, ...rest] = String(observer.id || '').split(':');
+    const platform = OBSERVER_PLATFORMS[prefix];
+    if (!platform || !rest.length) {
         return null;
     }
-
-    const samples = [];
-    for (let t = 0; t <= PASS_HORIZON_MS; t += PASS_STEP_MS) {
-        const date = new Date(now.getTime() + t);
-        let bestElev = -90;
-        let bestName = null;
-        for (const record of satRecords) {
-            const geo = propagateGeodetic(record, date);
-            if (!geo) {
-                continue;
-            }
-            const look = lookAngles(observer, geo.positionEcf, date);
-            if (!look) {
-                continue;
-            }
-            if (look.elevationDeg > bestElev) {
-                bestElev = look.elevationDeg;
-                bestName = record.name;
-            }
-        }
-        samples.push({
-            time: date,
-            elev: bestElev,
-            inView: bestElev >= MIN_ELEVATION_DEG,
-            name: bestName,
-        });
+    const document = await fetchJson(VEHICLE_PASSES_URL, 'Iridium vehicle passes');
+    if (!document.computed_at || document.expired) {
+        return null;
+    }
+    const vehicleId = rest.join(':');
+    const vehicle = (document.vehicles || []).find((v) => v.platform === platform && v.id === vehicleId);
+    if (
+        !vehicle ||
+        Math.abs(vehicle.lat - observer.lat) > VEHICLE_PASS_MAX_OFFSET_DEG ||
+        Math.abs(vehicle.lon - observer.lon) > VEHICLE_PASS_MAX_OFFSET_DEG
+    ) {
+        return null;
     }
+    return vehicle.next_pass ?? { none_in_horizon: true };
+}
 
-    const currentlyInView = samples[0]?.inView;
-    let aosIndex = -1;
-    if (currentlyInView) {
-        aosIndex = 0;
-    } else {
-        for (let i = 1; i < samples.length; i += 1) {
-            if (!samples[i - 1].inView && samples[i].inView) {
-                aosIndex = i;
-                break;
-            }
-        }
+/**
+ * Next AOS / peak / LOS in the next 2 h for one observer (computed server-side).
+ */
+async function fetchNextPass(observer) {
+    let result = null;
+    try {
+        result = await fetchVehicleNextPass(observer);
+    } catch (error) {
+        console.warn('Iridium vehicle pass lookup failed, computing for position:', error);
     }
-    if (aosIndex < 0) {
-        return { currentlyInView: false, noneInHorizon: true };
+    if (!result) {
+        const params = new URLSearchParams({ lat: observer.lat.toFixed(4), lon: observer.lon.toFixed(4) });
+        result = await fetchJson(`${PASSES_URL}?${params}`, 'Iridium pass');
     }
-
-    let peak = samples[aosIndex];
-    let losIndex = aosIndex;
-    for (let i = aosIndex; i < samples.length; i += 1) {
-        if (samples[i].elev > peak.elev) {
-            peak = samples[i];
-        }
-        if (samples[i].inView) {
-            losIndex = i;
-        }
-        if (i > aosIndex && !samples[i].inView) {
-            losIndex = i - 1;
-            break;
-        }
+    if (result.none_in_horizon) {
+        return { currentlyInView: false, noneInHorizon: true };
     }
-
-    const aos = samples[aosIndex];
-    const los = samples[losIndex];
     return {
-        currentlyInView: Boolean(currentlyInView),
+        currentlyInView: Boolean(result.currently_in_view),
         noneInHorizon: false,
-        aosTime: aos.time,
-        aosSat: aos.name,
-        peakTime: peak.time,
-        peakElev: peak.elev,
-        peakSat: peak.name,
-        losTime: los.time,
-        gapMs: currentlyInView ? 0 : aos.time.getTime() - now.getTime(),
+        aosTime: new Date(result.aos_time),
+        aosSat: result.aos_satellite,
+        peakTime: new Date(result.peak_time),
+        peakElev: result.peak_elevation_deg,
+        peakSat: result.peak_satellite,
+        losTime: new Date(result.los_time),
+        gapMs: (result.gap_seconds ?? 0) * 1000,
     };
 }
 
-function updatePassPanel(observers, force = false) {
+async function updatePassPanel(observers, force = false) {
     const now = Date.now();
-    if (!force && now - lastPassScanAt < PASS_SCAN_INTERVAL_MS) {
+    const observer = selectedObserver(observers);
+    const observerKey = observer ? `${observer.id}:${observer.lat.toFixed(2)},${observer.lon.toFixed(2)}` : null;
+    if (!force && observerKey === lastPassObserverKey && now - lastPassScanAt < PASS_SCAN_INTERVAL_MS) {
         return;
     }
     lastPassScanAt = now;
+    lastPassObserverKey = observerKey;
 
-    const observer = selectedObserver(observers);
     if (!observer) {
         renderPassPanel('<span class="text-muted">Load a mission track to see next Iridium pass.</span>');
         return;
     }
 
-    const result = scanNextPass(observer, new Date());
-    if (!result) {
+    let result;
+    try {
+        result = await fetchNextPass(observer);
+    } catch (error) {
+        console.warn('Iridium pass lookup failed:', error);
         renderPassPanel('<span class="text-muted">Unable to compute pass timeline.</span>');
         return;
     }
+    if (!isIridiumEnabled || observerKey !== lastPassObserverKey) {
+        return;
+    }
     if (result.noneInHorizon) {
         renderPassPanel(
             `<div><strong>${observer.label}</strong>: no pass with elev ≥ ${MIN_ELEVATION_DEG}° in the next 2 hours.</div>`
@@ -386,28 +401,30 @@ function updatePassPanel(observers, force = false) {
 }
 
 function redrawOverlay() {
-    if (!isIridiumEnabled || !missionMapRef || !satRecords.length) {
+    if (!isIridiumEnabled || !missionMapRef || !satPositions) {
         return;
     }
+    refreshPositionsIfExpiring();
 
     const observers = getObservers();
     syncObserverSelect(observers);
     ensureIridiumPane();
 
-    const now = new Date();
+    const nowMs = Date.now();
     const inViewByNorad = new Map();
 
-    for (const record of satRecords) {
-        const geo = propagateGeodetic(record, now);
+    satPositions.satellites.forEach((sat, index) => {
+        const geo = satPositionAt(index, nowMs);
         if (!geo) {
-            continue;
+            return;
         }
+        const record = { noradId: sat.norad_id, name: sat.name || `NORAD ${sat.norad_id}` };
         const visibleFor = [];
         let bestElev = -90;
         let bestAz = 0;
         for (const obs of observers) {
-            const look = lookAngles(obs, geo.positionEcf, now);
-            if (!look || look.elevationDeg < MIN_ELEVATION_DEG) {
+            const look = lookAngles(obs, geo);
+            if (look.elevationDeg < MIN_ELEVATION_DEG) {
                 continue;
             }
             visibleFor.push({
@@ -422,7 +439,7 @@ function redrawOverlay() {
             }
         }
         if (!visibleFor.length) {
-            continue;
+            return;
         }
         const key = String(record.noradId ?? record.name);
         inViewByNorad.set(key, {
@@ -432,7 +449,7 @@ function redrawOverlay() {
             bestElev,
             bestAz,
         });
-    }
+    });
 
     clearMapLayers();
     markerLayerGroup = L.layerGroup().addTo(missionMapRef);
@@ -489,23 +506,30 @@ function redrawOverlay() {
     updatePassPanel(observers);
 }
 
-async function fetchTles() {
-    const response = await fetchWithAuth(TLE_URL);
-    if (!response.ok) {
-        let detail = `TLE fetch failed (${response.status})`;
-        try {
-            const body = await response.json();
-            if (body?.detail) {
-                detail = typeof body.detail === 'string' ? body.detail : JSON.stringify(body.detail);
-            }
-        } catch {
-            // keep status-based message
-        }
-        const err = new Error(detail);
-        err.status = response.status;
-        throw err;
+function positionsExpireAt() {
+    return satPositions.start_ms + (satPositions.steps - 1) * satPositions.step_seconds * 1000;
+}
+
+function refreshPositionsIfExpiring() {
+    if (positionsRefreshPending || Date.now() < positionsExpireAt() - POSITIONS_REFRESH_MARGIN_MS) {
+        return;
     }
-    return response.json();
+    positionsRefreshPending = fetchPositions()
+        .then((payload) => {
+            if (isIridiumEnabled) {
+                satPositions = payload;
+                updateTleMeta(payload);
+            }
+        })
+        .catch((error) => console.warn('Iridium position refresh failed:', error))
+        .finally(() => {
+            positionsRefreshPending = null;
+        });
+}
+
+function fetchPositions() {
+    const params = new URLSearchParams({ minutes: String(POSITIONS_WINDOW_MIN) });
+    return fetchJson(`${POSITIONS_URL}?${params}`, 'Iridium position');
 }
 
 function formatCacheAge(ageSeconds) {
@@ -547,19 +571,11 @@ async function enableOverlay() {
     if (!missionMapRef) {
         throw new Error('Map not initialized');
     }
-    const payload = await fetchTles();
-    satRecords = buildSatRecords(payload.satellites);
-    if (!satRecords.length) {
+    const payload = await fetchPositions();
+    if (!payload.satellites?.length) {
         throw new Error('No usable Iridium TLEs in response');
     }
-    tleMeta = {
-        fetchedAt: payload.fetched_at,
-        source: payload.source,
-        count: satRecords.length,
-        cacheHit: payload.cache_hit,
-        stale: Boolean(payload.stale),
-        ageSeconds: payload.age_seconds,
-    };
+    satPositions = payload;
     updateTleMeta(payload);
     if (payload.stale) {
         showToast(
@@ -570,6 +586,7 @@ async function enableOverlay() {
     isIridiumEnabled = true;
     setControlsEnabled(true);
     lastPassScanAt = 0;
+    lastPassObserverKey = null;
     redrawOverlay();
     stopTick();
     tickTimer = setInterval(redrawOverlay, TICK_MS);
@@ -580,8 +597,7 @@ function disableOverlay() {
     stopTick();
     clearMapLayers();
     setControlsEnabled(false);
-    satRecords = [];
-    tleMeta = null;
+    satPositions = null;
     const countEl = document.getElementById('iridiumInViewCount');
     if (countEl) {
         countEl.textContent = '';